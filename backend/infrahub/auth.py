@@ -3,6 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import partial
 from typing import TYPE_CHECKING, Callable, Optional
 
 import bcrypt
@@ -10,6 +11,7 @@ import jwt
 from pydantic import BaseModel
 
 from infrahub import config, models
+from infrahub.auth_cache import CachedAccount, ValidatedToken, auth_cache
 from infrahub.core.account import validate_token
 from infrahub.core.constants import AccountStatus, InfrahubKind
 from infrahub.core.manager import NodeManager
@@ -47,9 +49,20 @@ class AccountSession(BaseModel):
         return self.auth_type == AuthType.JWT
 
 
-async def validate_active_account(db: InfrahubDatabase, account_id: str) -> None:
+async def _load_account(db: InfrahubDatabase, account_id: str) -> CachedAccount:
     account: CoreGenericAccount = await NodeManager.get_one(db=db, id=account_id, raise_on_error=True)
-    if account.status.value != AccountStatus.ACTIVE.value:
+    return CachedAccount(account_id=account.id, role=account.role.value.value, status=account.status.value)
+
+
+async def get_account(db: InfrahubDatabase, account_id: str) -> CachedAccount:
+    return await auth_cache.get_account(
+        account_id=account_id, loader=partial(_load_account, db=db, account_id=account_id)
+    )
+
+
+async def validate_active_account(db: InfrahubDatabase, account_id: str) -> None:
+    account = await get_account(db=db, account_id=account_id)
+    if account.status != AccountStatus.ACTIVE.value:
         raise AuthorizationError("This account has been deactivated")
 
 
@@ -111,17 +124,18 @@ async def create_fresh_access_token(
     if not refresh_token:
         raise AuthorizationError("The provided refresh token has been invalidated in the database")
 
-    account: Optional[CoreGenericAccount] = await NodeManager.get_one(id=refresh_data.account_id, db=db)
-    if not account:
+    try:
+        account = await get_account(db=db, account_id=refresh_data.account_id)
+    except NodeNotFoundError:
         raise NodeNotFoundError(
             branch_name=selected_branch.name,
             node_type="Account",
             identifier=refresh_data.account_id,
             message="That login user doesn't exist in the system",
-        )
+        ) from None
 
     access_token = generate_access_token(
-        account_id=account.id, role=account.role.value.value, session_id=refresh_data.session_id
+        account_id=account.account_id, role=account.role, session_id=refresh_data.session_id
     )
 
     return models.AccessTokenResponse(access_token=access_token)
@@ -236,17 +250,26 @@ async def validate_jwt_refresh_token(db: InfrahubDatabase, token: str) -> models
     raise AuthorizationError("Invalid token, current token is not a refresh token")
 
 
-async def validate_api_key(db: InfrahubDatabase, token: str) -> AccountSession:
+async def _validate_api_key_token(db: InfrahubDatabase, token: str) -> Optional[ValidatedToken]:
     account_id, role = await validate_token(token=token, db=db)
     if not account_id:
+        return None
+    return ValidatedToken(account_id=account_id, role=role)
+
+
+async def validate_api_key(db: InfrahubDatabase, token: str) -> AccountSession:
+    validated_token = await auth_cache.get_token(
+        token=token, loader=partial(_validate_api_key_token, db=db, token=token)
+    )
+    if not validated_token:
         raise AuthorizationError("Invalid token")
 
-    await validate_active_account(db=db, account_id=str(account_id))
+    await validate_active_account(db=db, account_id=validated_token.account_id)
 
     # The read-only account role is deprecated and will only be used for anonymous access
-    role = "read-write" if role == "read-only" else role
+    role = "read-write" if validated_token.role == "read-only" else validated_token.role
 
-    return AccountSession(account_id=account_id, role=role, auth_type=AuthType.API)
+    return AccountSession(account_id=validated_token.account_id, role=role, auth_type=AuthType.API)
 
 
 def _validate_is_admin(account_session: AccountSession) -> None:
@@ -273,6 +296,8 @@ def validate_mutation_permissions(operation: str, account_session: AccountSessio
         f"{InfrahubKind.ACCOUNT}Create": _validate_is_admin,
         f"{InfrahubKind.ACCOUNT}Delete": _validate_is_admin,
         f"{InfrahubKind.ACCOUNT}Upsert": _validate_is_admin,
+        f"{InfrahubKind.ACCOUNT}CreateMany": _validate_is_admin,
+        f"{InfrahubKind.ACCOUNT}UpsertMany": _validate_is_admin,
     }
     if validator := validation_map.get(operation):
         validator(account_session)
@@ -284,6 +309,7 @@ def validate_mutation_permissions_update_node(
     validation_map: dict[str, Callable[[AccountSession, str, list[str]], None]] = {
         f"{InfrahubKind.ACCOUNT}Update": _validate_update_account,
         f"{InfrahubKind.ACCOUNT}Upsert": _validate_update_account,
+        f"{InfrahubKind.ACCOUNT}UpsertMany": _validate_update_account,
     }
 
     if validator := validation_map.get(operation):
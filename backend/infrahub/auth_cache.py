@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, TypeVar
+
+import ujson
+
+from infrahub import config
+from infrahub.core.constants import InfrahubKind
+from infrahub.message_bus.types import KVTTL
+
+if TYPE_CHECKING:
+    from infrahub.core.schema import MainSchemaTypes
+    from infrahub.services.adapters.cache import InfrahubCache
+
+SHARED_KEY_PREFIX = "security"
+# Stored outside of the prefix of the other entries so that it doesn't expire along with them
+SHARED_GENERATION_KEY = "security_generation"
+
+CachedValue = TypeVar("CachedValue", "ValidatedToken", "CachedAccount")
+
+
+@dataclass
+class ValidatedToken:
+    account_id: str
+    role: str
+
+
+@dataclass
+class CachedAccount:
+    account_id: str
+    role: str
+    status: str
+
+
+def is_account(schema: MainSchemaTypes) -> bool:
+    return schema.kind == InfrahubKind.GENERICACCOUNT or InfrahubKind.GENERICACCOUNT in getattr(
+        schema, "inherit_from", []
+    )
+
+
+def is_account_token(schema: MainSchemaTypes) -> bool:
+    return schema.kind == InfrahubKind.ACCOUNTTOKEN
+
+
+class AuthCache:
+    """Short-lived cache of the API tokens and the accounts validated by this worker.
+
+    Authenticating a request requires to look up the API token and to check the status of the account in the database,
+    the results are kept in a bounded LRU for `token_cache_ttl` seconds to spare these queries to the clients sending
+    many requests. When a shared cache is set, the entries are also exchanged with the other API servers.
+
+    The entries of an account are discarded when the account is modified or deleted and when one of its tokens is
+    deleted, an expired token can still be accepted until its entry expires.
+
+    The shared entries are stored with the generation of the shared cache read before loading them, each invalidation
+    changes the generation so that an entry loaded by another worker before the invalidation is never used.
+    """
+
+    def __init__(self, max_age: Optional[int] = None, max_size: Optional[int] = None) -> None:
+        self._max_age = max_age
+        self._max_size = max_size
+        self._tokens: OrderedDict[str, tuple[float, ValidatedToken]] = OrderedDict()
+        self._accounts: OrderedDict[str, tuple[float, CachedAccount]] = OrderedDict()
+        # Incremented on each invalidation so that a load which started before it doesn't store outdated entries
+        self._generation = 0
+        self.shared_cache: Optional[InfrahubCache] = None
+
+    @property
+    def max_age(self) -> int:
+        if self._max_age is not None:
+            return self._max_age
+        return config.SETTINGS.security.token_cache_ttl
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.security.token_cache_size
+
+    @property
+    def shared_ttl(self) -> KVTTL:
+        """Return the longest TTL supported by the shared cache that doesn't exceed the one of the local entries."""
+        return max((ttl for ttl in KVTTL.variations() if ttl.value <= self.max_age), default=KVTTL.ONE)
+
+    @staticmethod
+    def _get_token_key(token: str) -> str:
+        # Only a digest of the token is used so that the shared cache doesn't contain any credential
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @staticmethod
+    def _get_shared_token_key(key: str) -> str:
+        return f"{SHARED_KEY_PREFIX}:api_token:{key}"
+
+    @staticmethod
+    def _get_shared_account_key(account_id: str) -> str:
+        return f"{SHARED_KEY_PREFIX}:account:{account_id}"
+
+    @staticmethod
+    def _get_shared_account_token_key(account_id: str, key: str) -> str:
+        """Return the key referencing the token of an account, to find the tokens to delete along with the account."""
+        return f"{SHARED_KEY_PREFIX}:account_token:{account_id}:{key}"
+
+    def _get_local(self, entries: OrderedDict[str, tuple[float, CachedValue]], key: str) -> Optional[CachedValue]:
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        loaded_at, value = entry
+        if time.monotonic() - loaded_at >= self.max_age:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return value
+
+    def _set_local(self, entries: OrderedDict[str, tuple[float, CachedValue]], key: str, value: CachedValue) -> None:
+        entries[key] = (time.monotonic(), value)
+        entries.move_to_end(key)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+    async def _get(
+        self,
+        entries: OrderedDict[str, tuple[float, CachedValue]],
+        key: str,
+        shared_key: str,
+        value_type: type[CachedValue],
+        loader: Callable[[], Awaitable[Optional[CachedValue]]],
+    ) -> Optional[CachedValue]:
+        if not self.max_age:
+            return await loader()
+
+        value = self._get_local(entries=entries, key=key)
+        if value is not None:
+            return value
+
+        generation = self._generation
+        if self.shared_cache:
+            value = await self._get_shared(key=key, shared_key=shared_key, value_type=value_type, loader=loader)
+        else:
+            value = await loader()
+        if value is None:
+            return None
+
+        if generation == self._generation:
+            self._set_local(entries=entries, key=key, value=value)
+        return value
+
+    async def _get_shared(
+        self,
+        key: str,
+        shared_key: str,
+        value_type: type[CachedValue],
+        loader: Callable[[], Awaitable[Optional[CachedValue]]],
+    ) -> Optional[CachedValue]:
+        assert self.shared_cache is not None
+        shared_generation = await self.shared_cache.get(key=SHARED_GENERATION_KEY) or ""
+        if data := await self.shared_cache.get(key=shared_key):
+            entry = ujson.loads(data)
+            if entry["generation"] == shared_generation:
+                return value_type(**entry["value"])
+
+        value = await loader()
+        if value is None:
+            return None
+        await self.shared_cache.set(
+            key=shared_key,
+            value=ujson.dumps({"generation": shared_generation, "value": asdict(value)}),
+            expires=self.shared_ttl,
+        )
+        if isinstance(value, ValidatedToken):
+            await self.shared_cache.set(
+                key=self._get_shared_account_token_key(account_id=value.account_id, key=key),
+                value=key,
+                expires=self.shared_ttl,
+            )
+        return value
+
+    async def _renew_shared_generation(self) -> None:
+        assert self.shared_cache is not None
+        await self.shared_cache.set(key=SHARED_GENERATION_KEY, value=str(uuid.uuid4()))
+
+    async def get_token(
+        self, token: str, loader: Callable[[], Awaitable[Optional[ValidatedToken]]]
+    ) -> Optional[ValidatedToken]:
+        """Return the account of an API token, the invalid tokens are not cached."""
+        key = self._get_token_key(token=token)
+        return await self._get(
+            entries=self._tokens,
+            key=key,
+            shared_key=self._get_shared_token_key(key=key),
+            value_type=ValidatedToken,
+            loader=loader,
+        )
+
+    async def get_account(self, account_id: str, loader: Callable[[], Awaitable[CachedAccount]]) -> CachedAccount:
+        account = await self._get(
+            entries=self._accounts,
+            key=account_id,
+            shared_key=self._get_shared_account_key(account_id=account_id),
+            value_type=CachedAccount,
+            loader=loader,
+        )
+        assert account is not None
+        return account
+
+    def discard_account(self, account_id: Optional[str] = None) -> None:
+        """Discard the local entries of an account and of its tokens, or all the entries if no account is provided."""
+        self._generation += 1
+        if account_id is None:
+            self._tokens.clear()
+            self._accounts.clear()
+            return
+
+        self._accounts.pop(account_id, None)
+        for key in [key for key, (_, token) in self._tokens.items() if token.account_id == account_id]:
+            del self._tokens[key]
+
+    def discard_token(self, token: str) -> None:
+        """Discard the local entry of an API token."""
+        self._generation += 1
+        self._tokens.pop(self._get_token_key(token=token), None)
+
+    async def invalidate_account(self, account_id: str) -> None:
+        """Discard the entries of an account and of its tokens, locally and in the shared cache."""
+        self.discard_account(account_id=account_id)
+        if not self.shared_cache:
+            return
+
+        await self._renew_shared_generation()
+        await self.shared_cache.delete(key=self._get_shared_account_key(account_id=account_id))
+        account_token_keys = await self.shared_cache.list_keys(
+            filter_pattern=self._get_shared_account_token_key(account_id=account_id, key="*")
+        )
+        for account_token_key in account_token_keys:
+            key = account_token_key.rsplit(":", 1)[-1]
+            await self.shared_cache.delete(key=self._get_shared_token_key(key=key))
+            await self.shared_cache.delete(key=account_token_key)
+
+    async def invalidate_token(self, token: str) -> None:
+        """Discard the entry of an API token, locally and in the shared cache."""
+        self.discard_token(token=token)
+        if not self.shared_cache:
+            return
+
+        await self._renew_shared_generation()
+        await self.shared_cache.delete(key=self._get_shared_token_key(key=self._get_token_key(token=token)))
+
+
+auth_cache = AuthCache()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Hashable
+
+
+class ComputedAttributeBatcher:
+    """Coalesce the objects to process for a computed attribute.
+
+    An object is processed right away when no batch is running for its key. Otherwise it is added to the next batch of
+    the key, which is processed as soon as the running one completes, so that the objects received while a batch is
+    running are processed together. Every request waits for the batch that contains its object and raises the error of
+    that batch if its processing failed.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Hashable, tuple[set[str], asyncio.Future[None]]] = {}
+        self._running: dict[Hashable, asyncio.Future[None]] = {}
+
+    async def process(self, key: Hashable, object_id: str, processor: Callable[[list[str]], Awaitable[None]]) -> None:
+        if key in self._pending:
+            pending_object_ids, pending_future = self._pending[key]
+            pending_object_ids.add(object_id)
+            await asyncio.shield(pending_future)
+            return
+
+        object_ids = {object_id}
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        # The error is raised by the request which processes the batch, it doesn't need to be retrieved from the future
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._pending[key] = (object_ids, future)
+        try:
+            while (running := self._running.get(key)) is not None:
+                await asyncio.wait({running})
+            del self._pending[key]
+            self._running[key] = future
+            try:
+                await processor(sorted(object_ids))
+            finally:
+                del self._running[key]
+        except BaseException as exc:
+            if self._pending.get(key, (None, None))[1] is future:
+                del self._pending[key]
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+            raise
+        future.set_result(None)
@@ -1,4 +1,5 @@
 from datetime import timedelta
+from functools import partial
 from typing import TYPE_CHECKING
 
 from prefect import flow
@@ -16,7 +17,7 @@ from infrahub.core.constants import ComputedAttributeKind, InfrahubKind
 from infrahub.core.registry import registry
 from infrahub.git.repository import get_initialized_repo
 from infrahub.services import services
-from infrahub.support.macro import MacroDefinition
+from infrahub.support.macro import get_macro_definition
 from infrahub.tasks.registry import refresh_branches
 from infrahub.workflows.catalogue import (
     PROCESS_COMPUTED_MACRO,
@@ -25,15 +26,19 @@ from infrahub.workflows.catalogue import (
 )
 from infrahub.workflows.utils import add_branch_tag
 
+from .batch import ComputedAttributeBatcher
 from .constants import (
     PROCESS_AUTOMATION_NAME,
     PROCESS_AUTOMATION_NAME_PREFIX,
+    PROCESS_JINJA2_BATCH_SIZE,
     QUERY_AUTOMATION_NAME,
     QUERY_AUTOMATION_NAME_PREFIX,
 )
 from .models import ComputedAttributeAutomations, PythonTransformComputedAttribute, PythonTransformTarget
 
 if TYPE_CHECKING:
+    from infrahub_sdk.node import InfrahubNode
+
     from infrahub.core.schema.computed_attribute import ComputedAttribute
 
 UPDATE_ATTRIBUTE = """
@@ -51,6 +56,8 @@ mutation UpdateAttribute(
 }
 """
 
+jinja2_batcher = ComputedAttributeBatcher()
+
 
 @flow(
     name="process_computed_attribute_transform",
@@ -143,6 +150,31 @@ async def process_jinja2(
     updated_fields: list[str] | None = None,
 ) -> None:
     """Request to the creation of git branches in available repositories."""
+
+    # The objects received by this worker for the same computed attribute while it is being processed are processed
+    # together in the next batch
+    await jinja2_batcher.process(
+        key=(branch_name, node_kind, computed_attribute_kind, computed_attribute_name, tuple(updated_fields or [])),
+        object_id=object_id,
+        processor=partial(
+            process_jinja2_batch,
+            branch_name,
+            node_kind,
+            computed_attribute_name=computed_attribute_name,
+            computed_attribute_kind=computed_attribute_kind,
+            updated_fields=updated_fields,
+        ),
+    )
+
+
+async def process_jinja2_batch(
+    branch_name: str,
+    node_kind: str,
+    object_ids: list[str],
+    computed_attribute_name: str,
+    computed_attribute_kind: str,
+    updated_fields: list[str] | None = None,
+) -> None:
     log = get_run_logger()
     service = services.service
     schema_branch = registry.schema.get_schema_branch(name=branch_name)
@@ -155,13 +187,14 @@ async def process_jinja2(
         if attrib.kind == computed_attribute_kind and attrib.attribute.name == computed_attribute_name
     ]
     for computed_macro in computed_macros:
-        found = []
+        found: dict[str, InfrahubNode] = {}
         for id_filter in computed_macro.node_filters:
-            filters = {id_filter: object_id}
-            nodes = await service.client.filters(
-                kind=computed_macro.kind, prefetch_relationships=True, populate_store=True, **filters
-            )
-            found.extend(nodes)
+            for offset in range(0, len(object_ids), PROCESS_JINJA2_BATCH_SIZE):
+                filters = {id_filter: object_ids[offset : offset + PROCESS_JINJA2_BATCH_SIZE]}
+                nodes = await service.client.filters(
+                    kind=computed_macro.kind, prefetch_relationships=True, populate_store=True, **filters
+                )
+                found.update({node.id: node for node in nodes})
 
         if not found:
             log.debug("No nodes found that requires updates")
@@ -169,8 +202,9 @@ async def process_jinja2(
         template_string = "n/a"
         if computed_macro.attribute.computed_attribute and computed_macro.attribute.computed_attribute.jinja2_template:
             template_string = computed_macro.attribute.computed_attribute.jinja2_template
-        macro_definition = MacroDefinition(macro=template_string)
-        for node in found:
+        macro_definition = get_macro_definition(macro=template_string)
+        updates: dict[str, str] = {}
+        for node in found.values():
             my_filter = {}
             for variable in macro_definition.variables:
                 components = variable.split("__")
@@ -195,20 +229,38 @@ async def process_jinja2(
             if value == existing_value:
                 log.debug(f"Ignoring to update {node} with existing value on {computed_macro.attribute.name}={value}")
                 continue
+            updates[node.id] = value
 
-            await service.client.execute_graphql(
-                query=UPDATE_ATTRIBUTE,
-                variables={
-                    "id": node.id,
-                    "kind": computed_macro.kind,
-                    "attribute": computed_macro.attribute.name,
-                    "value": value,
-                },
-                branch_name=branch_name,
-            )
-            log.info(
-                f"Updating computed attribute {computed_attribute_kind}.{computed_attribute_name}='{value}' ({node.id})"
+        node_ids = list(updates)
+        for offset in range(0, len(node_ids), PROCESS_JINJA2_BATCH_SIZE):
+            batch = {node_id: updates[node_id] for node_id in node_ids[offset : offset + PROCESS_JINJA2_BATCH_SIZE]}
+            query, variables = build_update_attributes_query(
+                kind=computed_macro.kind, attribute=computed_macro.attribute.name, values=batch
             )
+            await service.client.execute_graphql(query=query, variables=variables, branch_name=branch_name)
+            for node_id, value in batch.items():
+                log.info(
+                    f"Updating computed attribute {computed_attribute_kind}.{computed_attribute_name}='{value}' ({node_id})"
+                )
+
+
+def build_update_attributes_query(kind: str, attribute: str, values: dict[str, str]) -> tuple[str, dict[str, str]]:
+    """Build a single mutation updating the value of a computed attribute on several nodes of the same kind."""
+    variables = {"kind": kind, "attribute": attribute}
+    arguments = ["$kind: String!", "$attribute: String!"]
+    mutations = []
+    for idx, (node_id, value) in enumerate(values.items()):
+        variables[f"id{idx}"] = node_id
+        variables[f"value{idx}"] = value
+        arguments.extend([f"$id{idx}: String!", f"$value{idx}: String!"])
+        mutations.append(
+            f"  update{idx}: InfrahubUpdateComputedAttribute(\n"
+            f"    data: {{id: $id{idx}, attribute: $attribute, value: $value{idx}, kind: $kind}}\n"
+            "  ) {\n    ok\n  }"
+        )
+
+    query = "mutation UpdateAttributes(" + ", ".join(arguments) + ") {\n" + "\n".join(mutations) + "\n}\n"
+    return query, variables
 
 
 @flow(name="computed-attribute-setup", flow_run_name="Setup computed attributes in task-manager")
@@ -133,6 +133,11 @@ class MainSettings(BaseSettings):
         default=["infrahub.permissions.LocalPermissionBackend"],
         description="List of modules to handle permissions, they will be run in the given order",
     )
+    permission_cache_ttl: int = Field(
+        default=60,
+        ge=0,
+        description="Number of seconds the permissions of an account are kept in cache, 0 disables the cache",
+    )
 
 
 class FileSystemStorageSettings(BaseSettings):
@@ -212,6 +217,11 @@ class DatabaseSettings(BaseSettings):
         le=20,
         description="Maximum number of level to search in a hierarchy.",
     )
+    max_nodes_per_create_query: int = Field(
+        default=500,
+        ge=1,
+        description="Maximum number of nodes created with a single query by the bulk operations.",
+    )
     retry_limit: int = Field(
         default=3, description="Maximum number of times a transient issue in a transaction should be retried."
     )
@@ -254,6 +264,9 @@ class BrokerSettings(BaseSettings):
     maximum_concurrent_messages: int = Field(
         default=2, description="The maximum number of concurrent messages fetched by each worker", ge=1
     )
+    maximum_concurrent_publishes: int = Field(
+        default=500, description="The maximum number of messages of a batch published without waiting for an ack", ge=1
+    )
     virtualhost: str = Field(default="/", description="The virtual host to connect to")
     driver: BrokerDriver = BrokerDriver.RabbitMQ
 
@@ -326,6 +339,14 @@ class ApiSettings(BaseSettings):
     cors_allow_credentials: bool = Field(
         default=True, description="If True, cookies will be allowed to be included in cross-site HTTP requests"
     )
+    graphql_batch_max_operations: int = Field(
+        default=50, ge=1, description="Maximum number of operations accepted in a batched GraphQL request"
+    )
+    graphql_batch_max_concurrency: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of read-only operations of a batched GraphQL request executed concurrently",
+    )
 
 
 class GitSettings(BaseSettings):
@@ -558,6 +579,18 @@ class SecuritySettings(BaseSettings):
     secret_key: str = Field(
         default_factory=generate_uuid, description="The secret key used to validate authentication tokens"
     )
+    token_cache_ttl: int = Field(
+        default=10,
+        ge=0,
+        description="Number of seconds the validated API tokens and the status of the accounts are kept in cache, 0 disables the cache",
+    )
+    token_cache_size: int = Field(
+        default=10000, ge=1, description="Maximum number of API tokens and of accounts kept in the cache of each worker"
+    )
+    token_cache_shared: bool = Field(
+        default=False,
+        description="Share the validated API tokens and the status of the accounts between the API servers through the cache",
+    )
     oauth2_providers: list[Oauth2Provider] = Field(default_factory=list, description="The selected OAuth2 providers")
     oauth2_provider_settings: SecurityOAuth2ProviderSettings = Field(default_factory=SecurityOAuth2ProviderSettings)
     oidc_providers: list[OIDCProvider] = Field(default_factory=list, description="The selected OIDC providers")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import ipaddress
 import re
 from enum import Enum
@@ -34,6 +35,7 @@ from .constants.relationship_label import RELATIONSHIP_TO_NODE_LABEL, RELATIONSH
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.node import Node
+    from infrahub.core.query import QueryResult
     from infrahub.core.schema import AttributeSchema
     from infrahub.database import InfrahubDatabase
 
@@ -108,6 +110,7 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         self.is_default = is_default
         self.is_from_profile = is_from_profile
         self.from_pool: Optional[dict] = None
+        self._state: Optional[tuple[Any, ...]] = None
 
         self._init_node_property_mixin(kwargs)
         self._init_flag_property_mixin(kwargs)
@@ -138,9 +141,11 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
             self.value = data
 
         # Assign default values
+        has_assigned_default = False
         if self.value is None and self.schema.default_value is not None:
             self.value = self.schema.default_value
             self.is_default = True
+            has_assigned_default = True
 
         if self.value is not None:
             self.validate(value=self.value, name=self.name, schema=self.schema)
@@ -154,10 +159,36 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         if self.is_visible is None:
             self.is_visible = True
 
+        # An attribute loaded from the database is unchanged, unless its default value was assigned above
+        if isinstance(data, AttributeFromDB) and not has_assigned_default:
+            self.clear_changes()
+
     @property
     def is_enum(self) -> bool:
         return bool(self.schema.enum)
 
+    @property
+    def is_dirty(self) -> bool:
+        """Indicate if the attribute has been modified since it was last loaded from or saved to the database.
+
+        An attribute that hasn't been loaded from the database is always considered modified.
+        """
+        return self._state is None or self._state != self._get_state()
+
+    def _get_state(self) -> tuple[Any, ...]:
+        value = copy.deepcopy(self.value) if isinstance(self.value, (dict, list)) else self.value
+        return (
+            value,
+            self.is_default,
+            self.is_from_profile,
+            *[getattr(self, prop_name) for prop_name in self._flag_properties],
+            *[getattr(self, f"{prop_name}_id") for prop_name in self._node_properties],
+        )
+
+    def clear_changes(self) -> None:
+        """Consider the current state of the attribute as the one stored in the database."""
+        self._state = self._get_state()
+
     def get_branch_based_on_support_type(self) -> Branch:
         """If the attribute is branch aware, return the Branch object associated with this attribute
         If the attribute is branch agnostic return the Global Branch
@@ -326,7 +357,9 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         if not self.id or self.is_from_profile:
             return False
 
-        return await self._update(at=save_at, db=db)
+        updated = await self._update(at=save_at, db=db)
+        self.clear_changes()
+        return updated
 
     async def delete(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> bool:
         if not self.db_id:
@@ -392,19 +425,7 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
 
         update_at = Timestamp(at)
 
-        # Validate if the value is still correct, will raise a ValidationError if not
-        self.validate(value=self.value, name=self.name, schema=self.schema)
-
-        # Check if the current value is still the default one
-        if self.is_default:
-            if isinstance(self.value, Enum):
-                has_default_value = self.schema.default_value == self.value.value
-            else:
-                has_default_value = self.schema.default_value == self.value
-            if (self.schema.default_value is not None and not has_default_value) or (
-                self.schema.default_value is None and self.value is not None
-            ):
-                self.is_default = False
+        self._prepare_update()
 
         query = await NodeListGetAttributeQuery.init(
             db=db,
@@ -431,6 +452,40 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
             if rel.get("branch") == branch.name:
                 await update_relationships_to([rel.element_id], to=update_at, db=db)
 
+        await self._update_properties(
+            db=db, at=update_at, current_attr_data=current_attr_data, current_attr_result=current_attr_result
+        )
+
+        return True
+
+    def _prepare_update(self) -> None:
+        """Validate the value before an update and check if it is still the default one."""
+
+        # Validate if the value is still correct, will raise a ValidationError if not
+        self.validate(value=self.value, name=self.name, schema=self.schema)
+
+        # Check if the current value is still the default one
+        if self.is_default:
+            if isinstance(self.value, Enum):
+                has_default_value = self.schema.default_value == self.value.value
+            else:
+                has_default_value = self.schema.default_value == self.value
+            if (self.schema.default_value is not None and not has_default_value) or (
+                self.schema.default_value is None and self.value is not None
+            ):
+                self.is_default = False
+
+    async def _update_properties(
+        self,
+        db: InfrahubDatabase,
+        at: Timestamp,
+        current_attr_data: AttributeFromDB,
+        current_attr_result: QueryResult,
+    ) -> None:
+        """Update the flags and the node properties of the attribute that differ from the ones in the database."""
+
+        branch = self.get_branch_based_on_support_type()
+
         # ---------- Update the Flags ----------
         SUPPORTED_FLAGS = (
             ("is_visible", "isv", "rel_isv"),
@@ -439,12 +494,12 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
 
         for flag_name, _, rel_name in SUPPORTED_FLAGS:
             if current_attr_data.flag_properties[flag_name] != getattr(self, flag_name):
-                query = await AttributeUpdateFlagQuery.init(db=db, attr=self, at=update_at, flag_name=flag_name)
+                query = await AttributeUpdateFlagQuery.init(db=db, attr=self, at=at, flag_name=flag_name)
                 await query.execute(db=db)
 
                 rel = current_attr_result.get(rel_name)
                 if rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
+                    await update_relationships_to([rel.element_id], to=at, db=db)
 
         # ---------- Update the Node Properties ----------
         for prop_name in self._node_properties:
@@ -453,15 +508,13 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
                 and current_attr_data.node_properties[prop_name].uuid == getattr(self, f"{prop_name}_id")
             ):
                 query = await AttributeUpdateNodePropertyQuery.init(
-                    db=db, attr=self, at=update_at, prop_name=prop_name, prop_id=getattr(self, f"{prop_name}_id")
+                    db=db, attr=self, at=at, prop_name=prop_name, prop_id=getattr(self, f"{prop_name}_id")
                 )
                 await query.execute(db=db)
 
                 rel = current_attr_result.get(f"rel_{prop_name}")
                 if rel and rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
-
-        return True
+                    await update_relationships_to([rel.element_id], to=at, db=db)
 
     async def to_graphql(
         self,
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from infrahub.core.branch import Branch
 from infrahub.core.node import Node
@@ -29,6 +29,9 @@ class NodeConstraintRunner:
         for node_constraint in self.node_constraints:
             await node_constraint.check(node, filters=field_filters)
 
+        await self._check_relationships(node=node, field_filters=field_filters)
+
+    async def _check_relationships(self, node: Node, field_filters: Optional[list[str]] = None) -> None:
         for relationship_name in node.get_schema().relationship_names:
             if field_filters and relationship_name not in field_filters:
                 continue
@@ -36,3 +39,18 @@ class NodeConstraintRunner:
             await relationship_manager.fetch_relationship_ids(db=self.db, force_refresh=True)
             for relationship_constraint in self.relationship_manager_constraints:
                 await relationship_constraint.check(relm=relationship_manager, node_schema=node.get_schema())
+
+    async def check_many(self, nodes: Sequence[Node], field_filters: Optional[list[str]] = None) -> None:
+        """Check the constraints of nodes that are saved together.
+
+        The node constraints validate the whole batch at once, which also covers the conflicts between
+        the nodes of the batch, the relationship constraints are checked node by node.
+        """
+        for node in nodes:
+            await node.resolve_relationships(db=self.db)
+
+        for node_constraint in self.node_constraints:
+            await node_constraint.check_many(nodes, filters=field_filters)
+
+        for node in nodes:
+            await self._check_relationships(node=node, field_filters=field_filters)
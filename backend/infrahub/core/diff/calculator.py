@@ -39,8 +39,7 @@ class DiffCalculator:
             diff_from=from_time,
             diff_to=to_time,
         )
-        await branch_diff_query.execute(db=self.db)
-        for query_result in branch_diff_query.get_results():
+        async for query_result in branch_diff_query.execute_stream(db=self.db):
             diff_parser.read_result(query_result=query_result)
 
         if base_branch.name != diff_branch.name:
@@ -59,8 +58,7 @@ class DiffCalculator:
                 ],
                 new_node_field_specifiers=[(nfs.node_uuid, nfs.field_name) for nfs in new_node_field_specifiers],
             )
-            await base_diff_query.execute(db=self.db)
-            for query_result in base_diff_query.get_results():
+            async for query_result in base_diff_query.execute_stream(db=self.db):
                 diff_parser.read_result(query_result=query_result)
 
         diff_parser.parse()
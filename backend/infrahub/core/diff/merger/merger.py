@@ -1,21 +1,35 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import time
+from typing import TYPE_CHECKING, AsyncGenerator, AsyncIterator
 
 from infrahub.core import registry
 from infrahub.core.diff.model.path import BranchTrackingId
 from infrahub.core.diff.query.merge import DiffMergePropertiesQuery, DiffMergeQuery, DiffMergeRollbackQuery
 
+from .metrics import (
+    MERGE_NODES_THROUGHPUT_METRICS,
+    MERGE_PROPERTIES_THROUGHPUT_METRICS,
+    MERGED_NODES_METRICS,
+    MERGED_PROPERTIES_METRICS,
+)
+
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.core.diff.model.path import CardinalityOneConflictPeer, EnrichedDiffNode, EnrichedDiffRoot
     from infrahub.core.diff.repository.repository import DiffRepository
     from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
+    from .model import AttributePropertyMergeDict, NodeMergeDict, RelationshipPropertyMergeDict
     from .serializer import DiffMergeSerializer
 
 
 class DiffMerger:
+    # number of diff nodes retrieved from the database at once
+    NODE_PAGE_SIZE: int = 1000
+
     def __init__(
         self,
         db: InfrahubDatabase,
@@ -41,31 +55,106 @@ class DiffMerger:
                 latest_diff = diff
         if latest_diff is None:
             raise RuntimeError(f"Missing diff for branch {self.source_branch.name}")
-        enriched_diff = await self.diff_repository.get_one(
-            diff_branch_name=self.source_branch.name, diff_id=latest_diff.uuid
-        )
-        async for node_diff_dicts, property_diff_dicts in self.serializer.serialize_diff(diff=enriched_diff):
-            merge_query = await DiffMergeQuery.init(
-                db=self.db,
-                branch=self.source_branch,
-                at=at,
-                target_branch=self.destination_branch,
-                node_diff_dicts=node_diff_dicts,
-            )
-            await merge_query.execute(db=self.db)
-            merge_properties_query = await DiffMergePropertiesQuery.init(
-                db=self.db,
-                branch=self.source_branch,
-                at=at,
-                target_branch=self.destination_branch,
-                property_diff_dicts=property_diff_dicts,
-            )
-            await merge_properties_query.execute(db=self.db)
+        conflict_peers = await self.diff_repository.get_cardinality_one_conflict_peers(diff_id=latest_diff.uuid)
+        if self.db.is_transaction:
+            # queries of a transaction cannot be executed concurrently
+            await self._merge_diff(diff=latest_diff, conflict_peers=conflict_peers, at=at, read_db=self.db)
+        else:
+            async with self.db.start_session(read_only=True) as read_db:
+                await self._merge_diff(diff=latest_diff, conflict_peers=conflict_peers, at=at, read_db=read_db)
 
         self.source_branch.branched_from = at.to_string()
         await self.source_branch.save(db=self.db)
         registry.branch[self.source_branch.name] = self.source_branch
 
+    async def _merge_diff(
+        self,
+        diff: EnrichedDiffRoot,
+        conflict_peers: list[CardinalityOneConflictPeer],
+        at: Timestamp,
+        read_db: InfrahubDatabase,
+    ) -> None:
+        """Merge the diff batch by batch
+
+        The next page of the diff is retrieved on read_db and serialized into the next pair of queries while the
+        current pair is executed, unless both run on the same session.
+        """
+        pipelined = read_db is not self.db
+        batches = self.serializer.serialize_diff(
+            diff=diff, node_pages=self._get_node_pages(diff=diff, read_db=read_db), conflict_peers=conflict_peers
+        )
+        num_nodes = num_properties = 0
+        start_time = time.monotonic()
+        next_batch: asyncio.Task[tuple[DiffMergeQuery, DiffMergePropertiesQuery, int, int] | None] | None = None
+        try:
+            batch = await self._prepare_batch(batches=batches, at=at)
+            while batch:
+                merge_query, merge_properties_query, batch_num_nodes, batch_num_properties = batch
+                if pipelined:
+                    next_batch = asyncio.create_task(self._prepare_batch(batches=batches, at=at))
+                await merge_query.execute(db=self.db)
+                await merge_properties_query.execute(db=self.db)
+                num_nodes += batch_num_nodes
+                num_properties += batch_num_properties
+                MERGED_NODES_METRICS.inc(batch_num_nodes)
+                MERGED_PROPERTIES_METRICS.inc(batch_num_properties)
+                batch = await next_batch if next_batch else await self._prepare_batch(batches=batches, at=at)
+        finally:
+            if next_batch and not next_batch.done():
+                next_batch.cancel()
+                await asyncio.gather(next_batch, return_exceptions=True)
+            await batches.aclose()
+
+        duration = time.monotonic() - start_time
+        if duration > 0:
+            MERGE_NODES_THROUGHPUT_METRICS.observe(num_nodes / duration)
+            MERGE_PROPERTIES_THROUGHPUT_METRICS.observe(num_properties / duration)
+
+    async def _get_node_pages(
+        self, diff: EnrichedDiffRoot, read_db: InfrahubDatabase
+    ) -> AsyncGenerator[set[EnrichedDiffNode], None]:
+        offset = 0
+        while True:
+            nodes = await self.diff_repository.get_node_page(
+                base_branch_name=diff.base_branch_name,
+                diff_branch_name=diff.diff_branch_name,
+                diff_id=diff.uuid,
+                limit=self.NODE_PAGE_SIZE,
+                offset=offset,
+                db=read_db,
+            )
+            yield nodes
+            if len(nodes) < self.NODE_PAGE_SIZE:
+                return
+            offset += self.NODE_PAGE_SIZE
+
+    async def _prepare_batch(
+        self,
+        batches: AsyncIterator[
+            tuple[list[NodeMergeDict], list[AttributePropertyMergeDict | RelationshipPropertyMergeDict]]
+        ],
+        at: Timestamp,
+    ) -> tuple[DiffMergeQuery, DiffMergePropertiesQuery, int, int] | None:
+        try:
+            node_diff_dicts, property_diff_dicts = await batches.__anext__()
+        except StopAsyncIteration:
+            return None
+        merge_query = await DiffMergeQuery.init(
+            db=self.db,
+            branch=self.source_branch,
+            at=at,
+            target_branch=self.destination_branch,
+            node_diff_dicts=node_diff_dicts,
+        )
+        merge_properties_query = await DiffMergePropertiesQuery.init(
+            db=self.db,
+            branch=self.source_branch,
+            at=at,
+            target_branch=self.destination_branch,
+            property_diff_dicts=property_diff_dicts,
+        )
+        return (merge_query, merge_properties_query, len(node_diff_dicts), len(property_diff_dicts))
+
     async def rollback(self, at: Timestamp) -> None:
         rollback_query = await DiffMergeRollbackQuery.init(
             db=self.db, branch=self.source_branch, target_branch=self.destination_branch, at=at
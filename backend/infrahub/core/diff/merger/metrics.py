@@ -0,0 +1,22 @@
+from prometheus_client import Counter, Histogram
+
+METRIC_PREFIX = "infrahub_diff_merge"
+
+MERGED_NODES_METRICS = Counter(
+    f"{METRIC_PREFIX}_nodes",
+    "Number of diff nodes merged into the destination branch",
+)
+MERGED_PROPERTIES_METRICS = Counter(
+    f"{METRIC_PREFIX}_properties",
+    "Number of diff properties merged into the destination branch",
+)
+MERGE_NODES_THROUGHPUT_METRICS = Histogram(
+    f"{METRIC_PREFIX}_nodes_per_second",
+    "Number of diff nodes merged per second, measured over a complete merge",
+    buckets=[10, 50, 100, 250, 500, 1000, 2500, 5000, 10000],
+)
+MERGE_PROPERTIES_THROUGHPUT_METRICS = Histogram(
+    f"{METRIC_PREFIX}_properties_per_second",
+    "Number of diff properties merged per second, measured over a complete merge",
+    buckets=[10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000],
+)
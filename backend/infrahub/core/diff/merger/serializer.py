@@ -1,6 +1,6 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator, Iterable
 
-from infrahub.core.constants import DiffAction, RelationshipCardinality
+from infrahub.core.constants import DiffAction
 from infrahub.core.constants.database import DatabaseEdgeType
 from infrahub.core.schema import MainSchemaTypes
 from infrahub.database import InfrahubDatabase
@@ -8,9 +8,11 @@ from infrahub.exceptions import SchemaNotFoundError
 from infrahub.types import ATTRIBUTE_PYTHON_TYPES
 
 from ..model.path import (
+    CardinalityOneConflictPeer,
     ConflictSelection,
     EnrichedDiffAttribute,
     EnrichedDiffConflict,
+    EnrichedDiffNode,
     EnrichedDiffProperty,
     EnrichedDiffRoot,
     EnrichedDiffSingleRelationship,
@@ -41,6 +43,7 @@ class DiffMergeSerializer:
     def _reset_caches(self) -> None:
         self._relationship_id_cache = {}
         self._attribute_type_cache = {}
+        self._conflicted_cardinality_one_relationships = set()
 
     @property
     def source_branch_name(self) -> str:
@@ -121,77 +124,83 @@ class DiffMergeSerializer:
             return value_type(raw_value)
         return raw_value
 
-    def _cache_conflicted_cardinality_one_relationships(self, diff: EnrichedDiffRoot) -> None:
-        for node in diff.nodes:
-            for rel in node.relationships:
-                if rel.cardinality is not RelationshipCardinality.ONE:
-                    continue
-                for element in rel.relationships:
-                    if element.conflict is None:
-                        continue
-                    for prop in element.properties:
-                        if prop.property_type is not DatabaseEdgeType.IS_RELATED:
-                            continue
-                        relationship_identifier = self._get_relationship_identifier(
-                            schema_kind=node.kind, relationship_name=rel.name
-                        )
-                        if prop.previous_value:
-                            self._conflicted_cardinality_one_relationships.add(
-                                (node.uuid, relationship_identifier, prop.previous_value)
-                            )
-                        if prop.new_value:
-                            self._conflicted_cardinality_one_relationships.add(
-                                (node.uuid, relationship_identifier, prop.new_value)
-                            )
+    def _cache_conflicted_cardinality_one_relationships(
+        self, conflict_peers: Iterable[CardinalityOneConflictPeer]
+    ) -> None:
+        for conflict_peer in conflict_peers:
+            relationship_identifier = self._get_relationship_identifier(
+                schema_kind=conflict_peer.node_kind, relationship_name=conflict_peer.relationship_name
+            )
+            self._conflicted_cardinality_one_relationships.add(
+                (conflict_peer.node_uuid, relationship_identifier, conflict_peer.peer_id)
+            )
 
     async def serialize_diff(
-        self, diff: EnrichedDiffRoot
+        self,
+        diff: EnrichedDiffRoot,
+        node_pages: AsyncIterator[Iterable[EnrichedDiffNode]],
+        conflict_peers: Iterable[CardinalityOneConflictPeer],
     ) -> AsyncGenerator[
         tuple[list[NodeMergeDict], list[AttributePropertyMergeDict | RelationshipPropertyMergeDict]], None
     ]:
+        """Serialize the nodes of the diff in batches of at most max_batch_size nodes
+
+        The nodes are consumed page by page from node_pages so that the whole diff never has to be held in memory.
+        conflict_peers must cover the whole diff because a conflict on one node affects how its peers are merged.
+        """
         self._reset_caches()
         self._source_branch_name = diff.diff_branch_name
         self._target_branch_name = diff.base_branch_name
-        self._cache_conflicted_cardinality_one_relationships(diff=diff)
+        self._cache_conflicted_cardinality_one_relationships(conflict_peers=conflict_peers)
         serialized_node_diffs = []
         serialized_property_diffs: list[AttributePropertyMergeDict | RelationshipPropertyMergeDict] = []
-        for node in diff.nodes:
-            node_action = self._get_action(action=node.action, conflict=node.conflict)
-            serial_attr_diffs = []
-            for attr_diff in node.attributes:
-                serial_attr_diff, attribute_property_diff = self._serialize_attribute(
-                    attribute_diff=attr_diff, node_uuid=node.uuid, node_kind=node.kind
-                )
-                if serial_attr_diff:
-                    serial_attr_diffs.append(serial_attr_diff)
-                serialized_property_diffs.append(attribute_property_diff)
-            relationship_diffs = []
-            for rel_diff in node.relationships:
-                relationship_identifier = self._get_relationship_identifier(
-                    schema_kind=node.kind, relationship_name=rel_diff.name
-                )
-                for relationship_element_diff in rel_diff.relationships:
-                    element_diffs, relationship_property_diffs = self._serialize_relationship_element(
-                        relationship_diff=relationship_element_diff,
-                        relationship_identifier=relationship_identifier,
-                        node_uuid=node.uuid,
-                    )
-                    relationship_diffs.extend(element_diffs)
-                    serialized_property_diffs.extend(relationship_property_diffs)
-            if node_action in (DiffAction.ADDED, DiffAction.REMOVED) or serial_attr_diffs or relationship_diffs:
-                serialized_node_diffs.append(
-                    NodeMergeDict(
-                        uuid=node.uuid,
-                        action=self._to_action_str(action=node_action),
-                        attributes=serial_attr_diffs,
-                        relationships=relationship_diffs,
-                    )
-                )
-            if len(serialized_node_diffs) == self.max_batch_size:
-                yield (serialized_node_diffs, serialized_property_diffs)
-                serialized_node_diffs, serialized_property_diffs = [], []
+        async for nodes in node_pages:
+            for node in nodes:
+                serialized_node_diff, node_property_diffs = self._serialize_node(node=node)
+                serialized_property_diffs.extend(node_property_diffs)
+                if serialized_node_diff:
+                    serialized_node_diffs.append(serialized_node_diff)
+                if len(serialized_node_diffs) == self.max_batch_size:
+                    yield (serialized_node_diffs, serialized_property_diffs)
+                    serialized_node_diffs, serialized_property_diffs = [], []
         yield (serialized_node_diffs, serialized_property_diffs)
 
+    def _serialize_node(
+        self, node: EnrichedDiffNode
+    ) -> tuple[NodeMergeDict | None, list[AttributePropertyMergeDict | RelationshipPropertyMergeDict]]:
+        serialized_property_diffs: list[AttributePropertyMergeDict | RelationshipPropertyMergeDict] = []
+        node_action = self._get_action(action=node.action, conflict=node.conflict)
+        serial_attr_diffs = []
+        for attr_diff in node.attributes:
+            serial_attr_diff, attribute_property_diff = self._serialize_attribute(
+                attribute_diff=attr_diff, node_uuid=node.uuid, node_kind=node.kind
+            )
+            if serial_attr_diff:
+                serial_attr_diffs.append(serial_attr_diff)
+            serialized_property_diffs.append(attribute_property_diff)
+        relationship_diffs = []
+        for rel_diff in node.relationships:
+            relationship_identifier = self._get_relationship_identifier(
+                schema_kind=node.kind, relationship_name=rel_diff.name
+            )
+            for relationship_element_diff in rel_diff.relationships:
+                element_diffs, relationship_property_diffs = self._serialize_relationship_element(
+                    relationship_diff=relationship_element_diff,
+                    relationship_identifier=relationship_identifier,
+                    node_uuid=node.uuid,
+                )
+                relationship_diffs.extend(element_diffs)
+                serialized_property_diffs.extend(relationship_property_diffs)
+        if node_action in (DiffAction.ADDED, DiffAction.REMOVED) or serial_attr_diffs or relationship_diffs:
+            serialized_node_diff = NodeMergeDict(
+                uuid=node.uuid,
+                action=self._to_action_str(action=node_action),
+                attributes=serial_attr_diffs,
+                relationships=relationship_diffs,
+            )
+            return (serialized_node_diff, serialized_property_diffs)
+        return (None, serialized_property_diffs)
+
     def _get_property_actions_and_values(
         self, property_diff: EnrichedDiffProperty, python_value_type: type
     ) -> list[tuple[DiffAction, Primitives]]:
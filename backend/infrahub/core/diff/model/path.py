@@ -96,6 +96,16 @@ class NodeDiffFieldSummary:
     relationship_names: set[str] = field(default_factory=set)
 
 
+@dataclass(frozen=True)
+class CardinalityOneConflictPeer:
+    """Peer of a conflicted relationship element of cardinality one."""
+
+    node_uuid: str
+    node_kind: str
+    relationship_name: str
+    peer_id: str
+
+
 @dataclass
 class BaseSummary:
     num_added: int = field(default=0, kw_only=True)
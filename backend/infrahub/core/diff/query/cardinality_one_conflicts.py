@@ -0,0 +1,56 @@
+from typing import Any
+
+from infrahub.core.constants import RelationshipCardinality
+from infrahub.core.constants.database import DatabaseEdgeType
+from infrahub.core.query import Query, QueryType
+from infrahub.database import InfrahubDatabase
+
+from ..model.path import CardinalityOneConflictPeer
+
+
+class EnrichedDiffCardinalityOneConflictsQuery(Query):
+    """
+    Get the peers of every conflicted relationship element of cardinality one in a diff
+    """
+
+    name = "enriched_diff_cardinality_one_conflicts"
+    type = QueryType.READ
+
+    def __init__(self, diff_id: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.diff_id = diff_id
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params = {
+            "diff_id": self.diff_id,
+            "cardinality_one": RelationshipCardinality.ONE.value,
+            "is_related": DatabaseEdgeType.IS_RELATED.value,
+        }
+        query = """
+        MATCH (:DiffRoot {uuid: $diff_id})-[:DIFF_HAS_NODE]->(diff_node:DiffNode)
+            -[:DIFF_HAS_RELATIONSHIP]->(diff_relationship:DiffRelationship {cardinality: $cardinality_one})
+            -[:DIFF_HAS_ELEMENT]->(diff_rel_element:DiffRelationshipElement)
+        WHERE exists((diff_rel_element)-[:DIFF_HAS_CONFLICT]->(:DiffConflict))
+        MATCH (diff_rel_element)-[:DIFF_HAS_PROPERTY]->(diff_rel_property:DiffProperty {property_type: $is_related})
+        WITH
+            diff_node.uuid AS node_uuid,
+            diff_node.kind AS node_kind,
+            diff_relationship.name AS relationship_name,
+            [diff_rel_property.previous_value, diff_rel_property.new_value] AS peer_ids
+        UNWIND peer_ids AS peer_id
+        WITH DISTINCT node_uuid, node_kind, relationship_name, peer_id
+        WHERE peer_id IS NOT NULL AND peer_id <> ""
+        """
+        self.add_to_query(query=query)
+        self.return_labels = ["node_uuid", "node_kind", "relationship_name", "peer_id"]
+
+    def get_conflict_peers(self) -> list[CardinalityOneConflictPeer]:
+        return [
+            CardinalityOneConflictPeer(
+                node_uuid=result.get_as_type(label="node_uuid", return_type=str),
+                node_kind=result.get_as_type(label="node_kind", return_type=str),
+                relationship_name=result.get_as_type(label="relationship_name", return_type=str),
+                peer_id=result.get_as_type(label="peer_id", return_type=str),
+            )
+            for result in self.get_results()
+        ]
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from infrahub.core.query import Query, QueryType
@@ -89,7 +90,8 @@ class EnrichedNodeBatchCreateQuery(Query):
         self.node_create_batch = node_create_batch
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
-        self.params = self._build_node_batch_params()
+        # the parameters are built in a thread so that the next batch can be prepared while the previous one is saved
+        self.params = await asyncio.to_thread(self._build_node_batch_params)
         query = """
 UNWIND $node_details_list AS node_details
 WITH node_details.root_uuid AS root_uuid, node_details.node_map AS node_map
@@ -322,16 +324,12 @@ class EnrichedNodesLinkQuery(Query):
     type = QueryType.WRITE
     insert_return = False
 
-    def __init__(self, enriched_diffs: EnrichedDiffs, **kwargs: Any) -> None:
+    def __init__(self, node_links_list: list[dict[str, str]], **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self.enriched_diffs = enriched_diffs
+        self.node_links_list = node_links_list
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
-        parent_links_list = []
-        for diff_root in (self.enriched_diffs.base_branch_diff, self.enriched_diffs.diff_branch_diff):
-            for node in diff_root.nodes:
-                parent_links_list.extend(self._build_node_parent_links(enriched_node=node, root_uuid=diff_root.uuid))
-        self.params = {"node_links_list": parent_links_list}
+        self.params = {"node_links_list": self.node_links_list}
         query = """
 UNWIND $node_links_list AS node_link_details
 WITH
@@ -350,7 +348,24 @@ CALL {
         """
         self.add_to_query(query)
 
-    def _build_node_parent_links(self, enriched_node: EnrichedDiffNode, root_uuid: str) -> list[dict[str, str]]:
+    @classmethod
+    def get_node_links(cls, enriched_diffs: EnrichedDiffs) -> list[dict[str, str]]:
+        """Return the list of links between the parent and child nodes of both diffs, without duplicates."""
+        parent_links: dict[tuple[str, str, str, str], dict[str, str]] = {}
+        for diff_root in (enriched_diffs.base_branch_diff, enriched_diffs.diff_branch_diff):
+            for node in diff_root.nodes:
+                for parent_link in cls._build_node_parent_links(enriched_node=node, root_uuid=diff_root.uuid):
+                    link_key = (
+                        parent_link["root_uuid"],
+                        parent_link["parent_uuid"],
+                        parent_link["relationship_name"],
+                        parent_link["child_uuid"],
+                    )
+                    parent_links.setdefault(link_key, parent_link)
+        return list(parent_links.values())
+
+    @classmethod
+    def _build_node_parent_links(cls, enriched_node: EnrichedDiffNode, root_uuid: str) -> list[dict[str, str]]:
         if not enriched_node.relationships:
             return []
         parent_links = []
@@ -364,5 +379,5 @@ CALL {
                         "root_uuid": root_uuid,
                     }
                 )
-                parent_links.extend(self._build_node_parent_links(enriched_node=child_node, root_uuid=root_uuid))
+                parent_links.extend(cls._build_node_parent_links(enriched_node=child_node, root_uuid=root_uuid))
         return parent_links
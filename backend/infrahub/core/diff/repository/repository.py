@@ -1,3 +1,4 @@
+import asyncio
 from typing import Generator
 
 from infrahub import config
@@ -5,11 +6,14 @@ from infrahub.core import registry
 from infrahub.core.diff.query.field_summary import EnrichedDiffNodeFieldSummaryQuery
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase, retry_db_transaction
+from infrahub.database.metrics import QUERY_BATCH_SIZE_METRICS
 from infrahub.exceptions import ResourceNotFoundError
 
 from ..model.path import (
+    CardinalityOneConflictPeer,
     ConflictSelection,
     EnrichedDiffConflict,
+    EnrichedDiffNode,
     EnrichedDiffRoot,
     EnrichedDiffs,
     EnrichedNodeCreateRequest,
@@ -17,6 +21,7 @@ from ..model.path import (
     TimeRange,
     TrackingId,
 )
+from ..query.cardinality_one_conflicts import EnrichedDiffCardinalityOneConflictsQuery
 from ..query.delete_query import EnrichedDiffDeleteQuery
 from ..query.diff_get import EnrichedDiffGetQuery
 from ..query.diff_summary import DiffSummaryCounters, DiffSummaryQuery
@@ -30,7 +35,9 @@ from .deserializer import EnrichedDiffDeserializer
 
 
 class DiffRepository:
-    MAX_SAVE_BATCH_SIZE: int = 100
+    # maximum number of diff elements (nodes, attributes, relationships, properties and conflicts) saved per query
+    MAX_SAVE_BATCH_ELEMENTS: int = 2000
+    MAX_LINK_BATCH_SIZE: int = 5000
 
     def __init__(self, db: InfrahubDatabase, deserializer: EnrichedDiffDeserializer):
         self.db = db
@@ -73,6 +80,36 @@ class DiffRepository:
             diff_roots = [dr for dr in diff_roots if len(dr.nodes) > 0]
         return diff_roots
 
+    async def get_node_page(
+        self,
+        base_branch_name: str,
+        diff_branch_name: str,
+        diff_id: str,
+        limit: int,
+        offset: int = 0,
+        db: InfrahubDatabase | None = None,
+    ) -> set[EnrichedDiffNode]:
+        """Get one page of the nodes of a diff, without their parents
+
+        The query is executed on db if provided, so that the next page can be retrieved on another session
+        while the previous one is being processed.
+        """
+        db = db or self.db
+        query = await EnrichedDiffGetQuery.init(
+            db=db,
+            base_branch_name=base_branch_name,
+            diff_branch_names=[diff_branch_name],
+            max_depth=config.SETTINGS.database.max_depth_search_hierarchy,
+            limit=limit,
+            offset=offset,
+            diff_ids=[diff_id],
+        )
+        await query.execute(db=db)
+        diff_roots = await self.deserializer.deserialize(database_results=query.get_results(), include_parents=False)
+        if not diff_roots:
+            return set()
+        return diff_roots[0].nodes
+
     async def get_pairs(
         self,
         base_branch_name: str,
@@ -144,28 +181,73 @@ class DiffRepository:
             raise ResourceNotFoundError(f"Multiple diffs for {error_str}")
         return enriched_diffs[0]
 
+    @staticmethod
+    def _get_node_size(node: EnrichedDiffNode) -> int:
+        """Number of elements that will be created in the database to save this node, excluding its child nodes."""
+        size = 1 + int(node.conflict is not None)
+        for attribute in node.attributes:
+            size += 1 + sum(1 + int(prop.conflict is not None) for prop in attribute.properties)
+        for relationship in node.relationships:
+            size += 1
+            for element in relationship.relationships:
+                size += 1 + int(element.conflict is not None)
+                size += sum(1 + int(prop.conflict is not None) for prop in element.properties)
+        return size
+
     def _get_node_create_request_batch(
         self, enriched_diffs: EnrichedDiffs
-    ) -> Generator[list[EnrichedNodeCreateRequest], None, None]:
-        node_requests = []
+    ) -> Generator[tuple[list[EnrichedNodeCreateRequest], int], None, None]:
+        """Group the nodes in batches based on the number of elements to create instead of the number of nodes."""
+        node_requests: list[EnrichedNodeCreateRequest] = []
+        batch_size = 0
         for diff_root in (enriched_diffs.base_branch_diff, enriched_diffs.diff_branch_diff):
             for node in diff_root.nodes:
-                node_requests.append(EnrichedNodeCreateRequest(node=node, root_uuid=diff_root.uuid))
-                if len(node_requests) == self.MAX_SAVE_BATCH_SIZE:
-                    yield node_requests
+                node_size = self._get_node_size(node=node)
+                if node_requests and batch_size + node_size > self.MAX_SAVE_BATCH_ELEMENTS:
+                    yield node_requests, batch_size
                     node_requests = []
+                    batch_size = 0
+                node_requests.append(EnrichedNodeCreateRequest(node=node, root_uuid=diff_root.uuid))
+                batch_size += node_size
         if node_requests:
-            yield node_requests
+            yield node_requests, batch_size
 
     @retry_db_transaction(name="enriched_diff_save")
     async def save(self, enriched_diffs: EnrichedDiffs) -> None:
         root_query = await EnrichedDiffRootsCreateQuery.init(db=self.db, enriched_diffs=enriched_diffs)
         await root_query.execute(db=self.db)
-        for node_create_batch in self._get_node_create_request_batch(enriched_diffs=enriched_diffs):
-            node_query = await EnrichedNodeBatchCreateQuery.init(db=self.db, node_create_batch=node_create_batch)
-            await node_query.execute(db=self.db)
-        link_query = await EnrichedNodesLinkQuery.init(db=self.db, enriched_diffs=enriched_diffs)
-        await link_query.execute(db=self.db)
+        await self._save_nodes(enriched_diffs=enriched_diffs)
+        await self._save_node_links(enriched_diffs=enriched_diffs)
+
+    async def _save_nodes(self, enriched_diffs: EnrichedDiffs) -> None:
+        """Save the nodes in batches, the query for the next batch is prepared while the current one is executed."""
+        batches = self._get_node_create_request_batch(enriched_diffs=enriched_diffs)
+        next_batch = next(batches, None)
+        if next_batch is None:
+            return
+        next_query = asyncio.create_task(EnrichedNodeBatchCreateQuery.init(db=self.db, node_create_batch=next_batch[0]))
+        try:
+            while next_batch is not None:
+                node_query = await next_query
+                batch_size = next_batch[1]
+                next_batch = next(batches, None)
+                if next_batch is not None:
+                    next_query = asyncio.create_task(
+                        EnrichedNodeBatchCreateQuery.init(db=self.db, node_create_batch=next_batch[0])
+                    )
+                QUERY_BATCH_SIZE_METRICS.labels(query=node_query.name).observe(batch_size)
+                await node_query.execute(db=self.db)
+        finally:
+            if not next_query.done():
+                next_query.cancel()
+
+    async def _save_node_links(self, enriched_diffs: EnrichedDiffs) -> None:
+        node_links = EnrichedNodesLinkQuery.get_node_links(enriched_diffs=enriched_diffs)
+        for start in range(0, len(node_links), self.MAX_LINK_BATCH_SIZE):
+            node_links_batch = node_links[start : start + self.MAX_LINK_BATCH_SIZE]
+            link_query = await EnrichedNodesLinkQuery.init(db=self.db, node_links_list=node_links_batch)
+            QUERY_BATCH_SIZE_METRICS.labels(query=link_query.name).observe(len(node_links_batch))
+            await link_query.execute(db=self.db)
 
     async def summary(
         self,
@@ -221,6 +303,11 @@ class DiffRepository:
             diff_roots.append(self.deserializer.build_diff_root(root_node=neo4j_node))
         return diff_roots
 
+    async def get_cardinality_one_conflict_peers(self, diff_id: str) -> list[CardinalityOneConflictPeer]:
+        query = await EnrichedDiffCardinalityOneConflictsQuery.init(db=self.db, diff_id=diff_id)
+        await query.execute(db=self.db)
+        return query.get_conflict_peers()
+
     async def get_conflict_by_id(self, conflict_id: str) -> EnrichedDiffConflict:
         query = await EnrichedDiffConflictQuery.init(db=self.db, conflict_id=conflict_id)
         await query.execute(db=self.db)
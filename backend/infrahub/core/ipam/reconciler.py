@@ -1,16 +1,24 @@
 import ipaddress
+from collections import defaultdict
 from typing import TYPE_CHECKING, Optional, Union
 
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
-from infrahub.core.query.ipam import IPPrefixReconcileQuery
+from infrahub.core.query.ipam import (
+    IPNamespaceMembersFetch,
+    IPNamespaceParentsFetch,
+    IPNodesParentUpdate,
+    IPPrefixReconcileQuery,
+)
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import NodeNotFoundError
 
-from .constants import AllIPTypes
+from .constants import AllIPTypes, IPAddressType, IPNetworkType
+from .model import IpamNodeDetails
+from .tree import IpamTree
 
 if TYPE_CHECKING:
     from infrahub.core.relationship.model import RelationshipManager
@@ -80,6 +88,8 @@ class IPNodesToReconcile:
 
 
 class IpamReconciler:
+    page_size: int = 1000
+
     def __init__(self, db: InfrahubDatabase, branch: Branch) -> None:
         self.db = db
         self.branch = branch
@@ -151,6 +161,99 @@ class IpamReconciler:
 
         return reconcile_nodes.node
 
+    async def reconcile_many(self, ipam_node_details: list[IpamNodeDetails], at: Optional[Timestamp] = None) -> None:
+        """Reconcile many IP prefixes and IP addresses at once, for example after a large import or a branch merge.
+
+        Instead of running the reconcile query for every value, the IPAM tree of each namespace is loaded in memory,
+        the parent of every IP prefix and IP address is calculated in a single pass and the parent relationships that
+        changed are written in batched queries.
+        """
+        self.at = Timestamp(at)
+
+        details_by_namespace: dict[str, list[IpamNodeDetails]] = defaultdict(list)
+        for ipam_node_detail in ipam_node_details:
+            details_by_namespace[ipam_node_detail.namespace_id].append(ipam_node_detail)
+
+        for namespace_id, namespace_details in details_by_namespace.items():
+            await self._reconcile_namespace(namespace_id=namespace_id, ipam_node_details=namespace_details)
+
+    async def _reconcile_namespace(self, namespace_id: str, ipam_node_details: list[IpamNodeDetails]) -> None:
+        members_query = await IPNamespaceMembersFetch.init(
+            db=self.db, branch=self.branch, namespace=namespace_id, at=self.at
+        )
+        await members_query.execute(db=self.db)
+        prefixes: dict[str, IPNetworkType] = {str(prefix.id): prefix.prefix for prefix in members_query.get_prefixes()}
+        addresses: dict[str, IPAddressType] = {
+            str(address.id): address.address for address in members_query.get_addresses()
+        }
+
+        member_uuids = set(prefixes) | set(addresses)
+        # like for a single reconcile, the provided values take precedence over the ones in the database
+        deleted_uuids: set[str] = set()
+        for ipam_node_detail in ipam_node_details:
+            if not ipam_node_detail.is_delete and ipam_node_detail.node_uuid not in member_uuids:
+                node_type = InfrahubKind.IPADDRESS if ipam_node_detail.is_address else InfrahubKind.IPPREFIX
+                raise NodeNotFoundError(node_type=node_type, identifier=ipam_node_detail.ip_value)
+            if ipam_node_detail.is_delete:
+                deleted_uuids.add(ipam_node_detail.node_uuid)
+                prefixes.pop(ipam_node_detail.node_uuid, None)
+                addresses.pop(ipam_node_detail.node_uuid, None)
+            elif ipam_node_detail.is_address:
+                addresses[ipam_node_detail.node_uuid] = ipaddress.ip_interface(ipam_node_detail.ip_value)
+            else:
+                prefixes[ipam_node_detail.node_uuid] = ipaddress.ip_network(ipam_node_detail.ip_value)
+
+        tree = IpamTree.build(prefixes=prefixes.items(), addresses=addresses.items())
+
+        parents_query = await IPNamespaceParentsFetch.init(
+            db=self.db, branch=self.branch, namespace=namespace_id, at=self.at
+        )
+        await parents_query.execute(db=self.db)
+        current_parent_uuids = parents_query.get_parent_uuids()
+
+        new_parent_uuids: dict[str, Optional[str]] = {}
+        for node_uuid, calculated_parent_uuid in tree.get_parent_ids().items():
+            calculated_parent_uuids = {calculated_parent_uuid} if calculated_parent_uuid else set()
+            if current_parent_uuids.get(node_uuid, set()) != calculated_parent_uuids:
+                new_parent_uuids[node_uuid] = calculated_parent_uuid
+
+        await self._update_parents(
+            new_parent_uuids={
+                node_uuid: parent_uuid for node_uuid, parent_uuid in new_parent_uuids.items() if node_uuid in prefixes
+            },
+            is_address=False,
+        )
+        await self._update_parents(
+            new_parent_uuids={
+                node_uuid: parent_uuid for node_uuid, parent_uuid in new_parent_uuids.items() if node_uuid in addresses
+            },
+            is_address=True,
+        )
+        await self._delete_nodes(node_uuids=deleted_uuids)
+
+    async def _update_parents(self, new_parent_uuids: dict[str, Optional[str]], is_address: bool) -> None:
+        node_uuids = list(new_parent_uuids)
+        for offset in range(0, len(node_uuids), self.page_size):
+            query = await IPNodesParentUpdate.init(
+                db=self.db,
+                branch=self.branch,
+                parent_uuids={
+                    node_uuid: new_parent_uuids[node_uuid] for node_uuid in node_uuids[offset : offset + self.page_size]
+                },
+                is_address=is_address,
+                at=self.at,
+            )
+            await query.execute(db=self.db)
+
+    async def _delete_nodes(self, node_uuids: set[str]) -> None:
+        uuids = list(node_uuids)
+        for offset in range(0, len(uuids), self.page_size):
+            nodes = await NodeManager.get_many(
+                db=self.db, branch=self.branch, ids=uuids[offset : offset + self.page_size], at=self.at
+            )
+            for node in nodes.values():
+                await node.delete(db=self.db, at=self.at)
+
     async def _update_node_parent(self, node: Node, new_parent_uuid: Optional[str]) -> None:
         node_kinds = {node.get_kind()} | set(node.get_schema().inherit_from)
         is_prefix = False
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from infrahub.core.query.ipam import IPNamespaceMembersFetch
+
+from .constants import AllIPTypes, IPAddressType, IPNetworkType, PrefixMemberType
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.database import InfrahubDatabase
+
+MAX_PREFIXLEN = {4: 32, 6: 128}
+
+
+def _pack_address(ip_int: int, prefixlen: int) -> int:
+    """Store an IP address and its prefix length as a single integer to keep large trees compact."""
+    return (ip_int << 8) | prefixlen
+
+
+def _unpack_address(packed: int) -> tuple[int, int]:
+    return packed >> 8, packed & 0xFF
+
+
+def _to_interface(packed: int) -> IPAddressType:
+    ip_int, prefixlen = _unpack_address(packed)
+    return ipaddress.ip_interface((ip_int, prefixlen))
+
+
+def _get_mask(version: int, prefixlen: int) -> int:
+    max_prefixlen = MAX_PREFIXLEN[version]
+    return ((1 << prefixlen) - 1) << (max_prefixlen - prefixlen)
+
+
+@dataclass(eq=False)
+class IpamTreePrefix:
+    """IP prefix of an IpamTree along with its direct child prefixes and IP addresses."""
+
+    id: str
+    version: int
+    network_int: int
+    prefixlen: int
+    parent: Optional[IpamTreePrefix] = None
+    prefixes: dict[str, IpamTreePrefix] = field(default_factory=dict)
+    addresses: dict[str, int] = field(default_factory=dict)
+    # sum of the number of addresses covered by the direct child prefixes
+    used_prefix_space: int = 0
+
+    @property
+    def network(self) -> IPNetworkType:
+        return ipaddress.ip_network((self.network_int, self.prefixlen))
+
+    @property
+    def num_addresses(self) -> int:
+        return 2 ** (MAX_PREFIXLEN[self.version] - self.prefixlen)
+
+    def contains(self, ip_int: int, prefixlen: int) -> bool:
+        return prefixlen >= self.prefixlen and ip_int & _get_mask(self.version, self.prefixlen) == self.network_int
+
+    def add_prefix(self, prefix: IpamTreePrefix) -> None:
+        prefix.parent = self
+        self.prefixes[prefix.id] = prefix
+        self.used_prefix_space += prefix.num_addresses
+
+    def remove_prefix(self, prefix: IpamTreePrefix) -> None:
+        del self.prefixes[prefix.id]
+        self.used_prefix_space -= prefix.num_addresses
+
+
+class IpamTree:
+    """In-memory hierarchy of the IP prefixes and IP addresses of a single IP namespace.
+
+    Every IP prefix and IP address is attached to the most specific IP prefix containing it, which mirrors the
+    parent, children and ip_addresses relationships maintained by the IpamReconciler. Lookups use one hash table
+    per prefix length so that finding the parent of a value requires at most one lookup per distinct prefix length.
+    """
+
+    def __init__(self) -> None:
+        self._roots = {
+            version: IpamTreePrefix(id="", version=version, network_int=0, prefixlen=0) for version in MAX_PREFIXLEN
+        }
+        self._prefixes: dict[str, IpamTreePrefix] = {}
+        self._address_owners: dict[str, IpamTreePrefix] = {}
+        # {version: {prefixlen: {network_int: prefix}}}
+        self._tables: dict[int, dict[int, dict[int, IpamTreePrefix]]] = {version: {} for version in MAX_PREFIXLEN}
+        self._prefixlens: dict[int, list[int]] = {version: [] for version in MAX_PREFIXLEN}
+
+    @classmethod
+    def build(
+        cls,
+        prefixes: Iterable[tuple[str, IPNetworkType]],
+        addresses: Iterable[tuple[str, IPAddressType]],
+    ) -> IpamTree:
+        tree = cls()
+        # inserting the least specific prefixes first avoids moving children around while building the tree
+        for prefix_id, network in sorted(prefixes, key=lambda item: item[1].prefixlen):
+            tree.add_prefix(prefix_id=prefix_id, network=network)
+        for address_id, address in addresses:
+            tree.add_address(address_id=address_id, address=address)
+        return tree
+
+    @property
+    def num_prefixes(self) -> int:
+        return len(self._prefixes)
+
+    @property
+    def num_addresses(self) -> int:
+        return len(self._address_owners)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._prefixes or node_id in self._address_owners
+
+    def _find_container(self, version: int, ip_int: int, prefixlen: int, strict: bool = False) -> IpamTreePrefix:
+        """Return the most specific prefix containing the value or the root of the IP version if there is none."""
+        tables = self._tables[version]
+        for table_prefixlen in self._prefixlens[version]:
+            if table_prefixlen > prefixlen or (strict and table_prefixlen == prefixlen):
+                continue
+            prefix = tables[table_prefixlen].get(ip_int & _get_mask(version, table_prefixlen))
+            if prefix:
+                return prefix
+        return self._roots[version]
+
+    def _register(self, prefix: IpamTreePrefix) -> None:
+        self._prefixes[prefix.id] = prefix
+        table = self._tables[prefix.version].get(prefix.prefixlen)
+        if table is None:
+            table = self._tables[prefix.version][prefix.prefixlen] = {}
+            self._prefixlens[prefix.version] = sorted(self._tables[prefix.version], reverse=True)
+        # keep the first prefix registered for a network if the namespace contains duplicates
+        table.setdefault(prefix.network_int, prefix)
+
+    def _unregister(self, prefix: IpamTreePrefix) -> None:
+        del self._prefixes[prefix.id]
+        table = self._tables[prefix.version][prefix.prefixlen]
+        if table.get(prefix.network_int) is not prefix:
+            return
+        del table[prefix.network_int]
+        duplicate = next((p for p in prefix.prefixes.values() if p.prefixlen == prefix.prefixlen), None)
+        if duplicate:
+            table[prefix.network_int] = duplicate
+        elif not table:
+            del self._tables[prefix.version][prefix.prefixlen]
+            self._prefixlens[prefix.version] = sorted(self._tables[prefix.version], reverse=True)
+
+    def add_prefix(self, prefix_id: str, network: IPNetworkType) -> None:
+        if prefix_id in self._prefixes:
+            self.remove_prefix(prefix_id=prefix_id)
+        prefix = IpamTreePrefix(
+            id=prefix_id, version=network.version, network_int=int(network.network_address), prefixlen=network.prefixlen
+        )
+        parent = self._find_container(version=prefix.version, ip_int=prefix.network_int, prefixlen=prefix.prefixlen)
+        for child in list(parent.prefixes.values()):
+            if child.prefixlen > prefix.prefixlen and prefix.contains(child.network_int, child.prefixlen):
+                parent.remove_prefix(child)
+                prefix.add_prefix(child)
+        for address_id, packed_address in list(parent.addresses.items()):
+            if prefix.contains(*_unpack_address(packed_address)):
+                del parent.addresses[address_id]
+                prefix.addresses[address_id] = packed_address
+                self._address_owners[address_id] = prefix
+        parent.add_prefix(prefix)
+        self._register(prefix)
+
+    def remove_prefix(self, prefix_id: str) -> None:
+        prefix = self._prefixes.get(prefix_id)
+        if not prefix or not prefix.parent:
+            return
+        self._unregister(prefix)
+        parent = prefix.parent
+        parent.remove_prefix(prefix)
+        for child in prefix.prefixes.values():
+            parent.add_prefix(child)
+        for address_id, packed_address in prefix.addresses.items():
+            parent.addresses[address_id] = packed_address
+            self._address_owners[address_id] = parent
+
+    def add_address(self, address_id: str, address: IPAddressType) -> None:
+        if address_id in self._address_owners:
+            self.remove_address(address_id=address_id)
+        ip_int = int(address.ip)
+        prefixlen = address.network.prefixlen
+        owner = self._find_container(version=address.version, ip_int=ip_int, prefixlen=prefixlen)
+        owner.addresses[address_id] = _pack_address(ip_int=ip_int, prefixlen=prefixlen)
+        self._address_owners[address_id] = owner
+
+    def remove_address(self, address_id: str) -> None:
+        owner = self._address_owners.pop(address_id, None)
+        if owner:
+            del owner.addresses[address_id]
+
+    def remove_node(self, node_id: str) -> None:
+        self.remove_prefix(prefix_id=node_id)
+        self.remove_address(address_id=node_id)
+
+    def get_parent_id(self, ip_value: AllIPTypes) -> Optional[str]:
+        """Return the ID of the most specific prefix that contains ip_value, excluding ip_value itself."""
+        if isinstance(ip_value, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+            parent = self._find_container(
+                version=ip_value.version,
+                ip_int=int(ip_value.network_address),
+                prefixlen=ip_value.prefixlen,
+                strict=True,
+            )
+        else:
+            parent = self._find_container(
+                version=ip_value.version, ip_int=int(ip_value.ip), prefixlen=ip_value.network.prefixlen
+            )
+        return parent.id or None
+
+    def get_parent_ids(self) -> dict[str, Optional[str]]:
+        """Return the ID of the parent prefix of every IP prefix and IP address of the tree."""
+        parent_ids: dict[str, Optional[str]] = {
+            prefix_id: prefix.parent.id or None if prefix.parent else None
+            for prefix_id, prefix in self._prefixes.items()
+        }
+        for address_id, owner in self._address_owners.items():
+            parent_ids[address_id] = owner.id or None
+        return parent_ids
+
+    def _get_scope(self, network: IPNetworkType) -> tuple[IpamTreePrefix, bool]:
+        """Return the prefix matching network if it exists in the tree, otherwise the prefix that would contain it."""
+        network_int = int(network.network_address)
+        prefix = self._tables[network.version].get(network.prefixlen, {}).get(network_int)
+        if prefix:
+            return prefix, True
+        return self._find_container(version=network.version, ip_int=network_int, prefixlen=network.prefixlen), False
+
+    def get_child_prefixes(self, network: IPNetworkType) -> list[tuple[str, IPNetworkType]]:
+        """Return the top-level prefixes located within network."""
+        scope, is_exact = self._get_scope(network=network)
+        network_int, prefixlen = int(network.network_address), network.prefixlen
+        return [
+            (child.id, child.network)
+            for child in scope.prefixes.values()
+            if is_exact
+            or (
+                child.prefixlen > prefixlen and child.network_int & _get_mask(network.version, prefixlen) == network_int
+            )
+        ]
+
+    def _iter_addresses(self, prefix: IpamTreePrefix) -> Iterator[tuple[str, int]]:
+        yield from prefix.addresses.items()
+        for child in prefix.prefixes.values():
+            yield from self._iter_addresses(prefix=child)
+
+    def get_addresses(self, network: IPNetworkType) -> list[tuple[str, IPAddressType]]:
+        """Return all the IP addresses located within network, whatever their depth in the hierarchy."""
+        scope, is_exact = self._get_scope(network=network)
+        if is_exact:
+            return [(address_id, _to_interface(packed)) for address_id, packed in self._iter_addresses(prefix=scope)]
+        network_int, prefixlen = int(network.network_address), network.prefixlen
+        mask = _get_mask(network.version, prefixlen)
+        addresses = []
+        for address_id, packed_address in scope.addresses.items():
+            ip_int, address_prefixlen = _unpack_address(packed_address)
+            if address_prefixlen >= prefixlen and ip_int & mask == network_int:
+                addresses.append((address_id, _to_interface(packed_address)))
+        for child in scope.prefixes.values():
+            if child.prefixlen > prefixlen and child.network_int & mask == network_int:
+                addresses.extend(
+                    (address_id, _to_interface(packed)) for address_id, packed in self._iter_addresses(prefix=child)
+                )
+        return addresses
+
+    def get_utilization(self, prefix_id: str, member_type: PrefixMemberType) -> tuple[int, int]:
+        """Return the used and total space of a prefix, like the PrefixUtilizationGetter does for a single branch.
+
+        The space of a prefix is its number of addresses, minus the network and broadcast addresses for IPv4 prefixes
+        of addresses larger than a /31 that are not pools. This method does not know if a prefix is a pool, so the
+        total space is returned without this adjustment.
+        """
+        prefix = self._prefixes[prefix_id]
+        if member_type is PrefixMemberType.ADDRESS:
+            return len(prefix.addresses), prefix.num_addresses
+        return prefix.used_prefix_space, prefix.num_addresses
+
+
+class IpamTreeRegistry:
+    """Cache of the IpamTree of every (branch, IP namespace) used by this worker.
+
+    A tree is loaded from the database the first time it is needed and is then kept up to date from the mutation
+    events of IP prefixes and IP addresses. As some changes, like a branch merge, are only notified for a whole
+    branch, the trees are also reloaded once they are older than max_age seconds.
+    """
+
+    def __init__(self, max_age: int = 300) -> None:
+        self.max_age = max_age
+        self._trees: dict[tuple[str, str], tuple[IpamTree, float]] = {}
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+    def _get_cached(self, key: tuple[str, str]) -> Optional[IpamTree]:
+        tree_and_time = self._trees.get(key)
+        if not tree_and_time:
+            return None
+        tree, loaded_at = tree_and_time
+        if time.monotonic() - loaded_at > self.max_age:
+            del self._trees[key]
+            return None
+        return tree
+
+    async def get_tree(self, db: InfrahubDatabase, branch: Branch, namespace_id: str) -> IpamTree:
+        key = (branch.name, namespace_id)
+        tree = self._get_cached(key)
+        if tree:
+            return tree
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            tree = self._get_cached(key)
+            if tree:
+                return tree
+            query = await IPNamespaceMembersFetch.init(db=db, branch=branch, namespace=namespace_id)
+            await query.execute(db=db)
+            tree = IpamTree.build(
+                prefixes=((str(prefix.id), prefix.prefix) for prefix in query.get_prefixes()),
+                addresses=((str(address.id), address.address) for address in query.get_addresses()),
+            )
+            self._trees[key] = (tree, time.monotonic())
+        return tree
+
+    def update_node(
+        self,
+        branch_name: str,
+        node_id: str,
+        namespace_id: Optional[str] = None,
+        ip_value: Optional[AllIPTypes] = None,
+    ) -> None:
+        """Update the trees of a branch after an IP prefix or an IP address was created, updated or deleted
+
+        The node is removed from the trees of the branch and then added back to the tree of its namespace, unless
+        no ip_value is provided which indicates that the node has been deleted.
+        """
+        for (tree_branch_name, tree_namespace_id), (tree, _) in self._trees.items():
+            if tree_branch_name != branch_name:
+                continue
+            tree.remove_node(node_id=node_id)
+            if ip_value is None or tree_namespace_id != namespace_id:
+                continue
+            if isinstance(ip_value, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+                tree.add_prefix(prefix_id=node_id, network=ip_value)
+            else:
+                tree.add_address(address_id=node_id, address=ip_value)
+
+    def invalidate(self, branch_name: Optional[str] = None) -> None:
+        """Discard the trees of a branch, or all the trees if no branch is provided."""
+        for key in list(self._trees):
+            if branch_name is None or key[0] == branch_name:
+                del self._trees[key]
+
+
+ipam_trees = IpamTreeRegistry()
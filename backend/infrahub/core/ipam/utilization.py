@@ -69,12 +69,12 @@ class PrefixUtilizationGetter:
         prefix_child_details_list: list[PrefixChildDetails] = []
         if ip_prefixes is None:
             ip_prefixes = self.ip_prefixes
-        prefix_ids = {prefix.get_id() for prefix in ip_prefixes}
-        prefix_ids &= set(self._results_by_prefix_id.keys())
-        if not prefix_ids:
-            return prefix_child_details_list
-        for prefix_id in prefix_ids:
-            child_details_by_branch = self._results_by_prefix_id[prefix_id]
+        # Look up each prefix in the results instead of intersecting with the set of all the results
+        # as this method is called once per prefix when computing the utilization of many prefixes
+        for prefix_id in {prefix.get_id() for prefix in ip_prefixes}:
+            child_details_by_branch = self._results_by_prefix_id.get(prefix_id)
+            if not child_details_by_branch:
+                continue
             branch_names_to_check = branch_names or list(child_details_by_branch.keys())
             for branch_name in branch_names_to_check:
                 for child_details in child_details_by_branch.get(branch_name, []):
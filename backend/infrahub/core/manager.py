@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-from functools import reduce
+import asyncio
+from functools import partial, reduce
 from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, overload
 
 from infrahub_sdk.utils import deep_merge_dict, is_valid_uuid
 
+from infrahub import config
 from infrahub.core.node import Node
 from infrahub.core.node.delete_validator import NodeDeleteValidator
 from infrahub.core.query.node import (
     AttributeFromDB,
     AttributeNodePropertyFromDB,
     NodeAttributesFromDB,
+    NodeCreateManyQuery,
     NodeGetHierarchyQuery,
     NodeGetListQuery,
     NodeListGetAttributeQuery,
@@ -26,11 +29,15 @@ from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import NodeNotFoundError, ProcessingError, SchemaNotFoundError
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from infrahub.core.branch import Branch
     from infrahub.core.constants import RelationshipHierarchyDirection
+    from infrahub.core.query import Query
     from infrahub.database import InfrahubDatabase
 
 SchemaProtocol = TypeVar("SchemaProtocol")
+T = TypeVar("T")
 
 # pylint: disable=redefined-builtin,too-many-lines
 
@@ -57,9 +64,9 @@ def get_schema(
     db: InfrahubDatabase, branch: Branch, node_schema: type[SchemaProtocol] | MainSchemaTypes | str
 ) -> MainSchemaTypes:
     if isinstance(node_schema, str):
-        return db.schema.get(name=node_schema, branch=branch.name)
+        return db.schema.get(name=node_schema, branch=branch.name, duplicate=False)
     if hasattr(node_schema, "_is_runtime_protocol") and getattr(node_schema, "_is_runtime_protocol"):
-        return db.schema.get(name=node_schema.__name__, branch=branch.name)
+        return db.schema.get(name=node_schema.__name__, branch=branch.name, duplicate=False)
     if not isinstance(node_schema, (MainSchemaTypes)):
         raise ValueError(f"Invalid schema provided {node_schema}")
 
@@ -1094,13 +1101,57 @@ class NodeManager:
         branch = await registry.get_branch(branch=branch, db=db)
         at = Timestamp(at)
 
-        # Query all nodes
-        query = await NodeListGetInfoQuery.init(
+        return await cls._get_many(
+            db=db,
+            ids=ids,
+            fields=fields,
+            at=at,
+            branch=branch,
+            include_source=include_source,
+            include_owner=include_owner,
+            prefetch_relationships=prefetch_relationships,
+            account=account,
+            branch_agnostic=branch_agnostic,
+            branches={branch.name: branch},
+        )
+
+    @classmethod
+    async def _get_many(  # pylint: disable=too-many-branches
+        cls,
+        db: InfrahubDatabase,
+        ids: list[str],
+        fields: Optional[dict],
+        at: Timestamp,
+        branch: Branch,
+        include_source: bool,
+        include_owner: bool,
+        prefetch_relationships: bool,
+        account: Any,
+        branch_agnostic: bool,
+        branches: dict[str, Branch],
+    ) -> dict[str, Node]:
+        """Load the nodes, the queries that don't depend on each other are executed concurrently.
+
+        The branches are cached in `branches` for the duration of the call, including while loading the peers.
+        """
+
+        # Query all nodes and, if prefetch_relationships is enabled, all the peers associated with them at once.
+        info_query = await NodeListGetInfoQuery.init(
             db=db, ids=ids, branch=branch, account=account, at=at, branch_agnostic=branch_agnostic
         )
-        await query.execute(db=db)
-        nodes_info_by_id: dict[str, NodeToProcess] = {node.node_uuid: node async for node in query.get_nodes(db=db)}
-        profile_ids_by_node_id = query.get_profile_ids_by_node_id()
+        queries: list[Query] = [info_query]
+        relationships_query: Optional[NodeListGetRelationshipsQuery] = None
+        if prefetch_relationships:
+            relationships_query = await NodeListGetRelationshipsQuery.init(
+                db=db, ids=ids, branch=branch, at=at, branch_agnostic=branch_agnostic
+            )
+            queries.append(relationships_query)
+        await cls._execute_queries(db=db, queries=queries)
+
+        nodes_info_by_id: dict[str, NodeToProcess] = {
+            node.node_uuid: node async for node in info_query.get_nodes(db=db)
+        }
+        profile_ids_by_node_id = info_query.get_profile_ids_by_node_id()
         all_profile_ids = reduce(
             lambda all_ids, these_ids: all_ids | set(these_ids), profile_ids_by_node_id.values(), set()
         )
@@ -1112,7 +1163,7 @@ class NodeManager:
                 fields["profile_priority"]["value"] = None
 
         # Query list of all Attributes
-        query = await NodeListGetAttributeQuery.init(
+        attribute_query = await NodeListGetAttributeQuery.init(
             db=db,
             ids=list(nodes_info_by_id.keys()) + list(all_profile_ids),
             fields=fields,
@@ -1123,8 +1174,46 @@ class NodeManager:
             at=at,
             branch_agnostic=branch_agnostic,
         )
-        await query.execute(db=db)
-        all_node_attributes = query.get_attributes_group_by_node()
+
+        # The peers are loaded while the attributes are being queried, the peers that are part of the nodes
+        # already being loaded are built from the same data when all the attributes have been requested.
+        peers_per_node: dict[str, dict[str, list[str]]] = {}
+        peer_ids: set[str] = set()
+        reused_peer_ids: set[str] = set()
+        if relationships_query:
+            peers_per_node = relationships_query.get_peers_group_by_node()
+            for node_data in peers_per_node.values():
+                for node_peers in node_data.values():
+                    peer_ids.update(node_peers)
+            if not fields and not branch_agnostic:
+                reused_peer_ids = peer_ids & nodes_info_by_id.keys()
+
+        peers: dict[str, Node] = {}
+        if peer_ids - reused_peer_ids:
+            _, peers = await cls._gather(
+                db,
+                cls._run_in_session(db=db, func=attribute_query.execute),
+                cls._run_in_session(
+                    db=db,
+                    func=partial(
+                        cls._get_many,
+                        ids=list(peer_ids - reused_peer_ids),
+                        fields=None,
+                        at=at,
+                        branch=branch,
+                        include_source=include_source,
+                        include_owner=include_owner,
+                        prefetch_relationships=False,
+                        account=None,
+                        branch_agnostic=False,
+                        branches=branches,
+                    ),
+                ),
+            )
+        else:
+            await cls._execute_queries(db=db, queries=[attribute_query])
+
+        all_node_attributes = attribute_query.get_attributes_group_by_node()
         profile_attributes: dict[str, dict[str, AttributeFromDB]] = {}
         node_attributes: dict[str, dict[str, AttributeFromDB]] = {}
         for node_id, attribute_dict in all_node_attributes.items():
@@ -1136,79 +1225,164 @@ class NodeManager:
             profile_attributes_id_map=profile_attributes, profile_ids_by_node_id=profile_ids_by_node_id
         )
 
-        # if prefetch_relationships is enabled
-        # Query all the peers associated with all nodes at once.
-        peers_per_node = None
-        peers = None
-        if prefetch_relationships:
-            query = await NodeListGetRelationshipsQuery.init(
-                db=db, ids=ids, branch=branch, at=at, branch_agnostic=branch_agnostic
-            )
-            await query.execute(db=db)
-            peers_per_node = query.get_peers_group_by_node()
-            peer_ids = []
-
-            for node_data in peers_per_node.values():
-                for node_peers in node_data.values():
-                    peer_ids.extend(node_peers)
-
-            peer_ids = list(set(peer_ids))
-            peers = await cls.get_many(
-                ids=peer_ids,
-                branch=branch,
-                at=at,
+        for peer_id in reused_peer_ids:
+            peers[peer_id] = await cls._build_node(
                 db=db,
-                include_owner=include_owner,
-                include_source=include_source,
+                node=nodes_info_by_id[peer_id],
+                node_attributes=node_attributes,
+                profile_index=profile_index,
+                at=at,
+                branch=branch,
+                branches=branches,
             )
 
         nodes = {}
 
-        for node_id in ids:  # pylint: disable=too-many-nested-blocks
+        for node_id in ids:
             if node_id not in nodes_info_by_id:
                 continue
 
-            node = nodes_info_by_id[node_id]
-            new_node_data: dict[str, Union[str, AttributeFromDB]] = {
-                "db_id": node.node_id,
-                "id": node_id,
-                "updated_at": node.updated_at,
-            }
-
-            if not node.schema:
-                raise SchemaNotFoundError(
-                    branch_name=branch.name,
-                    identifier=node_id,
-                    message=f"Unable to find the Schema associated with {node_id}, {node.labels}",
-                )
+            nodes[node_id] = await cls._build_node(
+                db=db,
+                node=nodes_info_by_id[node_id],
+                node_attributes=node_attributes,
+                profile_index=profile_index,
+                at=at,
+                branch=branch,
+                branches=branches,
+                peers=peers if prefetch_relationships else None,
+                peers_per_node=peers_per_node,
+            )
 
-            # --------------------------------------------------------
-            # Attributes
-            # --------------------------------------------------------
-            if node_id in node_attributes:
-                for attr_name, attr in node_attributes[node_id].attrs.items():
-                    new_node_data[attr_name] = attr
-
-            # --------------------------------------------------------
-            # Relationships
-            # --------------------------------------------------------
-            if prefetch_relationships and peers:
-                for rel_schema in node.schema.relationships:
-                    if node_id in peers_per_node and rel_schema.identifier in peers_per_node[node_id]:
-                        rel_peers = [peers.get(id) for id in peers_per_node[node_id][rel_schema.identifier]]
-                        if rel_schema.cardinality == "one":
-                            if len(rel_peers) == 1:
-                                new_node_data[rel_schema.name] = rel_peers[0]
-                        elif rel_schema.cardinality == "many":
-                            new_node_data[rel_schema.name] = rel_peers
-
-            new_node_data_with_profile_overrides = profile_index.apply_profiles(new_node_data)
-            node_class = identify_node_class(node=node)
+        return nodes
+
+    @classmethod
+    async def _build_node(
+        cls,
+        db: InfrahubDatabase,
+        node: NodeToProcess,
+        node_attributes: dict[str, NodeAttributesFromDB],
+        profile_index: ProfileAttributeIndex,
+        at: Timestamp,
+        branch: Branch,
+        branches: dict[str, Branch],
+        peers: Optional[dict[str, Node]] = None,
+        peers_per_node: Optional[dict[str, dict[str, list[str]]]] = None,
+    ) -> Node:
+        node_id = node.node_uuid
+        new_node_data: dict[str, Union[str, AttributeFromDB]] = {
+            "db_id": node.node_id,
+            "id": node_id,
+            "updated_at": node.updated_at,
+        }
+
+        if not node.schema:
+            raise SchemaNotFoundError(
+                branch_name=branch.name,
+                identifier=node_id,
+                message=f"Unable to find the Schema associated with {node_id}, {node.labels}",
+            )
+
+        # --------------------------------------------------------
+        # Attributes
+        # --------------------------------------------------------
+        if node_id in node_attributes:
+            for attr_name, attr in node_attributes[node_id].attrs.items():
+                new_node_data[attr_name] = attr
+
+        # --------------------------------------------------------
+        # Relationships
+        # --------------------------------------------------------
+        if peers and peers_per_node and node_id in peers_per_node:
+            for rel_schema in node.schema.relationships:
+                if rel_schema.identifier in peers_per_node[node_id]:
+                    rel_peers = [peers.get(id) for id in peers_per_node[node_id][rel_schema.identifier]]
+                    if rel_schema.cardinality == "one":
+                        if len(rel_peers) == 1:
+                            new_node_data[rel_schema.name] = rel_peers[0]
+                    elif rel_schema.cardinality == "many":
+                        new_node_data[rel_schema.name] = rel_peers
+
+        new_node_data_with_profile_overrides = profile_index.apply_profiles(new_node_data)
+        node_class = identify_node_class(node=node)
+        node_branch = branches.get(node.branch) if isinstance(node.branch, str) else node.branch
+        if not node_branch:
             node_branch = await registry.get_branch(db=db, branch=node.branch)
-            item = await node_class.init(schema=node.schema, branch=node_branch, at=at, db=db)
-            await item.load(**new_node_data_with_profile_overrides, db=db)
+            branches[node_branch.name] = node_branch
+        item = await node_class.init(schema=node.schema, branch=node_branch, at=at, db=db)
+        await item.load(**new_node_data_with_profile_overrides, db=db)
+
+        return item
 
-            nodes[node_id] = item
+    @staticmethod
+    async def _execute_queries(db: InfrahubDatabase, queries: list[Query]) -> None:
+        """Execute independent read queries, each one on its own session when the database is not in a transaction."""
+
+        if db.is_transaction or len(queries) == 1:
+            for query in queries:
+                await query.execute(db=db)
+            return
+
+        async def _execute(query: Query) -> None:
+            async with db.start_session(read_only=True) as session_db:
+                await query.execute(db=session_db)
+
+        await asyncio.gather(*[_execute(query=query) for query in queries])
+
+    @staticmethod
+    async def _run_in_session(db: InfrahubDatabase, func: Callable[..., Awaitable[T]]) -> T:
+        """Run a function that reads from the database on its own session so it can run concurrently with others.
+
+        A session can't be used by two coroutines at the same time, a transaction is reused as is since it is only
+        shared by coroutines that are executed one after the other.
+        """
+
+        if db.is_transaction:
+            return await func(db=db)
+        async with db.start_session(read_only=True) as session_db:
+            return await func(db=session_db)
+
+    @staticmethod
+    async def _gather(db: InfrahubDatabase, *coroutines: Awaitable[Any]) -> list[Any]:
+        """Run the coroutines concurrently, unless the database is in a transaction that can't be shared."""
+
+        if db.is_transaction:
+            return [await coroutine for coroutine in coroutines]
+        return list(await asyncio.gather(*coroutines))
+
+    @classmethod
+    async def create_many(
+        cls,
+        db: InfrahubDatabase,
+        nodes: list[Node],
+        at: Optional[Union[Timestamp, str]] = None,
+    ) -> list[Node]:
+        """Create multiple new nodes in the database.
+
+        The nodes of the same kind are created together, with a single query for each batch of
+        `max_nodes_per_create_query` nodes, instead of one query per node.
+        """
+        create_at = Timestamp(at)
+        batch_size = config.SETTINGS.database.max_nodes_per_create_query
+
+        nodes_per_kind: dict[tuple[str, str], list[Node]] = {}
+        branches: dict[str, Branch] = {}
+        for node in nodes:
+            if node._existing:
+                raise ValueError(f"{node.get_kind()} {node.get_id()} already exists in the database")
+            branch = node.get_branch_based_on_support_type()
+            branches[branch.name] = branch
+            nodes_per_kind.setdefault((node.get_kind(), branch.name), []).append(node)
+
+        for (_, branch_name), kind_nodes in nodes_per_kind.items():
+            for idx in range(0, len(kind_nodes), batch_size):
+                batch = kind_nodes[idx : idx + batch_size]
+                query = await NodeCreateManyQuery.init(db=db, nodes=batch, branch=branches[branch_name], at=create_at)
+                await query.execute(db=db)
+                ids_per_node = query.get_ids_per_node()
+                for node in batch:
+                    db_id, new_ids = ids_per_node[node.get_id()]
+                    node._set_as_created(at=create_at, db_id=db_id, new_ids=new_ids)
 
         return nodes
 
@@ -315,10 +315,37 @@ class HashableModel(BaseModel):
 
     _exclude_from_hash: list[str] = []
     _sort_by: list[str] = []
+    _read_only: bool = False
 
     def __hash__(self) -> int:
         return hash(self.get_hash())
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_") and getattr(self, "_read_only", False):
+            raise TypeError(
+                f"{self.__class__.__name__} is read-only and can't be modified, use duplicate() to get a mutable copy"
+            )
+        super().__setattr__(name, value)
+
+    @property
+    def is_read_only(self) -> bool:
+        return self._read_only
+
+    def set_read_only(self, value: bool = True) -> None:
+        """Mark the object and all its sub-models as read-only.
+
+        Read-only objects can be safely shared between multiple consumers without being duplicated first.
+        """
+        self._read_only = value
+        for field_name in self.model_fields.keys():
+            field_value = getattr(self, field_name)
+            if isinstance(field_value, HashableModel):
+                field_value.set_read_only(value=value)
+            elif isinstance(field_value, list):
+                for item in field_value:
+                    if isinstance(item, HashableModel):
+                        item.set_read_only(value=value)
+
     def get_hash(self, display_values: bool = False) -> str:
         """Generate a hash for the object.
 
@@ -404,8 +431,14 @@ class HashableModel(BaseModel):
         return tuple(self_sort_keys) >= tuple(other_sort_keys)
 
     def duplicate(self) -> Self:
-        """Duplicate the current object by doing a deep copy of everything and recreating a new object."""
-        return self.model_copy(deep=True)
+        """Duplicate the current object by doing a deep copy of everything and recreating a new object.
+
+        The new object is always mutable, even if the current object is read-only.
+        """
+        new_object = self.model_copy(deep=True)
+        if self._read_only:
+            new_object.set_read_only(value=False)
+        return new_object
 
     @staticmethod
     def is_list_composed_of_hashable_model(items: list[Any]) -> bool:
@@ -10,11 +10,18 @@ from infrahub.core import registry
 from infrahub.core.constants import BranchSupportType, ComputedAttributeKind, InfrahubKind, RelationshipCardinality
 from infrahub.core.constants.schema import SchemaElementPathType
 from infrahub.core.protocols import CoreNumberPool
-from infrahub.core.query.node import NodeCheckIDQuery, NodeCreateAllQuery, NodeDeleteQuery, NodeGetListQuery
+from infrahub.core.query.attribute import AttributeUpdateValuesQuery
+from infrahub.core.query.node import (
+    NodeCheckIDQuery,
+    NodeCreateAllQuery,
+    NodeDeleteQuery,
+    NodeGetListQuery,
+    NodeListGetAttributeQuery,
+)
 from infrahub.core.schema import AttributeSchema, NodeSchema, ProfileSchema, RelationshipSchema
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import InitializationError, NodeNotFoundError, PoolExhaustedError, ValidationError
-from infrahub.support.macro import MacroDefinition
+from infrahub.support.macro import get_macro_definition
 from infrahub.types import ATTRIBUTE_TYPES
 
 from ...graphql.constants import KIND_GRAPHQL_FIELD_NAME
@@ -207,9 +214,9 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
             attrs["schema"] = schema
         elif isinstance(schema, str):
             # TODO need to raise a proper exception for this, right now it will raise a generic ValueError
-            attrs["schema"] = db.schema.get(name=schema, branch=branch)
+            attrs["schema"] = db.schema.get(name=schema, branch=branch, duplicate=False)
         elif hasattr(schema, "_is_runtime_protocol") and getattr(schema, "_is_runtime_protocol"):
-            attrs["schema"] = db.schema.get(name=schema.__name__, branch=branch)
+            attrs["schema"] = db.schema.get(name=schema.__name__, branch=branch, duplicate=False)
         else:
             raise ValueError(f"Invalid schema provided {type(schema)}, expected NodeSchema or ProfileSchema")
 
@@ -384,7 +391,7 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
                     ValidationError({macro: f"{macro} is missing computational_logic for macro ({attr_schema.kind})"})
                 )
                 continue
-            macro_definition = MacroDefinition(macro=attr_schema.computed_attribute.jinja2_template)
+            macro_definition = get_macro_definition(macro=attr_schema.computed_attribute.jinja2_template)
 
             for variable in macro_definition.variables:
                 attribute_path = schema_branch.validate_schema_path(
@@ -529,18 +536,22 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         query = await NodeCreateAllQuery.init(db=db, node=self, at=create_at)
         await query.execute(db=db)
 
-        _, self.db_id = query.get_self_ids()
-        self._at = create_at
-        self._updated_at = create_at
-        self._existing = True
+        _, db_id = query.get_self_ids()
+        self._set_as_created(at=create_at, db_id=db_id, new_ids=query.get_ids())
 
-        new_ids = query.get_ids()
+    def _set_as_created(self, at: Timestamp, db_id: str, new_ids: dict[str, tuple[str, str]]) -> None:
+        """Assign the IDs returned by the database once the node, its attributes and its relationships are created."""
+        self.db_id = db_id
+        self._at = at
+        self._updated_at = at
+        self._existing = True
 
         # Go over the list of Attribute and assign the new IDs one by one
         for name in self._attributes:
             attr: BaseAttribute = getattr(self, name)
             attr.id, attr.db_id = new_ids[name]
-            attr.at = create_at
+            attr.at = at
+            attr.clear_changes()
 
         # Go over the list of relationships and assign the new IDs one by one
         for name in self._relationships:
@@ -548,31 +559,77 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
             for rel in relm._relationships:
                 identifier = f"{rel.schema.identifier}::{rel.peer_id}"
                 rel.id, rel.db_id = new_ids[identifier]
+            relm.clear_changes()
 
     async def _update(
         self, db: InfrahubDatabase, at: Optional[Timestamp] = None, fields: list[str] | None = None
     ) -> None:
-        """Update the node in the database if needed."""
+        """Update the node in the database if needed.
+
+        Only the attributes and the relationships that have been modified since the node was loaded or last saved,
+        or that are listed in fields, are written to the database.
+        """
 
         update_at = Timestamp(at)
 
-        # Go over the list of Attribute and update them one by one
+        attributes: list[BaseAttribute] = []
         for name in self._attributes:
-            if fields and name in fields:
-                attr: BaseAttribute = getattr(self, name)
-                await attr.save(at=update_at, db=db)
-            else:
-                attr: BaseAttribute = getattr(self, name)
-                await attr.save(at=update_at, db=db)
+            attr: BaseAttribute = getattr(self, name)
+            if attr.is_dirty or (fields and name in fields):
+                attributes.append(attr)
+        await self._update_attributes(db=db, at=update_at, attributes=attributes)
 
-        # Go over the list of relationships and update them one by one
         for name in self._relationships:
-            if fields and name in fields:
-                rel: RelationshipManager = getattr(self, name)
+            rel: RelationshipManager = getattr(self, name)
+            if rel.is_dirty or (fields and name in fields):
                 await rel.save(at=update_at, db=db)
-            else:
-                attr: BaseAttribute = getattr(self, name)
-                await attr.save(at=update_at, db=db)
+
+    async def _update_attributes(self, db: InfrahubDatabase, at: Timestamp, attributes: list[BaseAttribute]) -> None:
+        """Update multiple attributes of the node, the current state of all of them is read in one query
+        and all the new values are written in another one."""
+
+        attributes = [attr for attr in attributes if attr.id and not attr.is_from_profile]
+        if not attributes:
+            return
+
+        for attr in attributes:
+            attr._prepare_update()
+
+        query = await NodeListGetAttributeQuery.init(
+            db=db,
+            ids=[self.id],
+            fields={attr.name: True for attr in attributes},
+            branch=self._branch,
+            at=at,
+            include_source=True,
+            include_owner=True,
+        )
+        await query.execute(db=db)
+        current_attributes = {attr.name: query.get_result_by_id_and_name(self.id, attr.name) for attr in attributes}
+
+        attributes_to_update: list[BaseAttribute] = []
+        rel_ids_to_update: list[str] = []
+        for attr in attributes:
+            current_attr_data, current_attr_result = current_attributes[attr.name]
+            if current_attr_data.content == attr.to_db():
+                continue
+            attributes_to_update.append(attr)
+            rel = current_attr_result.get_rel("r2")
+            if rel.get("branch") == attr.get_branch_based_on_support_type().name:
+                rel_ids_to_update.append(rel.element_id)
+
+        if attributes_to_update:
+            query = await AttributeUpdateValuesQuery.init(
+                db=db, attributes=attributes_to_update, rel_ids_to_update=rel_ids_to_update, at=at
+            )
+            await query.execute(db=db)
+
+        for attr in attributes:
+            current_attr_data, current_attr_result = current_attributes[attr.name]
+            await attr._update_properties(
+                db=db, at=at, current_attr_data=current_attr_data, current_attr_result=current_attr_result
+            )
+            attr.clear_changes()
 
     async def save(self, db: InfrahubDatabase, at: Optional[Timestamp] = None, fields: list[str] | None = None) -> Self:
         """Create or Update the Node in the database."""
@@ -1,23 +1,36 @@
-from typing import TYPE_CHECKING, Optional
+from typing import Any, Optional, Sequence, Union
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.node import Node
+from infrahub.core.schema import AttributeSchema, MainSchemaTypes, NodeSchema, ProfileSchema
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import ValidationError
 
 from .interface import NodeConstraintInterface
 
-if TYPE_CHECKING:
-    from infrahub.core.schema import MainSchemaTypes
-
 
 class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
     def __init__(self, db: InfrahubDatabase, branch: Branch) -> None:
         self.db = db
         self.branch = branch
 
+    def _get_comparison_schema(
+        self, node_schema: Union[NodeSchema, ProfileSchema], unique_attr: AttributeSchema
+    ) -> MainSchemaTypes:
+        if unique_attr.inherited:
+            for generic_parent_schema_name in node_schema.inherit_from:
+                generic_parent_schema = self.db.schema.get(
+                    generic_parent_schema_name, branch=self.branch, duplicate=False
+                )
+                parent_attr = generic_parent_schema.get_attribute_or_none(unique_attr.name)
+                if parent_attr is None:
+                    continue
+                if parent_attr.unique is True:
+                    return generic_parent_schema
+        return node_schema
+
     async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[list[str]] = None) -> None:
         at = Timestamp(at)
         node_schema = node.get_schema()
@@ -25,17 +38,8 @@ class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
             if filters and unique_attr.name not in filters:
                 continue
 
-            comparison_schema: MainSchemaTypes = node_schema
+            comparison_schema = self._get_comparison_schema(node_schema=node_schema, unique_attr=unique_attr)
             attr = getattr(node, unique_attr.name)
-            if unique_attr.inherited:
-                for generic_parent_schema_name in node_schema.inherit_from:
-                    generic_parent_schema = self.db.schema.get(generic_parent_schema_name, branch=self.branch)
-                    parent_attr = generic_parent_schema.get_attribute_or_none(unique_attr.name)
-                    if parent_attr is None:
-                        continue
-                    if parent_attr.unique is True:
-                        comparison_schema = generic_parent_schema
-                        break
             nodes = await registry.manager.query(
                 schema=comparison_schema,
                 filters={f"{unique_attr.name}__value": attr.value},
@@ -49,3 +53,60 @@ class NodeAttributeUniquenessConstraint(NodeConstraintInterface):
                 raise ValidationError(
                     {unique_attr.name: f"An object already exist with this value: {unique_attr.name}: {attr.value}"}
                 )
+
+    async def check_many(
+        self, nodes: Sequence[Node], at: Optional[Timestamp] = None, filters: Optional[list[str]] = None
+    ) -> None:
+        """Check the unique attributes of many nodes with one query per attribute.
+
+        The existing nodes that are part of the batch are compared using their new values, the others are
+        queried from the database with all the values of the batch at once.
+        """
+        at = Timestamp(at)
+        nodes_per_attribute: dict[tuple[str, str], tuple[MainSchemaTypes, list[Node]]] = {}
+        for node in nodes:
+            node_schema = node.get_schema()
+            for unique_attr in node_schema.unique_attributes:
+                if filters and unique_attr.name not in filters:
+                    continue
+                comparison_schema = self._get_comparison_schema(node_schema=node_schema, unique_attr=unique_attr)
+                _, attr_nodes = nodes_per_attribute.setdefault(
+                    (comparison_schema.kind, unique_attr.name), (comparison_schema, [])
+                )
+                attr_nodes.append(node)
+
+        batch_node_ids = {node.get_id() for node in nodes}
+        for (_, attribute_name), (comparison_schema, attr_nodes) in nodes_per_attribute.items():
+            # the values are compared as strings, like in the uniqueness constraints, as some of them aren't hashable
+            node_id_per_value: dict[str, str] = {}
+            values: list[Any] = []
+            for node in attr_nodes:
+                value = getattr(node, attribute_name).get_value()
+                # constraint cannot be violated by a node without value
+                if value is None:
+                    continue
+                if node_id_per_value.setdefault(str(value), node.get_id()) != node.get_id():
+                    raise ValidationError(
+                        {attribute_name: f"An object already exist with this value: {attribute_name}: {value}"}
+                    )
+                values.append(value)
+
+            if not values:
+                continue
+
+            existing_nodes = await registry.manager.query(
+                schema=comparison_schema,
+                filters={f"{attribute_name}__values": values},
+                fields={attribute_name: None},
+                db=self.db,
+                branch=self.branch,
+                at=at,
+            )
+            for existing_node in existing_nodes:
+                if existing_node.get_id() in batch_node_ids:
+                    continue
+                value = getattr(existing_node, attribute_name).get_value()
+                if str(value) in node_id_per_value:
+                    raise ValidationError(
+                        {attribute_name: f"An object already exist with this value: {attribute_name}: {value}"}
+                    )
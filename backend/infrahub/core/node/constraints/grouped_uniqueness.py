@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Union
 
 from infrahub.core import registry
 from infrahub.core.schema import (
     MainSchemaTypes,
+    NodeSchema,
+    ProfileSchema,
     SchemaAttributePath,
     SchemaAttributePathValue,
 )
@@ -29,52 +31,60 @@ if TYPE_CHECKING:
 
 
 class NodeGroupedUniquenessConstraint(NodeConstraintInterface):
+    """Validate the uniqueness constraints of a batch of nodes with one query per schema.
+
+    The values of all the nodes for all the constraints are sent to the database at once to find the existing nodes
+    with the same values and the duplicates within the batch are found in memory, so checking one node is a batch of one.
+    """
+
     def __init__(self, db: InfrahubDatabase, branch: Branch) -> None:
         self.db = db
         self.branch = branch
         self.schema_branch = registry.schema.get_schema_branch(branch.name)
 
+    def _get_schemas_to_check(self, node_schema: Union[NodeSchema, ProfileSchema]) -> list[MainSchemaTypes]:
+        schemas_to_check: list[MainSchemaTypes] = [node_schema]
+        if node_schema.inherit_from:
+            for parent_schema_name in node_schema.inherit_from:
+                parent_schema = self.schema_branch.get(name=parent_schema_name, duplicate=False)
+                if parent_schema.uniqueness_constraints:
+                    schemas_to_check.append(parent_schema)
+        return schemas_to_check
+
+    @staticmethod
+    def _is_path_group_in_filters(path_group: list[SchemaAttributePath], filters: Optional[list[str]] = None) -> bool:
+        if not filters:
+            return True
+        for attribute_path in path_group:
+            if attribute_path.related_schema and attribute_path.relationship_schema:
+                if attribute_path.relationship_schema.name in filters:
+                    return True
+            elif attribute_path.attribute_schema and attribute_path.attribute_schema.name in filters:
+                return True
+        return False
+
     def _build_query_request(
         self,
-        updated_node: Node,
         node_schema: MainSchemaTypes,
-        path_groups: list[list[SchemaAttributePath]],
-        filters: Optional[list[str]] = None,
+        path_values_groups: Iterable[list[SchemaAttributePathValue]],
     ) -> NodeUniquenessQueryRequest:
         query_request = NodeUniquenessQueryRequest(kind=node_schema.kind)
-        for path_group in path_groups:
-            include_in_query = not filters
-            query_relationship_paths: set[QueryRelationshipAttributePath] = set()
-            query_attribute_paths: set[QueryAttributePath] = set()
-            for attribute_path in path_group:
-                if attribute_path.related_schema and attribute_path.relationship_schema:
-                    if filters and attribute_path.relationship_schema.name in filters:
-                        include_in_query = True
-                    query_relationship_paths.add(
+        for path_values in path_values_groups:
+            for path_value in path_values:
+                if path_value.relationship_schema:
+                    query_request.relationship_attribute_paths.add(
                         QueryRelationshipAttributePath(
-                            identifier=attribute_path.relationship_schema.get_identifier(),
+                            identifier=path_value.relationship_schema.get_identifier(), value=path_value.value
                         )
                     )
-                    continue
-                if attribute_path.attribute_schema:
-                    if filters and attribute_path.attribute_schema.name in filters:
-                        include_in_query = True
-                    attribute_name = attribute_path.attribute_schema.name
-                    attribute = getattr(updated_node, attribute_name)
-                    if attribute.is_enum:
-                        attribute_value = attribute.value.value
-                    else:
-                        attribute_value = attribute.value
-                    query_attribute_paths.add(
+                elif path_value.attribute_schema:
+                    query_request.unique_attribute_paths.add(
                         QueryAttributePath(
-                            attribute_name=attribute_name,
-                            property_name=attribute_path.attribute_property_name or "value",
-                            value=attribute_value,
+                            attribute_name=path_value.attribute_schema.name,
+                            property_name=path_value.attribute_property_name or "value",
+                            value=path_value.value,
                         )
                     )
-            if include_in_query:
-                query_request.relationship_attribute_paths |= query_relationship_paths
-                query_request.unique_attribute_paths |= query_attribute_paths
         return query_request
 
     async def _get_node_attribute_path_values(
@@ -95,22 +105,18 @@ class NodeGroupedUniquenessConstraint(NodeConstraintInterface):
             elif schema_attribute_path.attribute_schema:
                 attribute_name = schema_attribute_path.attribute_schema.name
                 attribute_field = getattr(updated_node, attribute_name)
-                attribute_value = getattr(attribute_field, schema_attribute_path.attribute_property_name or "value")
+                property_name = schema_attribute_path.attribute_property_name or "value"
+                if property_name == "value":
+                    attribute_value = attribute_field.get_value()
+                else:
+                    attribute_value = getattr(attribute_field, property_name)
                 node_value_combination.append(
                     SchemaAttributePathValue.from_schema_attribute_path(schema_attribute_path, value=attribute_value)
                 )
         return node_value_combination
 
-    def _check_one_constraint_group(
-        self, schema_attribute_path_values: list[SchemaAttributePathValue], results_index: UniquenessQueryResultsIndex
-    ) -> None:
-        # constraint cannot be violated if this node is missing any values
-        if any(sapv.value is None for sapv in schema_attribute_path_values):
-            return
-
-        matching_node_ids = results_index.get_node_ids_for_value_group(schema_attribute_path_values)
-        if not matching_node_ids:
-            return
+    @staticmethod
+    def _raise_violation(schema_attribute_path_values: list[SchemaAttributePathValue]) -> None:
         uniqueness_constraint_fields = []
         for sapv in schema_attribute_path_values:
             if sapv.relationship_schema:
@@ -122,50 +128,81 @@ class NodeGroupedUniquenessConstraint(NodeConstraintInterface):
         errors = [ValidationError({field_name: error_msg}) for field_name in uniqueness_constraint_fields]
         raise ValidationError(errors)
 
-    async def _check_results(
-        self,
-        updated_node: Node,
-        path_groups: list[list[SchemaAttributePath]],
+    @classmethod
+    def _check_within_batch(cls, path_values_per_node: dict[str, list[SchemaAttributePathValue]]) -> None:
+        node_id_per_values: dict[tuple[str, ...], str] = {}
+        for node_id, path_values in path_values_per_node.items():
+            values = tuple(str(sapv.value) for sapv in path_values)
+            if node_id_per_values.setdefault(values, node_id) != node_id:
+                cls._raise_violation(schema_attribute_path_values=path_values)
+
+    @classmethod
+    def _check_results(
+        cls,
+        path_values_groups: Iterable[list[SchemaAttributePathValue]],
         query_results: Iterable[QueryResult],
+        exclude_node_ids: set[str],
     ) -> None:
-        results_index = UniquenessQueryResultsIndex(
-            query_results=query_results, exclude_node_ids={updated_node.get_id()}
-        )
-        for path_group in path_groups:
-            schema_attribute_path_values = await self._get_node_attribute_path_values(
-                updated_node=updated_node, path_group=path_group
-            )
-            self._check_one_constraint_group(
-                schema_attribute_path_values=schema_attribute_path_values, results_index=results_index
-            )
+        results_index = UniquenessQueryResultsIndex(query_results=query_results, exclude_node_ids=exclude_node_ids)
+        for path_values in path_values_groups:
+            if results_index.get_node_ids_for_value_group(path_values):
+                cls._raise_violation(schema_attribute_path_values=path_values)
+
+    async def _get_path_values_per_node(
+        self, nodes: Sequence[Node], path_group: list[SchemaAttributePath]
+    ) -> dict[str, list[SchemaAttributePathValue]]:
+        path_values_per_node: dict[str, list[SchemaAttributePathValue]] = {}
+        for node in nodes:
+            path_values = await self._get_node_attribute_path_values(updated_node=node, path_group=path_group)
+            # constraint cannot be violated if this node is missing any values
+            if any(sapv.value is None for sapv in path_values):
+                continue
+            path_values_per_node[node.get_id()] = path_values
+        return path_values_per_node
 
     async def _check_one_schema(
         self,
-        node: Node,
+        nodes: Sequence[Node],
         node_schema: MainSchemaTypes,
         at: Optional[Timestamp] = None,
         filters: Optional[list[str]] = None,
     ) -> None:
         schema_branch = self.db.schema.get_schema_branch(name=self.branch.name)
         path_groups = node_schema.get_unique_constraint_schema_attribute_paths(schema_branch=schema_branch)
-        query_request = self._build_query_request(
-            updated_node=node, node_schema=node_schema, path_groups=path_groups, filters=filters
-        )
-        if not query_request:
+        path_values_groups: list[list[SchemaAttributePathValue]] = []
+        for path_group in path_groups:
+            if not self._is_path_group_in_filters(path_group=path_group, filters=filters):
+                continue
+            path_values_per_node = await self._get_path_values_per_node(nodes=nodes, path_group=path_group)
+            self._check_within_batch(path_values_per_node=path_values_per_node)
+            path_values_groups.extend(path_values_per_node.values())
+        if not path_values_groups:
             return
+
+        # a single query returns the existing nodes matching the values of any constraint of the schema
+        query_request = self._build_query_request(node_schema=node_schema, path_values_groups=path_values_groups)
         query = await NodeUniqueAttributeConstraintQuery.init(
             db=self.db, branch=self.branch, at=at, query_request=query_request, min_count_required=0
         )
         await query.execute(db=self.db)
-        await self._check_results(updated_node=node, path_groups=path_groups, query_results=query.get_results())
+        # the nodes of the batch have been compared using their new values already
+        self._check_results(
+            path_values_groups=path_values_groups,
+            query_results=query.get_results(),
+            exclude_node_ids={node.get_id() for node in nodes},
+        )
 
     async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[list[str]] = None) -> None:
-        node_schema = node.get_schema()
-        schemas_to_check: list[MainSchemaTypes] = [node_schema]
-        if node_schema.inherit_from:
-            for parent_schema_name in node_schema.inherit_from:
-                parent_schema = self.schema_branch.get(name=parent_schema_name, duplicate=False)
-                if parent_schema.uniqueness_constraints:
-                    schemas_to_check.append(parent_schema)
-        for schema in schemas_to_check:
-            await self._check_one_schema(node=node, node_schema=schema, at=at, filters=filters)
+        await self.check_many(nodes=[node], at=at, filters=filters)
+
+    async def check_many(
+        self, nodes: Sequence[Node], at: Optional[Timestamp] = None, filters: Optional[list[str]] = None
+    ) -> None:
+        nodes_per_schema: dict[str, tuple[MainSchemaTypes, list[Node]]] = {}
+        for node in nodes:
+            for schema in self._get_schemas_to_check(node_schema=node.get_schema()):
+                _, schema_nodes = nodes_per_schema.setdefault(schema.kind, (schema, []))
+                schema_nodes.append(node)
+
+        for node_schema, schema_nodes in nodes_per_schema.values():
+            await self._check_one_schema(nodes=schema_nodes, node_schema=node_schema, at=at, filters=filters)
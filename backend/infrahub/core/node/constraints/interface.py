@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Sequence
 
 from infrahub.core.node import Node
 from infrahub.core.timestamp import Timestamp
@@ -8,3 +8,10 @@ from infrahub.core.timestamp import Timestamp
 class NodeConstraintInterface(ABC):
     @abstractmethod
     async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[list[str]] = None) -> None: ...
+
+    async def check_many(
+        self, nodes: Sequence[Node], at: Optional[Timestamp] = None, filters: Optional[list[str]] = None
+    ) -> None:
+        """Check the constraint for nodes saved together, the nodes must also satisfy the constraint between them."""
+        for node in nodes:
+            await self.check(node=node, at=at, filters=filters)
@@ -1,23 +1,27 @@
 from __future__ import annotations
 
 import ipaddress
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional
 
 from infrahub.core import registry
 from infrahub.core.ipam.reconciler import IpamReconciler
+from infrahub.core.ipam.tree import ipam_trees
 from infrahub.core.query.ipam import get_ip_addresses
 from infrahub.core.query.resource_manager import (
     IPAddressPoolGetReserved,
     IPAddressPoolSetReserved,
 )
 from infrahub.exceptions import PoolExhaustedError, ValidationError
-from infrahub.pools.address import get_available
+from infrahub.pools.allocators import pool_allocators
+from infrahub.pools.prefix import PrefixAllocator
 
 from .. import Node
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
-    from infrahub.core.ipam.constants import IPAddressType
+    from infrahub.core.ipam.constants import IPAddressType, IPNetworkType
+    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 
@@ -68,6 +72,11 @@ class CoreIPAddressPool(Node):
         await node.save(db=db)
         reconciler = IpamReconciler(db=db, branch=branch)
         await reconciler.reconcile(ip_value=next_prefix, namespace=ip_namespace.id, node_uuid=node.get_id())
+        ipam_trees.update_node(
+            branch_name=branch.name, node_id=node.get_id(), namespace_id=ip_namespace.id, ip_value=next_prefix
+        )
+        db.add_rollback_callback(partial(ipam_trees.update_node, branch_name=branch.name, node_id=node.get_id()))
+        pool_allocators.update_node(node_id=node.get_id(), namespace_id=ip_namespace.id, ip_value=next_prefix)
 
         if identifier:
             query_set = await IPAddressPoolSetReserved.init(
@@ -78,29 +87,93 @@ class CoreIPAddressPool(Node):
         return node
 
     async def get_next(self, db: InfrahubDatabase, prefixlen: Optional[int] = None) -> IPAddressType:
-        # Measure utilization of all prefixes identified as resources
+        """Allocate the next available address, it is considered used by the pool from then on."""
+        next_addresses = await self.get_next_many(db=db, prefixlen=prefixlen, count=1)
+        return next_addresses[0]
+
+    async def get_next_many(
+        self, db: InfrahubDatabase, count: int, prefixlen: Optional[int] = None
+    ) -> list[IPAddressType]:
+        """Allocate count addresses from the resources of the pool, either all of them are allocated or none.
+
+        The addresses are released if the transaction in which they are allocated is rolled back.
+        """
         resources = await self.resources.get_peers(db=db)  # type: ignore[attr-defined]
         ip_namespace = await self.ip_namespace.get_peer(db=db)  # type: ignore[attr-defined]
 
-        for resource in resources.values():
-            ip_prefix = ipaddress.ip_network(resource.prefix.value)  # type: ignore[attr-defined]
-            prefix_length = prefixlen or ip_prefix.prefixlen
+        async with pool_allocators.get_lock(pool_id=self.get_id()):
+            allocations: list[tuple[PrefixAllocator, IPNetworkType, int]] = []
+            for resource in resources.values():
+                ip_prefix = ipaddress.ip_network(resource.prefix.value)  # type: ignore[attr-defined]
+                prefix_length = prefixlen or ip_prefix.prefixlen
+
+                if not ip_prefix.prefixlen <= prefix_length <= ip_prefix.max_prefixlen:
+                    for allocator, subnet, _ in allocations:
+                        allocator.release(subnet=subnet)
+                    raise ValidationError(input_value="Invalid prefix length for current selected prefix")
+
+                is_pool = bool(resource.is_pool.value)  # type: ignore[attr-defined]
+                allocator = await pool_allocators.get_allocator(
+                    key=(self.get_id(), resource.get_id(), str(ip_prefix), str(is_pool)),
+                    namespace_id=ip_namespace.id,
+                    is_address=True,
+                    loader=partial(
+                        self._load_allocator, db=db, ip_prefix=ip_prefix, ip_namespace=ip_namespace, is_pool=is_pool
+                    ),
+                    syncer=partial(self._get_changes, db=db, ip_prefix=ip_prefix, ip_namespace=ip_namespace),
+                )
+                allocations.extend(
+                    (allocator, subnet, prefix_length)
+                    for subnet in allocator.allocate(
+                        prefixlen=ip_prefix.max_prefixlen, count=count - len(allocations), lowest_first=True
+                    )
+                )
+                if len(allocations) == count:
+                    for allocator, subnet, _ in allocations:
+                        db.add_rollback_callback(partial(allocator.release, subnet=subnet))
+                    return [
+                        ipaddress.ip_interface((subnet.network_address, prefix_length))
+                        for _, subnet, prefix_length in allocations
+                    ]
+
+            for allocator, subnet, _ in allocations:
+                allocator.release(subnet=subnet)
 
-            if not ip_prefix.prefixlen <= prefix_length <= ip_prefix.max_prefixlen:
-                raise ValidationError(input_value="Invalid prefix length for current selected prefix")
-
-            addresses = await get_ip_addresses(
-                db=db, ip_prefix=ip_prefix, namespace=ip_namespace, branch=self._branch, branch_agnostic=True
-            )
+        raise PoolExhaustedError("There are no more addresses available in this pool.")
 
-            available = get_available(
-                network=ip_prefix,
-                addresses=[ip.address for ip in addresses],
-                is_pool=resource.is_pool.value,  # type: ignore[attr-defined]
+    async def _load_allocator(
+        self, at: Timestamp, db: InfrahubDatabase, ip_prefix: IPNetworkType, ip_namespace: Node, is_pool: bool
+    ) -> PrefixAllocator:
+        addresses = await get_ip_addresses(
+            db=db, ip_prefix=ip_prefix, namespace=ip_namespace, branch=self._branch, at=at, branch_agnostic=True
+        )
+
+        allocator = PrefixAllocator(ip_prefix)
+        if not is_pool:
+            # If the prefix is not a pool the network address and the broadcast address in case of IPv4 are not usable
+            allocator.reserve(subnet=ipaddress.ip_network((ip_prefix.network_address, ip_prefix.max_prefixlen)))
+            if ip_prefix.version == 4:
+                allocator.reserve(subnet=ipaddress.ip_network((ip_prefix.broadcast_address, ip_prefix.max_prefixlen)))
+        for address in addresses:
+            allocator.reserve(
+                subnet=ipaddress.ip_network((address.address.ip, address.address.max_prefixlen)),
+                identifier=str(address.id),
             )
-
-            if available:
-                next_address = available.iter_cidrs()[0]
-                return ipaddress.ip_interface(f"{next_address.ip}/{prefix_length}")
-
-        raise PoolExhaustedError("There are no more addresses available in this pool.")
+        return allocator
+
+    async def _get_changes(
+        self, since: str, at: Timestamp, db: InfrahubDatabase, ip_prefix: IPNetworkType, ip_namespace: Node
+    ) -> list[tuple[str, IPNetworkType]]:
+        addresses = await get_ip_addresses(
+            db=db,
+            ip_prefix=ip_prefix,
+            namespace=ip_namespace,
+            branch=self._branch,
+            at=at,
+            branch_agnostic=True,
+            since=since,
+        )
+        return [
+            (str(address.id), ipaddress.ip_network((address.address.ip, address.address.max_prefixlen)))
+            for address in addresses
+        ]
@@ -1,22 +1,26 @@
 from __future__ import annotations
 
 import ipaddress
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional
 
 from infrahub.core import registry
 from infrahub.core.ipam.reconciler import IpamReconciler
+from infrahub.core.ipam.tree import ipam_trees
 from infrahub.core.query.ipam import get_subnets
 from infrahub.core.query.resource_manager import (
     PrefixPoolGetReserved,
     PrefixPoolSetReserved,
 )
-from infrahub.pools.prefix import PrefixPool
+from infrahub.pools.allocators import pool_allocators
+from infrahub.pools.prefix import PrefixAllocator
 
 from .. import Node
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.ipam.constants import IPNetworkType
+    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 
@@ -72,6 +76,11 @@ class CoreIPPrefixPool(Node):
         await node.save(db=db)
         reconciler = IpamReconciler(db=db, branch=branch)
         await reconciler.reconcile(ip_value=next_prefix, namespace=ip_namespace.id, node_uuid=node.get_id())
+        ipam_trees.update_node(
+            branch_name=branch.name, node_id=node.get_id(), namespace_id=ip_namespace.id, ip_value=next_prefix
+        )
+        db.add_rollback_callback(partial(ipam_trees.update_node, branch_name=branch.name, node_id=node.get_id()))
+        pool_allocators.update_node(node_id=node.get_id(), namespace_id=ip_namespace.id, ip_value=next_prefix)
 
         if identifier:
             query_set = await PrefixPoolSetReserved.init(
@@ -82,27 +91,73 @@ class CoreIPPrefixPool(Node):
         return node
 
     async def get_next(self, db: InfrahubDatabase, prefixlen: int) -> IPNetworkType:
-        # Measure utilization of all prefixes identified as resources
-        resources = await self.resources.get_peers(db=db)  # type: ignore[attr-defined]
-        ip_namespace = await self.ip_namespace.get_peer(db=db)  # type: ignore[attr-defined]
+        """Allocate the next available prefix, it is considered used by the pool from then on."""
+        next_prefixes = await self.get_next_many(db=db, prefixlen=prefixlen, count=1)
+        return next_prefixes[0]
 
-        for resource in resources.values():
-            subnets = await get_subnets(
-                db=db,
-                ip_prefix=ipaddress.ip_network(resource.prefix.value),  # type: ignore[attr-defined]
-                namespace=ip_namespace,
-                branch=self._branch,
-                branch_agnostic=True,
-            )
+    async def get_next_many(self, db: InfrahubDatabase, prefixlen: int, count: int) -> list[IPNetworkType]:
+        """Allocate count prefixes from the resources of the pool, either all of them are allocated or none.
 
-            pool = PrefixPool(resource.prefix.value)  # type: ignore[attr-defined]
-            for subnet in subnets:
-                pool.reserve(subnet=str(subnet.prefix))
+        The prefixes are released if the transaction in which they are allocated is rolled back.
+        """
+        resources = await self.resources.get_peers(db=db)  # type: ignore[attr-defined]
+        ip_namespace = await self.ip_namespace.get_peer(db=db)  # type: ignore[attr-defined]
 
-            try:
-                next_available = pool.get(prefixlen=prefixlen)
-                return next_available
-            except IndexError:
-                continue
+        async with pool_allocators.get_lock(pool_id=self.get_id()):
+            allocations: list[tuple[PrefixAllocator, IPNetworkType]] = []
+            for resource in resources.values():
+                ip_prefix = ipaddress.ip_network(resource.prefix.value)  # type: ignore[attr-defined]
+                if prefixlen <= ip_prefix.prefixlen:
+                    continue
+
+                allocator = await pool_allocators.get_allocator(
+                    key=(self.get_id(), resource.get_id(), str(ip_prefix)),
+                    namespace_id=ip_namespace.id,
+                    is_address=False,
+                    loader=partial(self._load_allocator, db=db, ip_prefix=ip_prefix, ip_namespace=ip_namespace),
+                    syncer=partial(self._get_changes, db=db, ip_prefix=ip_prefix, ip_namespace=ip_namespace),
+                )
+                allocations.extend(
+                    (allocator, subnet)
+                    for subnet in allocator.allocate(prefixlen=prefixlen, count=count - len(allocations))
+                )
+                if len(allocations) == count:
+                    for allocator, subnet in allocations:
+                        db.add_rollback_callback(partial(allocator.release, subnet=subnet))
+                    return [subnet for _, subnet in allocations]
+
+            for allocator, subnet in allocations:
+                allocator.release(subnet=subnet)
 
         raise IndexError("No more resources available")
+
+    async def _load_allocator(
+        self, at: Timestamp, db: InfrahubDatabase, ip_prefix: IPNetworkType, ip_namespace: Node
+    ) -> PrefixAllocator:
+        subnets = await get_subnets(
+            db=db,
+            ip_prefix=ip_prefix,
+            namespace=ip_namespace,
+            branch=self._branch,
+            at=at,
+            branch_agnostic=True,
+        )
+
+        allocator = PrefixAllocator(ip_prefix)
+        for subnet in sorted(subnets, key=lambda subnet: subnet.prefix.prefixlen):
+            allocator.reserve(subnet=subnet.prefix, identifier=str(subnet.id))
+        return allocator
+
+    async def _get_changes(
+        self, since: str, at: Timestamp, db: InfrahubDatabase, ip_prefix: IPNetworkType, ip_namespace: Node
+    ) -> list[tuple[str, IPNetworkType]]:
+        subnets = await get_subnets(
+            db=db,
+            ip_prefix=ip_prefix,
+            namespace=ip_namespace,
+            branch=self._branch,
+            at=at,
+            branch_agnostic=True,
+            since=since,
+        )
+        return [(str(subnet.id), subnet.prefix) for subnet in subnets]
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Optional
 
-from infrahub.core.query.resource_manager import NumberPoolGetReserved, NumberPoolGetUsed, NumberPoolSetReserved
+from infrahub.core.query.resource_manager import (
+    NumberPoolGetChanged,
+    NumberPoolGetReserved,
+    NumberPoolGetUsed,
+    NumberPoolSetReserved,
+)
 from infrahub.exceptions import PoolExhaustedError
+from infrahub.pools.allocators import number_allocators
+from infrahub.pools.number import NumberAllocator
 
 from .. import Node
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 
@@ -41,26 +50,51 @@ class CoreNumberPool(Node):
         return number
 
     async def get_next(self, db: InfrahubDatabase, branch: Branch) -> int:
-        query = await NumberPoolGetUsed.init(db=db, branch=branch, pool=self, branch_agnostic=True)
-        await query.execute(db=db)
-        taken = [result.get_as_optional_type("av.value", return_type=int) for result in query.results]
-        next_number = find_next_free(
-            start=self.start_range.value,  # type: ignore[attr-defined]
-            end=self.end_range.value,  # type: ignore[attr-defined]
-            taken=taken,
-        )
-        if next_number is None:
-            raise PoolExhaustedError("There are no more addresses available in this pool.")
+        """Allocate the next available number, it is considered used by the pool from then on."""
+        numbers = await self.get_next_many(db=db, branch=branch, count=1)
+        return numbers[0]
 
-        return next_number
+    async def get_next_many(self, db: InfrahubDatabase, branch: Branch, count: int) -> list[int]:
+        """Allocate count numbers, either all of them are allocated or none.
 
+        The numbers are released if the transaction in which they are allocated is rolled back.
+        """
+        start_range = int(self.start_range.value)  # type: ignore[attr-defined]
+        end_range = int(self.end_range.value)  # type: ignore[attr-defined]
 
-def find_next_free(start: int, end: int, taken: list[int | None]) -> Optional[int]:
-    used_numbers = [number for number in taken if number is not None]
-    used_set = set(used_numbers)
+        async with number_allocators.get_lock(pool_id=self.get_id()):
+            pool_allocator = await number_allocators.get_allocator(
+                key=(self.get_id(), self.node_attribute.value, str(start_range), str(end_range)),  # type: ignore[attr-defined]
+                loader=partial(
+                    self._load_allocator, db=db, branch=branch, start_range=start_range, end_range=end_range
+                ),
+                syncer=partial(self._get_changes, db=db, branch=branch),
+            )
+            numbers = pool_allocator.allocate(count=count)
+            if len(numbers) < count:
+                for number in numbers:
+                    pool_allocator.release(number=number)
+                raise PoolExhaustedError("There are no more addresses available in this pool.")
+            for number in numbers:
+                db.add_rollback_callback(partial(pool_allocator.release, number=number))
 
-    for num in range(start, end + 1):
-        if num not in used_set:
-            return num
+        return numbers
 
-    return None
+    async def _load_allocator(
+        self, at: Timestamp, db: InfrahubDatabase, branch: Branch, start_range: int, end_range: int
+    ) -> NumberAllocator:
+        query = await NumberPoolGetUsed.init(db=db, branch=branch, pool=self, branch_agnostic=True, at=at)
+        await query.execute(db=db)
+        taken = [result.get_as_optional_type("value", return_type=int) for result in query.results]
+        return NumberAllocator.from_used(
+            start=start_range, end=end_range, numbers=[number for number in taken if number is not None]
+        )
+
+    async def _get_changes(
+        self, since: str, at: Timestamp, db: InfrahubDatabase, branch: Branch
+    ) -> tuple[set[int], set[int]]:
+        query = await NumberPoolGetChanged.init(
+            db=db, branch=branch, pool=self, since=since, branch_agnostic=True, at=at
+        )
+        await query.execute(db=db)
+        return query.get_changes()
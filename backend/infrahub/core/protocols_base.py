@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional, Protocol, Union, runtime_checkable
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Protocol, Union, runtime_checkable
 
 from typing_extensions import Self
 
@@ -51,6 +51,10 @@ class InfrahubDatabase(Protocol):
         self, query: str, params: Optional[dict[str, Any]] = None, name: str = "undefined"
     ) -> tuple[list[Record], dict[str, Any]]: ...
 
+    def execute_query_stream(
+        self, query: str, params: Optional[dict[str, Any]] = None, name: str = "undefined"
+    ) -> AsyncIterator[Record]: ...
+
     async def run_query(
         self, query: str, params: Optional[dict[str, Any]] = None, name: str = "undefined"
     ) -> AsyncResult: ...
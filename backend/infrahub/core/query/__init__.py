@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Generator, Iterator, Optional, TypeVar, Union
 
 import ujson
 from neo4j.graph import Node as Neo4jNode
@@ -17,7 +17,6 @@ from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import QueryError
 
 if TYPE_CHECKING:
-    from neo4j import Record
     from typing_extensions import Self
 
     from infrahub.core.branch import Branch
@@ -158,24 +157,72 @@ def cleanup_return_labels(labels: list[str]) -> list[str]:
     return clean_labels
 
 
+def get_label_index(labels: list[str]) -> dict[str, int]:
+    """Return the position of each label in the list of labels, the first position is used for duplicated labels."""
+    label_index: dict[str, int] = {}
+    for idx, label in enumerate(labels):
+        label_index.setdefault(label, idx)
+    return label_index
+
+
 class QueryResult:
-    def __init__(self, data: list[Union[Neo4jNode, Neo4jRelationship, list[Neo4jNode]]], labels: list[str]):
+    """One row returned by a query.
+
+    The labels and their index are computed once per query and shared between all the rows,
+    the scores used to sort the results are only calculated the first time they are accessed.
+    """
+
+    __slots__ = (
+        "_branch_score",
+        "_has_deleted_rels",
+        "_label_index",
+        "_time_score",
+        "data",
+        "labels",
+        "permission_score",
+    )
+
+    def __init__(
+        self,
+        data: list[Union[Neo4jNode, Neo4jRelationship, list[Neo4jNode]]],
+        labels: list[str],
+        label_index: Optional[dict[str, int]] = None,
+    ):
         self.data = data
-        self.labels = cleanup_return_labels(labels)
-        self.branch_score: int = 0
-        self.time_score: int = 0
+        if label_index is None:
+            self.labels = cleanup_return_labels(labels)
+            self._label_index = get_label_index(self.labels)
+        else:
+            self.labels = labels
+            self._label_index = label_index
+        self._branch_score: Optional[int] = None
+        self._time_score: Optional[int] = None
+        self._has_deleted_rels: Optional[bool] = None
         self.permission_score = PermissionLevel.DEFAULT
-        self.has_deleted_rels: bool = False
 
-        self.calculate_branch_score()
-        self.calculate_time_score()
-        self.check_rels_status()
+    @property
+    def branch_score(self) -> int:
+        if self._branch_score is None:
+            self.calculate_branch_score()
+        return self._branch_score  # type: ignore[return-value]
+
+    @property
+    def time_score(self) -> int:
+        if self._time_score is None:
+            self.calculate_time_score()
+        return self._time_score  # type: ignore[return-value]
+
+    @property
+    def has_deleted_rels(self) -> bool:
+        if self._has_deleted_rels is None:
+            self.check_rels_status()
+        return self._has_deleted_rels  # type: ignore[return-value]
 
     def calculate_branch_score(self) -> None:
         """The branch score is a simple way to order and classify multiple responses for the same branch.
         If the branch name is not the default branch it will get a higher score
         """
-        self.branch_score = 0
+        self._branch_score = 0
 
         for rel in self.get_rels():
             branch_level = rel.get("branch_level", None)
@@ -183,13 +230,13 @@ class QueryResult:
             if not branch_level:
                 continue
 
-            self.branch_score += branch_level
+            self._branch_score += branch_level
 
     def calculate_time_score(self) -> None:
         """The time score look into the to and from time all relationships
         if the 'to' field is not defined
         """
-        self.time_score = 0
+        self._time_score = 0
 
         for rel in self.get_rels():
             branch_name = rel.get("branch", None)
@@ -200,22 +247,24 @@ class QueryResult:
             to_time = rel.get("to", None)
 
             if to_time:
-                self.time_score += 1
+                self._time_score += 1
             else:
-                self.time_score += 2
+                self._time_score += 2
 
     def check_rels_status(self) -> None:
         """Check if some relationships have the status deleted and update the flag `has_deleted_rels`"""
+        self._has_deleted_rels = False
         for rel in self.get_rels():
             if rel.get("status", None) == "deleted":
-                self.has_deleted_rels = True
+                self._has_deleted_rels = True
                 return
 
     def _get(self, label: str) -> Union[Neo4jNode, Neo4jRelationship, list[Neo4jNode]]:
-        if label not in self.labels:
-            raise ValueError(f"{label} is not a valid value for this query, must be one of {self.labels}")
+        try:
+            return_id = self._label_index[label]
+        except KeyError:
+            raise ValueError(f"{label} is not a valid value for this query, must be one of {self.labels}") from None
 
-        return_id = self.labels.index(label)
         return self.data[return_id]
 
     def get(self, label: str) -> Union[Neo4jNode, Neo4jRelationship]:
@@ -533,12 +582,7 @@ class Query(ABC):
         query_str = self.get_query()
 
         if self.type == QueryType.READ:
-            if self.limit or self.offset:
-                results = await db.execute_query(
-                    query=query_str, params=self.params, name=self.name, context=self.get_context()
-                )
-            else:
-                results = await self.query_with_size_limit(db=db)
+            self.results = [result async for result in self._stream_results(db=db, query=query_str)]
 
         elif self.type == QueryType.WRITE:
             results, metadata = await db.execute_query_with_metadata(
@@ -546,38 +590,49 @@ class Query(ABC):
             )
             if "stats" in metadata:
                 self.stats.add(metadata.get("stats"))
+            labels = cleanup_return_labels(self.return_labels)
+            label_index = get_label_index(labels)
+            self.results = [QueryResult(data=result, labels=labels, label_index=label_index) for result in results]
         else:
             raise ValueError(f"unknown value for {self.type}")
 
-        if not results and self.raise_error_if_empty:
+        if not self.results and self.raise_error_if_empty:
             raise QueryError(query=query_str, params=self.params)
 
-        self.results = [QueryResult(data=result, labels=self.return_labels) for result in results]
         self.has_been_executed = True
 
         return self
 
-    async def query_with_size_limit(self, db: InfrahubDatabase) -> list[Record]:
-        query_limit = config.SETTINGS.database.query_size_limit
-        offset = 0
-        results: list[Record] = []
-        remaining = True
-        while remaining:
-            offset_results, metadata = await db.execute_query_with_metadata(
-                query=self.get_query(limit=query_limit, offset=offset),
-                params=self.params,
-                name=self.name,
-                context=self.get_context(),
-            )
-            if "stats" in metadata:
-                self.stats.add(metadata.get("stats"))
-            results.extend(offset_results)
-            offset += query_limit
+    async def execute_stream(self, db: InfrahubDatabase) -> AsyncIterator[QueryResult]:
+        """Execute a READ query and yield the results one by one as they are returned by the database.
+
+        Unlike execute(), the results are not stored in self.results and they are not sorted by score,
+        this is meant for queries returning a large number of rows that can be processed incrementally.
+        """
+        if self.type != QueryType.READ:
+            raise TypeError("Only READ queries can be streamed.")
 
-            if len(offset_results) < query_limit:
-                remaining = False
+        if config.SETTINGS.miscellaneous.print_query_details:
+            self.print(include_var=True)
+
+        query_str = self.get_query()
+        has_results = False
+        async for result in self._stream_results(db=db, query=query_str):
+            has_results = True
+            yield result
+
+        if not has_results and self.raise_error_if_empty:
+            raise QueryError(query=query_str, params=self.params)
+
+        self.has_been_executed = True
 
-        return results
+    async def _stream_results(self, db: InfrahubDatabase, query: str) -> AsyncIterator[QueryResult]:
+        labels = cleanup_return_labels(self.return_labels)
+        label_index = get_label_index(labels)
+        async for record in db.execute_query_stream(
+            query=query, params=self.params, name=self.name, context=self.get_context()
+        ):
+            yield QueryResult(data=record, labels=labels, label_index=label_index)
 
     async def count(self, db: InfrahubDatabase) -> int:
         """Count the number of results matching a READ query.
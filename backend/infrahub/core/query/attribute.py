@@ -72,6 +72,79 @@ class AttributeUpdateValueQuery(AttributeQuery):
         self.return_labels = ["a", "av", "r"]
 
 
+class AttributeUpdateValuesQuery(Query):
+    """Update the value of multiple attributes in a single query.
+
+    The relationships to the previous values that must be closed are updated first, then the new values are created
+    with one UNWIND per type of AttributeValue as they don't share the same labels and properties.
+    """
+
+    name = "attribute_update_values"
+    type: QueryType = QueryType.WRITE
+
+    def __init__(
+        self,
+        attributes: list[BaseAttribute],
+        rel_ids_to_update: list[str],
+        at: Optional[Union[Timestamp, str]] = None,
+        **kwargs: Any,
+    ):
+        self.attributes = attributes
+        self.rel_ids_to_update = rel_ids_to_update
+        self.at = Timestamp(at)
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
+        self.params["at"] = self.at.to_string()
+        self.params["rel_ids"] = [db.to_database_id(rel_id) for rel_id in self.rel_ids_to_update]
+
+        query = """
+        CALL {
+            MATCH ()-[r]->()
+            WHERE %(id_func)s(r) IN $rel_ids
+            SET r.to = $at
+            RETURN count(r) AS num_updated
+        }
+        """ % {"id_func": db.get_id_function_name()}
+        self.add_to_query(query)
+        self.return_labels = ["num_updated"]
+
+        values_per_type: dict[tuple[tuple[str, ...], tuple[str, ...]], list[dict[str, Any]]] = {}
+        for attr in self.attributes:
+            content = attr.to_db()
+            labels = ["AttributeValue"]
+            node_type = attr.get_db_node_type()
+            if node_type == AttributeDBNodeType.IPHOST:
+                labels.append("AttributeIPHost")
+            elif node_type == AttributeDBNodeType.IPNETWORK:
+                labels.append("AttributeIPNetwork")
+
+            branch = attr.get_branch_based_on_support_type()
+            values_per_type.setdefault((tuple(labels), tuple(content.keys())), []).append(
+                {"uuid": attr.id, "branch": branch.name, "branch_level": branch.hierarchy_level, "content": content}
+            )
+
+        for idx, ((value_labels, keys), values) in enumerate(values_per_type.items()):
+            self.params[f"values_{idx}"] = values
+            query = """
+            CALL {
+                UNWIND $values_%(idx)s AS value
+                MATCH (a:Attribute { uuid: value.uuid })
+                MERGE (av:%(labels)s { %(props)s } )
+                CREATE (a)-[r:%(rel_label)s { branch: value.branch, branch_level: value.branch_level, status: "active", from: $at }]->(av)
+                RETURN count(r) AS num_created_%(idx)s
+            }
+            """ % {
+                "idx": idx,
+                "labels": ":".join(value_labels),
+                "props": ", ".join(f"{key}: value.content.{key}" for key in keys),
+                "rel_label": RELATIONSHIP_TO_VALUE_LABEL,
+            }
+            self.add_to_query(query)
+            self.return_labels.append(f"num_created_{idx}")
+
+
 class AttributeUpdateFlagQuery(AttributeQuery):
     name = "attribute_update_flag"
     type: QueryType = QueryType.WRITE
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import ipaddress
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
 
-from infrahub.core.constants import InfrahubKind
+from infrahub_sdk.uuidt import UUIDT
+
+from infrahub.core.constants import InfrahubKind, RelationshipStatus
+from infrahub.core.constants.relationship_label import RELATIONSHIP_TO_VALUE_LABEL
 from infrahub.core.ipam.constants import AllIPTypes, IPAddressType, IPNetworkType
 from infrahub.core.registry import registry
 from infrahub.core.utils import convert_ip_to_binary_str
 
-from . import Query
+from . import Query, QueryType
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -53,15 +56,18 @@ class IPPrefixSubnetFetch(Query):
         self,
         obj: IPNetworkType,
         namespace: Optional[Union[Node, str]] = None,
+        since: Optional[str] = None,
         **kwargs,
     ):
         self.obj = obj
         self.namespace_id = _get_namespace_id(namespace)
+        self.since = since
 
         super().__init__(**kwargs)
 
     async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
         self.params["ns_id"] = self.namespace_id
+        self.params["since"] = self.since
 
         prefix_bin = convert_ip_to_binary_str(self.obj)[: self.obj.prefixlen]
         self.params["prefix_binary"] = prefix_bin
@@ -96,6 +102,7 @@ class IPPrefixSubnetFetch(Query):
             AND av.prefixlen > $maxprefixlen
             AND av.version = $ip_version
             AND all(r IN relationships(path2) WHERE (%(branch_filter)s))
+            AND ($since IS NULL OR any(r IN relationships(path2) WHERE r.from >= $since))
         // TODO Need to check for delete nodes
         WITH
             collect([pfx, av]) as all_prefixes_and_value,
@@ -144,15 +151,18 @@ class IPPrefixIPAddressFetch(Query):
         self,
         obj: IPNetworkType,
         namespace: Optional[Union[Node, str]] = None,
+        since: Optional[str] = None,
         **kwargs,
     ):
         self.obj = obj
         self.namespace_id = _get_namespace_id(namespace)
+        self.since = since
 
         super().__init__(**kwargs)
 
     async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
         self.params["ns_id"] = self.namespace_id
+        self.params["since"] = self.since
 
         prefix_bin = convert_ip_to_binary_str(self.obj)[: self.obj.prefixlen]
         self.params["prefix_binary"] = prefix_bin
@@ -187,6 +197,7 @@ class IPPrefixIPAddressFetch(Query):
             AND av.prefixlen >= $maxprefixlen
             AND av.version = $ip_version
             AND all(r IN relationships(path2) WHERE (%(branch_filter)s))
+            AND ($since IS NULL OR any(r IN relationships(path2) WHERE r.from >= $since))
         """ % {
             "ns_label": InfrahubKind.IPNAMESPACE,
             "node_label": InfrahubKind.IPADDRESS,
@@ -210,6 +221,323 @@ class IPPrefixIPAddressFetch(Query):
         return addresses
 
 
+class IPNamespaceMembersFetch(Query):
+    """Fetch the value of every IP prefix and IP address of a namespace."""
+
+    name: str = "ipnamespace_members_fetch"
+
+    def __init__(
+        self,
+        namespace: Optional[Union[Node, str]] = None,
+        **kwargs,
+    ):
+        self.namespace_id = _get_namespace_id(namespace)
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.params["ns_id"] = self.namespace_id
+
+        branch_filter, branch_params = self.branch.get_query_filter_path(
+            at=self.at.to_string(), branch_agnostic=self.branch_agnostic
+        )
+        self.params.update(branch_params)
+
+        # ruff: noqa: E501
+        query = """
+        // First match on IPNAMESPACE
+        MATCH (ns:%(ns_label)s)
+        WHERE ns.uuid = $ns_id
+        CALL {
+            WITH ns
+            MATCH (ns)-[r:IS_PART_OF]-(root:Root)
+            WHERE %(branch_filter)s
+            RETURN ns as ns1, r as r1
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH ns, r1 as r
+        WHERE r.status = "active"
+        WITH ns
+        // MATCH all prefixes and addresses of the namespace along with their value
+        MATCH path = (ns)-[r1:IS_RELATED]-(ns_rel:Relationship)-[r2:IS_RELATED]-(member:Node)-[r3:HAS_ATTRIBUTE]-(an:Attribute)-[r4:HAS_VALUE]-(av:AttributeValue)
+        WHERE ns_rel.name IN ["ip_namespace__ip_prefix", "ip_namespace__ip_address"]
+            AND an.name IN ["prefix", "address"]
+            AND any(l IN labels(av) WHERE l IN ["%(prefix_label)s", "%(address_label)s"])
+            AND all(r IN relationships(path) WHERE (%(branch_filter)s))
+        WITH
+            member,
+            av,
+            reduce(br_lvl = 0, r in relationships(path) | br_lvl + r.branch_level) AS sum_branch_level,
+            all(r in relationships(path) WHERE r.status = "active") AS is_active,
+            [r4.from, r3.from, r2.from, r1.from] AS from_times
+        ORDER BY member.uuid, sum_branch_level DESC, from_times[0] DESC, from_times[1] DESC, from_times[2] DESC, from_times[3] DESC
+        // keep the latest value of each member if it is still active
+        WITH member, head(collect([av, is_active])) AS latest_value
+        WHERE latest_value[1] = TRUE
+        WITH member, latest_value[0] AS av
+        """ % {
+            "ns_label": InfrahubKind.IPNAMESPACE,
+            "prefix_label": PREFIX_ATTRIBUTE_LABEL,
+            "address_label": ADDRESS_ATTRIBUTE_LABEL,
+            "branch_filter": branch_filter,
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["member", "av"]
+
+    def get_prefixes(self) -> list[IPPrefixData]:
+        """Return all the prefixes of the namespace."""
+        return [
+            IPPrefixData(
+                id=result.get_node("member").get("uuid"),
+                prefix=ipaddress.ip_network(result.get_node("av").get("value")),
+            )
+            for result in self.get_results()
+            if PREFIX_ATTRIBUTE_LABEL in result.get_node("av").labels
+        ]
+
+    def get_addresses(self) -> list[IPAddressData]:
+        """Return all the addresses of the namespace."""
+        return [
+            IPAddressData(
+                id=result.get_node("member").get("uuid"),
+                address=ipaddress.ip_interface(result.get_node("av").get("value")),
+            )
+            for result in self.get_results()
+            if ADDRESS_ATTRIBUTE_LABEL in result.get_node("av").labels
+        ]
+
+
+class IPNamespaceParentsFetch(Query):
+    """Fetch the current parent prefix of every IP prefix and IP address of a namespace."""
+
+    name: str = "ipnamespace_parents_fetch"
+
+    def __init__(
+        self,
+        namespace: Optional[Union[Node, str]] = None,
+        **kwargs,
+    ):
+        self.namespace_id = _get_namespace_id(namespace)
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.params["ns_id"] = self.namespace_id
+
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string())
+        self.params.update(branch_params)
+
+        # ruff: noqa: E501
+        query = """
+        // First match on IPNAMESPACE
+        MATCH (ns:%(ns_label)s)
+        WHERE ns.uuid = $ns_id
+        CALL {
+            WITH ns
+            MATCH (ns)-[r:IS_PART_OF]-(root:Root)
+            WHERE %(branch_filter)s
+            RETURN ns as ns1, r as r1
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH ns, r1 as r
+        WHERE r.status = "active"
+        WITH ns
+        // MATCH all prefixes and addresses of the namespace
+        MATCH ns_path = (ns)-[:IS_RELATED]-(ns_rel:Relationship)-[:IS_RELATED]-(member:Node)
+        WHERE ns_rel.name IN ["ip_namespace__ip_prefix", "ip_namespace__ip_address"]
+            AND all(r IN relationships(ns_path) WHERE (%(branch_filter)s) AND r.status = "active")
+        WITH DISTINCT member
+        // MATCH the parent prefixes of each member, prefixes are linked to their parent with an outbound relationship
+        MATCH parent_path = (member)-[r1:IS_RELATED]-(parent_rel:Relationship)-[r2:IS_RELATED]-(parent:%(prefix_kind)s)
+        WHERE (
+                (parent_rel.name = "parent__child" AND startNode(r1) = member AND endNode(r2) = parent)
+                OR (parent_rel.name = "ip_prefix__ip_address" AND "%(address_kind)s" IN labels(member))
+            )
+            AND all(r IN relationships(parent_path) WHERE (%(branch_filter)s))
+        WITH
+            member,
+            parent,
+            r1.branch_level + r2.branch_level AS branch_level,
+            (r1.status = "active" AND r2.status = "active") AS is_active,
+            [r1.from, r2.from] AS from_times
+        ORDER BY member.uuid, parent.uuid, branch_level DESC, from_times[0] DESC, from_times[1] DESC
+        // keep the parents for which the latest relationship is still active
+        WITH member, parent, head(collect(is_active)) AS is_latest_active
+        WHERE is_latest_active = TRUE
+        """ % {
+            "ns_label": InfrahubKind.IPNAMESPACE,
+            "prefix_kind": InfrahubKind.IPPREFIX,
+            "address_kind": InfrahubKind.IPADDRESS,
+            "branch_filter": branch_filter,
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["member.uuid AS member_uuid", "parent.uuid AS parent_uuid"]
+
+    def get_parent_uuids(self) -> dict[str, set[str]]:
+        """Return the UUIDs of the parent prefixes of the members of the namespace that have one."""
+        parent_uuids: dict[str, set[str]] = {}
+        for result in self.get_results():
+            parent_uuids.setdefault(str(result.get("member_uuid")), set()).add(str(result.get("parent_uuid")))
+        return parent_uuids
+
+
+class IPNodesParentUpdate(Query):
+    """Replace the parent prefix of many IP prefixes or many IP addresses in a single query.
+
+    The relationship to the current parent of each node is deleted the same way `Relationship.delete` does it and a
+    relationship to the new parent is created if there is one. For IP prefixes, the `is_top_level` attribute is
+    updated in the same query.
+    """
+
+    name: str = "ip_nodes_parent_update"
+    type: QueryType = QueryType.WRITE
+
+    def __init__(
+        self,
+        parent_uuids: dict[str, Optional[str]],
+        is_address: bool = False,
+        **kwargs,
+    ):
+        self.parent_uuids = parent_uuids
+        self.is_address = is_address
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        if self.is_address:
+            node_schema = db.schema.get(name=InfrahubKind.IPADDRESS, branch=self.branch, duplicate=False)
+            rel_schema = node_schema.get_relationship(name="ip_prefix")
+        else:
+            node_schema = db.schema.get(name=InfrahubKind.IPPREFIX, branch=self.branch, duplicate=False)
+            rel_schema = node_schema.get_relationship(name="parent")
+
+        self.params["updates"] = [
+            {"node_uuid": node_uuid, "parent_uuid": parent_uuid, "rel_uuid": str(UUIDT())}
+            for node_uuid, parent_uuid in self.parent_uuids.items()
+        ]
+        self.params["rel_name"] = rel_schema.identifier
+        self.params["branch_support"] = rel_schema.branch.value
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+        self.params["at"] = self.at.to_string()
+
+        rel_prop: dict[str, Any] = {
+            "branch": self.branch.name,
+            "branch_level": self.branch.hierarchy_level,
+            "from": self.at.to_string(),
+        }
+        if rel_schema.hierarchical:
+            rel_prop["hierarchy"] = rel_schema.hierarchical
+        self.params["rel_prop_active"] = {**rel_prop, "status": RelationshipStatus.ACTIVE.value}
+        self.params["rel_prop_deleted"] = {**rel_prop, "status": RelationshipStatus.DELETED.value}
+
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string())
+        self.params.update(branch_params)
+
+        arrows = rel_schema.get_query_arrows()
+
+        # ruff: noqa: E501
+        query = """
+        UNWIND $updates AS update
+        MATCH (member:Node { uuid: update.node_uuid })
+        // MATCH the relationships to the current parent, the latest edges of both sides must be active
+        CALL {
+            WITH member
+            MATCH path = (member)%(left_start)s[r1:IS_RELATED]%(left_end)s(rl:Relationship { name: $rel_name })%(right_start)s[r2:IS_RELATED]%(right_end)s(parent:%(prefix_kind)s)
+            WHERE all(r IN relationships(path) WHERE (%(branch_filter)s))
+            WITH
+                rl,
+                parent,
+                r1.branch_level + r2.branch_level AS branch_level,
+                (r1.status = "active" AND r2.status = "active") AS is_active,
+                [r1.from, r2.from] AS from_times
+            ORDER BY rl.uuid, branch_level DESC, from_times[0] DESC, from_times[1] DESC
+            WITH rl, parent, head(collect(is_active)) AS is_latest_active
+            WHERE is_latest_active = TRUE
+            RETURN collect([rl, parent]) AS current_parents
+        }
+        // Delete the relationships to the current parent
+        CALL {
+            WITH member, current_parents
+            UNWIND current_parents AS current_parent
+            WITH member, current_parent[0] AS rl, current_parent[1] AS parent
+            CALL {
+                WITH rl
+                MATCH (rl)-[edge]-()
+                WHERE edge.branch = $branch AND edge.status = "active" AND edge.to IS NULL
+                SET edge.to = $at
+            }
+            CREATE (member)%(left_start)s[:IS_RELATED $rel_prop_deleted ]%(left_end)s(rl)
+            CREATE (rl)%(right_start)s[:IS_RELATED $rel_prop_deleted ]%(right_end)s(parent)
+            WITH rl
+            CALL {
+                WITH rl
+                MATCH (rl)-[edge:IS_VISIBLE]->(visible)
+                CREATE (rl)-[deleted_edge:IS_VISIBLE $rel_prop_deleted]->(visible)
+            }
+            CALL {
+                WITH rl
+                MATCH (rl)-[edge:IS_PROTECTED]->(protected)
+                CREATE (rl)-[deleted_edge:IS_PROTECTED $rel_prop_deleted]->(protected)
+            }
+            CALL {
+                WITH rl
+                MATCH (rl)-[edge:HAS_OWNER]->(owner_node)
+                CREATE (rl)-[deleted_edge:HAS_OWNER $rel_prop_deleted]->(owner_node)
+            }
+            CALL {
+                WITH rl
+                MATCH (rl)-[edge:HAS_SOURCE]->(source_node)
+                CREATE (rl)-[deleted_edge:HAS_SOURCE $rel_prop_deleted]->(source_node)
+            }
+        }
+        // Create the relationship to the new parent, if any
+        CALL {
+            WITH member, update
+            MATCH (new_parent:%(prefix_kind)s { uuid: update.parent_uuid })
+            CREATE (rl:Relationship { uuid: update.rel_uuid, name: $rel_name, branch_support: $branch_support })
+            CREATE (member)%(left_start)s[:IS_RELATED $rel_prop_active ]%(left_end)s(rl)
+            CREATE (rl)%(right_start)s[:IS_RELATED $rel_prop_active ]%(right_end)s(new_parent)
+            MERGE (ip:Boolean { value: false })
+            MERGE (iv:Boolean { value: true })
+            CREATE (rl)-[:IS_PROTECTED $rel_prop_active ]->(ip)
+            CREATE (rl)-[:IS_VISIBLE $rel_prop_active ]->(iv)
+        }
+        """ % {
+            "left_start": arrows.left.start,
+            "left_end": arrows.left.end,
+            "right_start": arrows.right.start,
+            "right_end": arrows.right.end,
+            "prefix_kind": InfrahubKind.IPPREFIX,
+            "branch_filter": branch_filter,
+        }
+        self.add_to_query(query)
+
+        if not self.is_address:
+            query = """
+            // Set the is_top_level attribute of the prefixes
+            CALL {
+                WITH member, update
+                MATCH (member)-[:HAS_ATTRIBUTE]-(attr:Attribute { name: "is_top_level" })
+                CALL {
+                    WITH attr
+                    MATCH (attr)-[edge:%(value_label)s]->()
+                    WHERE edge.branch = $branch AND edge.status = "active" AND edge.to IS NULL
+                    SET edge.to = $at
+                }
+                MERGE (av:AttributeValue { value: update.parent_uuid IS NULL, is_default: false })
+                CREATE (attr)-[:%(value_label)s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(av)
+            }
+            """ % {"value_label": RELATIONSHIP_TO_VALUE_LABEL}
+            self.add_to_query(query)
+
+        self.return_labels = ["count(member) AS num_updated"]
+
+
 async def get_subnets(
     db: InfrahubDatabase,
     ip_prefix: IPNetworkType,
@@ -217,10 +545,12 @@ async def get_subnets(
     branch: Optional[Union[Branch, str]] = None,
     at: Optional[Union[Timestamp, str]] = None,
     branch_agnostic: bool = False,
+    since: Optional[str] = None,
 ) -> Iterable[IPPrefixData]:
+    """Return the IP prefixes directly within a prefix, only the ones created or modified after since if provided."""
     branch = await registry.get_branch(db=db, branch=branch)
     query = await IPPrefixSubnetFetch.init(
-        db=db, branch=branch, obj=ip_prefix, namespace=namespace, at=at, branch_agnostic=branch_agnostic
+        db=db, branch=branch, obj=ip_prefix, namespace=namespace, at=at, branch_agnostic=branch_agnostic, since=since
     )
     await query.execute(db=db)
     return query.get_subnets()
@@ -233,10 +563,12 @@ async def get_ip_addresses(
     branch: Optional[Union[Branch, str]] = None,
     at=None,
     branch_agnostic: bool = False,
+    since: Optional[str] = None,
 ) -> Iterable[IPAddressData]:
+    """Return the IP addresses within a prefix, only the ones created or modified after since if provided."""
     branch = await registry.get_branch(db=db, branch=branch)
     query = await IPPrefixIPAddressFetch.init(
-        db=db, branch=branch, obj=ip_prefix, namespace=namespace, at=at, branch_agnostic=branch_agnostic
+        db=db, branch=branch, obj=ip_prefix, namespace=namespace, at=at, branch_agnostic=branch_agnostic, since=since
     )
     await query.execute(db=db)
     return query.get_addresses()
@@ -25,6 +25,7 @@ if TYPE_CHECKING:
     from infrahub.core.schema.attribute_schema import AttributeSchema
     from infrahub.core.schema.profile_schema import ProfileSchema
     from infrahub.core.schema.relationship_schema import RelationshipSchema
+    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 # pylint: disable=consider-using-f-string,redefined-builtin,too-many-lines
@@ -115,6 +116,198 @@ class NodeQuery(Query):
         super().__init__(**kwargs)
 
 
+async def _get_node_create_params(db: InfrahubDatabase, node: Node, branch: Branch, at: Timestamp) -> dict[str, Any]:
+    """Return the properties of a new node, of its attributes and of its relationships to create it in the database."""
+    attributes: list[AttributeCreateData] = []
+    attributes_iphost: list[AttributeCreateData] = []
+    attributes_ipnetwork: list[AttributeCreateData] = []
+
+    for attr_name in node._attributes:
+        attr: BaseAttribute = getattr(node, attr_name)
+        attr_data = attr.get_create_data()
+
+        if attr_data.node_type == AttributeDBNodeType.IPHOST:
+            attributes_iphost.append(attr_data)
+        elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
+            attributes_ipnetwork.append(attr_data)
+        else:
+            attributes.append(attr_data)
+
+    relationships: list[RelationshipCreateData] = []
+    for rel_name in node._relationships:
+        rel_manager: RelationshipManager = getattr(node, rel_name)
+        for rel in rel_manager._relationships:
+            relationships.append(await rel.get_create_data(db=db))
+
+    return {
+        "attrs": [attr.model_dump() for attr in attributes],
+        "attrs_iphost": [attr.model_dump() for attr in attributes_iphost],
+        "attrs_ipnetwork": [attr.model_dump() for attr in attributes_ipnetwork],
+        "rels_bidir": [rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value],
+        "rels_out": [
+            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.OUTBOUND.value
+        ],
+        "rels_in": [rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value],
+        "node_prop": {
+            "uuid": node.id,
+            "kind": node.get_kind(),
+            "namespace": node._schema.namespace,
+            "branch_support": node._schema.branch,
+        },
+        "node_branch_prop": {
+            "branch": branch.name,
+            "branch_level": branch.hierarchy_level,
+            "status": "active",
+            "from": at.to_string(),
+        },
+    }
+
+
+def _get_node_create_elements_query(params: str) -> str:
+    """Return the part of the query creating the attributes and the relationships of a node `n`.
+
+    The properties of the attributes and relationships are read from `params`, either the parameters of the query
+    or a variable holding the properties of the node being created.
+    """
+    rel_prop_str = "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at }"
+
+    iphost_prop = {
+        "value": "attr.content.value",
+        "is_default": "attr.content.is_default",
+        "binary_address": "attr.content.binary_address",
+        "version": "attr.content.version",
+        "prefixlen": "attr.content.prefixlen",
+    }
+    iphost_prop_list = [f"{key}: {value}" for key, value in iphost_prop.items()]
+
+    ipnetwork_prop = {
+        "value": "attr.content.value",
+        "is_default": "attr.content.is_default",
+        "binary_address": "attr.content.binary_address",
+        "version": "attr.content.version",
+        "prefixlen": "attr.content.prefixlen",
+        # "num_addresses": "attr.content.num_addresses",
+    }
+    ipnetwork_prop_list = [f"{key}: {value}" for key, value in ipnetwork_prop.items()]
+
+    query = """
+    FOREACH ( attr IN %(params)sattrs |
+        CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
+        CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
+        MERGE (av:AttributeValue { value: attr.content.value, is_default: attr.content.is_default })
+        CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(av)
+        MERGE (ip:Boolean { value: attr.is_protected })
+        MERGE (iv:Boolean { value: attr.is_visible })
+        CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(ip)
+        CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(iv)
+        FOREACH ( prop IN attr.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
+        )
+        FOREACH ( prop IN attr.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
+        )
+    )
+    FOREACH ( attr IN %(params)sattrs_iphost |
+        CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
+        CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
+        MERGE (av:AttributeValue:AttributeIPHost { %(iphost_prop)s })
+        CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(av)
+        MERGE (ip:Boolean { value: attr.is_protected })
+        MERGE (iv:Boolean { value: attr.is_visible })
+        CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(ip)
+        CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(iv)
+        FOREACH ( prop IN attr.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
+        )
+        FOREACH ( prop IN attr.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
+        )
+    )
+    FOREACH ( attr IN %(params)sattrs_ipnetwork |
+        CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
+        CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
+        MERGE (av:AttributeValue:AttributeIPNetwork { %(ipnetwork_prop)s })
+        CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(av)
+        MERGE (ip:Boolean { value: attr.is_protected })
+        MERGE (iv:Boolean { value: attr.is_visible })
+        CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(ip)
+        CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(iv)
+        FOREACH ( prop IN attr.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
+        )
+        FOREACH ( prop IN attr.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
+        )
+    )
+    FOREACH ( rel IN %(params)srels_bidir |
+        MERGE (d:Node { uuid: rel.destination_id })
+        CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
+        CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
+        CREATE (d)-[:IS_RELATED %(rel_prop)s ]->(rl)
+        MERGE (ip:Boolean { value: rel.is_protected })
+        MERGE (iv:Boolean { value: rel.is_visible })
+        CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(ip)
+        CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(iv)
+        FOREACH ( prop IN rel.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
+        )
+        FOREACH ( prop IN rel.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
+        )
+    )
+    FOREACH ( rel IN %(params)srels_out |
+        MERGE (d:Node { uuid: rel.destination_id })
+        CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
+        CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
+        CREATE (d)<-[:IS_RELATED %(rel_prop)s ]-(rl)
+        MERGE (ip:Boolean { value: rel.is_protected })
+        MERGE (iv:Boolean { value: rel.is_visible })
+        CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(ip)
+        CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(iv)
+        FOREACH ( prop IN rel.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
+        )
+        FOREACH ( prop IN rel.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
+        )
+    )
+    FOREACH ( rel IN %(params)srels_in |
+        MERGE (d:Node { uuid: rel.destination_id })
+        CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
+        CREATE (n)<-[:IS_RELATED %(rel_prop)s ]-(rl)
+        CREATE (d)-[:IS_RELATED %(rel_prop)s ]->(rl)
+        MERGE (ip:Boolean { value: rel.is_protected })
+        MERGE (iv:Boolean { value: rel.is_visible })
+        CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(ip)
+        CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(iv)
+        FOREACH ( prop IN rel.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
+        )
+        FOREACH ( prop IN rel.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
+        )
+    )
+    """ % {
+        "params": params,
+        "rel_prop": rel_prop_str,
+        "iphost_prop": ", ".join(iphost_prop_list),
+        "ipnetwork_prop": ", ".join(ipnetwork_prop_list),
+    }
+    return query
+
+
 class NodeCreateAllQuery(NodeQuery):
     name = "node_create_all"
 
@@ -129,195 +322,19 @@ class NodeCreateAllQuery(NodeQuery):
         self.params["branch_level"] = self.branch.hierarchy_level
         self.params["kind"] = self.node.get_kind()
         self.params["branch_support"] = self.node._schema.branch
-
-        attributes: list[AttributeCreateData] = []
-        attributes_iphost: list[AttributeCreateData] = []
-        attributes_ipnetwork: list[AttributeCreateData] = []
-
-        for attr_name in self.node._attributes:
-            attr: BaseAttribute = getattr(self.node, attr_name)
-            attr_data = attr.get_create_data()
-
-            if attr_data.node_type == AttributeDBNodeType.IPHOST:
-                attributes_iphost.append(attr_data)
-            elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
-                attributes_ipnetwork.append(attr_data)
-            else:
-                attributes.append(attr_data)
-
-        relationships: list[RelationshipCreateData] = []
-        for rel_name in self.node._relationships:
-            rel_manager: RelationshipManager = getattr(self.node, rel_name)
-            for rel in rel_manager._relationships:
-                relationships.append(await rel.get_create_data(db=db))
-
-        self.params["attrs"] = [attr.model_dump() for attr in attributes]
-        self.params["attrs_iphost"] = [attr.model_dump() for attr in attributes_iphost]
-        self.params["attrs_ipnetwork"] = [attr.model_dump() for attr in attributes_ipnetwork]
-        self.params["rels_bidir"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value
-        ]
-        self.params["rels_out"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.OUTBOUND.value
-        ]
-        self.params["rels_in"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value
-        ]
-
-        self.params["node_prop"] = {
-            "uuid": self.node.id,
-            "kind": self.node.get_kind(),
-            "namespace": self.node._schema.namespace,
-            "branch_support": self.node._schema.branch,
-        }
-        self.params["node_branch_prop"] = {
-            "branch": self.branch.name,
-            "branch_level": self.branch.hierarchy_level,
-            "status": "active",
-            "from": at.to_string(),
-        }
-
-        rel_prop_str = "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at }"
-
-        iphost_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-        }
-        iphost_prop_list = [f"{key}: {value}" for key, value in iphost_prop.items()]
-
-        ipnetwork_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-            # "num_addresses": "attr.content.num_addresses",
-        }
-        ipnetwork_prop_list = [f"{key}: {value}" for key, value in ipnetwork_prop.items()]
+        self.params.update(await _get_node_create_params(db=db, node=self.node, branch=self.branch, at=at))
 
         query = """
         MATCH (root:Root)
         CREATE (n:Node:%(labels)s $node_prop )
         CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
         WITH distinct n
-        FOREACH ( attr IN $attrs |
-            CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
-            CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
-            MERGE (av:AttributeValue { value: attr.content.value, is_default: attr.content.is_default })
-            CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(av)
-            MERGE (ip:Boolean { value: attr.is_protected })
-            MERGE (iv:Boolean { value: attr.is_visible })
-            CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(ip)
-            CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(iv)
-            FOREACH ( prop IN attr.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN attr.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-        )
-        FOREACH ( attr IN $attrs_iphost |
-            CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
-            CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
-            MERGE (av:AttributeValue:AttributeIPHost { %(iphost_prop)s })
-            CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(av)
-            MERGE (ip:Boolean { value: attr.is_protected })
-            MERGE (iv:Boolean { value: attr.is_visible })
-            CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(ip)
-            CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(iv)
-            FOREACH ( prop IN attr.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN attr.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-        )
-        FOREACH ( attr IN $attrs_ipnetwork |
-            CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
-            CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
-            MERGE (av:AttributeValue:AttributeIPNetwork { %(ipnetwork_prop)s })
-            CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(av)
-            MERGE (ip:Boolean { value: attr.is_protected })
-            MERGE (iv:Boolean { value: attr.is_visible })
-            CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(ip)
-            CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(iv)
-            FOREACH ( prop IN attr.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN attr.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-        )
-        FOREACH ( rel IN $rels_bidir |
-            MERGE (d:Node { uuid: rel.destination_id })
-            CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
-            CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
-            CREATE (d)-[:IS_RELATED %(rel_prop)s ]->(rl)
-            MERGE (ip:Boolean { value: rel.is_protected })
-            MERGE (iv:Boolean { value: rel.is_visible })
-            CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(ip)
-            CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(iv)
-            FOREACH ( prop IN rel.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN rel.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-        )
-        FOREACH ( rel IN $rels_out |
-            MERGE (d:Node { uuid: rel.destination_id })
-            CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
-            CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
-            CREATE (d)<-[:IS_RELATED %(rel_prop)s ]-(rl)
-            MERGE (ip:Boolean { value: rel.is_protected })
-            MERGE (iv:Boolean { value: rel.is_visible })
-            CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(ip)
-            CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(iv)
-            FOREACH ( prop IN rel.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN rel.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-        )
-        FOREACH ( rel IN $rels_in |
-            MERGE (d:Node { uuid: rel.destination_id })
-            CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
-            CREATE (n)<-[:IS_RELATED %(rel_prop)s ]-(rl)
-            CREATE (d)-[:IS_RELATED %(rel_prop)s ]->(rl)
-            MERGE (ip:Boolean { value: rel.is_protected })
-            MERGE (iv:Boolean { value: rel.is_visible })
-            CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(ip)
-            CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(iv)
-            FOREACH ( prop IN rel.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN rel.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-        )
+        %(elements)s
         WITH distinct n
         MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
         """ % {
             "labels": ":".join(self.node.get_labels()),
-            "rel_prop": rel_prop_str,
-            "iphost_prop": ", ".join(iphost_prop_list),
-            "ipnetwork_prop": ", ".join(ipnetwork_prop_list),
+            "elements": _get_node_create_elements_query(params="$"),
         }
 
         self.params["at"] = at.to_string()
@@ -348,6 +365,67 @@ class NodeCreateAllQuery(NodeQuery):
         return data
 
 
+class NodeCreateManyQuery(Query):
+    """Create multiple new nodes of the same kind, along with their attributes and relationships, in a single query."""
+
+    name = "node_create_many"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    def __init__(self, nodes: list[Node], branch: Branch, **kwargs: Any) -> None:
+        if len({node.get_kind() for node in nodes}) > 1:
+            raise ValueError("All the nodes created in a single query must be of the same kind")
+
+        self.nodes = nodes
+        self.branch = branch
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.params["nodes"] = [
+            await _get_node_create_params(db=db, node=node, branch=self.branch, at=self.at) for node in self.nodes
+        ]
+
+        query = """
+        MATCH (root:Root)
+        UNWIND $nodes AS node
+        CREATE (n:Node:%(labels)s)
+        SET n = node.node_prop
+        CREATE (n)-[r:IS_PART_OF]->(root)
+        SET r = node.node_branch_prop
+        WITH n, node
+        %(elements)s
+        WITH distinct n
+        MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
+        """ % {
+            "labels": ":".join(self.nodes[0].get_labels()),
+            "elements": _get_node_create_elements_query(params="node."),
+        }
+
+        self.params["at"] = self.at.to_string()
+
+        self.add_to_query(query)
+        self.return_labels = ["n", "rn", "rv"]
+
+    def get_ids_per_node(self) -> dict[str, tuple[str, dict[str, tuple[str, str]]]]:
+        """Return the database ID of each new node along with the IDs of its attributes and relationships."""
+        data: dict[str, tuple[str, dict[str, tuple[str, str]]]] = {}
+        for result in self.get_results():
+            node = result.get_node("n")
+            element = result.get_node("rn")
+            _, element_ids = data.setdefault(node["uuid"], (node.element_id, {}))
+            if "Relationship" in element.labels:
+                peer = result.get_node("rv")
+                name = f"{element.get('name')}::{peer.get('uuid')}"
+            elif "Attribute" in element.labels:
+                name = element.get("name")
+            element_ids[name] = (element["uuid"], element.element_id)
+
+        return data
+
+
 class NodeDeleteQuery(NodeQuery):
     name = "node_delete"
 
@@ -187,7 +187,14 @@ class NumberPoolGetReserved(Query):
 
 
 class NumberPoolGetUsed(Query):
+    """Return the numbers of a pool that are in use.
+
+    A number that has been reserved but that is not assigned to an attribute yet is considered used, so that a number
+    allocated by another request is not handed out again before the node using it is saved.
+    """
+
     name: str = "number_pool_get_used"
+    include_released: bool = False
 
     def __init__(
         self,
@@ -198,6 +205,13 @@ class NumberPoolGetUsed(Query):
 
         super().__init__(**kwargs)  # type: ignore[arg-type]
 
+    def _get_candidates_query(self) -> str:
+        """Return the part of the query matching the values whose status must be checked."""
+        return """
+        MATCH (pool)-[:IS_RESERVED]->(av:AttributeValue)
+        WITH DISTINCT pool, av
+        """
+
     async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
         self.params["pool_id"] = self.pool.get_id()
         self.params["start_range"] = self.pool.start_range.value
@@ -212,26 +226,92 @@ class NumberPoolGetUsed(Query):
 
         query = """
         MATCH (pool:%(number_pool)s { uuid: $pool_id })
+        %(candidates)s
+        WITH pool, av
+        WHERE toInteger(av.value) >= $start_range and toInteger(av.value) <= $end_range
         CALL {
-            WITH pool
-            MATCH (pool)-[res:IS_RESERVED]->(av:AttributeValue)<-[hv:HAS_VALUE]-(attr:Attribute)
+            WITH pool, av
+            OPTIONAL MATCH (pool)-[res:IS_RESERVED]->(av)<-[hv:HAS_VALUE]-(attr:Attribute)
             WHERE
                 attr.name = $attribute_name
                 AND
-                toInteger(av.value) >= $start_range and toInteger(av.value) <= $end_range
+                res.status = "active" AND hv.status = "active"
                 AND
                 all(r in [res, hv] WHERE (%(branch_filter)s))
-            RETURN av, (res.status = "active" AND hv.status = "active") AS is_active
+            RETURN count(hv) > 0 AS is_active
         }
-        WITH av, is_active
-        WHERE is_active = TRUE
+        CALL {
+            WITH pool, av
+            MATCH (pool)-[res:IS_RESERVED]->(av)
+            OPTIONAL MATCH (av)<-[hv:HAS_VALUE]-(attr:Attribute)
+            WHERE attr.name = $attribute_name
+            WITH max(res.from) AS reserved_at, max(hv.from) AS assigned_at
+            RETURN assigned_at IS NULL OR reserved_at > assigned_at AS is_pending
+        }
+        WITH av, is_active OR is_pending AS is_used
         """ % {
+            "candidates": self._get_candidates_query(),
             "branch_filter": branch_filter,
             "number_pool": InfrahubKind.NUMBERPOOL,
         }
         self.add_to_query(query)
-        self.return_labels = ["av.value"]
-        self.order_by = ["av.value"]
+        if self.include_released:
+            self.return_labels = ["av.value AS value", "is_used"]
+        else:
+            self.add_to_query("WHERE is_used = TRUE")
+            self.return_labels = ["av.value AS value"]
+        self.order_by = ["value"]
+
+
+class NumberPoolGetChanged(NumberPoolGetUsed):
+    """Return the numbers of a pool whose reservation or value changed since a given time and if they are still used.
+
+    The numbers are considered used under the same conditions as in NumberPoolGetUsed.
+    """
+
+    name: str = "number_pool_get_changed"
+    include_released: bool = True
+
+    def __init__(
+        self,
+        pool: CoreNumberPool,
+        since: str,
+        **kwargs: dict[str, Any],
+    ) -> None:
+        self.since = since
+
+        super().__init__(pool=pool, **kwargs)  # type: ignore[arg-type]
+
+    def _get_candidates_query(self) -> str:
+        return """
+        CALL {
+            WITH pool
+            MATCH (pool)-[res:IS_RESERVED]->(av:AttributeValue)
+            WHERE res.from >= $since OR res.to >= $since
+            RETURN av
+            UNION
+            WITH pool
+            MATCH (pool)-[:IS_RESERVED]->(av:AttributeValue)<-[hv:HAS_VALUE]-(attr:Attribute)
+            WHERE attr.name = $attribute_name AND (hv.from >= $since OR hv.to >= $since)
+            RETURN av
+        }
+        """
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
+        self.params["since"] = self.since
+        await super().query_init(db=db, **kwargs)
+
+    def get_changes(self) -> tuple[set[int], set[int]]:
+        """Return the numbers used and the numbers released since the given time."""
+        used: set[int] = set()
+        released: set[int] = set()
+        for result in self.get_results():
+            number = result.get_as_type(label="value", return_type=int)
+            if result.get_as_type(label="is_used", return_type=bool):
+                used.add(number)
+            else:
+                released.add(number)
+        return used, released
 
 
 class NumberPoolSetReserved(Query):
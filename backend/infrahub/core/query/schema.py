@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from infrahub.core.constants.database import DatabaseEdgeType
+from infrahub.core.query import Query, QueryType
+from infrahub.core.timestamp import Timestamp
+
+if TYPE_CHECKING:
+    from infrahub.database import InfrahubDatabase
+
+SCHEMA_LABELS = ["SchemaNode", "SchemaGeneric", "SchemaAttribute", "SchemaRelationship"]
+
+
+class SchemaLastChangeQuery(Query):
+    """Return the time of the most recent change of the schema of a branch that happened before a given time.
+
+    Every change of the schema creates or terminates an edge connected to one of the schema nodes or to their
+    attributes and relationships, the schema is identical at any time between two consecutive changes.
+    """
+
+    name: str = "schema_last_change"
+    type: QueryType = QueryType.READ
+    insert_return: bool = False
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        branch_names: set[str] = set()
+        for names in self.branch.get_branches_and_times_to_query_global(at=self.at).keys():
+            branch_names.update(names)
+
+        self.params["branch_names"] = sorted(branch_names)
+        self.params["at"] = self.at.to_string()
+
+        query = """
+        MATCH (n)-[r1:%(node_edges)s]-(m)
+        WHERE (%(labels_filter)s) AND r1.branch IN $branch_names
+        OPTIONAL MATCH (m)-[r2:%(property_edges)s]->()
+        WHERE NOT m:Root AND r2.branch IN $branch_names
+        UNWIND [r1.from, r1.to, r2.from, r2.to] AS change_time
+        WITH change_time
+        WHERE change_time IS NOT NULL AND change_time <= $at
+        RETURN max(change_time) AS last_change
+        """ % {
+            "labels_filter": " OR ".join(f"n:{label}" for label in SCHEMA_LABELS),
+            "node_edges": "|".join(
+                edge.value
+                for edge in (DatabaseEdgeType.IS_PART_OF, DatabaseEdgeType.HAS_ATTRIBUTE, DatabaseEdgeType.IS_RELATED)
+            ),
+            "property_edges": "|".join(
+                edge.value
+                for edge in (
+                    DatabaseEdgeType.HAS_VALUE,
+                    DatabaseEdgeType.IS_VISIBLE,
+                    DatabaseEdgeType.IS_PROTECTED,
+                    DatabaseEdgeType.HAS_OWNER,
+                    DatabaseEdgeType.HAS_SOURCE,
+                )
+            ),
+        }
+        self.add_to_query(query)
+        self.return_labels = ["last_change"]
+
+    def get_last_change(self) -> Optional[Timestamp]:
+        result = self.get_result()
+        if not result or not result.get_as_str("last_change"):
+            return None
+        return Timestamp(result.get_as_str("last_change"))
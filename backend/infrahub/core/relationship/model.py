@@ -425,7 +425,7 @@ class Relationship(FlagPropertyMixin, NodePropertyMixin):
                 await self.set_peer(value=peer)
 
         if not self.peer_id and self.peer_hfid:
-            peer_schema = db.schema.get(name=self.schema.peer, branch=self.branch)
+            peer_schema = db.schema.get(name=self.schema.peer, branch=self.branch, duplicate=False)
             kind = (
                 self.data["kind"]
                 if isinstance(self.data, dict) and "kind" in self.data and peer_schema.is_generic_schema
@@ -715,6 +715,7 @@ class RelationshipManager:
         )
         self._relationship_id_details: Optional[RelationshipUpdateDetails] = None
         self.has_fetched_relationships: bool = False
+        self._state: Optional[tuple[int, ...]] = None
 
     @classmethod
     async def init(
@@ -758,6 +759,23 @@ class RelationshipManager:
     def get_kind(self) -> str:
         return self.schema.kind
 
+    @property
+    def is_dirty(self) -> bool:
+        """Indicate if the relationships have been modified since they were fetched from or saved to the database.
+
+        Relationships that have not been fetched can't have been modified locally.
+        """
+        if not self.has_fetched_relationships:
+            return False
+        return self._state is None or self._state != self._get_state()
+
+    def _get_state(self) -> tuple[int, ...]:
+        return tuple(hash(rel) for rel in self._relationships)
+
+    def clear_changes(self) -> None:
+        """Consider the current list of relationships as the one stored in the database."""
+        self._state = self._get_state()
+
     def __iter__(self) -> Iterator[Relationship]:
         if self.schema.cardinality == "one":
             raise TypeError("relationship with single cardinality are not iterable")
@@ -933,6 +951,7 @@ class RelationshipManager:
         details = await self.fetch_relationship_ids(
             at=at, db=db, branch_agnostic=branch_agnostic, force_refresh=force_refresh
         )
+        is_first_fetch = not self.has_fetched_relationships
 
         for peer_id in details.peer_ids_present_database_only:
             self._relationships.append(
@@ -949,6 +968,9 @@ class RelationshipManager:
         for peer_id in details.peer_ids_present_local_only:
             await self.remove(peer_id=peer_id, db=db)
 
+        if is_first_fetch:
+            self.clear_changes()
+
     async def get(self, db: InfrahubDatabase) -> Union[Relationship, list[Relationship]]:
         rels = await self.get_relationships(db=db)
 
@@ -1141,6 +1163,7 @@ class RelationshipManager:
                         db=db,
                     )
 
+        self.clear_changes()
         return self
 
     async def delete(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from infrahub import lock
@@ -13,6 +14,7 @@ from infrahub.core.models import (
     SchemaDiff,
 )
 from infrahub.core.node import Node
+from infrahub.core.query.schema import SchemaLastChangeQuery
 from infrahub.core.registry import registry
 from infrahub.core.schema import (
     AttributeSchema,
@@ -32,6 +34,8 @@ from .schema_branch import SchemaBranch
 
 log = get_logger()
 
+HISTORICAL_SCHEMAS_CACHE_SIZE = 10
+
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.timestamp import Timestamp
@@ -43,6 +47,7 @@ class SchemaManager(NodeManager):
     def __init__(self) -> None:
         self._cache: dict[int, Any] = {}
         self._branches: dict[str, SchemaBranch] = {}
+        self._historical_schemas: OrderedDict[tuple[str, ...], SchemaBranch] = OrderedDict()
 
     def _get_from_cache(self, key: int) -> Any:
         return self._cache[key]
@@ -594,6 +599,34 @@ class SchemaManager(NodeManager):
         self.set_schema_branch(name=branch.name, schema=branch_schema)
         return branch_schema
 
+    async def load_schema_at(self, db: InfrahubDatabase, branch: Branch, at: Timestamp) -> SchemaBranch:
+        """Return the schema of a branch as it was at a given time.
+
+        The schema is identical at any time between two consecutive changes so the schemas are cached based on
+        the time of the last change that happened before `at`, the schema is only loaded from the database
+        the first time a given period is requested.
+        """
+        query = await SchemaLastChangeQuery.init(db=db, branch=branch, at=at)
+        await query.execute(db=db)
+        last_change = query.get_last_change()
+
+        key = (
+            branch.name,
+            str(branch.branched_from),
+            str(branch.schema_changed_at),
+            last_change.to_string() if last_change else "",
+        )
+        if key in self._historical_schemas:
+            self._historical_schemas.move_to_end(key)
+            return self._historical_schemas[key]
+
+        schema_branch = await self.load_schema_from_db(db=db, branch=branch, at=at)
+        self._historical_schemas[key] = schema_branch
+        if len(self._historical_schemas) > HISTORICAL_SCHEMAS_CACHE_SIZE:
+            self._historical_schemas.popitem(last=False)
+
+        return schema_branch
+
     async def load_schema_from_db(
         self,
         db: InfrahubDatabase,
@@ -242,11 +242,12 @@ class SchemaBranch:
     def set(self, name: str, schema: MainSchemaTypes) -> str:
         """Store a NodeSchema or GenericSchema associated with a specific name.
 
-        The object will be stored in the internal cache based on its hash value.
+        The object will be stored in the internal cache based on its hash value and it will become read-only.
         If a schema with the same name already exist, it will be replaced
         """
         schema_hash = schema.get_hash()
         if schema_hash not in self._cache:
+            schema.set_read_only()
             self._cache[schema_hash] = schema
 
         if "Node" in schema.__class__.__name__:
@@ -261,10 +262,10 @@ class SchemaBranch:
     def get(self, name: str, duplicate: bool = True) -> MainSchemaTypes:
         """Access a specific NodeSchema or GenericSchema, defined by its kind.
 
-        To ensure that no-one will ever change an object in the cache,
-        by default the function always returns a copy of the object, not the object itself
+        The objects in the cache are read-only, by default the function returns a mutable copy of the object.
 
-        If duplicate is set to false, the real object will be returned.
+        If duplicate is set to false, the read-only object from the cache will be returned, it can be shared safely
+        and it should be preferred when the schema doesn't need to be modified.
         """
         key = None
         if name in self.nodes:
@@ -714,7 +715,9 @@ class SchemaBranch:
 
                 if len(generic_display_labels) == 1:
                     # Only assign node display labels if a single generic has them defined
+                    node_schema = node_schema.duplicate()
                     node_schema.display_labels = generic_display_labels[0]
+                    self.set(name=name, schema=node_schema)
 
     def validate_order_by(self) -> None:
         for name in self.all_names:
@@ -1015,11 +1018,11 @@ class SchemaBranch:
         for name in self.all_names:
             node = self.get(name=name, duplicate=False)
 
-            attributes = [attr for attr in node.attributes if attr.kind == "Dropdown"]
-            if not attributes:
+            if not any(attr.kind == "Dropdown" for attr in node.attributes):
                 continue
 
             node = node.duplicate()
+            attributes = [attr for attr in node.attributes if attr.kind == "Dropdown"]
             changed = False
 
             for attr in attributes:
@@ -1135,6 +1138,7 @@ class SchemaBranch:
                     elif schema_attribute_path.is_type_relationship:
                         uniqueness_constraints.append(schema_attribute_path.relationship_schema.name)
 
+                node = self.get(name=name, duplicate=True)
                 node.uniqueness_constraints = [uniqueness_constraints]
                 self.set(name=node.kind, schema=node)
 
@@ -60,19 +60,26 @@ class UniquenessQueryResultsIndex:
                     self._node_index[node_id][attr_name] = attr_value
 
     def get_node_ids_for_value_group(self, path_value_group: list[SchemaAttributePathValue]) -> set[str]:
-        matching_node_ids = self._all_node_ids.copy()
+        # Start from the nodes matching the first value instead of all the nodes of the index,
+        # a lookup must not depend on the size of the index when checking a large batch of values
+        matching_node_ids: Optional[set[str]] = None
         for schema_attribute_path_value in path_value_group:
             if schema_attribute_path_value.value is None:
                 return set()
             value = str(schema_attribute_path_value.value)
             if schema_attribute_path_value.relationship_schema:
                 relationship_identifier = schema_attribute_path_value.relationship_schema.get_identifier()
-                matching_node_ids &= self._relationship_index.get(relationship_identifier, {}).get(value, set())
+                node_ids = self._relationship_index.get(relationship_identifier, {}).get(value, set())
             elif schema_attribute_path_value.attribute_schema:
                 attribute_name = schema_attribute_path_value.attribute_schema.name
-                matching_node_ids &= self._attribute_index.get(attribute_name, {}).get(value, set())
+                node_ids = self._attribute_index.get(attribute_name, {}).get(value, set())
+            else:
+                continue
+            matching_node_ids = node_ids.copy() if matching_node_ids is None else matching_node_ids & node_ids
             if not matching_node_ids:
                 return matching_node_ids
+        if matching_node_ids is None:
+            return self._all_node_ids.copy()
         return matching_node_ids
 
     def get_node_ids_for_path_group(self, path_group: list[SchemaAttributePath]) -> set[str]:
@@ -55,6 +55,7 @@ class NodeUniqueAttributeConstraintQuery(Query):
         relationship_names = set()
         relationship_attr_paths = []
         relationship_only_attr_paths = []
+        relationship_only_attr_paths_with_value = []
         relationship_attr_paths_with_value = []
         for rel_path in self.query_request.relationship_attribute_paths:
             relationship_names.add(rel_path.identifier)
@@ -64,6 +65,8 @@ class NodeUniqueAttributeConstraintQuery(Query):
                 )
             elif rel_path.attribute_name:
                 relationship_attr_paths.append((rel_path.identifier, rel_path.attribute_name))
+            elif rel_path.value:
+                relationship_only_attr_paths_with_value.append((rel_path.identifier, rel_path.value))
             else:
                 relationship_only_attr_paths.append(rel_path.identifier)
 
@@ -73,6 +76,7 @@ class NodeUniqueAttributeConstraintQuery(Query):
             and not relationship_attr_paths
             and not relationship_attr_paths_with_value
             and not relationship_only_attr_paths
+            and not relationship_only_attr_paths_with_value
         ):
             raise ValueError(
                 "The NodeUniquenessQueryRequest provided for node_constraints_uniqueness doesn't have enough information to continue"
@@ -88,6 +92,7 @@ class NodeUniqueAttributeConstraintQuery(Query):
                 "relationship_attr_paths": relationship_attr_paths,
                 "relationship_attr_paths_with_value": relationship_attr_paths_with_value,
                 "relationship_only_attr_paths": relationship_only_attr_paths,
+                "relationship_only_attr_paths_with_value": relationship_only_attr_paths_with_value,
                 "min_count_required": self.min_count_required,
             }
         )
@@ -113,7 +118,9 @@ class NodeUniqueAttributeConstraintQuery(Query):
         relationship_only_attr_paths_subquery = """
         WITH start_node
         MATCH rel_path = (start_node)-[:IS_RELATED]-(relationship_node:Relationship)-[:IS_RELATED]-(related_n:Node)
-        WHERE relationship_node.name in $relationship_only_attr_paths
+        WHERE relationship_node.name in $relationship_names
+            AND (relationship_node.name in $relationship_only_attr_paths
+            OR [relationship_node.name, related_n.uuid] in $relationship_only_attr_paths_with_value)
         RETURN rel_path as potential_path, relationship_node.name as rel_identifier, "id" as potential_attr, related_n.uuid as potential_attr_value
         """
 
@@ -122,7 +129,7 @@ class NodeUniqueAttributeConstraintQuery(Query):
             select_subqueries.append(attr_paths_subquery)
         if relationship_attr_paths_with_value or relationship_attr_paths:
             select_subqueries.append(relationship_attr_paths_with_value_subquery)
-        if relationship_only_attr_paths:
+        if relationship_only_attr_paths or relationship_only_attr_paths_with_value:
             select_subqueries.append(relationship_only_attr_paths_subquery)
 
         select_subqueries_str = "UNION".join(select_subqueries)
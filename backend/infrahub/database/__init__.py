@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Coroutine, Optional, TypeVar, Union
 
 from neo4j import (
     READ_ACCESS,
@@ -21,7 +21,7 @@ from neo4j import (
     TrustCustomCAs,
     TrustSystemCAs,
 )
-from neo4j.exceptions import ClientError, Neo4jError, ServiceUnavailable, TransientError
+from neo4j.exceptions import ClientError, ServiceUnavailable, TransientError
 from opentelemetry import trace
 from typing_extensions import Self
 
@@ -149,6 +149,7 @@ class InfrahubDatabase:
         self._session_mode: InfrahubDatabaseSessionMode = session_mode
         self._is_session_local: bool = False
         self._transaction: Optional[AsyncTransaction] = transaction
+        self._rollback_callbacks: list[Callable[[], object]] = []
         self.queries_names_to_config = queries_names_to_config if queries_names_to_config is not None else {}
 
         if schemas:
@@ -190,6 +191,20 @@ class InfrahubDatabase:
 
         return {}
 
+    def add_rollback_callback(self, callback: Callable[[], object]) -> None:
+        """Register a function to call if the current transaction is rolled back.
+
+        It is meant to revert the changes made to in-memory caches along with the changes made in the transaction,
+        outside of a transaction the queries are committed right away and the callback is ignored.
+        """
+        if self.is_transaction:
+            self._rollback_callbacks.append(callback)
+
+    def _run_rollback_callbacks(self) -> None:
+        callbacks, self._rollback_callbacks = self._rollback_callbacks, []
+        for callback in reversed(callbacks):
+            callback()
+
     def add_schema(self, schema: SchemaBranch, name: Optional[str] = None) -> None:
         self._schemas[name or schema.name] = schema
 
@@ -281,13 +296,18 @@ class InfrahubDatabase:
 
         if self._mode == InfrahubDatabaseMode.TRANSACTION:
             if exc_type is not None:
-                await self._transaction.rollback()
+                try:
+                    await self._transaction.rollback()
+                finally:
+                    self._run_rollback_callbacks()
             else:
                 try:
                     await self._transaction.commit()
-                except Neo4jError as exc:
-                    raise exc
+                except Exception:
+                    self._run_rollback_callbacks()
+                    raise
                 finally:
+                    self._rollback_callbacks = []
                     await self._transaction.close()
 
             if self._is_session_local:
@@ -318,34 +338,7 @@ class InfrahubDatabase:
             if name:
                 span.set_attribute("query_name", name)
 
-            runtime = Neo4jRuntime.UNDEFINED
-
-            try:
-                query_config = self.queries_names_to_config[name]
-                if self.db_type == DatabaseType.NEO4J:
-                    runtime = self.queries_names_to_config[name].neo4j_runtime
-                    if runtime not in [Neo4jRuntime.DEFAULT, Neo4jRuntime.UNDEFINED]:
-                        query = f"CYPHER runtime = {runtime.value}\n" + query
-                if query_config.profile_memory:
-                    query = "PROFILE\n" + query
-            except KeyError:
-                pass  # No specific config for this query
-
-            labels = {
-                "type": self._session_mode.value,
-                "query": name,
-                "runtime": runtime.value,
-                "context1": "",
-                "context2": "",
-            }
-            if context:
-                labels.update(
-                    {
-                        f"context{idx + 1}": f"{key}__{value}"
-                        for idx, (key, value) in enumerate(context.items())
-                        if idx <= 1
-                    }
-                )
+            query, labels = self._prepare_query(query=query, name=name, context=context)
 
             with QUERY_EXECUTION_METRICS.labels(**labels).time():
                 response = await self.run_query(query=query, params=params, name=name)
@@ -354,6 +347,64 @@ class InfrahubDatabase:
                 results = [item async for item in response]
                 return results, response._metadata or {}
 
+    async def execute_query_stream(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        name: str = "undefined",
+        context: dict[str, str] | None = None,
+    ) -> AsyncIterator[Record]:
+        """Execute a query once and yield the records as they are pulled from the driver.
+
+        The driver fetches the records from the server in batches, so the caller can process a large response
+        without the full list of records being held in memory at once and without having to re-execute the query
+        with an increasing SKIP.
+        """
+        with trace.get_tracer(__name__).start_as_current_span("execute_db_query_stream") as span:
+            span.set_attribute("query", query)
+            if name:
+                span.set_attribute("query_name", name)
+
+            query, labels = self._prepare_query(query=query, name=name, context=context)
+
+            with QUERY_EXECUTION_METRICS.labels(**labels).time():
+                response = await self.run_query(query=query, params=params, name=name)
+                if response is None:
+                    return
+                async for item in response:
+                    yield item
+
+    def _prepare_query(
+        self, query: str, name: str, context: dict[str, str] | None = None
+    ) -> tuple[str, dict[str, str]]:
+        """Apply the query specific configuration to the query and generate the labels for the metrics."""
+        runtime = Neo4jRuntime.UNDEFINED
+
+        try:
+            query_config = self.queries_names_to_config[name]
+            if self.db_type == DatabaseType.NEO4J:
+                runtime = self.queries_names_to_config[name].neo4j_runtime
+                if runtime not in [Neo4jRuntime.DEFAULT, Neo4jRuntime.UNDEFINED]:
+                    query = f"CYPHER runtime = {runtime.value}\n" + query
+            if query_config.profile_memory:
+                query = "PROFILE\n" + query
+        except KeyError:
+            pass  # No specific config for this query
+
+        labels = {
+            "type": self._session_mode.value,
+            "query": name,
+            "runtime": runtime.value,
+            "context1": "",
+            "context2": "",
+        }
+        if context:
+            labels.update(
+                {f"context{idx + 1}": f"{key}__{value}" for idx, (key, value) in enumerate(context.items()) if idx <= 1}
+            )
+
+        return query, labels
+
     async def run_query(
         self, query: str, params: Optional[dict[str, Any]] = None, name: Optional[str] = "undefined"
     ) -> AsyncResult:
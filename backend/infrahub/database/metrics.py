@@ -16,3 +16,10 @@ TRANSACTION_RETRIES = Counter(
     "Number of transaction that have been retried due to transcient error",
     labelnames=["name"],
 )
+
+QUERY_BATCH_SIZE_METRICS = Histogram(
+    f"{METRIC_PREFIX}_query_batch_size",
+    "Number of elements written to the database by a single batch query",
+    labelnames=["query"],
+    buckets=[10, 50, 100, 250, 500, 1000, 2500, 5000, 10000],
+)
@@ -1,12 +1,19 @@
-from typing import Any, Optional
+from __future__ import annotations
 
-from graphql import GraphQLSchema, OperationType
-from infrahub_sdk.analyzer import GraphQLQueryAnalyzer
+import copy
+from typing import TYPE_CHECKING, Any, Optional
+
+from graphql import GraphQLError, GraphQLSchema, OperationType, validate
+from infrahub_sdk.analyzer import GraphQLOperation, GraphQLQueryAnalyzer
 from infrahub_sdk.utils import extract_fields
 
-from infrahub.core.branch import Branch
 from infrahub.graphql.utils import extract_schema_models
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+    from infrahub.core.branch import Branch
+
 
 class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
     def __init__(
@@ -20,14 +27,56 @@ class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
         self.branch: Optional[Branch] = branch
         self.operation_name: Optional[str] = operation_name
         self.query_variables: dict[str, Any] = query_variables or {}
+        # Results that only depend on the query and the schema, shared with the copies returned by for_request()
+        self._results: dict[str, Any] = {}
         super().__init__(query=query, schema=schema)
 
+    def for_request(
+        self,
+        branch: Optional[Branch] = None,
+        operation_name: Optional[str] = None,
+        query_variables: Optional[dict[str, Any]] = None,
+    ) -> Self:
+        """Return a copy of the analyzer for a new execution of the same query against the same schema.
+
+        The parsed document and the results of the analysis are shared with the original object.
+        """
+        analyzer = copy.copy(self)
+        analyzer.branch = branch
+        analyzer.operation_name = operation_name
+        analyzer.query_variables = query_variables or {}
+        return analyzer
+
+    @property
+    def is_valid(self) -> tuple[bool, Optional[list[GraphQLError]]]:
+        if "is_valid" not in self._results:
+            if self.schema is None:
+                self._results["is_valid"] = (False, [GraphQLError("Schema is not provided")])
+            else:
+                errors = validate(schema=self.schema, document_ast=self.document)
+                self._results["is_valid"] = (False, errors) if errors else (True, None)
+        return self._results["is_valid"]
+
+    @property
+    def operations(self) -> list[GraphQLOperation]:
+        if "operations" not in self._results:
+            self._results["operations"] = super().operations
+        return self._results["operations"]
+
     @property
     def operation_names(self) -> list[str]:
         return [operation.name for operation in self.operations if operation.name is not None]
 
+    async def get_fields(self) -> dict[str, Any]:
+        if "fields" not in self._results:
+            self._results["fields"] = await super().get_fields()
+        return self._results["fields"]
+
     async def get_models_in_use(self, types: dict[str, Any]) -> set[str]:
         """List of Infrahub models that are referenced in the query."""
+        if "models_in_use" in self._results:
+            return self._results["models_in_use"]
+
         graphql_types = set()
         models = set()
 
@@ -57,4 +106,5 @@ class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
             except ValueError:
                 continue
 
+        self._results["models_in_use"] = models
         return models
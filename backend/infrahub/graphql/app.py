@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from dataclasses import replace
 from inspect import isawaitable
 from typing import (
     TYPE_CHECKING,
@@ -27,10 +28,11 @@ from graphql import (
     GraphQLFormattedError,
     Middleware,
     OperationType,
-    graphql,
+    execute,
     parse,
     subscribe,
     validate,
+    validate_schema,
 )
 from graphql.error.graphql_error import format_error
 from graphql.utilities import (
@@ -42,6 +44,7 @@ from starlette.requests import ClientDisconnect, HTTPConnection, Request
 from starlette.responses import JSONResponse, Response
 from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
 
+from infrahub import config
 from infrahub.api.dependencies import api_key_scheme, cookie_auth_scheme, jwt_scheme
 from infrahub.auth import AccountSession, authentication_token
 from infrahub.core.registry import registry
@@ -49,6 +52,8 @@ from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import BranchNotFoundError, Error
 from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
 from infrahub.graphql.initialization import GraphqlParams, prepare_graphql_params
+from infrahub.graphql.query_cache import query_cache
+from infrahub.graphql.response import GraphQLJSONResponse, render_graphql_response
 from infrahub.log import get_logger
 
 from .metrics import (
@@ -182,7 +187,7 @@ class InfrahubGraphQLApp:
 
     async def _handle_http_request(
         self, request: Request, db: InfrahubDatabase, branch: Branch, account_session: AccountSession
-    ) -> JSONResponse:
+    ) -> Response:
         if request.app.state.response_delay:
             self.logger.info(f"Adding response delay of {request.app.state.response_delay} seconds")
             time.sleep(request.app.state.response_delay)
@@ -195,23 +200,32 @@ class InfrahubGraphQLApp:
             self.logger.error("Exception ClientDisconnect in _handle_http_request")
             return JSONResponse({"errors": [str(exc)]}, status_code=400)
 
+        at = request.query_params.get("at", None)
+        graphql_params = prepare_graphql_params(
+            db=db, branch=branch, at=at, account_session=account_session, request=request
+        )
+
         if isinstance(operations, list):
-            return JSONResponse({"errors": ["This server does not support batching"]}, status_code=400)
+            return await self._handle_http_batch_request(
+                request=request,
+                db=db,
+                branch=branch,
+                account_session=account_session,
+                graphql_params=graphql_params,
+                operations=operations,
+                at=at,
+            )
 
         operation = operations
         query = operation["query"]
         variable_values = operation.get("variables")
         operation_name = operation.get("operationName")
 
-        at = request.query_params.get("at", None)
-        graphql_params = prepare_graphql_params(
-            db=db, branch=branch, at=at, account_session=account_session, request=request
-        )
-        analyzed_query = InfrahubGraphQLQueryAnalyzer(
+        analyzed_query = self._get_analyzed_query(
             query=query,
-            query_variables=variable_values,
-            schema=graphql_params.schema,
+            graphql_params=graphql_params,
             operation_name=operation_name,
+            variable_values=variable_values,
             branch=branch,
         )
         await self._evaluate_permissions(
@@ -226,11 +240,144 @@ class InfrahubGraphQLApp:
         # if the query contains some mutation, it's not currently supported to set AT manually
         if analyzed_query.contains_mutation:
             graphql_params.context.at = Timestamp()
-        elif at and branch.schema_changed_at and Timestamp(branch.schema_changed_at) > Timestamp(at):
-            schema_branch = await registry.schema.load_schema_from_db(db=db, branch=branch, at=Timestamp(at))
+        else:
+            await self._load_schema_at(db=db, branch=branch, at=at)
+
+        response = await self._execute_operation(
+            request=request, branch=branch, analyzed_query=analyzed_query, graphql_params=graphql_params
+        )
+        json_response = GraphQLJSONResponse(
+            response,
+            status_code=200,
+            background=graphql_params.context.background,
+        )
+
+        await self._observe_metrics(
+            request=request,
+            branch=branch,
+            analyzed_query=analyzed_query,
+            graphql_params=graphql_params,
+            response_size=len(json_response.body),
+        )
+
+        return json_response
+
+    async def _handle_http_batch_request(
+        self,
+        request: Request,
+        db: InfrahubDatabase,
+        branch: Branch,
+        account_session: AccountSession,
+        graphql_params: GraphqlParams,
+        operations: list[Any],
+        at: Optional[str] = None,
+    ) -> Response:
+        """Execute a list of operations and return the list of their responses, in the same order.
+
+        The permissions of all the operations are evaluated before executing any of them.
+        Consecutive read-only operations are executed concurrently, each one within its own database session,
+        operations that contain a mutation are executed one at a time in the order of the request.
+        """
+        if not operations:
+            return JSONResponse({"errors": ["The list of operations can't be empty"]}, status_code=400)
+        if len(operations) > config.SETTINGS.api.graphql_batch_max_operations:
+            return JSONResponse(
+                {
+                    "errors": [
+                        f"A batch can't contain more than {config.SETTINGS.api.graphql_batch_max_operations} operations"
+                    ]
+                },
+                status_code=400,
+            )
+        if not all(isinstance(operation, dict) and isinstance(operation.get("query"), str) for operation in operations):
+            return JSONResponse({"errors": ["Each operation of a batch must define a query"]}, status_code=400)
+
+        analyzed_queries: list[InfrahubGraphQLQueryAnalyzer] = []
+        for operation in operations:
+            analyzed_query = self._get_analyzed_query(
+                query=operation["query"],
+                graphql_params=graphql_params,
+                operation_name=operation.get("operationName"),
+                variable_values=operation.get("variables"),
+                branch=branch,
+            )
+            await self._evaluate_permissions(
+                db=db,
+                request=request,
+                query=analyzed_query,
+                query_parameters=graphql_params,
+                account_session=account_session,
+                branch=branch,
+            )
+            analyzed_queries.append(analyzed_query)
+
+        if not all(analyzed_query.contains_mutation for analyzed_query in analyzed_queries):
+            await self._load_schema_at(db=db, branch=branch, at=at)
+
+        semaphore = asyncio.Semaphore(config.SETTINGS.api.graphql_batch_max_concurrency)
+
+        async def execute_read_only(analyzed_query: InfrahubGraphQLQueryAnalyzer) -> dict[str, Any]:
+            async with semaphore, db.start_session(read_only=True) as session_db:
+                return await self._execute_operation(
+                    request=request,
+                    branch=branch,
+                    analyzed_query=analyzed_query,
+                    graphql_params=_copy_graphql_params(graphql_params=graphql_params, db=session_db),
+                )
+
+        async def execute_read_only_queries(queries: list[InfrahubGraphQLQueryAnalyzer]) -> list[dict[str, Any]]:
+            return await asyncio.gather(*[execute_read_only(analyzed_query=query) for query in queries])
+
+        responses: list[dict[str, Any]] = []
+        read_only_queries: list[InfrahubGraphQLQueryAnalyzer] = []
+        for analyzed_query in analyzed_queries:
+            if not analyzed_query.contains_mutation:
+                read_only_queries.append(analyzed_query)
+                continue
+
+            responses.extend(await execute_read_only_queries(queries=read_only_queries))
+            read_only_queries = []
+
+            mutation_params = _copy_graphql_params(graphql_params=graphql_params, db=db)
+            mutation_params.context.at = Timestamp()
+            responses.append(
+                await self._execute_operation(
+                    request=request, branch=branch, analyzed_query=analyzed_query, graphql_params=mutation_params
+                )
+            )
+        responses.extend(await execute_read_only_queries(queries=read_only_queries))
+
+        rendered_responses = [render_graphql_response(response) for response in responses]
+        for analyzed_query, rendered_response in zip(analyzed_queries, rendered_responses):
+            await self._observe_metrics(
+                request=request,
+                branch=branch,
+                analyzed_query=analyzed_query,
+                graphql_params=graphql_params,
+                response_size=len(rendered_response),
+            )
+
+        return Response(
+            content=b"[" + b",".join(rendered_responses) + b"]",
+            status_code=200,
+            media_type=GraphQLJSONResponse.media_type,
+            background=graphql_params.context.background,
+        )
+
+    async def _load_schema_at(self, db: InfrahubDatabase, branch: Branch, at: Optional[str] = None) -> None:
+        """Load the schema of the branch as it was at a given time if it changed since then."""
+        if at and branch.schema_changed_at and Timestamp(branch.schema_changed_at) > Timestamp(at):
+            schema_branch = await registry.schema.load_schema_at(db=db, branch=branch, at=Timestamp(at))
             db.add_schema(name=branch.name, schema=schema_branch)
 
-        if operation_name == "IntrospectionQuery":
+    async def _execute_operation(
+        self,
+        request: Request,
+        branch: Branch,
+        analyzed_query: InfrahubGraphQLQueryAnalyzer,
+        graphql_params: GraphqlParams,
+    ) -> dict[str, Any]:
+        if analyzed_query.operation_name == "IntrospectionQuery":
             nbr_object_in_schema = len(graphql_params.schema.type_map)
             self.logger.debug(
                 "Processing IntrospectionQuery .. ", branch=branch.name, nbr_object_in_schema=nbr_object_in_schema
@@ -242,15 +389,11 @@ class InfrahubGraphQLApp:
             span.set_attributes(labels)
 
             with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-                result = await graphql(
-                    schema=graphql_params.schema,
-                    source=query,
-                    context_value=graphql_params.context,
-                    root_value=self.root_value,
-                    middleware=self.middleware,
-                    variable_values=variable_values,
-                    operation_name=operation_name,
-                    execution_context_class=self.execution_context_class,
+                result = await self._execute_query(
+                    analyzed_query=analyzed_query,
+                    graphql_params=graphql_params,
+                    variable_values=analyzed_query.query_variables,
+                    operation_name=analyzed_query.operation_name,
                 )
 
         response: dict[str, Any] = {"data": result.data}
@@ -260,13 +403,19 @@ class InfrahubGraphQLApp:
                     self._log_error(error=error.original_error)
             response["errors"] = [self.error_formatter(error) for error in result.errors]
 
-        json_response = JSONResponse(
-            response,
-            status_code=200,
-            background=graphql_params.context.background,
-        )
+        return response
 
-        GRAPHQL_RESPONSE_SIZE_METRICS.labels(**labels).observe(len(json_response.render(response)))
+    async def _observe_metrics(
+        self,
+        request: Request,
+        branch: Branch,
+        analyzed_query: InfrahubGraphQLQueryAnalyzer,
+        graphql_params: GraphqlParams,
+        response_size: int,
+    ) -> None:
+        labels = self._set_labels(request=request, branch=branch, query=analyzed_query)
+
+        GRAPHQL_RESPONSE_SIZE_METRICS.labels(**labels).observe(response_size)
         GRAPHQL_QUERY_DEPTH_METRICS.labels(**labels).observe(await analyzed_query.calculate_depth())
         GRAPHQL_QUERY_HEIGHT_METRICS.labels(**labels).observe(await analyzed_query.calculate_height())
         # GRAPHQL_QUERY_VARS_METRICS.labels(**labels).observe(len(analyzed_query.variables))
@@ -276,10 +425,63 @@ class InfrahubGraphQLApp:
         )
 
         valid, errors = analyzed_query.is_valid
-        if not valid:
+        if not valid and errors:
             GRAPHQL_QUERY_ERRORS_METRICS.labels(**labels).observe(len(errors))
 
-        return json_response
+    @staticmethod
+    def _get_analyzed_query(
+        query: str,
+        graphql_params: GraphqlParams,
+        branch: Branch,
+        operation_name: Optional[str] = None,
+        variable_values: Optional[dict[str, Any]] = None,
+    ) -> InfrahubGraphQLQueryAnalyzer:
+        if not graphql_params.schema_hash:
+            return InfrahubGraphQLQueryAnalyzer(
+                query=query,
+                query_variables=variable_values,
+                schema=graphql_params.schema,
+                operation_name=operation_name,
+                branch=branch,
+            )
+        return query_cache.get_analyzer(
+            query=query,
+            schema=graphql_params.schema,
+            schema_hash=graphql_params.schema_hash,
+            branch=branch,
+            operation_name=operation_name,
+            query_variables=variable_values,
+        )
+
+    async def _execute_query(
+        self,
+        analyzed_query: InfrahubGraphQLQueryAnalyzer,
+        graphql_params: GraphqlParams,
+        operation_name: Optional[str] = None,
+        variable_values: Optional[dict[str, Any]] = None,
+    ) -> ExecutionResult:
+        """Execute the document already parsed by the analyzer, equivalent to graphql() without the parsing."""
+        schema_errors = validate_schema(graphql_params.schema)
+        if schema_errors:
+            return ExecutionResult(data=None, errors=schema_errors)
+
+        valid, validation_errors = analyzed_query.is_valid
+        if not valid:
+            return ExecutionResult(data=None, errors=validation_errors)
+
+        result = execute(
+            schema=graphql_params.schema,
+            document=analyzed_query.document,
+            root_value=self.root_value,
+            context_value=graphql_params.context,
+            variable_values=variable_values,
+            operation_name=operation_name,
+            middleware=self.middleware,
+            execution_context_class=self.execution_context_class,
+        )
+        if isawaitable(result):
+            return await result
+        return result
 
     def _set_labels(self, request: Request, branch: Branch, query: InfrahubGraphQLQueryAnalyzer) -> dict[str, Any]:
         return {
@@ -465,6 +667,15 @@ class InfrahubGraphQLApp:
             await websocket.send_json({"type": GQL_COMPLETE, "id": operation_id})
 
 
+def _copy_graphql_params(graphql_params: GraphqlParams, db: InfrahubDatabase) -> GraphqlParams:
+    """Return a copy of the parameters with a dedicated context to execute one operation of a batch.
+
+    The background tasks are shared between all the operations of the batch.
+    """
+    context = replace(graphql_params.context, db=db, related_node_ids=set(), peer_loaders={})
+    return replace(graphql_params, context=context)
+
+
 async def _get_operation_from_request(request: Request) -> Union[dict[str, Any], list[Any]]:
     content_type = request.headers.get("Content-Type", "").split(";")[0]
     if content_type == "application/json":
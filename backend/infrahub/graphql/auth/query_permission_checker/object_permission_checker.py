@@ -48,6 +48,8 @@ class ObjectPermissionChecker(GraphQLQueryPermissionCheckerInterface):
                 if operation.name and operation.name.startswith(kind):
                     # An empty string after prefix removal means a query to "view"
                     query_action = operation.name[len(kind) :].lower() or "view"
+                    # Bulk mutations require the same permissions as their single object counterpart
+                    query_action = query_action.removesuffix("many")
                     if query_action == "upsert":
                         # Require both create and update for Upsert mutations
                         actions.add("create")
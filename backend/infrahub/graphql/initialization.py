@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional
 
 from starlette.background import BackgroundTasks
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from infrahub.auth import AccountSession
     from infrahub.core.branch import Branch
     from infrahub.database import InfrahubDatabase
+    from infrahub.graphql.loaders.peers import PeerRelationshipsDataLoader
     from infrahub.services import InfrahubServices
 
 
@@ -25,6 +26,7 @@ if TYPE_CHECKING:
 class GraphqlParams:
     schema: GraphQLSchema
     context: GraphqlContext
+    schema_hash: Optional[str] = None
 
 
 @dataclass
@@ -38,6 +40,7 @@ class GraphqlContext:
     account_session: Optional[AccountSession] = None
     background: Optional[BackgroundTasks] = None
     request: Optional[HTTPConnection] = None
+    peer_loaders: dict[str, PeerRelationshipsDataLoader] = field(default_factory=dict)
 
     @property
     def active_account_session(self) -> AccountSession:
@@ -83,6 +86,7 @@ def prepare_graphql_params(
 
     return GraphqlParams(
         schema=gql_schema,
+        schema_hash=GraphQLSchemaManager.get_schema_hash_for_branch(branch=branch),
         context=GraphqlContext(
             db=db,
             branch=branch,
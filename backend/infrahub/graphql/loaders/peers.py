@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import ujson
+from graphene.utils.dataloader import DataLoader
+
+from infrahub.core.manager import NodeManager
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.core.relationship.model import Relationship
+    from infrahub.core.schema.relationship_schema import RelationshipSchema
+    from infrahub.core.timestamp import Timestamp
+    from infrahub.database import InfrahubDatabase
+
+
+@dataclass
+class QueryPeerParams:
+    branch: Union[Branch, str]
+    source_kind: str
+    schema: RelationshipSchema
+    filters: dict[str, Any]
+    fields: Optional[dict] = None
+    at: Optional[Union[Timestamp, str]] = None
+    branch_agnostic: bool = False
+
+    @property
+    def cache_key(self) -> str:
+        """Identify the loader that can be shared by all the parents requesting the same peers with the same arguments."""
+        filters = ujson.dumps(self.filters, sort_keys=True, default=str)
+        fields = ujson.dumps(self.fields, sort_keys=True, default=str)
+        return f"{self.source_kind}:{self.schema.name}:{self.schema.identifier}:{filters}:{fields}"
+
+
+class PeerRelationshipsDataLoader(DataLoader):
+    """Collect the ids of all the parent nodes requesting the peers of the same relationship
+    and resolve them with a single call to NodeManager.query_peers."""
+
+    def __init__(self, db: InfrahubDatabase, query_params: QueryPeerParams, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.db = db
+        self.query_params = query_params
+
+    async def batch_load_fn(self, keys: list[str]) -> list[list[Relationship]]:  # pylint: disable=method-hidden
+        async with self.db.start_session() as db:
+            peer_rels = await NodeManager.query_peers(
+                db=db,
+                ids=keys,
+                source_kind=self.query_params.source_kind,
+                schema=self.query_params.schema,
+                filters=self.query_params.filters,
+                fields=self.query_params.fields,
+                at=self.query_params.at,
+                branch=self.query_params.branch,
+                branch_agnostic=self.query_params.branch_agnostic,
+                fetch_peers=True,
+            )
+
+        peer_rels_by_node_id: dict[str, list[Relationship]] = defaultdict(list)
+        for rel in peer_rels:
+            peer_rels_by_node_id[rel.node_id].append(rel)
+
+        return [peer_rels_by_node_id.get(key, []) for key in keys]
@@ -37,6 +37,7 @@ from .mutations.repository import InfrahubRepositoryMutation
 from .mutations.resource_manager import (
     InfrahubNumberPoolMutation,
 )
+from .query_cache import query_cache
 from .resolver import (
     account_resolver,
     ancestors_resolver,
@@ -85,6 +86,8 @@ class GraphqlMutations:
     update: type[InfrahubMutation]
     upsert: type[InfrahubMutation]
     delete: type[InfrahubMutation]
+    create_many: Optional[type[InfrahubMutation]] = None
+    upsert_many: Optional[type[InfrahubMutation]] = None
 
 
 def get_attr_kind(node_schema: MainSchemaTypes, attr_schema: AttributeSchema) -> str:
@@ -108,6 +111,7 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
     @classmethod
     def clear_cache(cls) -> None:
         cls._branch_details_by_name = {}
+        query_cache.clear()
 
     @classmethod
     def _cache_branch(
@@ -124,9 +128,21 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
             schema_hash=schema_hash,
             gql_manager=cls(schema=schema_branch),
         )
+        previous_details = cls._branch_details_by_name.get(branch.name)
         cls._branch_details_by_name[branch.name] = branch_details
+
+        if previous_details and previous_details.schema_hash not in {
+            details.schema_hash for details in cls._branch_details_by_name.values()
+        }:
+            query_cache.invalidate(schema_hash=previous_details.schema_hash)
         return branch_details
 
+    @classmethod
+    def get_schema_hash_for_branch(cls, branch: Branch) -> Optional[str]:
+        if branch.name not in cls._branch_details_by_name:
+            return None
+        return cls._branch_details_by_name[branch.name].schema_hash
+
     @classmethod
     def get_manager_for_branch(cls, branch: Branch, schema_branch: SchemaBranch) -> GraphQLSchemaManager:
         if branch.name not in cls._branch_details_by_name:
@@ -514,6 +530,9 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
                 class_attrs[f"{node_schema.kind}Update"] = mutations.update.Field()
                 class_attrs[f"{node_schema.kind}Upsert"] = mutations.upsert.Field()
                 class_attrs[f"{node_schema.kind}Delete"] = mutations.delete.Field()
+                if mutations.create_many and mutations.upsert_many:
+                    class_attrs[f"{node_schema.kind}CreateMany"] = mutations.create_many.Field()
+                    class_attrs[f"{node_schema.kind}UpsertMany"] = mutations.upsert_many.Field()
 
             elif (
                 isinstance(node_schema, GenericSchema)
@@ -648,7 +667,28 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
         self.set_type(name=upsert._meta.name, graphql_type=upsert)
         self.set_type(name=delete._meta.name, graphql_type=delete)
 
-        return GraphqlMutations(create=create, update=update, upsert=upsert, delete=delete)
+        # The bulk mutations are only available for the kinds without a dedicated mutation class
+        # as the objects are created together instead of going through their mutate_create
+        if base_class is not InfrahubMutation:
+            return GraphqlMutations(create=create, update=update, upsert=upsert, delete=delete)
+
+        create_many = self.generate_graphql_mutation_many(
+            schema=schema, base_class=base_class, input_type=graphql_mutation_create_input, mutation_type="Create"
+        )
+        upsert_many = self.generate_graphql_mutation_many(
+            schema=schema, base_class=base_class, input_type=graphql_mutation_upsert_input, mutation_type="Upsert"
+        )
+        self.set_type(name=create_many._meta.name, graphql_type=create_many)
+        self.set_type(name=upsert_many._meta.name, graphql_type=upsert_many)
+
+        return GraphqlMutations(
+            create=create,
+            update=update,
+            upsert=upsert,
+            delete=delete,
+            create_many=create_many,
+            upsert_many=upsert_many,
+        )
 
     def generate_graphql_mutation_create_input(
         self, schema: Union[NodeSchema, ProfileSchema]
@@ -826,6 +866,34 @@ class GraphQLSchemaManager:  # pylint: disable=too-many-public-methods
 
         return type(name, (base_class,), main_attrs)
 
+    def generate_graphql_mutation_many(
+        self,
+        schema: Union[NodeSchema, ProfileSchema],
+        input_type: type[graphene.InputObjectType],
+        base_class: type[InfrahubMutation] = InfrahubMutation,
+        mutation_type: str = "Create",
+    ) -> type[InfrahubMutation]:
+        """Generate a GraphQL Mutation to CREATE or UPSERT multiple objects based on the specified NodeSchema."""
+        name = f"{schema.kind}{mutation_type}Many"
+
+        object_type = self.generate_graphql_object(schema=schema)
+
+        main_attrs: dict[str, Any] = {
+            "ok": graphene.Boolean(),
+            "count": graphene.Int(),
+            "objects": graphene.List(of_type=object_type),
+        }
+
+        meta_attrs: dict[str, Any] = {"schema": schema, "name": name, "description": schema.description}
+        main_attrs["Meta"] = type("Meta", (object,), meta_attrs)
+
+        args_attrs = {
+            "data": graphene.List(of_type=graphene.NonNull(input_type), required=True),
+        }
+        main_attrs["Arguments"] = type("Arguments", (object,), args_attrs)
+
+        return type(name, (base_class,), main_attrs)
+
     @staticmethod
     def generate_graphql_mutation_delete(
         schema: Union[NodeSchema, ProfileSchema], base_class: type[InfrahubMutation] = InfrahubMutation
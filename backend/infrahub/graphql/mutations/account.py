@@ -7,6 +7,7 @@ from infrahub_sdk.uuidt import UUIDT
 from typing_extensions import Self
 
 from infrahub.auth import AuthType
+from infrahub.auth_cache import auth_cache
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
@@ -14,6 +15,7 @@ from infrahub.core.protocols import CoreAccount, CoreNode, InternalAccountToken
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase, retry_db_transaction
 from infrahub.exceptions import NodeNotFoundError, PermissionDeniedError
+from infrahub.message_bus import messages
 
 from ..types import InfrahubObjectType
 
@@ -121,6 +123,11 @@ class AccountMixin:
         async with db.start_transaction() as dbt:
             await results[0].delete(db=dbt)  # type: ignore[arg-type]
 
+        await auth_cache.invalidate_token(token=results[0].token.value)
+        context: GraphqlContext = info.context
+        if context.service:
+            await context.service.send(message=messages.RefreshRegistryAccount(account_id=account.id))
+
         return cls(ok=True)  # type: ignore[call-arg]
 
     @classmethod
@@ -9,6 +9,7 @@ from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.ipam.reconciler import IpamReconciler
+from infrahub.core.ipam.tree import ipam_trees
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
 from infrahub.core.schema import NodeSchema
@@ -114,6 +115,9 @@ class InfrahubIPAddressMutation(InfrahubMutationMixin, Mutation):
             reconciled_address = await reconciler.reconcile(
                 ip_value=ip_address, namespace=namespace_id, node_uuid=address.get_id()
             )
+        ipam_trees.update_node(
+            branch_name=branch.name, node_id=address.get_id(), namespace_id=namespace_id, ip_value=ip_address
+        )
 
         result = await cls.mutate_create_to_graphql(info=info, db=db, obj=reconciled_address)
 
@@ -156,6 +160,9 @@ class InfrahubIPAddressMutation(InfrahubMutationMixin, Mutation):
                 result = await cls.mutate_update_to_graphql(db=dbt, info=info, obj=reconciled_address)
         except ValidationError as exc:
             raise ValueError(str(exc)) from exc
+        ipam_trees.update_node(
+            branch_name=branch.name, node_id=address.get_id(), namespace_id=namespace_id, ip_value=ip_address
+        )
 
         return address, result
 
@@ -187,7 +194,10 @@ class InfrahubIPAddressMutation(InfrahubMutationMixin, Mutation):
         branch: Branch,
         at: str,
     ):
-        return await super().mutate_delete(info=info, data=data, branch=branch, at=at)
+        address, result = await super().mutate_delete(info=info, data=data, branch=branch, at=at)
+        ipam_trees.update_node(branch_name=branch.name, node_id=address.get_id())
+
+        return address, result
 
 
 class InfrahubIPPrefixMutation(InfrahubMutationMixin, Mutation):
@@ -229,6 +239,9 @@ class InfrahubIPPrefixMutation(InfrahubMutationMixin, Mutation):
             reconciled_prefix = await reconciler.reconcile(
                 ip_value=ip_network, namespace=namespace_id, node_uuid=prefix.get_id()
             )
+        ipam_trees.update_node(
+            branch_name=branch.name, node_id=prefix.get_id(), namespace_id=namespace_id, ip_value=ip_network
+        )
 
         result = await cls.mutate_create_to_graphql(info=info, db=db, obj=reconciled_prefix)
 
@@ -271,6 +284,9 @@ class InfrahubIPPrefixMutation(InfrahubMutationMixin, Mutation):
                 result = await cls.mutate_update_to_graphql(db=dbt, info=info, obj=reconciled_prefix)
         except ValidationError as exc:
             raise ValueError(str(exc)) from exc
+        ipam_trees.update_node(
+            branch_name=branch.name, node_id=prefix.get_id(), namespace_id=namespace_id, ip_value=ip_network
+        )
 
         return prefix, result
 
@@ -323,6 +339,7 @@ class InfrahubIPPrefixMutation(InfrahubMutationMixin, Mutation):
                 )
         except ValidationError as exc:
             raise ValueError(str(exc)) from exc
+        ipam_trees.update_node(branch_name=branch.name, node_id=prefix.get_id())
 
         ok = True
 
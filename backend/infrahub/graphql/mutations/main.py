@@ -12,6 +12,7 @@ from infrahub.auth import (
     validate_mutation_permissions,
     validate_mutation_permissions_update_node,
 )
+from infrahub.auth_cache import auth_cache, is_account, is_account_token
 from infrahub.core import registry
 from infrahub.core.constants import MutationAction
 from infrahub.core.constraint.node.runner import NodeConstraintRunner
@@ -26,6 +27,7 @@ from infrahub.dependencies.registry import get_component_registry
 from infrahub.events import EventMeta, NodeMutatedEvent
 from infrahub.exceptions import ValidationError
 from infrahub.log import get_log_data, get_logger
+from infrahub.permissions.cache import affects_permissions, permission_cache
 from infrahub.worker import WORKER_IDENTITY
 
 from .node_getter.by_default_filter import MutationNodeGetterByDefaultFilter
@@ -63,6 +65,9 @@ class InfrahubMutationMixin:
         action = MutationAction.UNDEFINED
         validate_mutation_permissions(operation=cls.__name__, account_session=context.account_session)
 
+        if cls.__name__.endswith("Many"):
+            return await cls.mutate_many(info=info, data=data, **kwargs)
+
         if "Create" in cls.__name__:
             obj, mutation = await cls.mutate_create(
                 info=info, branch=context.branch, data=data, at=context.at, **kwargs
@@ -100,6 +105,14 @@ class InfrahubMutationMixin:
         # Reset the time of the query to guarantee that all resolvers executed after this point will account for the changes
         context.at = Timestamp()
 
+        # The other workers discard their cached permissions and accounts when they receive the event of the mutation
+        if affects_permissions(schema=obj._schema):
+            permission_cache.invalidate()
+        if is_account(schema=obj._schema):
+            await auth_cache.invalidate_account(account_id=obj.id)
+        if is_account_token(schema=obj._schema):
+            await cls._invalidate_account_token(token=obj)
+
         if config.SETTINGS.broker.enable and context.background:
             log_data = get_log_data()
             request_id = log_data.get("request_id", "")
@@ -119,6 +132,67 @@ class InfrahubMutationMixin:
 
         return mutation
 
+    @staticmethod
+    async def _invalidate_account_token(token: Node) -> None:
+        # The previous value of an updated token isn't known here so all the local entries are discarded, the shared
+        # entries are already ignored once the token is invalidated
+        auth_cache.discard_account()
+        await auth_cache.invalidate_token(token=token.token.value)  # type: ignore[attr-defined]
+
+    @classmethod
+    async def mutate_many(
+        cls, info: GraphQLResolveInfo, data: list[InputObjectType], *args: Any, **kwargs: Any
+    ) -> Self:
+        context: GraphqlContext = info.context
+
+        if "CreateMany" in cls.__name__:
+            objs = await cls.mutate_create_many(data=data, db=context.db, branch=context.branch, at=context.at)
+            actions = [MutationAction.ADDED] * len(objs)
+        elif "UpsertMany" in cls.__name__:
+            node_manager = NodeManager()
+            node_getters = [
+                MutationNodeGetterById(db=context.db, node_manager=node_manager),
+                MutationNodeGetterByHfid(db=context.db, node_manager=node_manager),
+                MutationNodeGetterByDefaultFilter(db=context.db, node_manager=node_manager),
+            ]
+            objs, created = await cls.mutate_upsert_many(
+                info=info, data=data, branch=context.branch, at=context.at, node_getters=node_getters
+            )
+            actions = [MutationAction.ADDED if is_created else MutationAction.UPDATED for is_created in created]
+        else:
+            raise ValueError(f"Unexpected class Name: {cls.__name__}, should end with CreateMany or UpsertMany")
+
+        # Reset the time of the query to guarantee that all resolvers executed after this point will account for the changes
+        context.at = Timestamp()
+
+        if any(affects_permissions(schema=obj._schema) for obj in objs):
+            permission_cache.invalidate()
+        for obj in objs:
+            if is_account(schema=obj._schema):
+                await auth_cache.invalidate_account(account_id=obj.id)
+            if is_account_token(schema=obj._schema):
+                await cls._invalidate_account_token(token=obj)
+
+        if config.SETTINGS.broker.enable and context.background:
+            log_data = get_log_data()
+            request_id = log_data.get("request_id", "")
+
+            events = [
+                NodeMutatedEvent(
+                    branch=context.branch.name,
+                    kind=obj._schema.kind,
+                    node_id=obj.id,
+                    data=await obj.to_graphql(db=context.db, filter_sensitive=True),
+                    action=action,
+                    meta=EventMeta(initiator_id=WORKER_IDENTITY, request_id=request_id),
+                )
+                for obj, action in zip(objs, actions)
+            ]
+
+            context.background.add_task(context.service.event.send_many, events)
+
+        return await cls.mutate_many_to_graphql(info=info, db=context.db, objs=objs)
+
     @classmethod
     async def _get_profile_ids(cls, db: InfrahubDatabase, obj: Node) -> set[str]:
         if not hasattr(obj, "profiles"):
@@ -193,6 +267,54 @@ class InfrahubMutationMixin:
 
         return obj
 
+    @classmethod
+    @retry_db_transaction(name="object_create_many")
+    async def mutate_create_many(
+        cls,
+        data: list[InputObjectType],
+        db: InfrahubDatabase,
+        branch: Branch,
+        at: str,
+    ) -> list[Node]:
+        """Create multiple objects, their constraints are validated together and they are created in batches."""
+        component_registry = get_component_registry()
+        node_constraint_runner = await component_registry.get_component(NodeConstraintRunner, db=db, branch=branch)
+        node_class = Node
+        if cls._meta.schema.kind in registry.node:
+            node_class = registry.node[cls._meta.schema.kind]
+
+        try:
+            objs: list[Node] = []
+            for item in data:
+                obj = await node_class.init(db=db, schema=cls._meta.schema, branch=branch, at=at)
+                await obj.new(db=db, **item)
+                objs.append(obj)
+            fields_to_validate = list({field_name for item in data for field_name in item})
+            await node_constraint_runner.check_many(nodes=objs, field_filters=fields_to_validate)
+            if db.is_transaction:
+                await NodeManager.create_many(db=db, nodes=objs, at=at)
+            else:
+                async with db.start_transaction() as dbt:
+                    await NodeManager.create_many(db=dbt, nodes=objs, at=at)
+
+        except ValidationError as exc:
+            raise ValueError(str(exc)) from exc
+
+        # Only the objects created with profiles need to be refreshed to get the values inherited from them
+        for idx, item in enumerate(data):
+            if item.get("profiles"):
+                objs[idx] = await cls._refresh_for_profile_update(db=db, branch=branch, obj=objs[idx])
+
+        return objs
+
+    @classmethod
+    async def mutate_many_to_graphql(cls, info: GraphQLResolveInfo, db: InfrahubDatabase, objs: list[Node]) -> Self:
+        fields = await extract_fields(info.field_nodes[0].selection_set)
+        result: dict[str, Any] = {"ok": True, "count": len(objs)}
+        if "objects" in fields:
+            result["objects"] = [await obj.to_graphql(db=db, fields=fields.get("objects", {})) for obj in objs]
+        return cls(**result)
+
     @classmethod
     async def mutate_create_to_graphql(cls, info: GraphQLResolveInfo, db: InfrahubDatabase, obj: Node) -> Self:
         fields = await extract_fields(info.field_nodes[0].selection_set)
@@ -315,6 +437,62 @@ class InfrahubMutationMixin:
         created_obj, mutation = await cls.mutate_create(info=info, data=data_dict, branch=branch, at=at)
         return created_obj, mutation, True
 
+    @classmethod
+    @retry_db_transaction(name="object_upsert_many")
+    async def mutate_upsert_many(
+        cls,
+        info: GraphQLResolveInfo,
+        data: list[InputObjectType],
+        branch: Branch,
+        at: str,
+        node_getters: list[MutationNodeGetterInterface],
+        database: Optional[InfrahubDatabase] = None,
+    ) -> tuple[list[Node], list[bool]]:
+        """Update the objects that already exist and create the others in batches, along with whether each one was created."""
+        context: GraphqlContext = info.context
+        db = database or context.db
+
+        node_schema = db.schema.get(name=cls._meta.schema.kind, branch=branch)
+
+        existing_nodes: list[Optional[Node]] = []
+        for item in data:
+            node = None
+            for getter in node_getters:
+                node = await getter.get_node(node_schema=node_schema, data=item, branch=branch, at=at)
+                if node:
+                    break
+            existing_nodes.append(node)
+
+        # hfid isn't a valid input when creating the object
+        data_to_create = [
+            {key: value for key, value in item.items() if key != "hfid"}
+            for item, node in zip(data, existing_nodes)
+            if node is None
+        ]
+
+        async def upsert(dbt: InfrahubDatabase) -> tuple[list[Node], list[Node]]:
+            updated_objs = [
+                await cls.mutate_update_object(db=dbt, info=info, data=item, branch=branch, obj=node)
+                for item, node in zip(data, existing_nodes)
+                if node is not None
+            ]
+            created_objs = await cls.mutate_create_many(data=data_to_create, db=dbt, branch=branch, at=at)
+            return updated_objs, created_objs
+
+        try:
+            if db.is_transaction:
+                updated_objs, created_objs = await upsert(dbt=db)
+            else:
+                async with db.start_transaction() as dbt:
+                    updated_objs, created_objs = await upsert(dbt=dbt)
+        except ValidationError as exc:
+            raise ValueError(str(exc)) from exc
+
+        # Return the objects in the same order as the data
+        updated_iter, created_iter = iter(updated_objs), iter(created_objs)
+        objs = [next(created_iter) if node is None else next(updated_iter) for node in existing_nodes]
+        return objs, [node is None for node in existing_nodes]
+
     @classmethod
     @retry_db_transaction(name="object_delete")
     async def mutate_delete(
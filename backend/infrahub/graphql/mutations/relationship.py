@@ -14,6 +14,8 @@ from infrahub.core.query.relationship import (
 from infrahub.core.relationship import Relationship
 from infrahub.database import retry_db_transaction
 from infrahub.exceptions import NodeNotFoundError, ValidationError
+from infrahub.message_bus import messages
+from infrahub.permissions.cache import affects_permissions, permission_cache
 
 from ..types import RelatedNodeInput
 
@@ -133,6 +135,14 @@ class RelationshipMixin:
                         await rel.load(db=db, data=existing_peers[node_data.get("id")])
                         await rel.delete(db=db)
 
+        # Adding or removing members, roles or permissions doesn't generate a node event, notify the other workers directly
+        if affects_permissions(schema=source._schema) or any(
+            affects_permissions(schema=node._schema) for node in nodes.values()
+        ):
+            permission_cache.invalidate()
+            if context.service:
+                await context.service.send(message=messages.RefreshRegistryPermissions())
+
         return cls(ok=True)
 
 
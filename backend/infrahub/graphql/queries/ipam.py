@@ -6,8 +6,8 @@ from typing import TYPE_CHECKING, Optional
 from graphene import Field, Int, ObjectType, String
 
 from infrahub.core.constants import InfrahubKind
+from infrahub.core.ipam.tree import ipam_trees
 from infrahub.core.manager import NodeManager
-from infrahub.core.query.ipam import get_ip_addresses, get_subnets
 from infrahub.exceptions import NodeNotFoundError, ValidationError
 from infrahub.pools.address import get_available
 from infrahub.pools.prefix import PrefixPool
@@ -44,16 +44,12 @@ class IPAddressGetNextAvailable(ObjectType):
             raise ValidationError(input_value="Invalid prefix length for current selected prefix")
 
         namespace = await prefix.ip_namespace.get_peer(db=context.db)  # type: ignore[attr-defined]
-        addresses = await get_ip_addresses(
-            db=context.db,
-            ip_prefix=ip_prefix,
-            namespace=namespace,
-            branch=context.branch,
-        )
+        ipam_tree = await ipam_trees.get_tree(db=context.db, branch=context.branch, namespace_id=namespace.id)
+        addresses = ipam_tree.get_addresses(network=ip_prefix)
 
         available = get_available(
             network=ip_prefix,
-            addresses=[ip.address for ip in addresses],
+            addresses=[address for _, address in addresses],
             is_pool=prefix.is_pool.value,  # type: ignore[attr-defined]
         )
 
@@ -85,16 +81,12 @@ class IPPrefixGetNextAvailable(ObjectType):
             )
 
         namespace = await prefix.ip_namespace.get_peer(db=context.db)  # type: ignore[attr-defined]
-        subnets = await get_subnets(
-            db=context.db,
-            ip_prefix=ipaddress.ip_network(prefix.prefix.value),  # type: ignore[attr-defined]
-            namespace=namespace,
-            branch=context.branch,
-        )
+        ipam_tree = await ipam_trees.get_tree(db=context.db, branch=context.branch, namespace_id=namespace.id)
+        subnets = ipam_tree.get_child_prefixes(network=ipaddress.ip_network(prefix.prefix.value))  # type: ignore[attr-defined]
 
         pool = PrefixPool(prefix.prefix.value)  # type: ignore[attr-defined]
-        for subnet in subnets:
-            pool.reserve(subnet=str(subnet.prefix))
+        for _, subnet in subnets:
+            pool.reserve(subnet=str(subnet))
 
         next_available = pool.get(prefixlen=prefix_length)
         return {"prefix": str(next_available)}
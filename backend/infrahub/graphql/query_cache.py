@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+
+from .metrics import GRAPHQL_QUERY_CACHE_HITS_METRICS, GRAPHQL_QUERY_CACHE_MISSES_METRICS
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
+    from infrahub.core.branch import Branch
+
+DEFAULT_MAX_SIZE = 1024
+
+
+class GraphQLQueryCache:
+    """LRU cache of the parsed and analyzed GraphQL queries.
+
+    The entries are keyed on the hash of the schema of the branch and on the hash of the query,
+    the analyzer stored for a given key is only valid for the GraphQL schema it has been created with.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str, str], InfrahubGraphQLQueryAnalyzer] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _get_query_hash(query: str) -> str:
+        return hashlib.md5(query.encode(), usedforsecurity=False).hexdigest()
+
+    def get_analyzer(
+        self,
+        query: str,
+        schema: GraphQLSchema,
+        schema_hash: str,
+        branch: Branch,
+        operation_name: Optional[str] = None,
+        query_variables: Optional[dict] = None,
+    ) -> InfrahubGraphQLQueryAnalyzer:
+        """Return an analyzer for the query, the query is only parsed if it's not already present in the cache."""
+        key = (schema_hash, self._get_query_hash(query=query))
+        analyzer = self._entries.get(key)
+        if analyzer:
+            GRAPHQL_QUERY_CACHE_HITS_METRICS.labels(branch.name).inc()
+            self._entries.move_to_end(key)
+            return analyzer.for_request(branch=branch, operation_name=operation_name, query_variables=query_variables)
+
+        GRAPHQL_QUERY_CACHE_MISSES_METRICS.labels(branch.name).inc()
+        analyzer = InfrahubGraphQLQueryAnalyzer(query=query, schema=schema)
+        self._entries[key] = analyzer
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return analyzer.for_request(branch=branch, operation_name=operation_name, query_variables=query_variables)
+
+    def invalidate(self, schema_hash: str) -> None:
+        """Remove all the queries analyzed against a given schema."""
+        for key in [key for key in self._entries if key[0] == schema_hash]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+query_cache = GraphQLQueryCache()
@@ -9,6 +9,7 @@ from infrahub.core.manager import NodeManager
 from infrahub.core.query.node import NodeGetHierarchyQuery
 from infrahub.exceptions import NodeNotFoundError
 
+from .loaders.peers import PeerRelationshipsDataLoader, QueryPeerParams
 from .parser import extract_selection
 from .permissions import get_permissions
 from .types import RELATIONS_PROPERTY_MAP, RELATIONS_PROPERTY_MAP_REVERSED
@@ -16,6 +17,7 @@ from .types import RELATIONS_PROPERTY_MAP, RELATIONS_PROPERTY_MAP_REVERSED
 if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
 
+    from infrahub.core.relationship.model import Relationship
     from infrahub.core.schema import MainSchemaTypes, NodeSchema
     from infrahub.graphql.initialization import GraphqlContext
 
@@ -92,20 +94,18 @@ async def default_resolver(*args: Any, **kwargs) -> dict | list[dict] | None:
         if "__" in key and value or key in ["id", "ids"]
     }
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
-            source_kind=node_schema.kind,
-            schema=node_rel,
-            filters=filters,
-            fields=fields,
-            at=context.at,
-            branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
-        )
+    query_params = QueryPeerParams(
+        branch=context.branch,
+        source_kind=node_schema.kind,
+        schema=node_rel,
+        filters=filters,
+        fields=fields,
+        at=context.at,
+        branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
+    )
+    objs = await _load_peers(context=context, node_id=parent["id"], query_params=query_params)
 
+    async with context.db.start_session() as db:
         if node_rel.cardinality == "many":
             return [
                 await obj.to_graphql(db=db, fields=fields, related_node_ids=context.related_node_ids) for obj in objs
@@ -237,23 +237,20 @@ async def single_relationship_resolver(parent: dict, info: GraphQLResolveInfo, *
 
     response: dict[str, Any] = {"node": None, "properties": {}}
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
-            source_kind=node_schema.kind,
-            schema=node_rel,
-            filters=filters,
-            fields=node_fields,
-            at=context.at,
-            branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
-        )
-
-        if not objs:
-            return response
+    query_params = QueryPeerParams(
+        branch=context.branch,
+        source_kind=node_schema.kind,
+        schema=node_rel,
+        filters=filters,
+        fields=node_fields,
+        at=context.at,
+        branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
+    )
+    objs = await _load_peers(context=context, node_id=parent["id"], query_params=query_params)
+    if not objs:
+        return response
 
+    async with context.db.start_session() as db:
         node_graph = await objs[0].to_graphql(db=db, fields=node_fields, related_node_ids=context.related_node_ids)
         for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
             value = node_graph.pop(key, None)
@@ -302,6 +299,31 @@ async def many_relationship_resolver(
 
     source_kind = node_schema.kind
 
+    if not include_descendants and offset is None and limit is None and node_fields:
+        # Without pagination, the peers of all the parents can be resolved together and counted once loaded
+        query_params = QueryPeerParams(
+            branch=context.branch,
+            source_kind=source_kind,
+            schema=node_rel,
+            filters=filters,
+            fields=node_fields,
+            at=context.at,
+            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
+        )
+        objs = await _load_peers(context=context, node_id=parent["id"], query_params=query_params)
+        if "count" in fields:
+            response["count"] = len(objs)
+        if not objs:
+            return response
+
+        async with context.db.start_session() as db:
+            node_graph = [
+                await obj.to_graphql(db=db, fields=node_fields, related_node_ids=context.related_node_ids)
+                for obj in objs
+            ]
+        response["edges"] = _build_relationship_edges(node_graph=node_graph)
+        return response
+
     async with context.db.start_session() as db:
         ids = [parent["id"]]
         if include_descendants:
@@ -354,21 +376,33 @@ async def many_relationship_resolver(
         node_graph = [
             await obj.to_graphql(db=db, fields=node_fields, related_node_ids=context.related_node_ids) for obj in objs
         ]
-
-        entries = []
-        for node in node_graph:
-            entry = {"node": {}, "properties": {}}
-            for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
-                value = node.pop(key, None)
-                if value:
-                    entry["properties"][mapped] = value
-            entry["node"] = node
-            entries.append(entry)
-        response["edges"] = entries
+        response["edges"] = _build_relationship_edges(node_graph=node_graph)
 
         return response
 
 
+def _build_relationship_edges(node_graph: list[dict]) -> list[dict[str, Any]]:
+    entries = []
+    for node in node_graph:
+        entry: dict[str, Any] = {"node": {}, "properties": {}}
+        for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
+            value = node.pop(key, None)
+            if value:
+                entry["properties"][mapped] = value
+        entry["node"] = node
+        entries.append(entry)
+    return entries
+
+
+async def _load_peers(context: GraphqlContext, node_id: str, query_params: QueryPeerParams) -> list[Relationship]:
+    """Load the peers of a node through a loader shared by all the nodes of the request querying the same relationship."""
+    if query_params.cache_key not in context.peer_loaders:
+        context.peer_loaders[query_params.cache_key] = PeerRelationshipsDataLoader(
+            db=context.db, query_params=query_params
+        )
+    return await context.peer_loaders[query_params.cache_key].load(node_id)
+
+
 async def ancestors_resolver(parent: dict, info: GraphQLResolveInfo, **kwargs) -> dict[str, Any]:
     return await hierarchy_resolver(
         direction=RelationshipHierarchyDirection.ANCESTORS, parent=parent, info=info, **kwargs
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+
+import ujson
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+
+def _default(obj: Any) -> Any:
+    """Convert the objects that can't be natively encoded to JSON."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def render_graphql_response(content: Any) -> bytes:
+    """Serialize the content of a GraphQL response, the output matches the compact encoding of `JSONResponse`."""
+    return ujson.dumps(
+        content, ensure_ascii=False, escape_forward_slashes=False, allow_nan=False, default=_default
+    ).encode("utf-8")
+
+
+class GraphQLJSONResponse(JSONResponse):
+    """JSONResponse using a faster encoder, the content is serialized only once when the response is created.
+
+    The size of the response is available with `len(response.body)` without rendering the content again.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return render_graphql_response(content)
@@ -1,21 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import time
 import uuid
 from asyncio import Lock as LocalLock
 from asyncio import sleep
-from typing import TYPE_CHECKING, Optional, Union
+from contextlib import suppress
+from typing import TYPE_CHECKING, Optional, Union, cast
 
+import nats
 import redis.asyncio as redis
+from nats.js.kv import KV_DEL, KV_PURGE
 from prometheus_client import Histogram
 from redis.asyncio.lock import Lock as GlobalLock
 
 from infrahub import config
+from infrahub.message_bus.types import KVTTL
 
 if TYPE_CHECKING:
     from types import TracebackType
 
     from infrahub.services import InfrahubServices
+    from infrahub.services.adapters.cache.nats import NATSCache
 
 registry: InfrahubLockRegistry = None
 
@@ -41,6 +47,10 @@ GLOBAL_INIT_LOCK = "global.init"
 GLOBAL_SCHEMA_LOCK = "global.schema"
 GLOBAL_GRAPH_LOCK = "global.graph"
 
+NATS_LOCK_PREFIX = "locks"
+NATS_LOCK_TTL = KVTTL.FIFTEEN.value
+NATS_LOCK_RENEW_INTERVAL = NATS_LOCK_TTL / 3
+
 
 class InfrahubMultiLock:
     """Context manager to allow multiple locks to be reserved together"""
@@ -70,12 +80,20 @@ class InfrahubMultiLock:
 
 
 class NATSLock:
-    """Context manager to lock using NATS"""
+    """Context manager to lock using NATS
+
+    Every client waiting for the lock registers a ticket under `locks.<name>.<token>` in a KV bucket with a TTL.
+    The lock is granted to the oldest live ticket, so waiters are served in FIFO order, and each waiter watches
+    the tickets of the lock so it wakes up as soon as the previous owner deletes its own.
+    Tickets are renewed in the background while they are alive, the ticket of a crashed worker expires after NATS_LOCK_TTL.
+    """
 
     def __init__(self, service: InfrahubServices, name: str) -> None:
         self.name = name
-        self.token = None
+        self.token: Optional[str] = None
         self.service = service
+        self.local = LocalLock()
+        self._renew_task: Optional[asyncio.Task] = None
 
     async def __aenter__(self):
         await self.acquire()
@@ -88,22 +106,122 @@ class NATSLock:
     ):
         await self.release()
 
-    async def acquire(self) -> None:
-        token = uuid.uuid1().hex
-        while True:
-            if await self.do_acquire(token):
-                self.token = token
-                return True
-            await sleep(0.1)  # default Redis GlobalLock value
+    @property
+    def prefix(self) -> str:
+        return f"{NATS_LOCK_PREFIX}.{self.name.replace(':', '.')}"
+
+    @property
+    def kv(self) -> nats.js.kv.KeyValue:
+        return cast("NATSCache", self.service.cache).get_kv(self.prefix)
 
-    async def do_acquire(self, token: str) -> bool:
-        return await self.service.cache.set(key=self.name, value=token, not_exists=True)
+    async def acquire(self) -> None:
+        # Only one task per process competes for the remote lock, the others wait in order on the local lock
+        await self.local.acquire()
+        try:
+            token = uuid.uuid4().hex
+            key = f"{self.prefix}.{token}"
+            revision = await self.kv.put(key=key, value=b"")
+            self.token = token
+            self._renew_task = asyncio.create_task(self._renew(key=key, value=str(revision).encode()))
+            await self._wait_for_turn()
+        except BaseException:
+            await self._release_ticket()
+            self.local.release()
+            raise
 
     async def release(self) -> None:
-        await self.service.cache.delete(key=self.name)
+        try:
+            await self._release_ticket()
+        finally:
+            self.local.release()
 
     async def locked(self) -> bool:
-        return await self.service.cache.get(key=self.name) is not None
+        if self.local.locked():
+            return True
+        return bool(await self._get_tickets())
+
+    async def _release_ticket(self) -> None:
+        if self._renew_task:
+            self._renew_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._renew_task
+            self._renew_task = None
+
+        if self.token:
+            await self.kv.delete(key=f"{self.prefix}.{self.token}")
+            self.token = None
+
+    async def _renew(self, key: str, value: bytes) -> None:
+        """Keep the ticket alive, the value stores the revision of the initial write to preserve the position in the queue."""
+        while True:
+            await asyncio.sleep(NATS_LOCK_RENEW_INTERVAL)
+            await self.kv.put(key=key, value=value)
+
+    async def _get_tickets(self) -> dict[str, int]:
+        watcher = await self.kv.watch(f"{self.prefix}.*", ignore_deletes=True)
+        tickets: dict[str, int] = {}
+        try:
+            async for entry in watcher:
+                tickets[entry.key.rsplit(".", maxsplit=1)[-1]] = get_ticket_position(entry=entry)
+        finally:
+            await watcher.stop()
+        return tickets
+
+    async def _wait_for_turn(self) -> None:
+        """Watch the tickets of the lock until ours is the oldest one alive.
+
+        The first updates returned by the watcher are the tickets currently registered, followed by a None marker,
+        after that the watcher returns every new ticket, renewal or deletion as they happen.
+        """
+        watcher = await self.kv.watch(f"{self.prefix}.*")
+        tickets: dict[str, tuple[int, float]] = {}
+        initialized = False
+        try:
+            while True:
+                try:
+                    entry = await watcher.updates(timeout=NATS_LOCK_RENEW_INTERVAL)
+                except nats.errors.TimeoutError:
+                    entry = None
+
+                if entry is None:
+                    initialized = True
+                elif entry.operation in (KV_DEL, KV_PURGE):
+                    tickets.pop(entry.key.rsplit(".", maxsplit=1)[-1], None)
+                else:
+                    tickets[entry.key.rsplit(".", maxsplit=1)[-1]] = (
+                        get_ticket_position(entry=entry),
+                        time.monotonic(),
+                    )
+
+                if initialized and get_lock_owner(tickets=tickets, ttl=NATS_LOCK_TTL) == self.token:
+                    return
+        finally:
+            await watcher.stop()
+
+
+def get_ticket_position(entry: nats.js.kv.KeyValue.Entry) -> int:
+    """Return the position of a NATSLock ticket in the queue.
+
+    The position is the revision of the first write of the ticket, renewals store it as their value.
+    """
+    if entry.value:
+        return int(entry.value.decode())
+    return entry.revision
+
+
+def get_lock_owner(tickets: dict[str, tuple[int, float]], ttl: float) -> Optional[str]:
+    """Return the token of the oldest ticket that has been seen alive within the last ttl seconds.
+
+    Expired tickets are removed from the dictionary, they belong to clients that stopped renewing them.
+    """
+    now = time.monotonic()
+    for token, (_, last_seen) in list(tickets.items()):
+        if now - last_seen > ttl:
+            del tickets[token]
+
+    if not tickets:
+        return None
+    return min(tickets, key=lambda token: tickets[token][0])
 
 
 class InfrahubLock:
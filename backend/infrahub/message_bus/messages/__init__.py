@@ -23,7 +23,10 @@ from .proposed_change.request_proposedchange_rungenerators import RequestPropose
 from .proposed_change.request_proposedchange_runtests import RequestProposedChangeRunTests
 from .proposed_change.request_proposedchange_schemaintegrity import RequestProposedChangeSchemaIntegrity
 from .refresh_git_fetch import RefreshGitFetch
+from .refresh_registry_account import RefreshRegistryAccount
 from .refresh_registry_branches import RefreshRegistryBranches
+from .refresh_registry_ipam import RefreshRegistryIpam
+from .refresh_registry_permissions import RefreshRegistryPermissions
 from .refresh_registry_rebasedbranch import RefreshRegistryRebasedBranch
 from .refresh_webhook_configuration import RefreshWebhookConfiguration
 from .request_artifactdefinition_check import RequestArtifactDefinitionCheck
@@ -57,7 +60,10 @@ MESSAGE_MAP: dict[str, type[InfrahubMessage]] = {
     "schema.migration.path": SchemaMigrationPath,
     "schema.validator.path": SchemaValidatorPath,
     "refresh.git.fetch": RefreshGitFetch,
+    "refresh.registry.account": RefreshRegistryAccount,
     "refresh.registry.branches": RefreshRegistryBranches,
+    "refresh.registry.ipam": RefreshRegistryIpam,
+    "refresh.registry.permissions": RefreshRegistryPermissions,
     "refresh.registry.rebased_branch": RefreshRegistryRebasedBranch,
     "refresh.webhook.configuration": RefreshWebhookConfiguration,
     "request.artifact_definition.check": RequestArtifactDefinitionCheck,
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from pydantic import Field
+
+from infrahub.message_bus import InfrahubMessage
+
+
+class RefreshRegistryAccount(InfrahubMessage):
+    """Sent to discard the cached API tokens and status of an account after it has been modified or deleted."""
+
+    account_id: Optional[str] = Field(
+        default=None, description="The ID of the account, the entries of all the accounts are discarded if not set"
+    )
@@ -0,0 +1,20 @@
+from typing import Optional
+
+from pydantic import Field
+
+from infrahub.message_bus import InfrahubMessage
+
+
+class RefreshRegistryIpam(InfrahubMessage):
+    """Sent to update the IPAM trees of the local registry after IP prefixes or IP addresses have changed."""
+
+    branch: str = Field(..., description="The branch on which the IP prefixes or IP addresses have changed")
+    node_id: Optional[str] = Field(
+        default=None,
+        description="The ID of the changed IP prefix or IP address, all the trees of the branch are discarded if not set",
+    )
+    namespace_id: Optional[str] = Field(default=None, description="The ID of the IP namespace of the node")
+    ip_value: Optional[str] = Field(
+        default=None, description="The prefix or address of the node, not set if the node has been deleted"
+    )
+    is_address: bool = Field(default=False, description="Indicates if the node is an IP address or an IP prefix")
@@ -0,0 +1,5 @@
+from infrahub.message_bus import InfrahubMessage
+
+
+class RefreshRegistryPermissions(InfrahubMessage):
+    """Sent to discard the cached permissions of the accounts after roles, groups, accounts or permissions have changed."""
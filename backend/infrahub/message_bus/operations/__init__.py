@@ -37,7 +37,10 @@ COMMAND_MAP = {
     "git.repository.connectivity": git.repository.connectivity,
     "git.repository.import_objects": git.repository.import_objects,
     "refresh.git.fetch": git.repository.fetch,
+    "refresh.registry.account": refresh.registry.account,
     "refresh.registry.branches": refresh.registry.branches,
+    "refresh.registry.ipam": refresh.registry.ipam,
+    "refresh.registry.permissions": refresh.registry.permissions,
     "refresh.registry.rebased_branch": refresh.registry.rebased_branch,
     "refresh.webhook.configuration": refresh.webhook.configuration,
     "request.generator_definition.check": requests.generator_definition.check,
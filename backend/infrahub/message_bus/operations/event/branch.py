@@ -43,6 +43,7 @@ async def merge(message: messages.EventBranchMerge, service: InfrahubServices) -
 
     events: List[InfrahubMessage] = [
         messages.RefreshRegistryBranches(),
+        messages.RefreshRegistryIpam(branch=message.target_branch),
     ]
     component_registry = get_component_registry()
     default_branch = registry.get_branch_from_registry()
@@ -82,6 +83,7 @@ async def rebased(message: messages.EventBranchRebased, service: InfrahubService
 
     events: List[InfrahubMessage] = [
         messages.RefreshRegistryRebasedBranch(branch=message.branch),
+        messages.RefreshRegistryIpam(branch=message.branch),
     ]
 
     # for every diff that touches the rebased branch, recalculate it
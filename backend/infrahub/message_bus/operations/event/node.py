@@ -1,15 +1,64 @@
-from typing import List
+from typing import List, Optional
 
 from prefect import flow
 
-from infrahub.core.constants import InfrahubKind
+from infrahub.auth_cache import is_account, is_account_token
+from infrahub.core import registry
+from infrahub.core.constants import InfrahubKind, MutationAction
+from infrahub.core.manager import NodeManager
+from infrahub.exceptions import BranchNotFoundError, SchemaNotFoundError
 from infrahub.log import get_logger
 from infrahub.message_bus import InfrahubMessage, messages
+from infrahub.permissions.cache import affects_permissions
 from infrahub.services import InfrahubServices
 
 log = get_logger()
 
 
+def _get_registry_refreshes(message: messages.EventNodeMutated) -> List[InfrahubMessage]:
+    try:
+        schema = registry.schema.get(name=message.kind, branch=message.branch, duplicate=False)
+    except (BranchNotFoundError, SchemaNotFoundError):
+        return []
+
+    refreshes: List[InfrahubMessage] = []
+    if is_account(schema=schema):
+        refreshes.append(messages.RefreshRegistryAccount(account_id=message.node_id))
+    if is_account_token(schema=schema):
+        refreshes.append(messages.RefreshRegistryAccount())
+    if affects_permissions(schema=schema):
+        refreshes.append(messages.RefreshRegistryPermissions())
+    return refreshes
+
+
+async def _get_ipam_refresh(
+    message: messages.EventNodeMutated, service: InfrahubServices
+) -> Optional[messages.RefreshRegistryIpam]:
+    try:
+        schema = registry.schema.get(name=message.kind, branch=message.branch, duplicate=False)
+    except (BranchNotFoundError, SchemaNotFoundError):
+        return None
+    inherit_from = getattr(schema, "inherit_from", [])
+    is_address = InfrahubKind.IPADDRESS in inherit_from
+    if not is_address and InfrahubKind.IPPREFIX not in inherit_from:
+        return None
+    if message.action == MutationAction.REMOVED.value:
+        return messages.RefreshRegistryIpam(branch=message.branch, node_id=message.node_id)
+
+    node = await NodeManager.get_one(db=service.database, id=message.node_id, branch=message.branch)
+    if not node:
+        return messages.RefreshRegistryIpam(branch=message.branch, node_id=message.node_id)
+    namespace = await node.ip_namespace.get_peer(db=service.database)  # type: ignore[attr-defined]
+    ip_attribute = node.address if is_address else node.prefix  # type: ignore[attr-defined]
+    return messages.RefreshRegistryIpam(
+        branch=message.branch,
+        node_id=message.node_id,
+        namespace_id=namespace.id if namespace else None,
+        ip_value=ip_attribute.value,
+        is_address=is_address,
+    )
+
+
 @flow(name="event-node-mutated")
 async def mutated(
     message: messages.EventNodeMutated,
@@ -29,6 +78,10 @@ async def mutated(
         InfrahubKind.CUSTOMWEBHOOK: [messages.RefreshWebhookConfiguration()],
     }
     events.extend(kind_map.get(message.kind, []))
+    ipam_refresh = await _get_ipam_refresh(message=message, service=service)
+    if ipam_refresh:
+        events.append(ipam_refresh)
+    events.extend(_get_registry_refreshes(message=message))
     events.append(
         messages.TriggerWebhookActions(event_type=f"{message.kind}.{message.action}", event_data=message.data)
     )
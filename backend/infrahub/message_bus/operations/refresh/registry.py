@@ -1,11 +1,22 @@
+import ipaddress
+
 from infrahub import lock
+from infrahub.auth_cache import auth_cache
+from infrahub.core.ipam.tree import ipam_trees
 from infrahub.core.registry import registry
 from infrahub.message_bus import messages
+from infrahub.permissions.cache import permission_cache
+from infrahub.pools.allocators import pool_allocators
 from infrahub.services import InfrahubServices
 from infrahub.tasks.registry import refresh_branches
 from infrahub.worker import WORKER_IDENTITY
 
 
+async def account(message: messages.RefreshRegistryAccount, service: InfrahubServices) -> None:
+    service.log.debug("Discarding cached account", account_id=message.account_id)
+    auth_cache.discard_account(account_id=message.account_id)
+
+
 async def branches(message: messages.RefreshRegistryBranches, service: InfrahubServices) -> None:
     if message.meta and message.meta.initiator_id == WORKER_IDENTITY:
         service.log.info("Ignoring refresh registry refresh request originating from self", worker=WORKER_IDENTITY)
@@ -29,3 +40,28 @@ async def rebased_branch(message: messages.RefreshRegistryRebasedBranch, service
         registry.branch[message.branch] = await registry.branch_object.get_by_name(
             name=message.branch, db=service.database
         )
+
+
+async def ipam(message: messages.RefreshRegistryIpam, service: InfrahubServices) -> None:
+    if not message.node_id:
+        service.log.debug("Discarding IPAM trees", branch=message.branch)
+        ipam_trees.invalidate(branch_name=message.branch)
+        return
+
+    ip_value = None
+    if message.ip_value:
+        ip_value = (
+            ipaddress.ip_interface(message.ip_value) if message.is_address else ipaddress.ip_network(message.ip_value)
+        )
+    ipam_trees.update_node(
+        branch_name=message.branch, node_id=message.node_id, namespace_id=message.namespace_id, ip_value=ip_value
+    )
+    pool_allocators.update_node(node_id=message.node_id, namespace_id=message.namespace_id, ip_value=ip_value)
+
+
+async def permissions(
+    message: messages.RefreshRegistryPermissions,  # pylint: disable=unused-argument
+    service: InfrahubServices,
+) -> None:
+    service.log.debug("Discarding cached permissions")
+    permission_cache.invalidate()
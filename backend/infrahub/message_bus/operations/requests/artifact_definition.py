@@ -133,7 +133,7 @@ async def check(message: messages.RequestArtifactDefinitionCheck, service: Infra
         await task_report.info(event=f"{requested_artifacts} artifact(s) requires to be generated.")
         for event in events:
             event.assign_meta(parent=message)
-            await service.send(message=event)
+        await service.send_many(messages=events)
 
 
 def _render_artifact(artifact_id: Optional[str], managed_branch: bool, impacted_artifacts: list[str]) -> bool:
@@ -126,7 +126,7 @@ async def check(message: messages.RequestGeneratorDefinitionCheck, service: Infr
         await task_report.info(event=f"{requested_instances} generator instances required to be executed.")
         for event in events:
             event.assign_meta(parent=message)
-            await service.send(message=event)
+        await service.send_many(messages=events)
 
 
 def _run_generator(instance_id: Optional[str], managed_branch: bool, impacted_instances: list[str]) -> bool:
@@ -103,7 +103,7 @@ async def pipeline(message: messages.RequestProposedChangePipeline, service: Inf
                     )
             for event in events:
                 event.assign_meta(parent=message)
-                await service.send(message=event)
+            await service.send_many(messages=events)
             await task_report.error("Pipeline aborted due to merge conflicts", proposed_change=message.proposed_change)
             return
 
@@ -200,7 +200,7 @@ async def pipeline(message: messages.RequestProposedChangePipeline, service: Inf
 
         for event in events:
             event.assign_meta(parent=message)
-            await service.send(message=event)
+        await service.send_many(messages=events)
 
 
 @flow(name="proposed-changed-schema-integrity")
@@ -309,7 +309,7 @@ async def repository_checks(message: messages.RequestProposedChangeRepositoryChe
             await task_report.info(f"{repository.repository_name}: Requesting user checks")
         for event in events:
             event.assign_meta(parent=message)
-            await service.send(message=event)
+        await service.send_many(messages=events)
 
 
 @flow(name="proposed-changed-refresh-artifact")
@@ -332,6 +332,7 @@ async def refresh_artifacts(message: messages.RequestProposedChangeRefreshArtifa
             proposed_change=message.proposed_change,
         )
 
+        events: list[InfrahubMessage] = []
         for artifact_definition in artifact_definitions:
             # Request artifact definition checks if the source branch that is managed in combination
             # to the Git repository containing modifications which could indicate changes to the transforms
@@ -373,7 +374,9 @@ async def refresh_artifacts(message: messages.RequestProposedChangeRefreshArtifa
                 )
 
                 msg.assign_meta(parent=message)
-                await service.send(message=msg)
+                events.append(msg)
+
+        await service.send_many(messages=events)
 
 
 @flow(name="proposed-changed-run-generator")
@@ -404,6 +407,7 @@ async def run_generators(message: messages.RequestProposedChangeRunGenerators, s
             for generator in generators
         ]
 
+        events: list[InfrahubMessage] = []
         for generator_definition in generator_definitions:
             # Request generator definitions if the source branch that is managed in combination
             # to the Git repository containing modifications which could indicate changes to the transforms
@@ -437,7 +441,9 @@ async def run_generators(message: messages.RequestProposedChangeRunGenerators, s
                     destination_branch=message.destination_branch,
                 )
                 msg.assign_meta(parent=message)
-                await service.send(message=msg)
+                events.append(msg)
+
+        await service.send_many(messages=events)
 
     next_messages: list[InfrahubMessage] = []
     if message.refresh_artifacts:
@@ -466,7 +472,7 @@ async def run_generators(message: messages.RequestProposedChangeRunGenerators, s
 
     for next_msg in next_messages:
         next_msg.assign_meta(parent=message)
-        await service.send(message=next_msg)
+    await service.send_many(messages=next_messages)
 
 
 GATHER_ARTIFACT_DEFINITIONS = """
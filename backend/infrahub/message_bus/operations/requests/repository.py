@@ -93,7 +93,7 @@ async def checks(message: messages.RequestRepositoryChecks, service: InfrahubSer
 
     for event in events:
         event.assign_meta(parent=message)
-        await service.send(message=event)
+    await service.send_many(messages=events)
 
 
 @flow(name="repository-users-check")
@@ -134,7 +134,7 @@ async def user_checks(message: messages.RequestRepositoryUserChecks, service: In
 
         for event in events:
             event.assign_meta(parent=message)
-            await service.send(message=event)
+        await service.send_many(messages=events)
 
         await task_report.info(
             f"Requested {len(repository.checks.peers)} user defined checks", proposed_change=message.proposed_change
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from itertools import product
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
+
+from infrahub import config
+from infrahub.core.constants import GlobalPermissions, InfrahubKind
+from infrahub.permissions.constants import PermissionDecisionFlag
+
+from .metrics import PERMISSION_CACHE_HITS_METRICS, PERMISSION_CACHE_MISSES_METRICS, PERMISSION_LOAD_TIME_METRICS
+
+if TYPE_CHECKING:
+    from infrahub.core.account import ObjectPermission
+    from infrahub.core.schema import MainSchemaTypes
+    from infrahub.permissions.constants import AssignedPermissions
+
+WILDCARD_VALUE = "*"
+WILDCARD_ACTION = "any"
+
+PERMISSION_KINDS = {
+    InfrahubKind.ACCOUNTGROUP,
+    InfrahubKind.ACCOUNTROLE,
+    InfrahubKind.BASEPERMISSION,
+    InfrahubKind.GENERICACCOUNT,
+    InfrahubKind.GLOBALPERMISSION,
+    InfrahubKind.OBJECTPERMISSION,
+}
+
+
+def affects_permissions(schema: MainSchemaTypes) -> bool:
+    """Indicate if a change to a node of this schema can modify the permissions granted to the accounts."""
+    if schema.kind in PERMISSION_KINDS:
+        return True
+    inherit_from = getattr(schema, "inherit_from", [])
+    return InfrahubKind.GENERICACCOUNT in inherit_from or InfrahubKind.BASEPERMISSION in inherit_from
+
+
+def compute_specificity(permission: ObjectPermission) -> int:
+    specificity = 0
+    if permission.namespace != WILDCARD_VALUE:
+        specificity += 1
+    if permission.name != WILDCARD_VALUE:
+        specificity += 1
+    if permission.action != WILDCARD_ACTION:
+        specificity += 1
+    if not permission.decision & PermissionDecisionFlag.ALLOW_ALL:
+        specificity += 1
+    return specificity
+
+
+class CompiledPermissions:
+    """Permissions of an account compiled into lookup tables.
+
+    The object permissions are indexed by (namespace, name, action) so a decision only looks at the few keys that can
+    match, the wildcard ones included, instead of scanning every permission. For each key only the decisions of the
+    most specific permissions are kept as they are the only ones that can take part in the final decision, along with
+    the position of the first of them so the keys can be combined in the order of the permissions.
+    """
+
+    def __init__(self, permissions: AssignedPermissions) -> None:
+        self.permissions = permissions
+        self.global_decisions: dict[str, bool] = {}
+        self.object_decisions: dict[tuple[str, str, str], tuple[int, int, PermissionDecisionFlag]] = {}
+
+        for global_permission in permissions["global_permissions"]:
+            # a deny preempts any allow for the same action
+            is_allowed = global_permission.decision != PermissionDecisionFlag.DENY
+            self.global_decisions[global_permission.action] = (
+                self.global_decisions.get(global_permission.action, True) and is_allowed
+            )
+
+        for position, object_permission in enumerate(permissions["object_permissions"]):
+            key = (object_permission.namespace, object_permission.name, object_permission.action)
+            specificity = compute_specificity(permission=object_permission)
+            decision = PermissionDecisionFlag(value=object_permission.decision)
+            current = self.object_decisions.get(key)
+            if current is None or specificity > current[0]:
+                self.object_decisions[key] = (specificity, position, decision)
+            elif specificity == current[0] and decision != PermissionDecisionFlag.DENY:
+                self.object_decisions[key] = (specificity, current[1], current[2] | decision)
+
+        self.is_super_admin = self.has_global_permission(action=GlobalPermissions.SUPER_ADMIN.value)
+
+    def has_global_permission(self, action: str) -> bool:
+        return self.global_decisions.get(action, False)
+
+    def report_object_permission(self, namespace: str, name: str, action: str) -> PermissionDecisionFlag:
+        """Return the decision of the most specific permissions matching the kind and the action."""
+        entries = [
+            entry
+            for key in set(product((namespace, WILDCARD_VALUE), (name, WILDCARD_VALUE), (action, WILDCARD_ACTION)))
+            if (entry := self.object_decisions.get(key))
+        ]
+        if not entries:
+            return PermissionDecisionFlag.DENY
+
+        highest_specificity = max(entry[0] for entry in entries)
+        _, _, combined_decision = min(entry for entry in entries if entry[0] == highest_specificity)
+        for specificity, _, decision in entries:
+            if specificity == highest_specificity:
+                # Only the first of the most specific permissions can bring a deny, as with a scan of the permissions
+                combined_decision |= decision & ~PermissionDecisionFlag.DENY
+
+        return combined_decision
+
+
+@dataclass
+class CachedPermissions:
+    permissions: CompiledPermissions
+    loaded_at: float
+
+
+class PermissionCache:
+    """Cache of the compiled permissions of the accounts used by this worker, per account and branch.
+
+    The entries are discarded when roles, groups, accounts or permissions are changed. As a safety net for the changes
+    that are not notified, like a branch being merged, an entry is also reloaded once it is older than the TTL.
+    """
+
+    def __init__(self, max_age: Optional[int] = None) -> None:
+        self._max_age = max_age
+        self._entries: dict[tuple[Optional[str], str], CachedPermissions] = {}
+        # Incremented on each invalidation so that a load which started before it doesn't store outdated permissions
+        self._generation = 0
+
+    @property
+    def max_age(self) -> int:
+        if self._max_age is not None:
+            return self._max_age
+        return config.SETTINGS.main.permission_cache_ttl
+
+    async def get_permissions(
+        self,
+        account_id: Optional[str],
+        branch_name: str,
+        loader: Callable[[], Awaitable[AssignedPermissions]],
+    ) -> CompiledPermissions:
+        key = (account_id, branch_name)
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry.loaded_at < self.max_age:
+            PERMISSION_CACHE_HITS_METRICS.inc()
+            return entry.permissions
+
+        PERMISSION_CACHE_MISSES_METRICS.inc()
+        generation = self._generation
+        start_time = time.monotonic()
+        permissions = CompiledPermissions(permissions=await loader())
+        loaded_at = time.monotonic()
+        PERMISSION_LOAD_TIME_METRICS.observe(loaded_at - start_time)
+        if self.max_age and generation == self._generation:
+            self._entries[key] = CachedPermissions(permissions=permissions, loaded_at=loaded_at)
+        return permissions
+
+    def invalidate(self, account_id: Optional[str] = None) -> None:
+        """Discard the permissions of an account, or of all the accounts if none is provided."""
+        self._generation += 1
+        if account_id is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == account_id]:
+            del self._entries[key]
+
+
+permission_cache = PermissionCache()
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from infrahub import config
 from infrahub.core.account import GlobalPermission, ObjectPermission, fetch_permissions, fetch_role_permissions
-from infrahub.core.constants import GlobalPermissions, PermissionDecision
 from infrahub.core.manager import NodeManager
 from infrahub.core.protocols import CoreAccountRole
 from infrahub.permissions.constants import PermissionDecisionFlag
 
 from .backend import PermissionBackend
+from .cache import CompiledPermissions, compute_specificity, permission_cache
 
 if TYPE_CHECKING:
     from infrahub.auth import AccountSession
@@ -23,16 +24,7 @@ class LocalPermissionBackend(PermissionBackend):
     wildcard_actions = ["any"]
 
     def _compute_specificity(self, permission: ObjectPermission) -> int:
-        specificity = 0
-        if permission.namespace not in self.wildcard_values:
-            specificity += 1
-        if permission.name not in self.wildcard_values:
-            specificity += 1
-        if permission.action not in self.wildcard_actions:
-            specificity += 1
-        if not permission.decision & PermissionDecisionFlag.ALLOW_ALL:
-            specificity += 1
-        return specificity
+        return compute_specificity(permission=permission)
 
     def report_object_permission(
         self, permissions: list[ObjectPermission], namespace: str, name: str, action: str
@@ -86,7 +78,7 @@ class LocalPermissionBackend(PermissionBackend):
 
         return grant_permission
 
-    async def load_permissions(
+    async def _fetch_permissions(
         self, db: InfrahubDatabase, account_session: AccountSession, branch: Branch
     ) -> AssignedPermissions:
         if not account_session.authenticated:
@@ -104,6 +96,27 @@ class LocalPermissionBackend(PermissionBackend):
 
         return await fetch_permissions(db=db, account_id=account_session.account_id, branch=branch)
 
+    async def load_compiled_permissions(
+        self, db: InfrahubDatabase, account_session: AccountSession, branch: Branch
+    ) -> CompiledPermissions:
+        """Return the permissions of the account compiled for lookups, they are cached for subsequent requests."""
+        if not account_session.authenticated and not config.SETTINGS.main.allow_anonymous_access:
+            return CompiledPermissions(permissions={"global_permissions": [], "object_permissions": []})
+
+        return await permission_cache.get_permissions(
+            account_id=account_session.account_id if account_session.authenticated else None,
+            branch_name=branch.name,
+            loader=partial(self._fetch_permissions, db=db, account_session=account_session, branch=branch),
+        )
+
+    async def load_permissions(
+        self, db: InfrahubDatabase, account_session: AccountSession, branch: Branch
+    ) -> AssignedPermissions:
+        compiled_permissions = await self.load_compiled_permissions(
+            db=db, account_session=account_session, branch=branch
+        )
+        return compiled_permissions.permissions
+
     async def has_permission(
         self,
         db: InfrahubDatabase,
@@ -111,25 +124,17 @@ class LocalPermissionBackend(PermissionBackend):
         permission: GlobalPermission | ObjectPermission,
         branch: Branch,
     ) -> bool:
-        granted_permissions = await self.load_permissions(db=db, account_session=account_session, branch=branch)
-        is_super_admin = self.resolve_global_permission(
-            permissions=granted_permissions["global_permissions"],
-            permission_to_check=GlobalPermission(
-                action=GlobalPermissions.SUPER_ADMIN, decision=PermissionDecision.ALLOW_ALL
-            ),
+        granted_permissions = await self.load_compiled_permissions(
+            db=db, account_session=account_session, branch=branch
         )
+        if granted_permissions.is_super_admin:
+            return True
 
         if isinstance(permission, GlobalPermission):
-            return (
-                self.resolve_global_permission(
-                    permissions=granted_permissions["global_permissions"], permission_to_check=permission
-                )
-                or is_super_admin
-            )
+            return granted_permissions.has_global_permission(action=permission.action)
 
-        return (
-            self.resolve_object_permission(
-                permissions=granted_permissions["object_permissions"], permission_to_check=permission
-            )
-            or is_super_admin
+        required_decision = PermissionDecisionFlag(value=permission.decision)
+        combined_decision = granted_permissions.report_object_permission(
+            namespace=permission.namespace, name=permission.name, action=permission.action
         )
+        return combined_decision & required_decision == required_decision
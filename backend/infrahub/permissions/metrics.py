@@ -0,0 +1,17 @@
+from prometheus_client import Counter, Histogram
+
+METRIC_PREFIX = "infrahub_permissions"
+
+PERMISSION_CACHE_HITS_METRICS = Counter(
+    f"{METRIC_PREFIX}_cache_hits",
+    "Number of permission lookups answered from the cache of compiled permissions",
+)
+PERMISSION_CACHE_MISSES_METRICS = Counter(
+    f"{METRIC_PREFIX}_cache_misses",
+    "Number of permission lookups that had to load the permissions from the database",
+)
+PERMISSION_LOAD_TIME_METRICS = Histogram(
+    f"{METRIC_PREFIX}_load_time_seconds",
+    "Time to load and compile the permissions of an account",
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
+
+from infrahub.core.timestamp import Timestamp
+
+if TYPE_CHECKING:
+    from infrahub.core.ipam.constants import AllIPTypes, IPNetworkType
+
+    from .number import NumberAllocator
+    from .prefix import PrefixAllocator
+
+
+@dataclass
+class PoolAllocator:
+    allocator: PrefixAllocator
+    namespace_id: str
+    is_address: bool
+    loaded_at: float
+    synced_at: str
+
+    def update(self, reserved: list[tuple[str, IPNetworkType]], synced_at: str) -> bool:
+        """Reserve the subnets used in the database since the last synchronization.
+
+        Return False if one of the subnets is already reserved for a node at a different place, the free space must
+        then be reloaded as the previous subnet of the node might still be used on another branch.
+        """
+        for node_id, subnet in reserved:
+            current_subnet = self.allocator.get_reserved(identifier=node_id)
+            if current_subnet and current_subnet != subnet:
+                return False
+            if self.allocator.contains(subnet=subnet):
+                self.allocator.reserve(subnet=subnet, identifier=node_id)
+        self.synced_at = synced_at
+        return True
+
+
+class PoolAllocatorRegistry:
+    """Cache of the free space of the resources of the IP pools used by this worker.
+
+    The free space of a resource is loaded from the database the first time the pool allocates from it. Before each
+    allocation the IP prefixes and IP addresses created or modified since the last synchronization are fetched from
+    the database, so that the resources allocated by the other workers are never handed out again. The free space is
+    also updated by the allocations done by this worker and by the mutation events of IP prefixes and IP addresses.
+    The synchronization looks sync_margin seconds further back to account for clock drift between workers and for
+    transactions committed late. As some changes are not synchronized, like the deletion of an IP prefix that might
+    contain other prefixes, the free space is also reloaded once it is older than max_age seconds.
+    """
+
+    def __init__(self, max_age: int = 300, sync_margin: int = 60) -> None:
+        self.max_age = max_age
+        self.sync_margin = sync_margin
+        self._allocators: dict[tuple[str, ...], PoolAllocator] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def get_lock(self, pool_id: str) -> asyncio.Lock:
+        """Return the lock to hold while allocating from a pool so that concurrent requests get different resources."""
+        return self._locks.setdefault(pool_id, asyncio.Lock())
+
+    async def get_allocator(
+        self,
+        key: tuple[str, ...],
+        namespace_id: str,
+        is_address: bool,
+        loader: Callable[[Timestamp], Awaitable[PrefixAllocator]],
+        syncer: Callable[[str, Timestamp], Awaitable[list[tuple[str, IPNetworkType]]]],
+    ) -> PrefixAllocator:
+        at = Timestamp()
+        synced_at = at.add_delta(seconds=-self.sync_margin).to_string()
+        pool_allocator = self._allocators.get(key)
+        if pool_allocator and time.monotonic() - pool_allocator.loaded_at <= self.max_age:
+            reserved = await syncer(pool_allocator.synced_at, at)
+            if pool_allocator.update(reserved=reserved, synced_at=synced_at):
+                return pool_allocator.allocator
+
+        allocator = await loader(at)
+        self._allocators[key] = PoolAllocator(
+            allocator=allocator,
+            namespace_id=namespace_id,
+            is_address=is_address,
+            loaded_at=time.monotonic(),
+            synced_at=synced_at,
+        )
+        return allocator
+
+    def update_node(
+        self, node_id: str, namespace_id: Optional[str] = None, ip_value: Optional[AllIPTypes] = None
+    ) -> None:
+        """Update the free space after an IP prefix or an IP address was created, updated or deleted.
+
+        No ip_value indicates that the node has been deleted. The free space is loaded across all the branches while the
+        events are sent for a single branch, so the free space of a resource is reloaded when one of its IP prefixes
+        or IP addresses is deleted or moved instead of being released, as it might still be used on another branch.
+        A prefix might also contain other prefixes that are still in use.
+        """
+        for key, pool_allocator in list(self._allocators.items()):
+            allocator = pool_allocator.allocator
+            subnet: Optional[IPNetworkType] = None
+            if pool_allocator.namespace_id == namespace_id:
+                if pool_allocator.is_address and isinstance(
+                    ip_value, (ipaddress.IPv4Interface, ipaddress.IPv6Interface)
+                ):
+                    subnet = ipaddress.ip_network((int(ip_value.ip), ip_value.max_prefixlen))
+                elif not pool_allocator.is_address and isinstance(
+                    ip_value, (ipaddress.IPv4Network, ipaddress.IPv6Network)
+                ):
+                    subnet = ip_value
+            # the resource itself is not one of its subnets, unless for a single address
+            if subnet is not None and (
+                not allocator.contains(subnet=subnet)
+                or (not pool_allocator.is_address and subnet.prefixlen <= allocator.network.prefixlen)
+            ):
+                subnet = None
+
+            current_subnet = allocator.get_reserved(identifier=node_id)
+            if current_subnet and current_subnet != subnet:
+                del self._allocators[key]
+                continue
+            if subnet is not None:
+                allocator.reserve(subnet=subnet, identifier=node_id)
+
+    def invalidate(self, pool_id: Optional[str] = None) -> None:
+        """Discard the free space of the resources of a pool, or of all the pools if no pool is provided."""
+        for key in list(self._allocators):
+            if pool_id is None or key[0] == pool_id:
+                del self._allocators[key]
+
+
+@dataclass
+class NumberPoolAllocator:
+    allocator: NumberAllocator
+    loaded_at: float
+    synced_at: str
+    allocated_at: dict[int, str] = field(default_factory=dict)
+
+    def allocate(self, count: int = 1) -> list[int]:
+        """Allocate up to count numbers and remember when they were allocated by this worker."""
+        numbers = self.allocator.allocate(count=count)
+        allocated_at = Timestamp().to_string()
+        for number in numbers:
+            self.allocated_at[number] = allocated_at
+        return numbers
+
+    def release(self, number: int) -> bool:
+        self.allocated_at.pop(number, None)
+        return self.allocator.release(number=number)
+
+    def update(self, used: set[int], released: set[int], since: str, synced_at: str) -> None:
+        """Apply the changes made in the database since the last synchronization.
+
+        A number allocated by this worker within the synchronized period might not be reserved in the database yet,
+        it is then reported as released by the change that freed it before it was allocated, so it is kept as used.
+        """
+        self.allocated_at = {number: at for number, at in self.allocated_at.items() if at >= since}
+        for number in used:
+            self.allocator.reserve(number=number)
+        for number in released - self.allocated_at.keys():
+            self.allocator.release(number=number)
+        self.synced_at = synced_at
+
+
+class NumberAllocatorRegistry:
+    """Cache of the numbers used by the number pools on this worker.
+
+    The used numbers of a pool are loaded once, then before each allocation only the numbers whose reservation or
+    value changed since the last synchronization are fetched from the database. The synchronization looks sync_margin
+    seconds further back to account for clock drift between workers and for transactions committed late, and the
+    numbers are reloaded entirely once they are older than max_age seconds.
+    """
+
+    def __init__(self, max_age: int = 300, sync_margin: int = 60) -> None:
+        self.max_age = max_age
+        self.sync_margin = sync_margin
+        self._allocators: dict[tuple[str, ...], NumberPoolAllocator] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def get_lock(self, pool_id: str) -> asyncio.Lock:
+        """Return the lock to hold while allocating from a pool so that concurrent requests get different numbers."""
+        return self._locks.setdefault(pool_id, asyncio.Lock())
+
+    async def get_allocator(
+        self,
+        key: tuple[str, ...],
+        loader: Callable[[Timestamp], Awaitable[NumberAllocator]],
+        syncer: Callable[[str, Timestamp], Awaitable[tuple[set[int], set[int]]]],
+    ) -> NumberPoolAllocator:
+        at = Timestamp()
+        synced_at = at.add_delta(seconds=-self.sync_margin).to_string()
+        pool_allocator = self._allocators.get(key)
+        if pool_allocator and time.monotonic() - pool_allocator.loaded_at <= self.max_age:
+            used, released = await syncer(pool_allocator.synced_at, at)
+            pool_allocator.update(used=used, released=released, since=pool_allocator.synced_at, synced_at=synced_at)
+            return pool_allocator
+
+        allocator = await loader(at)
+        self._allocators[key] = NumberPoolAllocator(
+            allocator=allocator, loaded_at=time.monotonic(), synced_at=synced_at
+        )
+        return self._allocators[key]
+
+    def invalidate(self, pool_id: Optional[str] = None) -> None:
+        """Discard the used numbers of a pool, or of all the pools if no pool is provided."""
+        for key in list(self._allocators):
+            if pool_id is None or key[0] == pool_id:
+                del self._allocators[key]
+
+
+pool_allocators = PoolAllocatorRegistry()
+number_allocators = NumberAllocatorRegistry()
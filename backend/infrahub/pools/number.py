@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
 from infrahub.core.query.resource_manager import NumberPoolGetAllocated
 from infrahub.core.registry import registry
@@ -65,3 +66,136 @@ class NumberUtilizationGetter:
     @property
     def total_pool_size(self) -> int:
         return self.end_range - self.start_range + 1
+
+
+class NumberAllocator:
+    """Keep track of the numbers used within a range as a sorted list of disjoint intervals.
+
+    Consecutive numbers are merged into a single interval so a pool allocated sequentially only holds a handful of
+    intervals, the next free number is found in constant time and checking or reserving a number is a binary search.
+    """
+
+    def __init__(self, start: int, end: int) -> None:
+        if start > end:
+            raise ValueError(f"The start of the range ({start}) must be lower than or equal to its end ({end})")
+        self.start = start
+        self.end = end
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self.num_used = 0
+
+    @classmethod
+    def from_used(cls, start: int, end: int, numbers: Iterable[int]) -> NumberAllocator:
+        """Build the allocator of a range from the numbers already in use, the numbers outside of the range are ignored."""
+        allocator = cls(start=start, end=end)
+        for number in sorted(set(numbers)):
+            if number < start or number > end:
+                continue
+            if allocator._ends and allocator._ends[-1] == number - 1:
+                allocator._ends[-1] = number
+            else:
+                allocator._starts.append(number)
+                allocator._ends.append(number)
+            allocator.num_used += 1
+        return allocator
+
+    @property
+    def num_free(self) -> int:
+        return self.end - self.start + 1 - self.num_used
+
+    @property
+    def intervals(self) -> list[tuple[int, int]]:
+        return list(zip(self._starts, self._ends))
+
+    def _find(self, number: int) -> int:
+        """Return the index of the last interval starting at or before the number, -1 if there is none."""
+        return bisect_right(self._starts, number) - 1
+
+    def is_used(self, number: int) -> bool:
+        idx = self._find(number)
+        return idx >= 0 and self._ends[idx] >= number
+
+    def reserve(self, number: int) -> bool:
+        """Mark a number as used, return False if it was already used."""
+        if number < self.start or number > self.end:
+            raise ValueError(f"{number} is not within the range {self.start}-{self.end}")
+
+        idx = self._find(number)
+        if idx >= 0 and self._ends[idx] >= number:
+            return False
+
+        merge_previous = idx >= 0 and self._ends[idx] == number - 1
+        merge_next = idx + 1 < len(self._starts) and self._starts[idx + 1] == number + 1
+        if merge_previous and merge_next:
+            self._ends[idx] = self._ends[idx + 1]
+            del self._starts[idx + 1]
+            del self._ends[idx + 1]
+        elif merge_previous:
+            self._ends[idx] = number
+        elif merge_next:
+            self._starts[idx + 1] = number
+        else:
+            self._starts.insert(idx + 1, number)
+            self._ends.insert(idx + 1, number)
+
+        self.num_used += 1
+        return True
+
+    def release(self, number: int) -> bool:
+        """Mark a number as free, return False if it was not used."""
+        idx = self._find(number)
+        if idx < 0 or self._ends[idx] < number:
+            return False
+
+        start, end = self._starts[idx], self._ends[idx]
+        if start == end:
+            del self._starts[idx]
+            del self._ends[idx]
+        elif number == start:
+            self._starts[idx] = number + 1
+        elif number == end:
+            self._ends[idx] = number - 1
+        else:
+            self._ends[idx] = number - 1
+            self._starts.insert(idx + 1, number + 1)
+            self._ends.insert(idx + 1, end)
+
+        self.num_used -= 1
+        return True
+
+    def get_next_free(self) -> Optional[int]:
+        """Return the lowest free number without reserving it."""
+        if not self._starts or self._starts[0] > self.start:
+            return self.start
+        next_free = self._ends[0] + 1
+        return next_free if next_free <= self.end else None
+
+    def allocate(self, count: int = 1) -> list[int]:
+        """Reserve and return the count lowest free numbers, fewer numbers are returned if the range is exhausted."""
+        numbers: list[int] = []
+        previous_end = self.start - 1
+        idx = 0
+        while len(numbers) < count and previous_end < self.end:
+            gap_start = self._starts[idx] if idx < len(self._starts) else self.end + 1
+            gap_end = min(gap_start - 1, previous_end + count - len(numbers))
+            numbers.extend(range(previous_end + 1, gap_end + 1))
+            previous_end = self._ends[idx] if idx < len(self._starts) else self.end
+            idx += 1
+
+        if not numbers:
+            return numbers
+
+        # Merge the numbers with the intervals they fill in a single pass and splice the result in place
+        stop = bisect_right(self._starts, numbers[-1] + 1)
+        starts: list[int] = []
+        ends: list[int] = []
+        for start, end in sorted([*zip(self._starts[:stop], self._ends[:stop]), *((nbr, nbr) for nbr in numbers)]):
+            if ends and ends[-1] >= start - 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        self._starts[:stop] = starts
+        self._ends[:stop] = ends
+        self.num_used += len(numbers)
+        return numbers
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import ipaddress
 from collections import OrderedDict, defaultdict
 from ipaddress import IPv4Network, IPv6Network
@@ -172,3 +173,162 @@ class PrefixPool:
         # except:
         #     log.warn("Unable to remove %s from list of available subnets" % str(subnet))
         #     return False
+
+
+class PrefixAllocator:
+    """Buddy allocator keeping track of the free space of a network.
+
+    The free space is stored as a list of free blocks per prefix length, along with a heap to find the lowest one.
+    Reserving, allocating and releasing a subnet is proportional to the number of prefix lengths of the network
+    rather than to the number of subnets already reserved, so the allocator can be kept around and updated instead
+    of being rebuilt for every allocation.
+    """
+
+    def __init__(self, network: Union[str, IPv4Network, IPv6Network]) -> None:
+        self.network = ipaddress.ip_network(network)
+        self.max_prefixlen = self.network.max_prefixlen
+        self._free: dict[int, set[int]] = defaultdict(set)
+        self._heaps: dict[int, list[int]] = defaultdict(list)
+        self._reserved: dict[tuple[int, int], Optional[str]] = {}
+        self._identifiers: dict[str, tuple[int, int]] = {}
+        self._add_free(network_int=int(self.network.network_address), prefixlen=self.network.prefixlen)
+
+    def _get_mask(self, prefixlen: int) -> int:
+        return ((1 << prefixlen) - 1) << (self.max_prefixlen - prefixlen)
+
+    def _get_block_size(self, prefixlen: int) -> int:
+        return 1 << (self.max_prefixlen - prefixlen)
+
+    def _add_free(self, network_int: int, prefixlen: int) -> None:
+        self._free[prefixlen].add(network_int)
+        heapq.heappush(self._heaps[prefixlen], network_int)
+
+    def _get_lowest_free(self, prefixlen: int) -> Optional[int]:
+        # blocks are only removed from the sets, the heaps are cleaned up lazily
+        heap, free = self._heaps[prefixlen], self._free[prefixlen]
+        while heap and heap[0] not in free:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _split(self, block_prefixlen: int, network_int: int, prefixlen: int) -> None:
+        """Split a free block down to network_int/prefixlen, the other half at each level becomes free."""
+        for split_prefixlen in range(block_prefixlen + 1, prefixlen + 1):
+            buddy = (network_int & self._get_mask(split_prefixlen)) ^ self._get_block_size(split_prefixlen)
+            self._add_free(network_int=buddy, prefixlen=split_prefixlen)
+
+    def _mark_reserved(self, network_int: int, prefixlen: int, identifier: Optional[str]) -> None:
+        self._reserved[network_int, prefixlen] = identifier
+        if identifier:
+            self._identifiers[identifier] = (network_int, prefixlen)
+
+    def contains(self, subnet: Union[str, IPv4Network, IPv6Network]) -> bool:
+        sub = subnet if isinstance(subnet, (IPv4Network, IPv6Network)) else ipaddress.ip_network(subnet)
+        return (
+            sub.version == self.network.version
+            and sub.prefixlen >= self.network.prefixlen
+            and int(sub.network_address) & self._get_mask(self.network.prefixlen) == int(self.network.network_address)
+        )
+
+    def _to_block(self, subnet: Union[str, IPv4Network, IPv6Network]) -> tuple[int, int]:
+        sub = subnet if isinstance(subnet, (IPv4Network, IPv6Network)) else ipaddress.ip_network(subnet)
+        if not self.contains(subnet=sub):
+            raise ValueError(f"{subnet} is not part of this network")
+        return int(sub.network_address), sub.prefixlen
+
+    def reserve(self, subnet: Union[str, IPv4Network, IPv6Network], identifier: Optional[str] = None) -> bool:
+        """Indicate that a subnet is used, return False if it was already covered by a reserved subnet."""
+        network_int, prefixlen = self._to_block(subnet)
+
+        if (network_int, prefixlen) in self._reserved:
+            if identifier:
+                self._mark_reserved(network_int=network_int, prefixlen=prefixlen, identifier=identifier)
+            return False
+
+        for block_prefixlen in range(prefixlen, self.network.prefixlen - 1, -1):
+            block = network_int & self._get_mask(block_prefixlen)
+            if block in self._free[block_prefixlen]:
+                self._free[block_prefixlen].discard(block)
+                self._split(block_prefixlen=block_prefixlen, network_int=network_int, prefixlen=prefixlen)
+                self._mark_reserved(network_int=network_int, prefixlen=prefixlen, identifier=identifier)
+                return True
+            if block_prefixlen < prefixlen and (block, block_prefixlen) in self._reserved:
+                return False
+
+        # The subnet contains smaller reserved subnets, this requires to look at all the free blocks within it
+        # but it should be rare as the subnets are usually reserved from the least specific to the most specific
+        mask = self._get_mask(prefixlen)
+        for block_prefixlen in range(prefixlen + 1, self.max_prefixlen + 1):
+            self._free[block_prefixlen] = {
+                block for block in self._free[block_prefixlen] if block & mask != network_int
+            }
+        for block, block_prefixlen in [key for key in self._reserved if key[0] & mask == network_int]:
+            if block_identifier := self._reserved.pop((block, block_prefixlen)):
+                del self._identifiers[block_identifier]
+        self._mark_reserved(network_int=network_int, prefixlen=prefixlen, identifier=identifier)
+        return True
+
+    def release(self, subnet: Union[str, IPv4Network, IPv6Network]) -> bool:
+        """Return a reserved subnet to the free space, merging it with its free buddies."""
+        network_int, prefixlen = self._to_block(subnet)
+        if (network_int, prefixlen) not in self._reserved:
+            return False
+        if identifier := self._reserved.pop((network_int, prefixlen)):
+            del self._identifiers[identifier]
+
+        while prefixlen > self.network.prefixlen:
+            buddy = network_int ^ self._get_block_size(prefixlen)
+            if buddy not in self._free[prefixlen]:
+                break
+            self._free[prefixlen].discard(buddy)
+            prefixlen -= 1
+            network_int &= self._get_mask(prefixlen)
+        self._add_free(network_int=network_int, prefixlen=prefixlen)
+        return True
+
+    def allocate(
+        self, prefixlen: int, count: int = 1, lowest_first: bool = False
+    ) -> list[Union[IPv4Network, IPv6Network]]:
+        """Allocate up to count subnets of a given prefix length and return them.
+
+        By default the smallest free block able to contain the subnet is used to limit the fragmentation of the
+        free space, with lowest_first the subnets are allocated from the lowest free block instead.
+        """
+        allocated: list[Union[IPv4Network, IPv6Network]] = []
+        if not self.network.prefixlen <= prefixlen <= self.max_prefixlen:
+            return allocated
+
+        while len(allocated) < count:
+            candidates = []
+            for block_prefixlen in range(prefixlen, self.network.prefixlen - 1, -1):
+                block = self._get_lowest_free(prefixlen=block_prefixlen)
+                if block is None:
+                    continue
+                candidates.append((block, block_prefixlen))
+                if not lowest_first:
+                    break
+            if not candidates:
+                break
+            block, block_prefixlen = min(candidates)
+            self._free[block_prefixlen].discard(block)
+            self._split(block_prefixlen=block_prefixlen, network_int=block, prefixlen=prefixlen)
+            self._mark_reserved(network_int=block, prefixlen=prefixlen, identifier=None)
+            allocated.append(ipaddress.ip_network((block, prefixlen)))
+
+        return allocated
+
+    def get_reserved(self, identifier: str) -> Optional[Union[IPv4Network, IPv6Network]]:
+        """Return the subnet reserved with an identifier, if any."""
+        if identifier not in self._identifiers:
+            return None
+        return ipaddress.ip_network(self._identifiers[identifier])
+
+    def get_free_subnets(self) -> list[Union[IPv4Network, IPv6Network]]:
+        """Return all the free blocks, sorted by address."""
+        return sorted(
+            (ipaddress.ip_network((block, prefixlen)) for prefixlen, blocks in self._free.items() for block in blocks),
+            key=lambda subnet: int(subnet.network_address),
+        )
+
+    @property
+    def num_free_addresses(self) -> int:
+        return sum(len(blocks) * self._get_block_size(prefixlen) for prefixlen, blocks in self._free.items())
@@ -22,6 +22,7 @@ from starlette_exporter import PrometheusMiddleware, handle_metrics
 from infrahub import __version__, config
 from infrahub.api import router as api
 from infrahub.api.exception_handlers import generic_api_exception_handler
+from infrahub.auth_cache import auth_cache
 from infrahub.components import ComponentType
 from infrahub.core.graph.index import node_indexes, rel_indexes
 from infrahub.core.initialization import initialization
@@ -89,6 +90,8 @@ async def app_initialization(application: FastAPI) -> None:
     async with application.state.db.start_session() as db:
         await initialization(db=db)
     services.prepare(service=service)
+    if config.SETTINGS.security.token_cache_shared:
+        auth_cache.shared_cache = service.cache
     application.state.service = service
     application.state.response_delay = config.SETTINGS.miscellaneous.response_delay
 
@@ -1,4 +1,4 @@
-from typing import Awaitable, Callable, Optional
+from typing import Awaitable, Callable, Optional, Sequence
 
 from infrahub_sdk import InfrahubClient
 from infrahub_sdk.task_report import TaskReport
@@ -122,6 +122,12 @@ class InfrahubServices:
             raise ValueError("Unable to determine routing key")
         await self.message_bus.publish(message, routing_key=routing_key, delay=delay, is_retry=is_retry)
 
+    async def send_many(self, messages: Sequence[InfrahubMessage]) -> None:
+        routing_keys = [ROUTING_KEY_MAP.get(type(message)) for message in messages]
+        if not all(routing_keys):
+            raise ValueError("Unable to determine routing key")
+        await self.message_bus.publish_many(list(zip(messages, routing_keys)))  # type: ignore[arg-type]
+
     async def reply(self, message: InfrahubResponse, initiator: InfrahubMessage) -> None:
         if initiator.meta:
             message.meta.correlation_id = initiator.meta.correlation_id
@@ -26,6 +26,8 @@ class NATSCache(InfrahubCache):
             self._tokenize_key_name("workers:schema_hash:branch:"): KVTTL.TWO_HOURS,
             self._tokenize_key_name("workers:active:"): KVTTL.FIFTEEN,
             self._tokenize_key_name("workers:worker:"): KVTTL.TWO_HOURS,
+            self._tokenize_key_name("locks:"): KVTTL.FIFTEEN,
+            self._tokenize_key_name("security:"): KVTTL.TEN,
         }
 
     async def initialize(self, service: InfrahubServices) -> None:
@@ -60,7 +62,8 @@ class NATSCache(InfrahubCache):
         return key.replace(":", ".")
 
     # FIXME: remove once NATS supports TTL for keys (2.11)
-    def _get_kv(self, key: str) -> nats.js.kv.KeyValue:
+    def get_kv(self, key: str) -> nats.js.kv.KeyValue:
+        """Return the KV bucket used to store a given key, the key must already be tokenized."""
         for bucket, ttl in self.kv_buckets.items():
             if key.startswith(bucket):
                 return self.kv[ttl.value]
@@ -68,12 +71,12 @@ class NATSCache(InfrahubCache):
 
     async def delete(self, key: str) -> None:
         key = self._tokenize_key_name(key)
-        await self._get_kv(key).delete(key)
+        await self.get_kv(key).delete(key)
 
     async def get(self, key: str) -> Optional[str]:
         key = self._tokenize_key_name(key)
         try:
-            entry = await self._get_kv(key).get(key=key)
+            entry = await self.get_kv(key).get(key=key)
             if entry.value:
                 return entry.value.decode()
         except nats.js.errors.KeyNotFoundError:
@@ -115,6 +118,8 @@ class NATSCache(InfrahubCache):
             )
         elif filter_pattern.startswith("validator_execution_id."):
             keys = await self._keys(self.kv[KVTTL.TWO_HOURS.value], filter_pattern)
+        elif filter_pattern.startswith("security."):
+            keys = await self._keys(self.kv[KVTTL.TEN.value], filter_pattern)
         else:
             keys = await self._keys(self.kv[0], filter_pattern)
 
@@ -126,9 +131,9 @@ class NATSCache(InfrahubCache):
         key = self._tokenize_key_name(key)
         if not_exists:
             try:
-                await self._get_kv(key).create(key=key, value=value.encode())
+                await self.get_kv(key).create(key=key, value=value.encode())
                 return True
             except nats.js.errors.KeyWrongLastSequenceError:
                 return False
-        await self._get_kv(key).put(key=key, value=value.encode())
+        await self.get_kv(key).put(key=key, value=value.encode())
         return True
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from prefect.events import emit_event
 
@@ -33,6 +33,12 @@ class InfrahubEventService:
         tasks = [self._send_bus(event=event), self._send_prefect(event=event)]
         await asyncio.gather(*tasks)
 
+    async def send_many(self, events: Sequence[InfrahubEvent]) -> None:
+        """Send multiple events, the messages of all the events are published to the bus as a single batch."""
+        await self.service.send_many(messages=[message for event in events for message in event.get_messages()])
+        for event in events:
+            await self._send_prefect(event=event)
+
     async def _send_bus(self, event: InfrahubEvent) -> None:
         for message in event.get_messages():
             await self.service.send(message=message)
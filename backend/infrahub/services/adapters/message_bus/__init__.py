@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, TypeVar
+from typing import TYPE_CHECKING, Optional, Sequence, TypeVar
 
 ResponseClass = TypeVar("ResponseClass")
 
@@ -38,6 +38,15 @@ class InfrahubMessageBus:
     ) -> None:
         raise NotImplementedError()
 
+    async def publish_many(self, messages: Sequence[tuple[InfrahubMessage, str]]) -> None:
+        """Publish a batch of messages along with their routing keys.
+
+        Adapters able to pipeline the messages to the broker should override this method, by default the messages
+        are published one after the other.
+        """
+        for message, routing_key in messages:
+            await self.publish(message, routing_key=routing_key)
+
     async def reply(self, message: InfrahubMessage, routing_key: str) -> None:
         raise NotImplementedError()
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import TYPE_CHECKING, Optional, TypeVar
+from typing import TYPE_CHECKING, Optional, Sequence, TypeVar
 
 import ujson
 from infrahub_sdk.uuidt import UUIDT
@@ -37,6 +37,13 @@ class BusSimulator(InfrahubMessageBus):
         self.messages_per_routing_key[routing_key].append(message)
         await execute_message(routing_key=routing_key, message_body=message.body, service=self.service)
 
+    async def publish_many(self, messages: Sequence[tuple[InfrahubMessage, str]]) -> None:
+        for message, routing_key in messages:
+            self.messages.append(message)
+            self.messages_per_routing_key.setdefault(routing_key, []).append(message)
+        for message, routing_key in messages:
+            await execute_message(routing_key=routing_key, message_body=message.body, service=self.service)
+
     async def reply(self, message: InfrahubMessage, routing_key: str) -> None:
         correlation_id = message.meta.correlation_id or "default"
         self.replies[correlation_id].append(message)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import ssl
-from typing import TYPE_CHECKING, Awaitable, Callable, MutableMapping, Optional, TypeVar
+from typing import TYPE_CHECKING, Awaitable, Callable, MutableMapping, Optional, Sequence, TypeVar
 
 import nats
 import ujson
@@ -32,6 +32,26 @@ async def _add_request_id(message: InfrahubMessage) -> None:
     message.meta.request_id = log_data.get("request_id", "")
 
 
+def _get_headers(message: InfrahubMessage) -> dict[str, str]:
+    headers = {}
+    if message.meta.correlation_id:
+        headers["correlation_id"] = message.meta.correlation_id
+    if message.meta.reply_to:
+        headers["reply_to"] = message.meta.reply_to
+    if message.meta.expiration:
+        headers["expiration"] = str(message.meta.expiration)
+    if message.meta.headers:
+        # Filter None and non-string values
+        for k, v in message.meta.headers.items():
+            if v:
+                headers[k] = str(v)
+
+    if is_instrumentation_enabled():
+        propagate.inject(headers)
+
+    return headers
+
+
 class NATSMessageBus(InfrahubMessageBus):
     def __init__(self, settings: Optional[BrokerSettings] = None) -> None:
         self.settings = settings or config.SETTINGS.broker
@@ -220,54 +240,38 @@ class NATSMessageBus(InfrahubMessageBus):
                 asyncio.create_task(self._publish_with_delay(message, routing_key, delay))
                 return
 
-            for enricher in self.message_enrichers:
-                await enricher(message)
-            message.assign_priority(priority=messages.message_priority(routing_key=routing_key))
-
-            headers = {}
-            if message.meta.correlation_id:
-                headers["correlation_id"] = message.meta.correlation_id
-            if message.meta.reply_to:
-                headers["reply_to"] = message.meta.reply_to
-            if message.meta.expiration:
-                headers["expiration"] = str(message.meta.expiration)
-
-            if message.meta.headers:
-                # Filter None and non-string values
-                for k, v in message.meta.headers.items():
-                    if v:
-                        headers[k] = str(v)
-
-            if is_instrumentation_enabled():
-                propagate.inject(headers)
-
-            await self.jetstream.publish(
-                subject=routing_key,
-                payload=message.body,
-                headers=headers,  # None value throws exception
-            )
+            await self._publish(message=message, routing_key=routing_key)
 
-    async def reply(self, message: InfrahubMessage, routing_key: str) -> None:
-        headers = {}
-        if message.meta.correlation_id:
-            headers["correlation_id"] = message.meta.correlation_id
-        if message.meta.reply_to:
-            headers["reply_to"] = message.meta.reply_to
-        if message.meta.expiration:
-            headers["expiration"] = str(message.meta.expiration)
-        if message.meta.headers:
-            # Filter None and non-string values
-            for k, v in message.meta.headers.items():
-                if v:
-                    headers[k] = str(v)
-
-        if is_instrumentation_enabled():
-            propagate.inject(headers)
+    async def publish_many(self, messages: Sequence[tuple[InfrahubMessage, str]]) -> None:
+        with trace.get_tracer(__name__).start_as_current_span("publish_messages") as span:
+            span.set_attribute("count", len(messages))
+
+            # The acks of JetStream are awaited together instead of waiting for each of them before the next publish
+            batch_size = self.settings.maximum_concurrent_publishes
+            for offset in range(0, len(messages), batch_size):
+                await asyncio.gather(
+                    *[
+                        self._publish(message=message, routing_key=routing_key)
+                        for message, routing_key in messages[offset : offset + batch_size]
+                    ]
+                )
 
+    async def _publish(self, message: InfrahubMessage, routing_key: str) -> None:
+        for enricher in self.message_enrichers:
+            await enricher(message)
+        message.assign_priority(priority=messages.message_priority(routing_key=routing_key))
+
+        await self.jetstream.publish(
+            subject=routing_key,
+            payload=message.body,
+            headers=_get_headers(message=message),  # None value throws exception
+        )
+
+    async def reply(self, message: InfrahubMessage, routing_key: str) -> None:
         await self.jetstream.publish(
             subject=routing_key,
             payload=message.body,
-            headers=headers,
+            headers=_get_headers(message=message),
         )
 
     async def rpc(self, message: InfrahubMessage, response_class: type[ResponseClass]) -> ResponseClass:
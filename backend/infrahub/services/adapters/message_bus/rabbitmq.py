@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Awaitable, Callable, MutableMapping, Optional, TypeVar
+from typing import TYPE_CHECKING, Awaitable, Callable, MutableMapping, Optional, Sequence, TypeVar
 
 import aio_pika
 import opentelemetry.instrumentation.aio_pika.span_builder
@@ -199,15 +199,32 @@ class RabbitMQMessageBus(InfrahubMessageBus):
     async def publish(
         self, message: InfrahubMessage, routing_key: str, delay: Optional[MessageTTL] = None, is_retry: bool = False
     ) -> None:
-        for enricher in self.message_enrichers:
-            await enricher(message)
-        message.assign_priority(priority=messages.message_priority(routing_key=routing_key))
+        await self._prepare_message(message=message, routing_key=routing_key)
         if delay:
             message.assign_header(key="delay", value=delay.value)
             await self.delayed_exchange.publish(self.format_message(message=message), routing_key=routing_key)
         else:
             await self.exchange.publish(self.format_message(message=message), routing_key=routing_key)
 
+    async def publish_many(self, messages: Sequence[tuple[InfrahubMessage, str]]) -> None:
+        # The publisher confirms are awaited together instead of waiting for each of them before the next publish
+        batch_size = self.settings.maximum_concurrent_publishes
+        for offset in range(0, len(messages), batch_size):
+            batch = messages[offset : offset + batch_size]
+            for message, routing_key in batch:
+                await self._prepare_message(message=message, routing_key=routing_key)
+            await asyncio.gather(
+                *[
+                    self.exchange.publish(self.format_message(message=message), routing_key=routing_key)
+                    for message, routing_key in batch
+                ]
+            )
+
+    async def _prepare_message(self, message: InfrahubMessage, routing_key: str) -> None:
+        for enricher in self.message_enrichers:
+            await enricher(message)
+        message.assign_priority(priority=messages.message_priority(routing_key=routing_key))
+
     async def reply(self, message: InfrahubMessage, routing_key: str) -> None:
         await self.channel.default_exchange.publish(self.format_message(message=message), routing_key=routing_key)
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
-from jinja2 import TemplateSyntaxError, meta, nodes
+from jinja2 import Template, TemplateSyntaxError, meta, nodes
 from jinja2.sandbox import SandboxedEnvironment
 
 ALLOWED_FILTERS = ["lower", "upper"]
@@ -15,6 +16,7 @@ class MacroDefinition:
         self._filters: list[str] = []
         self._variables: list[str] = []
         self.template = self._parse_template()
+        self._compiled: Template | None = None
 
     def _parse_template(self) -> nodes.Template:
         try:
@@ -36,8 +38,9 @@ class MacroDefinition:
         return template
 
     def render(self, variables: dict[str, Any]) -> str:
-        template = self.env.from_string(self.macro)
-        return template.render(variables)
+        if self._compiled is None:
+            self._compiled = self.env.from_string(self.macro)
+        return self._compiled.render(variables)
 
     @property
     def filters(self) -> list[str]:
@@ -46,3 +49,9 @@ class MacroDefinition:
     @property
     def variables(self) -> list[str]:
         return self._variables
+
+
+@lru_cache(maxsize=256)
+def get_macro_definition(macro: str) -> MacroDefinition:
+    """Return the definition of a macro, each macro is only parsed and compiled once."""
+    return MacroDefinition(macro=macro)
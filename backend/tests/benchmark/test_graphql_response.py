@@ -0,0 +1,37 @@
+import pytest
+from starlette.responses import JSONResponse
+
+from infrahub.graphql.response import GraphQLJSONResponse
+
+NBR_NODES = 50_000
+
+
+@pytest.fixture(scope="module")
+def graphql_response() -> dict:
+    return {
+        "data": {
+            "TestCar": {
+                "count": NBR_NODES,
+                "edges": [
+                    {
+                        "node": {
+                            "id": f"17a8f438-2ad4-4cb7-a4e0-{idx:012d}",
+                            "display_label": f"car-{idx}",
+                            "name": {"value": f"car-{idx}", "is_protected": False, "is_visible": True},
+                            "nbr_seats": {"value": idx % 8},
+                            "owner": {"node": {"id": f"0ad8c2dd-7e3a-4cb0-b1fb-{idx % 100:012d}"}},
+                        }
+                    }
+                    for idx in range(NBR_NODES)
+                ],
+            }
+        }
+    }
+
+
+def test_graphql_response_json(benchmark, graphql_response):
+    benchmark(JSONResponse, graphql_response)
+
+
+def test_graphql_response_ujson(benchmark, graphql_response):
+    benchmark(GraphQLJSONResponse, graphql_response)
@@ -0,0 +1,53 @@
+from infrahub.core.node.constraints.grouped_uniqueness import NodeGroupedUniquenessConstraint
+from infrahub.core.query import QueryResult
+from infrahub.core.schema import AttributeSchema, RelationshipSchema, SchemaAttributePathValue
+
+NBR_NODES = 50_000
+NBR_OWNERS = 100
+RETURN_LABELS = ["node_id", "deepest_branch_name", "node_count", "attr_name", "attr_value", "relationship_identifier"]
+
+NAME_SCHEMA = AttributeSchema(name="name", kind="Text")
+OWNER_SCHEMA = RelationshipSchema(name="owner", peer="TestPerson", identifier="testcar__testperson")
+
+
+def generate_path_values() -> dict[str, list[SchemaAttributePathValue]]:
+    return {
+        f"new-{idx}": [
+            SchemaAttributePathValue(attribute_schema=NAME_SCHEMA, attribute_property_name="value", value=f"car{idx}"),
+            SchemaAttributePathValue(
+                relationship_schema=OWNER_SCHEMA, related_schema=None, value=f"person{idx % NBR_OWNERS}"
+            ),
+        ]
+        for idx in range(NBR_NODES)
+    }
+
+
+def generate_query_results() -> list[QueryResult]:
+    """Existing nodes that share the name of a node of the batch but are owned by another person."""
+    results = []
+    for idx in range(NBR_NODES):
+        results.append(
+            QueryResult(data=[f"existing-{idx}", "main", 1, "name", f"car{idx}", None], labels=RETURN_LABELS)
+        )
+        results.append(
+            QueryResult(
+                data=[f"existing-{idx}", "main", 1, "id", f"person{(idx + 1) % NBR_OWNERS}", "testcar__testperson"],
+                labels=RETURN_LABELS,
+            )
+        )
+    return results
+
+
+def test_grouped_uniqueness_check_batch(benchmark):
+    path_values_per_node = generate_path_values()
+    query_results = generate_query_results()
+
+    def check_batch() -> None:
+        NodeGroupedUniquenessConstraint._check_within_batch(path_values_per_node=path_values_per_node)
+        NodeGroupedUniquenessConstraint._check_results(
+            path_values_groups=path_values_per_node.values(),
+            query_results=query_results,
+            exclude_node_ids=set(path_values_per_node.keys()),
+        )
+
+    benchmark(check_batch)
@@ -0,0 +1,77 @@
+import ipaddress
+
+import pytest
+
+from infrahub.core.ipam.constants import PrefixMemberType
+from infrahub.core.ipam.tree import IpamTree
+
+NBR_ADDRESSES = 1_000_000
+ADDRESSES_PER_PREFIX = 250
+NBR_LOOKUPS = 10_000
+NBR_PREFIXES = NBR_ADDRESSES // ADDRESSES_PER_PREFIX
+
+
+def generate_members() -> tuple[list, list]:
+    """Generate 10.0.0.0/8 split in /16 and /24 prefixes with ADDRESSES_PER_PREFIX addresses in each /24."""
+    prefixes = [("net-8", ipaddress.ip_network("10.0.0.0/8"))]
+    prefixes.extend((f"net-16-{idx}", ipaddress.ip_network((0x0A000000 + (idx << 16), 16))) for idx in range(256))
+    addresses = []
+    for idx in range(NBR_PREFIXES):
+        network_int = 0x0A000000 + (idx << 8)
+        prefixes.append((f"net-24-{idx}", ipaddress.ip_network((network_int, 24))))
+        addresses.extend(
+            (f"addr-{idx}-{host}", ipaddress.ip_interface((network_int + host, 24)))
+            for host in range(1, ADDRESSES_PER_PREFIX + 1)
+        )
+    return prefixes, addresses
+
+
+@pytest.fixture(scope="module")
+def ipam_members() -> tuple[list, list]:
+    return generate_members()
+
+
+@pytest.fixture(scope="module")
+def ipam_tree(ipam_members) -> IpamTree:
+    prefixes, addresses = ipam_members
+    return IpamTree.build(prefixes=prefixes, addresses=addresses)
+
+
+def test_ipam_tree_build(benchmark, ipam_members):
+    prefixes, addresses = ipam_members
+    tree = benchmark.pedantic(IpamTree.build, kwargs={"prefixes": prefixes, "addresses": addresses}, rounds=3)
+    assert tree.num_addresses == NBR_ADDRESSES
+
+
+def test_ipam_tree_get_parent(benchmark, ipam_tree, ipam_members):
+    _, addresses = ipam_members
+    step = NBR_ADDRESSES // NBR_LOOKUPS
+    values = [address for _, address in addresses[::step]]
+
+    def get_parents() -> int:
+        return sum(1 for value in values if ipam_tree.get_parent_id(value))
+
+    assert benchmark(get_parents) == NBR_LOOKUPS
+
+
+def test_ipam_tree_get_children(benchmark, ipam_tree):
+    # the first /16 prefixes are filled with 256 /24 prefixes each
+    nbr_networks = NBR_PREFIXES // 256
+    networks = [ipaddress.ip_network((0x0A000000 + (idx << 16), 16)) for idx in range(nbr_networks)]
+
+    def get_children() -> int:
+        return sum(len(ipam_tree.get_child_prefixes(network)) for network in networks)
+
+    assert benchmark(get_children) == nbr_networks * 256
+
+
+def test_ipam_tree_get_utilization(benchmark, ipam_tree):
+    prefix_ids = [f"net-24-{idx}" for idx in range(NBR_PREFIXES)]
+
+    def get_utilization() -> int:
+        return sum(
+            ipam_tree.get_utilization(prefix_id=prefix_id, member_type=PrefixMemberType.ADDRESS)[0]
+            for prefix_id in prefix_ids
+        )
+
+    assert benchmark(get_utilization) == NBR_ADDRESSES
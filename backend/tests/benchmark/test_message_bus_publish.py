@@ -0,0 +1,43 @@
+import asyncio
+
+from infrahub.config import BrokerSettings
+from infrahub.message_bus import messages
+from infrahub.services.adapters.message_bus.nats import NATSMessageBus
+
+NBR_MESSAGES = 2_000
+ACK_LATENCY = 0.001
+
+
+class LatencyJetStream:
+    """Stand-in for the JetStream context that acknowledges every message after a fixed round trip."""
+
+    def __init__(self) -> None:
+        self.nbr_published = 0
+
+    async def publish(self, subject: str, payload: bytes, headers: dict) -> None:
+        await asyncio.sleep(ACK_LATENCY)
+        self.nbr_published += 1
+
+
+def generate_messages() -> list[tuple[messages.RefreshRegistryBranches, str]]:
+    return [(messages.RefreshRegistryBranches(), "refresh.registry.branches") for _ in range(NBR_MESSAGES)]
+
+
+async def _publish(batch: bool) -> int:
+    bus = NATSMessageBus(settings=BrokerSettings())
+    bus.jetstream = LatencyJetStream()  # type: ignore[assignment]
+    batch_messages = generate_messages()
+    if batch:
+        await bus.publish_many(batch_messages)
+    else:
+        for message, routing_key in batch_messages:
+            await bus.publish(message, routing_key=routing_key)
+    return bus.jetstream.nbr_published
+
+
+def test_nats_publish_one_by_one(benchmark):
+    assert benchmark.pedantic(lambda: asyncio.run(_publish(batch=False)), rounds=1) == NBR_MESSAGES
+
+
+def test_nats_publish_many(benchmark):
+    assert benchmark.pedantic(lambda: asyncio.run(_publish(batch=True)), rounds=3) == NBR_MESSAGES
@@ -0,0 +1,38 @@
+from itertools import count
+
+from infrahub.core.branch import Branch
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.database import InfrahubDatabase
+
+NBR_NODES = 200
+
+
+async def _init_persons(db: InfrahubDatabase, branch: Branch, prefix: str) -> list[Node]:
+    persons = []
+    for idx in range(NBR_NODES):
+        person = await Node.init(db=db, schema="TestPerson", branch=branch)
+        await person.new(db=db, name=f"{prefix}-{idx}", height=150 + idx % 50)
+        persons.append(person)
+    return persons
+
+
+async def test_create_nodes_one_by_one(aio_benchmark, db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    counter = count()
+
+    async def create_nodes() -> None:
+        persons = await _init_persons(db=db, branch=default_branch, prefix=f"single{next(counter)}")
+        for person in persons:
+            await person.save(db=db)
+
+    aio_benchmark(create_nodes)
+
+
+async def test_create_nodes_many(aio_benchmark, db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    counter = count()
+
+    async def create_nodes() -> None:
+        persons = await _init_persons(db=db, branch=default_branch, prefix=f"many{next(counter)}")
+        await NodeManager.create_many(db=db, nodes=persons)
+
+    aio_benchmark(create_nodes)
@@ -0,0 +1,38 @@
+from itertools import count
+
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.core.schema import NodeSchema
+from infrahub.database import InfrahubDatabase
+
+NBR_ATTRIBUTES = 40
+
+
+async def test_update_single_attribute_wide_schema(
+    aio_benchmark, db: InfrahubDatabase, default_branch: Branch, register_core_models_schema
+):
+    node_schema = NodeSchema(
+        name="Wide",
+        namespace="Test",
+        attributes=[
+            {"name": f"attr{idx:02d}", "kind": "Text", "optional": True, "default_value": f"value{idx}"}
+            for idx in range(NBR_ATTRIBUTES)
+        ],
+    )
+    registry.schema.set(name=node_schema.kind, schema=node_schema, branch=default_branch.name)
+    registry.schema.process_schema_branch(name=default_branch.name)
+
+    obj = await Node.init(db=db, schema="TestWide", branch=default_branch)
+    await obj.new(db=db)
+    await obj.save(db=db)
+    node = await NodeManager.get_one(db=db, id=obj.id, branch=default_branch)
+
+    counter = count()
+
+    async def update_single_attribute() -> None:
+        node.attr00.value = f"updated{next(counter)}"
+        await node.save(db=db)
+
+    aio_benchmark(update_single_attribute)
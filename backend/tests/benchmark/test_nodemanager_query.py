@@ -0,0 +1,56 @@
+import tracemalloc
+
+import pytest
+
+from infrahub.core import registry
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.core.schema.schema_branch import SchemaBranch
+from infrahub.database import InfrahubDatabase
+
+NBR_TAGS = 50
+
+
+@pytest.fixture
+async def tags(db: InfrahubDatabase, default_branch, register_core_models_schema) -> list[Node]:
+    tags = []
+    for idx in range(NBR_TAGS):
+        tag = await Node.init(db=db, schema="BuiltinTag", branch=default_branch)
+        await tag.new(db=db, name=f"tag{idx:02}")
+        await tag.save(db=db)
+        tags.append(tag)
+    return tags
+
+
+@pytest.fixture(params=["read_only", "duplicate"])
+def schema_mode(request, monkeypatch) -> str:
+    """Run the benchmark with the shared read-only schema objects and with the previous deep copy on every get."""
+    if request.param == "duplicate":
+        original_get = SchemaBranch.get
+
+        def get_duplicate(self: SchemaBranch, name: str, duplicate: bool = True):
+            return original_get(self, name=name, duplicate=True)
+
+        monkeypatch.setattr(SchemaBranch, "get", get_duplicate)
+    return request.param
+
+
+def test_nodemanager_query(
+    benchmark, aio_benchmark, event_loop, db: InfrahubDatabase, default_branch, tags, schema_mode
+):
+    schema = registry.schema.get(name="BuiltinTag", branch=default_branch, duplicate=False)
+
+    tracemalloc.start()
+    try:
+        nodes = event_loop.run_until_complete(NodeManager.query(db=db, schema=schema, branch=default_branch))
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(nodes) == NBR_TAGS
+
+    benchmark.extra_info["schema_mode"] = schema_mode
+    # Memory allocated by the query, reported along with the timings to compare both schema modes
+    benchmark.extra_info["peak_memory"] = peak
+    benchmark.extra_info["retained_memory"] = current
+
+    aio_benchmark(NodeManager.query, db=db, schema=schema, branch=default_branch)
@@ -0,0 +1,59 @@
+from typing import Optional
+
+from infrahub.pools.number import NumberAllocator
+
+START_RANGE = 0
+END_RANGE = 4_000_000
+NBR_USED = 1_000_000
+NBR_ALLOCATIONS = 1_000
+
+
+def find_next_free(start: int, end: int, taken: list[int]) -> Optional[int]:
+    """Scan the range for the first number that isn't used, as the number pools did before the allocator."""
+    used_set = set(taken)
+    for num in range(start, end + 1):
+        if num not in used_set:
+            return num
+    return None
+
+
+def generate_used() -> list[int]:
+    """Generate NBR_USED numbers, the first half allocated sequentially and the second half every other number."""
+    half = NBR_USED // 2
+    return list(range(half)) + list(range(half, half + NBR_USED, 2))
+
+
+def test_number_allocator_load(benchmark):
+    used = generate_used()
+    allocator = benchmark(NumberAllocator.from_used, start=START_RANGE, end=END_RANGE, numbers=used)
+    assert allocator.num_used == NBR_USED
+
+
+def test_number_allocator_allocate(benchmark):
+    used = generate_used()
+
+    def setup():
+        return (NumberAllocator.from_used(start=START_RANGE, end=END_RANGE, numbers=used),), {}
+
+    def allocate(allocator: NumberAllocator) -> int:
+        return sum(len(allocator.allocate()) for _ in range(NBR_ALLOCATIONS))
+
+    assert benchmark.pedantic(allocate, setup=setup, rounds=5) == NBR_ALLOCATIONS
+
+
+def test_number_allocator_allocate_many(benchmark):
+    used = generate_used()
+
+    def setup():
+        return (NumberAllocator.from_used(start=START_RANGE, end=END_RANGE, numbers=used),), {}
+
+    def allocate(allocator: NumberAllocator) -> int:
+        return len(allocator.allocate(count=NBR_ALLOCATIONS))
+
+    assert benchmark.pedantic(allocate, setup=setup, rounds=5) == NBR_ALLOCATIONS
+
+
+def test_find_next_free(benchmark):
+    """Find a single free number from the list of used numbers, as done for every allocation before the allocator."""
+    used = list(range(NBR_USED))
+    assert benchmark(find_next_free, start=START_RANGE, end=END_RANGE, taken=used) == NBR_USED
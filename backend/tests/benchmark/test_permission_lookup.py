@@ -0,0 +1,43 @@
+from infrahub.core.account import ObjectPermission
+from infrahub.core.constants import PermissionDecision
+from infrahub.permissions import LocalPermissionBackend
+from infrahub.permissions.cache import CompiledPermissions
+
+NBR_KINDS = 200
+ACTIONS = ["view", "create", "update", "delete"]
+
+
+def generate_permissions() -> list[ObjectPermission]:
+    permissions = [
+        ObjectPermission(namespace="*", name="*", action="view", decision=PermissionDecision.ALLOW_ALL.value)
+    ]
+    for idx in range(NBR_KINDS):
+        for action in ACTIONS[1:]:
+            permissions.append(
+                ObjectPermission(
+                    namespace="Infra", name=f"Kind{idx}", action=action, decision=PermissionDecision.ALLOW_DEFAULT.value
+                )
+            )
+    return permissions
+
+
+def check_all_kinds(report) -> None:
+    for idx in range(NBR_KINDS):
+        for action in ACTIONS:
+            report(namespace="Infra", name=f"Kind{idx}", action=action)
+
+
+def test_report_object_permission_scan(benchmark):
+    backend = LocalPermissionBackend()
+    permissions = generate_permissions()
+
+    def report(namespace: str, name: str, action: str) -> None:
+        backend.report_object_permission(permissions=permissions, namespace=namespace, name=name, action=action)
+
+    benchmark(check_all_kinds, report)
+
+
+def test_report_object_permission_compiled(benchmark):
+    compiled = CompiledPermissions(permissions={"global_permissions": [], "object_permissions": generate_permissions()})
+
+    benchmark(check_all_kinds, compiled.report_object_permission)
@@ -0,0 +1,52 @@
+import ipaddress
+
+from infrahub.pools.prefix import PrefixAllocator, PrefixPool
+
+NBR_RESERVED = 50_000
+NBR_ALLOCATIONS = 1_000
+
+
+def generate_reserved() -> list[str]:
+    """Generate NBR_RESERVED /29 subnets of 10.0.0.0/8, leaving every other /29 free."""
+    return [str(ipaddress.ip_network((0x0A000000 + idx * 16, 29))) for idx in range(NBR_RESERVED)]
+
+
+def test_prefix_allocator_load(benchmark):
+    reserved = generate_reserved()
+
+    def load() -> PrefixAllocator:
+        allocator = PrefixAllocator("10.0.0.0/8")
+        for subnet in reserved:
+            allocator.reserve(subnet=subnet)
+        return allocator
+
+    allocator = benchmark(load)
+    assert allocator.num_free_addresses == 2**24 - NBR_RESERVED * 8
+
+
+def test_prefix_allocator_allocate(benchmark):
+    reserved = generate_reserved()
+
+    def setup():
+        allocator = PrefixAllocator("10.0.0.0/8")
+        for subnet in reserved:
+            allocator.reserve(subnet=subnet)
+        return (allocator,), {}
+
+    def allocate(allocator: PrefixAllocator) -> int:
+        return len(allocator.allocate(prefixlen=29, count=NBR_ALLOCATIONS))
+
+    assert benchmark.pedantic(allocate, setup=setup, rounds=5) == NBR_ALLOCATIONS
+
+
+def test_prefix_pool_allocate(benchmark):
+    """Allocate a single subnet with a PrefixPool rebuilt from the reserved subnets, as done for every allocation."""
+    reserved = generate_reserved()[:5_000]
+
+    def allocate() -> ipaddress.IPv4Network:
+        pool = PrefixPool("10.0.0.0/8")
+        for subnet in reserved:
+            pool.reserve(subnet=subnet)
+        return pool.get(prefixlen=29)
+
+    assert benchmark.pedantic(allocate, rounds=3) == ipaddress.ip_network("10.0.0.8/29")
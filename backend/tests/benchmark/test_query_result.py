@@ -0,0 +1,57 @@
+from neo4j._codec.hydration.v1 import HydrationHandler
+
+from infrahub.core.query import Query, QueryResult, QueryType, cleanup_return_labels, get_label_index
+from infrahub.database import InfrahubDatabase
+
+NBR_NODES = 10_000
+NBR_ATTRIBUTES = 10
+LABELS = ["n", "a", "av", "r1", "r2", "isv", "isp", "rel_isv", "rel_isp"]
+
+
+class FakeNodeListGetAttributeQuery(Query):
+    name = "fake_node_list_get_attribute"
+    type = QueryType.READ
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:  # pylint: disable=unused-argument
+        self.return_labels = LABELS
+
+
+def generate_records() -> list[list]:
+    factory = HydrationHandler().new_hydration_scope()._graph_hydrator
+    rel_properties = {
+        "branch": "main",
+        "branch_level": 1,
+        "from": "2024-01-01T00:00:00Z",
+        "to": None,
+        "status": "active",
+    }
+
+    records = []
+    for node_idx in range(NBR_NODES):
+        node = factory.hydrate_node(node_idx, {"Node"}, {"uuid": f"node-{node_idx}"}, str(node_idx))
+        for attr_idx in range(NBR_ATTRIBUTES):
+            base_id = (node_idx * NBR_ATTRIBUTES + attr_idx) * 10
+            attr = factory.hydrate_node(base_id + 1, {"Attribute"}, {"name": f"attr{attr_idx}"}, str(base_id + 1))
+            value = factory.hydrate_node(base_id + 2, {"AttributeValue"}, {"value": attr_idx}, str(base_id + 2))
+            isv = factory.hydrate_node(base_id + 3, {"Boolean"}, {"value": True}, str(base_id + 3))
+            isp = factory.hydrate_node(base_id + 4, {"Boolean"}, {"value": False}, str(base_id + 4))
+            rels = [
+                factory.hydrate_relationship(base_id + 5 + idx, base_id, base_id + 1, "HAS", rel_properties)
+                for idx in range(4)
+            ]
+            records.append([node, attr, value, rels[0], rels[1], isv, isp, rels[2], rels[3]])
+    return records
+
+
+def test_query_result_group_by(benchmark):
+    records = generate_records()
+    query = FakeNodeListGetAttributeQuery()
+    query.return_labels = LABELS
+
+    def build_and_group() -> int:
+        labels = cleanup_return_labels(query.return_labels)
+        label_index = get_label_index(labels)
+        query.results = [QueryResult(data=record, labels=labels, label_index=label_index) for record in records]
+        return len(list(query.get_results_group_by(("n", "uuid"), ("a", "name"))))
+
+    assert benchmark(build_and_group) == NBR_NODES * NBR_ATTRIBUTES
@@ -0,0 +1,14 @@
+from infrahub.core import registry
+from infrahub.database import InfrahubDatabase
+
+
+def test_schemabranch_get_duplicate(benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+    node = benchmark(schema.get, name="CoreProposedChange", duplicate=True)
+    assert not node.is_read_only
+
+
+def test_schemabranch_get_read_only(benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+    node = benchmark(schema.get, name="CoreProposedChange", duplicate=False)
+    assert node.is_read_only
@@ -19,6 +19,7 @@ from testcontainers.core.container import DockerContainer
 from testcontainers.core.waiting_utils import wait_for_logs
 
 from infrahub import config
+from infrahub.auth_cache import auth_cache
 from infrahub.config import load_and_exit
 from infrahub.core import registry
 from infrahub.core.branch import Branch
@@ -39,6 +40,7 @@ from infrahub.database import InfrahubDatabase, get_db
 from infrahub.lock import initialize_lock
 from infrahub.message_bus import InfrahubMessage, InfrahubResponse
 from infrahub.message_bus.types import MessageTTL
+from infrahub.permissions.cache import permission_cache
 from infrahub.services import services
 from infrahub.services.adapters.message_bus import InfrahubMessageBus
 from tests.adapters.log import FakeLogger
@@ -118,6 +120,8 @@ async def empty_database(db: InfrahubDatabase) -> None:
 @pytest.fixture
 async def reset_registry(db: InfrahubDatabase) -> None:
     registry.delete_all()
+    permission_cache.invalidate()
+    auth_cache.discard_account()
 
 
 @pytest.fixture
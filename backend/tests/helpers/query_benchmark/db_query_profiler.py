@@ -2,7 +2,7 @@ import time
 from dataclasses import dataclass
 from pathlib import Path
 from types import TracebackType
-from typing import Any, List, Optional, Self, Type
+from typing import Any, AsyncIterator, List, Optional, Self, Type
 
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -36,6 +36,7 @@ class QueryMeasurement:
     start_time: float
     nb_elements_loaded: Optional[int] = None
     memory: Optional[float] = None
+    nb_records: Optional[int] = None
 
 
 class GraphProfileGenerator:
@@ -55,6 +56,10 @@ class GraphProfileGenerator:
 
         for query_name in query_names:
             self.create_duration_graph(df=df, query_name=query_name, label=label, output_dir=output_location)
+            if df[df["query_name"] == query_name]["nb_records"].notna().any():
+                self.create_duration_per_record_graph(
+                    df=df, query_name=query_name, label=label, output_dir=output_location
+                )
             # self.create_memory_graph(query_name=query_name, label=label, output_dir=output_location)
 
     def create_duration_graph(self, df: pd.DataFrame, query_name: str, label: str, output_dir: Path) -> None:
@@ -79,6 +84,28 @@ class GraphProfileGenerator:
         file_name = f"{name}.png"
         plt.savefig(str(output_dir / file_name), bbox_inches="tight")
 
+    def create_duration_per_record_graph(self, df: pd.DataFrame, query_name: str, label: str, output_dir: Path) -> None:
+        metric = "duration_per_record"
+
+        name = f"{query_name}_{metric}"
+        plt.figure(name)
+
+        df_query = df[(df["query_name"] == query_name) & (df["nb_records"] > 0)].sort_values(
+            by="start_time", ascending=True
+        )
+        x = df_query["nb_elements_loaded"].values
+        y = df_query["duration"].values * 1_000_000 / df_query["nb_records"].values
+        plt.plot(x, y, label=label)
+
+        plt.legend(bbox_to_anchor=(1.04, 1), borderaxespad=0)
+
+        plt.ylabel("usec / record", fontsize=15)
+        plt.title(f"Query - {query_name} | {metric}", fontsize=20)
+        plt.grid()
+
+        file_name = f"{name}.png"
+        plt.savefig(str(output_dir / file_name), bbox_inches="tight")
+
 
 class InfrahubDatabaseProfiler(InfrahubDatabase):
     profiling_enabled: bool
@@ -148,6 +175,36 @@ class InfrahubDatabaseProfiler(InfrahubDatabase):
 
         return response, metadata
 
+    async def execute_query_stream(
+        self,
+        query: str,
+        params: dict[str, Any] | None = None,
+        name: str = "undefined",
+        context: dict[str, str] | None = None,
+    ) -> AsyncIterator[Record]:
+        if not self.profiling_enabled:
+            async for record in super().execute_query_stream(query, params, name):
+                yield record
+            return
+
+        # Measure the time to consume the full stream, which includes the processing done by the caller
+        time_start = time.time()
+        nb_records = 0
+        async for record in super().execute_query_stream(query, params, name):
+            nb_records += 1
+            yield record
+        duration_time = time.time() - time_start
+
+        self.measurements.append(
+            QueryMeasurement(
+                duration=duration_time,
+                query_name=str(name),
+                start_time=time_start,
+                nb_elements_loaded=self.nb_elements_loaded,
+                nb_records=nb_records,
+            )
+        )
+
     def profile(self, profile_memory: bool) -> Self:
         """
         This method allows to enable profiling of a InfrahubDatabaseProfiler instance
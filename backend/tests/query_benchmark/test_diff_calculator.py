@@ -0,0 +1,71 @@
+import inspect
+from pathlib import Path
+
+import pytest
+
+from infrahub.core import registry
+from infrahub.core.diff.calculator import DiffCalculator
+from infrahub.core.initialization import create_branch
+from infrahub.core.timestamp import Timestamp
+from tests.helpers.constants import NEO4J_ENTERPRISE_IMAGE
+from tests.helpers.query_benchmark.benchmark_config import BenchmarkConfig
+from tests.helpers.query_benchmark.car_person_generators import (
+    CarWithDiffInSecondBranchGenerator,
+)
+from tests.helpers.query_benchmark.data_generator import load_data_and_profile
+from tests.query_benchmark.conftest import RESULTS_FOLDER
+from tests.query_benchmark.utils import start_db_and_create_default_branch
+
+
+@pytest.mark.timeout(36000)  # 10 hours
+@pytest.mark.parametrize(
+    "benchmark_config",
+    [
+        BenchmarkConfig(neo4j_image=NEO4J_ENTERPRISE_IMAGE, load_db_indexes=True),
+    ],
+)
+async def test_diff_calculator_memory(
+    benchmark_config, car_person_schema_root, graph_generator, increase_query_size_limit
+):
+    """Profile the memory used to calculate the diff of a branch with ~100k changed fields."""
+    db_profiling_queries, default_branch = await start_db_and_create_default_branch(
+        neo4j_image=benchmark_config.neo4j_image,
+        load_indexes=benchmark_config.load_db_indexes,
+    )
+    registry.schema.register_schema(schema=car_person_schema_root, branch=default_branch.name)
+    diff_branch = await create_branch(branch_name="diff_branch", db=db_profiling_queries)
+
+    async def calculate_diff():
+        diff_calculator = DiffCalculator(db=db_profiling_queries)
+        calculated_diffs = await diff_calculator.calculate_diff(
+            base_branch=default_branch,
+            diff_branch=diff_branch,
+            from_time=Timestamp(diff_branch.branched_from),
+            to_time=Timestamp(),
+        )
+        assert calculated_diffs.diff_branch_diff.nodes, "expected some diff"
+
+    # Each updated car changes its name, engine, owner and drivers
+    nb_cars = 50_000
+    cars_generator = CarWithDiffInSecondBranchGenerator(
+        db=db_profiling_queries,
+        nb_persons=int(nb_cars / 100),
+        diff_ratio=0.5,
+        main_branch=default_branch,
+        diff_branch=diff_branch,
+    )
+
+    test_name = inspect.currentframe().f_code.co_name
+    module_name = Path(__file__).stem
+    graph_output_location = RESULTS_FOLDER / module_name / test_name
+
+    await load_data_and_profile(
+        data_generator=cars_generator,
+        func_call=calculate_diff,
+        profile_frequency=5000,
+        nb_elements=nb_cars,
+        graphs_output_location=graph_output_location,
+        test_label=str(benchmark_config),
+        graph_generator=graph_generator,
+        memory_profiling_rate=1,
+    )
@@ -0,0 +1,64 @@
+import inspect
+from pathlib import Path
+
+import pytest
+
+from infrahub.core import registry
+from infrahub.core.query.node import NodeGetListQuery
+from infrahub.database.constants import Neo4jRuntime
+from infrahub.log import get_logger
+from tests.helpers.constants import NEO4J_ENTERPRISE_IMAGE
+from tests.helpers.query_benchmark.benchmark_config import BenchmarkConfig
+from tests.helpers.query_benchmark.car_person_generators import CarGenerator
+from tests.helpers.query_benchmark.data_generator import load_data_and_profile
+from tests.query_benchmark.conftest import RESULTS_FOLDER
+from tests.query_benchmark.utils import start_db_and_create_default_branch
+
+log = get_logger()
+
+# pytestmark = pytest.mark.skip("Not relevant to test this currently.")
+
+
+@pytest.mark.timeout(36000)  # 10 hours
+@pytest.mark.parametrize(
+    "benchmark_config",
+    [
+        BenchmarkConfig(neo4j_runtime=Neo4jRuntime.DEFAULT, neo4j_image=NEO4J_ENTERPRISE_IMAGE, load_db_indexes=True),
+    ],
+)
+async def test_node_get_list_without_limit(benchmark_config, car_person_schema_root, graph_generator):
+    """
+    Profile a READ query returning more records than `query_size_limit`, the cost per record
+    is expected to stay flat as the number of records grows since the query is executed only once.
+    """
+
+    # Initialization
+    db_profiling_queries, default_branch = await start_db_and_create_default_branch(
+        neo4j_image=benchmark_config.neo4j_image,
+        load_indexes=benchmark_config.load_db_indexes,
+    )
+    registry.schema.register_schema(schema=car_person_schema_root, branch=default_branch.name)
+    car_schema = registry.schema.get_node_schema(name="TestCar", branch=default_branch)
+
+    # Build function to profile
+    async def init_and_execute():
+        query = await NodeGetListQuery.init(db=db_profiling_queries, branch=default_branch, schema=car_schema)
+        await query.execute(db=db_profiling_queries)
+        assert len(query.results) == db_profiling_queries.nb_elements_loaded
+
+    nb_cars = 50_000
+    cars_generator = CarGenerator(db=db_profiling_queries)
+
+    test_name = inspect.currentframe().f_code.co_name
+    module_name = Path(__file__).stem
+    graph_output_location = RESULTS_FOLDER / module_name / test_name
+
+    await load_data_and_profile(
+        data_generator=cars_generator,
+        func_call=init_and_execute,
+        profile_frequency=5_000,
+        nb_elements=nb_cars,
+        graphs_output_location=graph_output_location,
+        test_label=str(benchmark_config),
+        graph_generator=graph_generator,
+    )
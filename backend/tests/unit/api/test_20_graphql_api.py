@@ -48,6 +48,59 @@ async def test_graphql_endpoint(
     assert len(result_per_name["Jane"]["node"]["cars"]["edges"]) == 1
 
 
+async def test_graphql_endpoint_batch(
+    db: InfrahubDatabase, client, admin_headers, default_branch: Branch, create_test_admin, car_person_data
+):
+    query_persons = """
+    query {
+        TestPerson {
+            count
+        }
+    }
+    """
+    query_cars = """
+    query {
+        TestCar {
+            count
+        }
+    }
+    """
+    mutation = """
+    mutation {
+        TestPersonCreate(data: {name: { value: "Bill"}, height: {value: 180}}) {
+            ok
+        }
+    }
+    """
+
+    # Must execute in a with block to execute the startup/shutdown events
+    with client:
+        response = client.post(
+            "/graphql",
+            json=[{"query": query_persons}, {"query": query_cars}, {"query": mutation}, {"query": query_persons}],
+            headers=admin_headers,
+        )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"data": {"TestPerson": {"count": 2}}},
+        {"data": {"TestCar": {"count": 3}}},
+        {"data": {"TestPersonCreate": {"ok": True}}},
+        {"data": {"TestPerson": {"count": 3}}},
+    ]
+
+
+async def test_graphql_endpoint_batch_invalid(
+    db: InfrahubDatabase, client, admin_headers, default_branch: Branch, create_test_admin, car_person_data
+):
+    with client:
+        response = client.post("/graphql", json=[], headers=admin_headers)
+        assert response.status_code == 400
+
+        response = client.post("/graphql", json=[{"variables": {}}], headers=admin_headers)
+        assert response.status_code == 400
+
+
 async def test_graphql_endpoint_with_timestamp(
     db: InfrahubDatabase, client, admin_headers, default_branch: Branch, create_test_admin, car_person_data
 ):
@@ -0,0 +1,93 @@
+import asyncio
+
+from graphql import parse
+
+from infrahub.computed_attribute.batch import ComputedAttributeBatcher
+from infrahub.computed_attribute.tasks import build_update_attributes_query
+from infrahub.support.macro import get_macro_definition
+
+
+class BatchProcessor:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.batches: list[list[str]] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, object_ids: list[str]) -> None:
+        self.batches.append(object_ids)
+        await self.release.wait()
+        if self.fail:
+            raise ValueError(f"failed to process {object_ids}")
+
+
+async def test_batcher_process_right_away():
+    batcher = ComputedAttributeBatcher()
+    processor = BatchProcessor()
+    processor.release.set()
+
+    await asyncio.wait_for(batcher.process(key=("main", "TestCar"), object_id="car1", processor=processor), timeout=1)
+    assert processor.batches == [["car1"]]
+
+
+async def test_batcher_coalesce_objects():
+    batcher = ComputedAttributeBatcher()
+    processor = BatchProcessor()
+
+    tasks = [
+        asyncio.create_task(batcher.process(key=("main", "TestCar"), object_id=object_id, processor=processor))
+        for object_id in ("car1", "car3", "car2", "car3")
+    ]
+    person_task = asyncio.create_task(
+        batcher.process(key=("main", "TestPerson"), object_id="person1", processor=processor)
+    )
+    await asyncio.sleep(0.01)
+    # The objects received while the first batch is running are processed together in the next batch
+    assert processor.batches == [["car1"], ["person1"]]
+
+    processor.release.set()
+    await asyncio.gather(*tasks, person_task)
+    assert processor.batches == [["car1"], ["person1"], ["car2", "car3"]]
+
+
+async def test_batcher_propagate_failure():
+    batcher = ComputedAttributeBatcher()
+    processor = BatchProcessor(fail=True)
+
+    tasks = [
+        asyncio.create_task(batcher.process(key=("main", "TestCar"), object_id=object_id, processor=processor))
+        for object_id in ("car1", "car2", "car3")
+    ]
+    await asyncio.sleep(0.01)
+    processor.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert processor.batches == [["car1"], ["car2", "car3"]]
+    assert [str(result) for result in results] == [
+        "failed to process ['car1']",
+        "failed to process ['car2', 'car3']",
+        "failed to process ['car2', 'car3']",
+    ]
+
+
+def test_build_update_attributes_query():
+    query, variables = build_update_attributes_query(
+        kind="TestCar", attribute="description", values={"car1": "red car", "car2": "blue car"}
+    )
+
+    document = parse(query)
+    assert len(document.definitions[0].selection_set.selections) == 2
+    assert variables == {
+        "kind": "TestCar",
+        "attribute": "description",
+        "id0": "car1",
+        "value0": "red car",
+        "id1": "car2",
+        "value1": "blue car",
+    }
+
+
+def test_get_macro_definition_cached():
+    macro = get_macro_definition(macro="{{ name__value | upper }}")
+    assert get_macro_definition(macro="{{ name__value | upper }}") is macro
+    assert macro.render(variables={"name__value": "car"}) == "CAR"
+    assert macro.render(variables={"name__value": "bike"}) == "BIKE"
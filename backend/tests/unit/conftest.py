@@ -13,6 +13,7 @@ from pytest_httpx import HTTPXMock
 
 from infrahub import config
 from infrahub.auth import AccountSession, AuthType
+from infrahub.auth_cache import auth_cache
 from infrahub.core import registry
 from infrahub.core.attribute import (
     Boolean,
@@ -55,6 +56,7 @@ from infrahub.core.utils import delete_all_nodes
 from infrahub.database import InfrahubDatabase
 from infrahub.dependencies.registry import build_component_registry
 from infrahub.git import InfrahubRepository
+from infrahub.permissions.cache import permission_cache
 from infrahub.services import InfrahubServices, services
 from infrahub.services.adapters.workflow.local import WorkflowLocalExecution
 from tests.helpers.file_repo import FileRepo
@@ -2267,6 +2269,8 @@ async def prefix_schema(db: InfrahubDatabase, default_branch: Branch) -> SchemaR
 @pytest.fixture
 async def reset_registry(db: InfrahubDatabase) -> None:
     registry.delete_all()
+    permission_cache.invalidate()
+    auth_cache.discard_account()
 
 
 @pytest.fixture
@@ -1,9 +1,12 @@
+from unittest.mock import patch
+
 import pytest
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.node import Node
 from infrahub.core.node.constraints.grouped_uniqueness import NodeGroupedUniquenessConstraint
+from infrahub.core.validators.uniqueness.query import NodeUniqueAttributeConstraintQuery
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import ValidationError
 
@@ -13,6 +16,10 @@ class TestNodeGroupedUniquenessConstraint:
         constraint = NodeGroupedUniquenessConstraint(db=db, branch=branch)
         await constraint.check(node=node, filters=filters)
 
+    async def __call_system_under_test_many(self, db, branch, nodes, filters=None):
+        constraint = NodeGroupedUniquenessConstraint(db=db, branch=branch)
+        await constraint.check_many(nodes=nodes, filters=filters)
+
     async def test_no_uniqueness_constraint(
         self, db: InfrahubDatabase, default_branch: Branch, car_accord_main: Node, car_camry_main: Node
     ):
@@ -46,6 +53,20 @@ class TestNodeGroupedUniquenessConstraint:
 
         await self.__call_system_under_test(db=db, branch=default_branch, node=car_accord_main, filters=["color"])
 
+    async def test_uniqueness_constraints_single_query(
+        self, db: InfrahubDatabase, default_branch: Branch, car_accord_main: Node, car_camry_main: Node
+    ):
+        car_accord_main.nbr_seats.value = car_camry_main.nbr_seats.value
+        car_accord_main.get_schema().uniqueness_constraints = [["name__value"], ["nbr_seats__value", "owner"]]
+
+        original_execute = NodeUniqueAttributeConstraintQuery.execute
+        with patch.object(
+            NodeUniqueAttributeConstraintQuery, "execute", autospec=True, side_effect=original_execute
+        ) as mock_execute:
+            with pytest.raises(ValidationError, match="Violates uniqueness constraint 'nbr_seats-owner'"):
+                await self.__call_system_under_test(db=db, branch=default_branch, node=car_accord_main)
+        assert mock_execute.call_count == 1
+
     async def test_uniqueness_constraint_no_conflict_two_attribute(
         self,
         db: InfrahubDatabase,
@@ -194,3 +215,53 @@ class TestNodeGroupedUniquenessConstraint:
 
         with pytest.raises(ValidationError, match="Violates uniqueness constraint 'color-owner'"):
             await self.__call_system_under_test(db=db, branch=default_branch, node=car_node_1)
+
+    async def test_many_no_conflicts(
+        self,
+        db: InfrahubDatabase,
+        default_branch: Branch,
+        person_john_main: Node,
+        car_accord_main: Node,
+        car_camry_main: Node,
+    ):
+        car_accord_main.get_schema().uniqueness_constraints = [["name__value", "owner"]]
+        # the existing nodes of the batch are compared using their new values
+        car_accord_main.name.value = "camry"
+        car_camry_main.name.value = "accord"
+        new_car = await Node.init(db=db, schema="TestCar", branch=default_branch)
+        await new_car.new(db=db, name="civic", nbr_seats=5, is_electric=False, owner=person_john_main)
+
+        await self.__call_system_under_test_many(
+            db=db, branch=default_branch, nodes=[car_accord_main, car_camry_main, new_car]
+        )
+
+    async def test_many_conflict_existing(
+        self,
+        db: InfrahubDatabase,
+        default_branch: Branch,
+        person_john_main: Node,
+        car_accord_main: Node,
+        car_camry_main: Node,
+    ):
+        car_accord_main.get_schema().uniqueness_constraints = [["name__value"]]
+        new_cars = []
+        for name in ["civic", "camry"]:
+            new_car = await Node.init(db=db, schema="TestCar", branch=default_branch)
+            await new_car.new(db=db, name=name, nbr_seats=5, is_electric=False, owner=person_john_main)
+            new_cars.append(new_car)
+
+        with pytest.raises(ValidationError, match="Violates uniqueness constraint 'name'"):
+            await self.__call_system_under_test_many(db=db, branch=default_branch, nodes=new_cars)
+
+    async def test_many_conflict_within_batch(
+        self, db: InfrahubDatabase, default_branch: Branch, car_accord_main: Node, person_jane_main: Node
+    ):
+        car_accord_main.get_schema().uniqueness_constraints = [["nbr_seats__value", "owner"]]
+        new_cars = []
+        for name in ["civic", "corolla"]:
+            new_car = await Node.init(db=db, schema="TestCar", branch=default_branch)
+            await new_car.new(db=db, name=name, nbr_seats=4, is_electric=False, owner=person_jane_main)
+            new_cars.append(new_car)
+
+        with pytest.raises(ValidationError, match="Violates uniqueness constraint 'nbr_seats-owner'"):
+            await self.__call_system_under_test_many(db=db, branch=default_branch, nodes=new_cars)
@@ -1,8 +1,11 @@
+from types import SimpleNamespace
+
 import pytest
 
 from infrahub.core.branch import Branch
 from infrahub.core.node import Node
 from infrahub.core.node.constraints.attribute_uniqueness import NodeAttributeUniquenessConstraint
+from infrahub.core.schema import AttributeSchema
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import ValidationError
 
@@ -29,3 +32,68 @@ async def test_node_validate_constraint_node_uniqueness_success(
     await alfred.new(db=db, name="Alfred", height=160)
 
     await constraint.check(alfred)
+
+
+async def test_node_validate_constraint_node_uniqueness_many_failure(
+    db: InfrahubDatabase, default_branch: Branch, person_john_main
+):
+    constraint = NodeAttributeUniquenessConstraint(db=db, branch=default_branch)
+    alfred = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await alfred.new(db=db, name="Alfred", height=160)
+    new_john = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await new_john.new(db=db, name="John", height=160)
+
+    with pytest.raises(ValidationError) as exc:
+        await constraint.check_many([alfred, new_john])
+
+    assert "An object already exist with this value: name: John" in exc.value.message
+
+
+async def test_node_validate_constraint_node_uniqueness_many_within_batch(
+    db: InfrahubDatabase, default_branch: Branch, person_john_main
+):
+    constraint = NodeAttributeUniquenessConstraint(db=db, branch=default_branch)
+    alfred = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await alfred.new(db=db, name="Alfred", height=160)
+    other_alfred = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await other_alfred.new(db=db, name="Alfred", height=170)
+
+    with pytest.raises(ValidationError) as exc:
+        await constraint.check_many([alfred, other_alfred])
+
+    assert "An object already exist with this value: name: Alfred" in exc.value.message
+
+
+async def test_node_validate_constraint_node_uniqueness_many_success(
+    db: InfrahubDatabase, default_branch: Branch, person_john_main, person_jane_main
+):
+    constraint = NodeAttributeUniquenessConstraint(db=db, branch=default_branch)
+    alfred = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await alfred.new(db=db, name="Alfred", height=160)
+    # The names of the existing nodes of the batch are compared using their new values
+    person_john_main.name.value = "Jane"
+    person_jane_main.name.value = "John"
+
+    await constraint.check_many([alfred, person_john_main, person_jane_main])
+
+
+async def test_node_validate_constraint_node_uniqueness_many_unhashable_values():
+    schema = SimpleNamespace(
+        kind="TestThing",
+        inherit_from=[],
+        unique_attributes=[AttributeSchema(name="tags", kind="List", unique=True)],
+    )
+    nodes = [
+        SimpleNamespace(
+            get_schema=lambda: schema,
+            get_id=lambda node_id=node_id: node_id,
+            tags=SimpleNamespace(get_value=lambda: ["red", "blue"]),
+        )
+        for node_id in ("thing1", "thing2")
+    ]
+    constraint = NodeAttributeUniquenessConstraint(db=None, branch=None)  # type: ignore[arg-type]
+
+    with pytest.raises(ValidationError) as exc:
+        await constraint.check_many(nodes)  # type: ignore[arg-type]
+
+    assert "An object already exist with this value: tags: ['red', 'blue']" in exc.value.message
@@ -0,0 +1,60 @@
+from infrahub.core.query import QueryResult
+from infrahub.core.schema import AttributeSchema, RelationshipSchema, SchemaAttributePathValue
+from infrahub.core.validators.uniqueness.index import UniquenessQueryResultsIndex
+
+RETURN_LABELS = ["node_id", "deepest_branch_name", "node_count", "attr_name", "attr_value", "relationship_identifier"]
+NAME_SCHEMA = AttributeSchema(name="name", kind="Text")
+SEATS_SCHEMA = AttributeSchema(name="nbr_seats", kind="Number")
+OWNER_SCHEMA = RelationshipSchema(name="owner", peer="TestPerson", identifier="testcar__testperson")
+
+
+def _build_index(exclude_node_ids: set[str] | None = None) -> UniquenessQueryResultsIndex:
+    rows = [
+        ["c1", "main", 1, "name", "accord", None],
+        ["c1", "main", 1, "nbr_seats", 5, None],
+        ["c1", "main", 1, "id", "p1", "testcar__testperson"],
+        ["c2", "main", 1, "name", "camry", None],
+        ["c2", "main", 1, "nbr_seats", 5, None],
+        ["c2", "main", 1, "id", "p2", "testcar__testperson"],
+    ]
+    return UniquenessQueryResultsIndex(
+        query_results=[QueryResult(data=row, labels=RETURN_LABELS) for row in rows],
+        exclude_node_ids=exclude_node_ids,
+    )
+
+
+def test_get_node_ids_for_value_group():
+    index = _build_index()
+
+    assert index.get_node_ids_for_value_group(
+        [SchemaAttributePathValue(attribute_schema=SEATS_SCHEMA, attribute_property_name="value", value=5)]
+    ) == {"c1", "c2"}
+    assert index.get_node_ids_for_value_group(
+        [
+            SchemaAttributePathValue(attribute_schema=SEATS_SCHEMA, attribute_property_name="value", value=5),
+            SchemaAttributePathValue(relationship_schema=OWNER_SCHEMA, value="p2"),
+        ]
+    ) == {"c2"}
+    assert (
+        index.get_node_ids_for_value_group(
+            [
+                SchemaAttributePathValue(attribute_schema=NAME_SCHEMA, attribute_property_name="value", value="accord"),
+                SchemaAttributePathValue(relationship_schema=OWNER_SCHEMA, value="p2"),
+            ]
+        )
+        == set()
+    )
+    assert (
+        index.get_node_ids_for_value_group(
+            [SchemaAttributePathValue(attribute_schema=NAME_SCHEMA, attribute_property_name="value", value=None)]
+        )
+        == set()
+    )
+
+
+def test_get_node_ids_for_value_group_excluded_nodes():
+    index = _build_index(exclude_node_ids={"c1"})
+
+    assert index.get_node_ids_for_value_group(
+        [SchemaAttributePathValue(attribute_schema=SEATS_SCHEMA, attribute_property_name="value", value=5)]
+    ) == {"c2"}
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, call
+from unittest.mock import ANY, AsyncMock, call
 from uuid import uuid4
 
 import pytest
@@ -41,7 +41,9 @@ class TestMergeDiff:
 
     @pytest.fixture
     def mock_diff_repository(self) -> DiffRepository:
-        return AsyncMock(spec=DiffRepository)
+        diff_repository = AsyncMock(spec=DiffRepository)
+        diff_repository.get_cardinality_one_conflict_peers.return_value = []
+        return diff_repository
 
     @pytest.fixture
     def diff_merger(
@@ -327,7 +329,7 @@ class TestMergeDiff:
     ):
         empty_diff_root.nodes = {added_person_node_diff}
         mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        mock_diff_repository.get_node_page.return_value = empty_diff_root.nodes
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
@@ -335,11 +337,18 @@ class TestMergeDiff:
             await diff_merger.merge_graph(at=at)
 
         expected_awaits = [
-            call(diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid),
+            call(
+                base_branch_name=default_branch.name,
+                diff_branch_name=source_branch.name,
+                diff_id=empty_diff_root.uuid,
+                limit=DiffMerger.NODE_PAGE_SIZE,
+                offset=0,
+                db=ANY,
+            ),
         ]
         if check_idempotent:
             expected_awaits *= 2
-        assert mock_diff_repository.get_one.await_args_list == expected_awaits
+        assert mock_diff_repository.get_node_page.await_args_list == expected_awaits
 
         retrieved_node = await NodeManager.get_one(
             db=db, id=person_node_branch.id, branch=default_branch, include_owner=True, include_source=True
@@ -381,7 +390,7 @@ class TestMergeDiff:
         await person_branch.delete(db=db)
         empty_diff_root.nodes = {deleted_person_node_diff}
         mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        mock_diff_repository.get_node_page.return_value = empty_diff_root.nodes
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
@@ -389,11 +398,18 @@ class TestMergeDiff:
             await diff_merger.merge_graph(at=at)
 
         expected_awaits = [
-            call(diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid),
+            call(
+                base_branch_name=default_branch.name,
+                diff_branch_name=source_branch.name,
+                diff_id=empty_diff_root.uuid,
+                limit=DiffMerger.NODE_PAGE_SIZE,
+                offset=0,
+                db=ANY,
+            ),
         ]
         if check_idempotent:
             expected_awaits *= 2
-        assert mock_diff_repository.get_one.await_args_list == expected_awaits
+        assert mock_diff_repository.get_node_page.await_args_list == expected_awaits
 
         with pytest.raises(NodeNotFoundError):
             await NodeManager.get_one(db=db, branch=default_branch, id=person_node_main.id, raise_on_error=True)
@@ -407,6 +423,37 @@ class TestMergeDiff:
         owner_rel = await rolled_back_car.owner.get(db=db)
         assert owner_rel.peer_id == person_node_main.id
 
+    async def test_merge_diff_in_pages(
+        self,
+        db: InfrahubDatabase,
+        default_branch: Branch,
+        person_node_main: Node,
+        person_node_main2: Node,
+        source_branch: Branch,
+        mock_diff_repository: DiffRepository,
+        diff_merger: DiffMerger,
+        empty_diff_root: EnrichedDiffRoot,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(DiffMerger, "NODE_PAGE_SIZE", 1)
+        node_pages = []
+        for person_node in (person_node_main, person_node_main2):
+            person_branch = await NodeManager.get_one(db=db, branch=source_branch, id=person_node.id)
+            await person_branch.delete(db=db)
+            node_pages.append({self._get_empty_node_diff(node=person_branch, action=DiffAction.REMOVED)})
+        node_pages.append(set())
+        mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
+        mock_diff_repository.get_node_page.side_effect = node_pages
+        at = Timestamp()
+
+        await diff_merger.merge_graph(at=at)
+
+        page_offsets = [page_call.kwargs["offset"] for page_call in mock_diff_repository.get_node_page.await_args_list]
+        assert page_offsets == [0, 1, 2]
+        for person_node in (person_node_main, person_node_main2):
+            with pytest.raises(NodeNotFoundError):
+                await NodeManager.get_one(db=db, branch=default_branch, id=person_node.id, raise_on_error=True)
+
     @pytest.mark.parametrize(
         "conflict_selection,expect_deleted",
         [(ConflictSelection.DIFF_BRANCH, True), (ConflictSelection.BASE_BRANCH, False)],
@@ -434,13 +481,18 @@ class TestMergeDiff:
         deleted_node_diff.conflict = node_conflict
         empty_diff_root.nodes = {deleted_node_diff}
         mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        mock_diff_repository.get_node_page.return_value = empty_diff_root.nodes
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
 
-        mock_diff_repository.get_one.assert_awaited_once_with(
-            diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid
+        mock_diff_repository.get_node_page.assert_awaited_once_with(
+            base_branch_name=default_branch.name,
+            diff_branch_name=source_branch.name,
+            diff_id=empty_diff_root.uuid,
+            limit=DiffMerger.NODE_PAGE_SIZE,
+            offset=0,
+            db=ANY,
         )
         if expect_deleted:
             with pytest.raises(NodeNotFoundError):
@@ -655,7 +707,7 @@ class TestMergeDiff:
 
         empty_diff_root.nodes = {updated_person_node_diff, updated_car_diff}
         mock_diff_repository.get_empty_roots.return_value = [empty_diff_root]
-        mock_diff_repository.get_one.return_value = empty_diff_root
+        mock_diff_repository.get_node_page.return_value = empty_diff_root.nodes
         at = Timestamp()
 
         await diff_merger.merge_graph(at=at)
@@ -663,11 +715,18 @@ class TestMergeDiff:
             await diff_merger.merge_graph(at=at)
 
         expected_awaits = [
-            call(diff_branch_name=source_branch.name, diff_id=empty_diff_root.uuid),
+            call(
+                base_branch_name=default_branch.name,
+                diff_branch_name=source_branch.name,
+                diff_id=empty_diff_root.uuid,
+                limit=DiffMerger.NODE_PAGE_SIZE,
+                offset=0,
+                db=ANY,
+            ),
         ]
         if check_idempotent:
             expected_awaits *= 2
-        assert mock_diff_repository.get_one.await_args_list == expected_awaits
+        assert mock_diff_repository.get_node_page.await_args_list == expected_awaits
         updated_person = await NodeManager.get_one(
             db=db, branch=default_branch, id=person_node_main.id, include_owner=True
         )
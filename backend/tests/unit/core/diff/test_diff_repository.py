@@ -157,7 +157,8 @@ class TestDiffRepositorySaveAndLoad:
         assert diff_root == enriched_diff
 
     async def test_save_and_retrieve_large_diff(self, diff_repository: DiffRepository, reset_database):
-        diff_repository.MAX_SAVE_BATCH_SIZE = 3
+        diff_repository.MAX_SAVE_BATCH_ELEMENTS = 20
+        diff_repository.MAX_LINK_BATCH_SIZE = 2
         enriched_branch_diff = EnrichedRootFactory.build(
             base_branch_name=self.base_branch_name,
             diff_branch_name=self.diff_branch_name,
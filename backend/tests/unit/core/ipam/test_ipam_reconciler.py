@@ -4,7 +4,8 @@ import pytest
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
-from infrahub.core.initialization import create_ipam_namespace, get_default_ipnamespace
+from infrahub.core.initialization import create_branch, create_ipam_namespace, get_default_ipnamespace
+from infrahub.core.ipam.model import IpamNodeDetails
 from infrahub.core.ipam.reconciler import IpamReconciler
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
@@ -251,3 +252,163 @@ async def test_ipprefix_reconciler_prefix_value_update(db: InfrahubDatabase, def
         child_parent_rels = await child.ip_prefix.get_relationships(db=db)
         assert len(child_parent_rels) == 1
         assert child_parent_rels[0].peer_id == updated_prefix.id
+
+
+async def test_ipam_reconciler_reconcile_many(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    await create_ipam_namespace(db=db)
+    default_ipnamespace = await get_default_ipnamespace(db=db)
+    registry.default_ipnamespace = default_ipnamespace.id
+    prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=default_branch)
+    address_schema = registry.schema.get_node_schema(name="IpamIPAddress", branch=default_branch)
+    namespace = ip_dataset_01["ns1"]
+    new_prefix = await Node.init(db=db, schema=prefix_schema)
+    await new_prefix.new(db=db, prefix="10.10.0.0/18", ip_namespace=namespace)
+    await new_prefix.save(db=db)
+    new_address = await Node.init(db=db, schema=address_schema)
+    await new_address.new(db=db, address="10.10.3.1", ip_namespace=namespace)
+    await new_address.save(db=db)
+    address10 = ip_dataset_01["address10"]
+
+    reconciler = IpamReconciler(db=db, branch=default_branch)
+    await reconciler.reconcile_many(
+        ipam_node_details=[
+            IpamNodeDetails(
+                node_uuid=new_prefix.id,
+                is_address=False,
+                is_delete=False,
+                namespace_id=namespace.id,
+                ip_value=new_prefix.prefix.value,
+            ),
+            IpamNodeDetails(
+                node_uuid=new_address.id,
+                is_address=True,
+                is_delete=False,
+                namespace_id=namespace.id,
+                ip_value=new_address.address.value,
+            ),
+            IpamNodeDetails(
+                node_uuid=address10.id,
+                is_address=True,
+                is_delete=True,
+                namespace_id=namespace.id,
+                ip_value=address10.address.value,
+            ),
+        ]
+    )
+
+    # check deleted address
+    assert await NodeManager.get_one(db=db, branch=default_branch, id=address10.id) is None
+    # check new prefix parent and children
+    updated_prefix = await NodeManager.get_one(db=db, branch=default_branch, id=new_prefix.id)
+    assert updated_prefix.is_top_level.value is False
+    updated_prefix_parent_rels = await updated_prefix.parent.get_relationships(db=db)
+    assert [rel.peer_id for rel in updated_prefix_parent_rels] == [ip_dataset_01["net140"].id]
+    expected_child_prefix_ids = {ip_dataset_01["net142"].id, ip_dataset_01["net144"].id, ip_dataset_01["net145"].id}
+    updated_prefix_child_rels = await updated_prefix.children.get_relationships(db=db)
+    assert {rel.peer_id for rel in updated_prefix_child_rels} == expected_child_prefix_ids
+    assert not await updated_prefix.ip_addresses.get_relationships(db=db)
+    # check new address parent
+    updated_address = await NodeManager.get_one(db=db, branch=default_branch, id=new_address.id)
+    prefix_rels = await updated_address.ip_prefix.get_relationships(db=db)
+    assert [rel.peer_id for rel in prefix_rels] == [ip_dataset_01["net145"].id]
+    # check former parent of the children
+    updated_prefix_140 = await NodeManager.get_one(db=db, branch=default_branch, id=ip_dataset_01["net140"].id)
+    prefix_140_children_rels = await updated_prefix_140.children.get_relationships(db=db)
+    assert [rel.peer_id for rel in prefix_140_children_rels] == [updated_prefix.id]
+    assert not await updated_prefix_140.ip_addresses.get_relationships(db=db)
+
+
+async def test_ipam_reconciler_reconcile_many_no_change(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    await create_ipam_namespace(db=db)
+    default_ipnamespace = await get_default_ipnamespace(db=db)
+    registry.default_ipnamespace = default_ipnamespace.id
+    namespace = ip_dataset_01["ns1"]
+    net_140_prefix = ip_dataset_01["net140"]
+
+    reconciler = IpamReconciler(db=db, branch=default_branch)
+    await reconciler.reconcile_many(
+        ipam_node_details=[
+            IpamNodeDetails(
+                node_uuid=net_140_prefix.id,
+                is_address=False,
+                is_delete=False,
+                namespace_id=namespace.id,
+                ip_value=net_140_prefix.prefix.value,
+            )
+        ]
+    )
+
+    updated_prefix = await NodeManager.get_one(db=db, branch=default_branch, id=net_140_prefix.id)
+    updated_prefix_parent_rels = await updated_prefix.parent.get_relationships(db=db)
+    assert [rel.peer_id for rel in updated_prefix_parent_rels] == [ip_dataset_01["net146"].id]
+    updated_prefix_child_rels = await updated_prefix.children.get_relationships(db=db)
+    assert {rel.peer_id for rel in updated_prefix_child_rels} == {
+        ip_dataset_01["net142"].id,
+        ip_dataset_01["net144"].id,
+        ip_dataset_01["net145"].id,
+    }
+
+
+async def test_ipam_reconciler_reconcile_many_invalid_node_raises_error(
+    db: InfrahubDatabase, default_branch: Branch, ip_dataset_01
+):
+    await create_ipam_namespace(db=db)
+    default_ipnamespace = await get_default_ipnamespace(db=db)
+    registry.default_ipnamespace = default_ipnamespace.id
+    namespace = ip_dataset_01["ns1"]
+
+    reconciler = IpamReconciler(db=db, branch=default_branch)
+    with pytest.raises(NodeNotFoundError):
+        await reconciler.reconcile_many(
+            ipam_node_details=[
+                IpamNodeDetails(
+                    node_uuid="d9e1c2f0-3bf2-4b7a-8b38-6a0a0f2d6b11",
+                    is_address=True,
+                    is_delete=False,
+                    namespace_id=namespace.id,
+                    ip_value="10.10.3.1/32",
+                )
+            ]
+        )
+
+
+async def test_ipam_reconciler_reconcile_many_branch(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    await create_ipam_namespace(db=db)
+    default_ipnamespace = await get_default_ipnamespace(db=db)
+    registry.default_ipnamespace = default_ipnamespace.id
+    namespace = ip_dataset_01["ns1"]
+    branch = await create_branch(db=db, branch_name="reconcile_many")
+    prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=branch)
+    new_prefix = await Node.init(db=db, schema=prefix_schema, branch=branch)
+    await new_prefix.new(db=db, prefix="10.10.0.0/18", ip_namespace=namespace)
+    await new_prefix.save(db=db)
+
+    reconciler = IpamReconciler(db=db, branch=branch)
+    # one write query per updated node
+    reconciler.page_size = 1
+    await reconciler.reconcile_many(
+        ipam_node_details=[
+            IpamNodeDetails(
+                node_uuid=new_prefix.id,
+                is_address=False,
+                is_delete=False,
+                namespace_id=namespace.id,
+                ip_value=new_prefix.prefix.value,
+            )
+        ]
+    )
+
+    expected_child_prefix_ids = {ip_dataset_01["net142"].id, ip_dataset_01["net144"].id, ip_dataset_01["net145"].id}
+    updated_prefix = await NodeManager.get_one(db=db, branch=branch, id=new_prefix.id)
+    assert updated_prefix.is_top_level.value is False
+    updated_prefix_parent_rels = await updated_prefix.parent.get_relationships(db=db)
+    assert [rel.peer_id for rel in updated_prefix_parent_rels] == [ip_dataset_01["net140"].id]
+    updated_prefix_child_rels = await updated_prefix.children.get_relationships(db=db)
+    assert {rel.peer_id for rel in updated_prefix_child_rels} == expected_child_prefix_ids
+    branch_prefix_140 = await NodeManager.get_one(db=db, branch=branch, id=ip_dataset_01["net140"].id)
+    branch_prefix_140_children_rels = await branch_prefix_140.children.get_relationships(db=db)
+    assert [rel.peer_id for rel in branch_prefix_140_children_rels] == [new_prefix.id]
+    # the default branch is left untouched
+    main_prefix_140 = await NodeManager.get_one(db=db, branch=default_branch, id=ip_dataset_01["net140"].id)
+    main_prefix_140_children_rels = await main_prefix_140.children.get_relationships(db=db)
+    assert {rel.peer_id for rel in main_prefix_140_children_rels} == expected_child_prefix_ids
@@ -0,0 +1,164 @@
+import ipaddress
+
+import pytest
+
+from infrahub.core.ipam.constants import PrefixMemberType
+from infrahub.core.ipam.tree import IpamTree, IpamTreeRegistry
+
+PREFIXES = {
+    "net146": "10.0.0.0/8",
+    "net140": "10.10.0.0/16",
+    "net141": "10.10.1.0/24",
+    "net142": "10.10.2.0/24",
+    "net143": "10.20.0.0/16",
+    "net160": "2001:db8::/32",
+    "net161": "2001:db8:1::/48",
+}
+ADDRESSES = {
+    "addr1": "10.10.1.1/24",
+    "addr2": "10.10.1.2/24",
+    "addr3": "10.10.2.1/24",
+    "addr4": "10.10.3.1/16",
+    "addr5": "10.30.0.1/16",
+    "addr6": "192.168.0.1/24",
+    "addr7": "2001:db8:1::1/64",
+}
+
+
+@pytest.fixture
+def ipam_tree() -> IpamTree:
+    return IpamTree.build(
+        prefixes=[(prefix_id, ipaddress.ip_network(value)) for prefix_id, value in PREFIXES.items()],
+        addresses=[(address_id, ipaddress.ip_interface(value)) for address_id, value in ADDRESSES.items()],
+    )
+
+
+def test_build(ipam_tree: IpamTree):
+    assert ipam_tree.num_prefixes == len(PREFIXES)
+    assert ipam_tree.num_addresses == len(ADDRESSES)
+    assert "net141" in ipam_tree
+    assert "addr7" in ipam_tree
+    assert "unknown" not in ipam_tree
+
+
+def test_get_parent_id(ipam_tree: IpamTree):
+    assert ipam_tree.get_parent_id(ipaddress.ip_network("10.0.0.0/8")) is None
+    assert ipam_tree.get_parent_id(ipaddress.ip_network("10.10.0.0/16")) == "net146"
+    assert ipam_tree.get_parent_id(ipaddress.ip_network("10.10.1.128/25")) == "net141"
+    assert ipam_tree.get_parent_id(ipaddress.ip_network("2001:db8:1:1::/64")) == "net161"
+    assert ipam_tree.get_parent_id(ipaddress.ip_interface("10.10.2.10/24")) == "net142"
+    assert ipam_tree.get_parent_id(ipaddress.ip_interface("10.10.2.10/16")) == "net140"
+    assert ipam_tree.get_parent_id(ipaddress.ip_interface("172.16.0.1/16")) is None
+
+
+def test_get_parent_ids(ipam_tree: IpamTree):
+    parent_ids = ipam_tree.get_parent_ids()
+    assert len(parent_ids) == len(PREFIXES) + len(ADDRESSES)
+    assert parent_ids["net146"] is None
+    assert parent_ids["net141"] == "net140"
+    assert parent_ids["addr4"] == "net140"
+    assert parent_ids["addr6"] is None
+    assert parent_ids["addr7"] == "net161"
+
+
+def test_get_child_prefixes(ipam_tree: IpamTree):
+    children = ipam_tree.get_child_prefixes(ipaddress.ip_network("10.0.0.0/8"))
+    assert sorted(children) == [
+        ("net140", ipaddress.ip_network("10.10.0.0/16")),
+        ("net143", ipaddress.ip_network("10.20.0.0/16")),
+    ]
+    # a network that is not a prefix of the tree only returns the prefixes it contains
+    children = ipam_tree.get_child_prefixes(ipaddress.ip_network("10.10.2.0/23"))
+    assert children == [("net142", ipaddress.ip_network("10.10.2.0/24"))]
+    assert ipam_tree.get_child_prefixes(ipaddress.ip_network("10.10.1.0/24")) == []
+
+
+def test_get_addresses(ipam_tree: IpamTree):
+    addresses = ipam_tree.get_addresses(ipaddress.ip_network("10.10.0.0/16"))
+    assert sorted(address_id for address_id, _ in addresses) == ["addr1", "addr2", "addr3", "addr4"]
+    assert ("addr4", ipaddress.ip_interface("10.10.3.1/16")) in addresses
+
+    addresses = ipam_tree.get_addresses(ipaddress.ip_network("10.0.0.0/9"))
+    assert sorted(address_id for address_id, _ in addresses) == ["addr1", "addr2", "addr3", "addr4", "addr5"]
+
+    addresses = ipam_tree.get_addresses(ipaddress.ip_network("2001:db8::/32"))
+    assert addresses == [("addr7", ipaddress.ip_interface("2001:db8:1::1/64"))]
+
+
+def test_get_utilization(ipam_tree: IpamTree):
+    assert ipam_tree.get_utilization(prefix_id="net141", member_type=PrefixMemberType.ADDRESS) == (2, 256)
+    assert ipam_tree.get_utilization(prefix_id="net140", member_type=PrefixMemberType.PREFIX) == (512, 65536)
+    assert ipam_tree.get_utilization(prefix_id="net146", member_type=PrefixMemberType.PREFIX) == (
+        2 * 65536,
+        2**24,
+    )
+
+
+def test_add_prefix_moves_children(ipam_tree: IpamTree):
+    ipam_tree.add_prefix(prefix_id="net144", network=ipaddress.ip_network("10.10.0.0/22"))
+
+    assert ipam_tree.get_parent_id(ipaddress.ip_network("10.10.1.0/24")) == "net144"
+    assert ipam_tree.get_parent_id(ipaddress.ip_interface("10.10.3.1/16")) == "net140"
+    assert sorted(ipam_tree.get_child_prefixes(ipaddress.ip_network("10.10.0.0/16"))) == [
+        ("net144", ipaddress.ip_network("10.10.0.0/22"))
+    ]
+    assert ipam_tree.get_utilization(prefix_id="net140", member_type=PrefixMemberType.PREFIX) == (1024, 65536)
+
+
+def test_remove_prefix_moves_children_up(ipam_tree: IpamTree):
+    ipam_tree.remove_node(node_id="net140")
+
+    assert "net140" not in ipam_tree
+    assert ipam_tree.get_parent_id(ipaddress.ip_network("10.10.1.0/24")) == "net146"
+    assert ipam_tree.get_parent_id(ipaddress.ip_interface("10.10.3.1/16")) == "net146"
+    assert sorted(prefix_id for prefix_id, _ in ipam_tree.get_child_prefixes(ipaddress.ip_network("10.0.0.0/8"))) == [
+        "net141",
+        "net142",
+        "net143",
+    ]
+
+
+def test_update_address(ipam_tree: IpamTree):
+    ipam_tree.add_address(address_id="addr1", address=ipaddress.ip_interface("10.20.0.1/16"))
+    assert ipam_tree.num_addresses == len(ADDRESSES)
+    assert ipam_tree.get_parent_id(ipaddress.ip_interface("10.20.0.1/16")) == "net143"
+    assert ipam_tree.get_utilization(prefix_id="net141", member_type=PrefixMemberType.ADDRESS) == (1, 256)
+    assert ipam_tree.get_utilization(prefix_id="net143", member_type=PrefixMemberType.ADDRESS) == (1, 65536)
+
+    ipam_tree.remove_node(node_id="addr1")
+    assert "addr1" not in ipam_tree
+    assert ipam_tree.get_utilization(prefix_id="net143", member_type=PrefixMemberType.ADDRESS) == (0, 65536)
+
+
+def test_duplicate_prefixes(ipam_tree: IpamTree):
+    ipam_tree.add_prefix(prefix_id="net141-dup", network=ipaddress.ip_network("10.10.1.0/24"))
+    assert ipam_tree.get_parent_id(ipaddress.ip_network("10.10.1.0/24")) == "net140"
+
+    ipam_tree.remove_node(node_id="net141")
+    assert ipam_tree.get_parent_id(ipaddress.ip_interface("10.10.1.1/24")) == "net141-dup"
+    assert ipam_tree.get_child_prefixes(ipaddress.ip_network("10.10.0.0/16")) == [
+        ("net142", ipaddress.ip_network("10.10.2.0/24")),
+        ("net141-dup", ipaddress.ip_network("10.10.1.0/24")),
+    ]
+
+
+def test_registry_update_node_and_invalidate(ipam_tree: IpamTree):
+    registry = IpamTreeRegistry()
+    other_tree = IpamTree()
+    registry._trees["main", "ns1"] = (ipam_tree, 0.0)
+    registry._trees["main", "ns2"] = (other_tree, 0.0)
+    registry._trees["branch1", "ns1"] = (IpamTree(), 0.0)
+
+    registry.update_node(
+        branch_name="main", node_id="addr1", namespace_id="ns2", ip_value=ipaddress.ip_interface("10.10.1.1/24")
+    )
+    assert "addr1" not in ipam_tree
+    assert "addr1" in other_tree
+
+    registry.update_node(branch_name="main", node_id="net141")
+    assert "net141" not in ipam_tree
+
+    registry.invalidate(branch_name="main")
+    assert list(registry._trees) == [("branch1", "ns1")]
+    registry.invalidate()
+    assert not registry._trees
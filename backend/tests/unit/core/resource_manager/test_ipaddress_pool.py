@@ -62,3 +62,53 @@ async def test_get_next_full(
 
     with pytest.raises(PoolExhaustedError, match="There are no more addresses available in this pool"):
         await pool.get_next(db=db, prefixlen=30)
+
+
+async def test_get_next_released_on_rollback(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    default_ipnamespace: Node,
+    register_ipam_schema: SchemaBranch,
+    ip_dataset_prefix_v4,
+):
+    ns1 = ip_dataset_prefix_v4["ns1"]
+    net145 = ip_dataset_prefix_v4["net145"]
+
+    adress_pool_schema = registry.schema.get_node_schema(name=InfrahubKind.IPADDRESSPOOL, branch=default_branch)
+
+    pool = await CoreIPAddressPool.init(schema=adress_pool_schema, db=db)
+    await pool.new(db=db, name="pool1", resources=[net145], ip_namespace=ns1, default_address_type="IpamIPAddress")
+    await pool.save(db=db)
+
+    with pytest.raises(ValueError, match="rollback"):
+        async with db.start_transaction() as dbt:
+            node = await pool.get_resource(db=dbt, address_type="IpamIPAddress", branch=default_branch)
+            assert str(node.address.value) == "10.10.3.2/27"
+            raise ValueError("rollback")
+
+    next_address = await pool.get_next(db=db)
+    assert str(next_address) == "10.10.3.2/27"
+
+
+async def test_get_next_many(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    default_ipnamespace: Node,
+    register_ipam_schema: SchemaBranch,
+    ip_dataset_prefix_v4,
+):
+    ns1 = ip_dataset_prefix_v4["ns1"]
+    net145 = ip_dataset_prefix_v4["net145"]
+
+    adress_pool_schema = registry.schema.get_node_schema(name=InfrahubKind.IPADDRESSPOOL, branch=default_branch)
+
+    pool = await CoreIPAddressPool.init(schema=adress_pool_schema, db=db)
+    await pool.new(db=db, name="pool1", resources=[net145], ip_namespace=ns1, default_address_type="IpamIPAddress")
+    await pool.save(db=db)
+
+    # either all the addresses are allocated or none, 10.10.3.1 is used and the first and last ones are reserved
+    with pytest.raises(PoolExhaustedError):
+        await pool.get_next_many(db=db, count=30)
+
+    next_addresses = await pool.get_next_many(db=db, count=3)
+    assert [str(address) for address in next_addresses] == ["10.10.3.2/27", "10.10.3.3/27", "10.10.3.4/27"]
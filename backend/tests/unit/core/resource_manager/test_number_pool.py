@@ -1,8 +1,13 @@
+import pytest
+
 from infrahub.core.branch import Branch
 from infrahub.core.initialization import initialize_registry
 from infrahub.core.node import Node
+from infrahub.core.query.resource_manager import NumberPoolGetChanged, NumberPoolGetUsed, NumberPoolSetReserved
 from infrahub.core.schema import SchemaRoot
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
+from infrahub.exceptions import PoolExhaustedError
 from tests.helpers.schema import TICKET, load_schema
 
 
@@ -31,3 +36,49 @@ async def test_allocate_from_number_pool(db: InfrahubDatabase, default_branch: B
     await recreated_ticket2.new(db=db, title="ticket2", ticket_id={"from_pool": {"id": np1.id}})
     await recreated_ticket2.save(db=db)
     assert recreated_ticket2.ticket_id.value == 2
+
+
+async def test_number_pool_used_and_changed_agree(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema
+):
+    await load_schema(db=db, schema=SchemaRoot(nodes=[TICKET]))
+    await initialize_registry(db=db)
+
+    np1 = await Node.init(db=db, schema="CoreNumberPool")
+    await np1.new(db=db, name="pool1", node="TestingTicket", node_attribute="ticket_id", start_range=1, end_range=10)
+    await np1.save(db=db)
+    since = Timestamp()
+
+    ticket1 = await Node.init(db=db, schema=TICKET.kind)
+    await ticket1.new(db=db, title="ticket1", ticket_id={"from_pool": {"id": np1.id}})
+    await ticket1.save(db=db)
+
+    # A number reserved for a node which is not saved yet
+    query_set = await NumberPoolSetReserved.init(db=db, pool_id=np1.id, identifier="pending", reserved=2)
+    await query_set.execute(db=db)
+
+    query_used = await NumberPoolGetUsed.init(db=db, branch=default_branch, pool=np1, branch_agnostic=True)
+    await query_used.execute(db=db)
+    assert [result.get_as_type(label="value", return_type=int) for result in query_used.get_results()] == [1, 2]
+
+    query_changed = await NumberPoolGetChanged.init(
+        db=db, branch=default_branch, pool=np1, since=since.to_string(), branch_agnostic=True
+    )
+    await query_changed.execute(db=db)
+    assert query_changed.get_changes() == ({1, 2}, set())
+
+
+async def test_get_next_many(db: InfrahubDatabase, default_branch: Branch, register_core_models_schema):
+    await load_schema(db=db, schema=SchemaRoot(nodes=[TICKET]))
+    await initialize_registry(db=db)
+
+    np1 = await Node.init(db=db, schema="CoreNumberPool")
+    await np1.new(db=db, name="pool1", node="TestingTicket", node_attribute="ticket_id", start_range=1, end_range=10)
+    await np1.save(db=db)
+
+    # either all the numbers are allocated or none
+    with pytest.raises(PoolExhaustedError):
+        await np1.get_next_many(db=db, branch=default_branch, count=11)
+
+    assert await np1.get_next_many(db=db, branch=default_branch, count=3) == [1, 2, 3]
+    assert await np1.get_next(db=db, branch=default_branch) == 4
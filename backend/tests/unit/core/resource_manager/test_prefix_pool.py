@@ -138,3 +138,58 @@ async def test_get_all_resources(
         prefix5.prefix.value,
     ]
     assert sorted(all_prefixes) == ["10.10.0.0/24", "10.10.128.0/17", "10.10.4.0/24", "10.11.0.0/17", "10.11.128.0/17"]
+
+
+async def test_get_next_many(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    default_ipnamespace: Node,
+    register_ipam_schema: SchemaBranch,
+    ip_dataset_prefix_v4,
+):
+    ns1 = ip_dataset_prefix_v4["ns1"]
+    net140 = ip_dataset_prefix_v4["net140"]
+    net141 = ip_dataset_prefix_v4["net141"]
+
+    prefix_pool_schema = registry.schema.get_node_schema(name=InfrahubKind.IPPREFIXPOOL, branch=default_branch)
+
+    pool = await CoreIPPrefixPool.init(schema=prefix_pool_schema, db=db)
+    await pool.new(db=db, name="pool1", resources=[net140, net141], ip_namespace=ns1)
+    await pool.save(db=db)
+
+    # either all the prefixes are allocated or none
+    with pytest.raises(IndexError):
+        await pool.get_next_many(db=db, prefixlen=17, count=4)
+
+    next_subnets = await pool.get_next_many(db=db, prefixlen=17, count=3)
+    assert [str(subnet) for subnet in next_subnets] == ["10.10.128.0/17", "10.11.0.0/17", "10.11.128.0/17"]
+
+
+async def test_get_next_synchronized(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    default_ipnamespace: Node,
+    register_ipam_schema: SchemaBranch,
+    ip_dataset_prefix_v4,
+):
+    ns1 = ip_dataset_prefix_v4["ns1"]
+    net140 = ip_dataset_prefix_v4["net140"]
+    net141 = ip_dataset_prefix_v4["net141"]
+
+    prefix_pool_schema = registry.schema.get_node_schema(name=InfrahubKind.IPPREFIXPOOL, branch=default_branch)
+
+    pool = await CoreIPPrefixPool.init(schema=prefix_pool_schema, db=db)
+    await pool.new(db=db, name="pool1", resources=[net140, net141], ip_namespace=ns1)
+    await pool.save(db=db)
+
+    next_subnet = await pool.get_next(db=db, prefixlen=17)
+    assert str(next_subnet) == "10.10.128.0/17"
+
+    # prefix created by another worker, this one doesn't receive any event for it
+    prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=default_branch)
+    prefix = await Node.init(db=db, schema=prefix_schema)
+    await prefix.new(db=db, prefix="10.11.0.0/17", ip_namespace=ns1, parent=net141)
+    await prefix.save(db=db)
+
+    next_subnet = await pool.get_next(db=db, prefixlen=17)
+    assert str(next_subnet) == "10.11.128.0/17"
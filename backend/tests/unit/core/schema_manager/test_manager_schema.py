@@ -2,6 +2,7 @@ import copy
 import json
 import re
 import uuid
+from unittest.mock import patch
 
 import pytest
 from infrahub_sdk.utils import compare_lists
@@ -29,6 +30,7 @@ from infrahub.core.schema import (
 from infrahub.core.schema.computed_attribute import ComputedAttribute
 from infrahub.core.schema.manager import SchemaManager
 from infrahub.core.schema.schema_branch import SchemaBranch
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import SchemaNotFoundError, ValidationError
 from tests.conftest import TestHelper
@@ -80,6 +82,33 @@ async def test_schema_branch_get(default_branch: Branch):
     assert schema11 == schema
 
 
+async def test_schema_branch_get_read_only():
+    SCHEMA = {
+        "name": "Criticality",
+        "namespace": "Builtin",
+        "default_filter": "name__value",
+        "attributes": [
+            {"name": "name", "kind": "Text", "unique": True},
+            {"name": "description", "kind": "Text"},
+        ],
+    }
+    schema_branch = SchemaBranch(cache={}, name="test")
+    schema_branch.set(name="BuiltinCriticality", schema=NodeSchema(**SCHEMA))
+
+    shared = schema_branch.get(name="BuiltinCriticality", duplicate=False)
+    assert shared.is_read_only
+    assert shared is schema_branch.get(name="BuiltinCriticality", duplicate=False)
+    with pytest.raises(TypeError):
+        shared.label = "new label"
+    with pytest.raises(TypeError):
+        shared.attributes[0].optional = True
+
+    copy = schema_branch.get(name="BuiltinCriticality")
+    assert not copy.is_read_only
+    copy.label = "new label"
+    assert shared.label != "new label"
+
+
 async def test_schema_branch_load_schema_initial(schema_all_in_one):
     schema = SchemaBranch(cache={}, name="test")
     schema.load_schema(schema=SchemaRoot(**schema_all_in_one))
@@ -559,6 +588,27 @@ async def test_schema_branch_generate_weight(schema_all_in_one):
     assert len(in_second) == 1 and in_second[0].startswith(new_attr2_partial_id)
 
 
+async def test_schema_branch_process_dropdowns():
+    SCHEMA = {
+        "name": "Criticality",
+        "namespace": "Builtin",
+        "attributes": [
+            {"name": "name", "kind": "Text", "unique": True},
+            {"name": "status", "kind": "Dropdown", "choices": [{"name": "active"}, {"name": "passive"}]},
+        ],
+    }
+    schema = SchemaBranch(cache={}, name="test")
+    schema.set(name="BuiltinCriticality", schema=NodeSchema(**SCHEMA))
+    schema.process_dropdowns()
+
+    node = schema.get(name="BuiltinCriticality", duplicate=False)
+    assert node.is_read_only
+    choices = node.get_attribute(name="status").choices
+    assert [choice.name for choice in choices] == ["passive", "active"]
+    assert [choice.label for choice in choices] == ["Passive", "Active"]
+    assert all(choice.color for choice in choices)
+
+
 async def test_schema_branch_add_profile_schema(schema_all_in_one):
     core_profile_schema = _get_schema_by_kind(core_models, kind="CoreProfile")
     schema_all_in_one["generics"].append(core_profile_schema)
@@ -2360,6 +2410,49 @@ async def test_load_schema_from_db(
     assert description_schema.computed_attribute.jinja2_template == "{{ name__value }}"
 
 
+async def test_load_schema_at(
+    db: InfrahubDatabase, reset_registry, default_branch: Branch, register_internal_models_schema
+):
+    TAG_SCHEMA = {
+        "nodes": [
+            {
+                "namespace": "Builtin",
+                "name": "Tag",
+                "default_filter": "name__value",
+                "attributes": [{"name": "name", "kind": "Text", "unique": True}],
+            },
+        ],
+    }
+    CRITICALITY_SCHEMA = {
+        "namespace": "Test",
+        "name": "Criticality",
+        "default_filter": "name__value",
+        "attributes": [{"name": "name", "kind": "Text", "unique": True}],
+    }
+
+    schema = registry.schema.register_schema(schema=SchemaRoot(**TAG_SCHEMA), branch=default_branch.name)
+    await registry.schema.load_schema_to_db(schema=schema, db=db, branch=default_branch.name)
+    time_before_change = Timestamp()
+    time_before_change_2 = Timestamp()
+
+    await registry.schema.load_node_to_db(node=NodeSchema(**CRITICALITY_SCHEMA), db=db, branch=default_branch)
+    time_after_change = Timestamp()
+
+    with patch.object(
+        registry.schema, "load_schema_from_db", wraps=registry.schema.load_schema_from_db
+    ) as load_schema_from_db:
+        schema_before = await registry.schema.load_schema_at(db=db, branch=default_branch, at=time_before_change)
+        schema_before_2 = await registry.schema.load_schema_at(db=db, branch=default_branch, at=time_before_change_2)
+        assert schema_before is schema_before_2
+        assert load_schema_from_db.call_count == 1
+        assert "TestCriticality" not in schema_before.nodes
+
+        schema_after = await registry.schema.load_schema_at(db=db, branch=default_branch, at=time_after_change)
+        assert schema_after is not schema_before
+        assert load_schema_from_db.call_count == 2
+        assert "TestCriticality" in schema_after.nodes
+
+
 async def test_load_schema(
     db: InfrahubDatabase, reset_registry, default_branch: Branch, register_internal_models_schema
 ):
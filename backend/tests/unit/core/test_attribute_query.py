@@ -1,6 +1,9 @@
 from infrahub.core.branch import Branch
+from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
-from infrahub.core.query.attribute import AttributeGetQuery
+from infrahub.core.query.attribute import AttributeGetQuery, AttributeUpdateValuesQuery
+from infrahub.core.query.node import NodeListGetAttributeQuery
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 
 
@@ -13,3 +16,29 @@ async def test_AttributeGetQuery(db: InfrahubDatabase, default_branch: Branch, c
     await query.execute(db=db)
 
     assert query.num_of_results == 3
+
+
+async def test_AttributeUpdateValuesQuery(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    obj = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await obj.new(db=db, name="John", height=180)
+    await obj.save(db=db)
+
+    query = await NodeListGetAttributeQuery.init(
+        db=db, ids=[obj.id], fields={"name": True, "height": True}, branch=default_branch
+    )
+    await query.execute(db=db)
+    rel_ids = [query.get_result_by_id_and_name(obj.id, name)[1].get_rel("r2").element_id for name in ("name", "height")]
+
+    obj.name.value = "Jane"
+    obj.height.value = None
+    query = await AttributeUpdateValuesQuery.init(
+        db=db, attributes=[obj.name, obj.height], rel_ids_to_update=rel_ids, at=Timestamp()
+    )
+    await query.execute(db=db)
+
+    assert query.get_result().get("num_updated") == 2
+    assert query.get_result().get("num_created_0") == 2
+
+    person = await NodeManager.get_one(db=db, id=obj.id)
+    assert person.name.value == "Jane"
+    assert person.height.value is None
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from infrahub_sdk.uuidt import UUIDT
 
@@ -5,7 +7,7 @@ from infrahub.core.branch import Branch
 from infrahub.core.initialization import create_branch
 from infrahub.core.manager import NodeManager, identify_node_class
 from infrahub.core.node import Node
-from infrahub.core.query.node import NodeToProcess
+from infrahub.core.query.node import NodeListGetAttributeQuery, NodeToProcess
 from infrahub.core.registry import registry
 from infrahub.core.schema import NodeSchema
 from infrahub.core.schema.schema_branch import SchemaBranch
@@ -263,6 +265,46 @@ async def test_get_many_prefetch(db: InfrahubDatabase, default_branch: Branch, p
     assert tags[1]._peer
 
 
+async def test_get_many_prefetch_in_session(db: InfrahubDatabase, default_branch: Branch, person_jack_tags_main):
+    """The attributes and the peers are loaded concurrently, each of them must use its own session."""
+    used_databases: list[InfrahubDatabase] = []
+    original_execute = NodeListGetAttributeQuery.execute
+
+    async def execute(self: NodeListGetAttributeQuery, db: InfrahubDatabase) -> NodeListGetAttributeQuery:
+        used_databases.append(db)
+        return await original_execute(self, db=db)
+
+    async with db.start_session() as session_db:
+        with patch.object(NodeListGetAttributeQuery, "execute", execute):
+            nodes = await NodeManager.get_many(
+                db=session_db, ids=[person_jack_tags_main.id], prefetch_relationships=True
+            )
+
+        tags = await nodes[person_jack_tags_main.id].tags.get(db=session_db)
+
+    assert len(tags) == 2
+    assert {tag._peer.name.value for tag in tags} == {"Blue", "Red"}
+    # one query for the nodes and one for the peers, neither of them on the session of the caller
+    assert len(used_databases) == 2
+    assert len({id(used_db) for used_db in used_databases}) == 2
+    assert session_db not in used_databases
+
+
+async def test_get_many_prefetch_peers_in_ids(
+    db: InfrahubDatabase, default_branch: Branch, person_jack_tags_main, tag_blue_main, tag_red_main
+):
+    nodes = await NodeManager.get_many(
+        db=db, ids=[person_jack_tags_main.id, tag_blue_main.id, tag_red_main.id], prefetch_relationships=True
+    )
+
+    assert len(nodes) == 3
+    tags = await nodes[person_jack_tags_main.id].tags.get(db=db)
+    peers = {tag.peer_id: tag._peer for tag in tags}
+    assert set(peers.keys()) == {tag_blue_main.id, tag_red_main.id}
+    assert peers[tag_blue_main.id].name.value == tag_blue_main.name.value
+    assert peers[tag_red_main.id].name.value == tag_red_main.name.value
+
+
 async def test_get_many_with_profile(db: InfrahubDatabase, default_branch: Branch, criticality_low, criticality_medium):
     profile_schema = registry.schema.get("ProfileTestCriticality", branch=default_branch)
     crit_profile_1 = await Node.init(db=db, schema=profile_schema)
@@ -596,3 +638,32 @@ async def test_get_one_global(db: InfrahubDatabase, default_branch: Branch, base
     assert obj2.nbr_seats.value == 4
     assert obj2.color.value == "#444444"
     assert obj2.is_electric.value is True
+
+
+async def test_create_many(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    person = await Node.init(db=db, schema="TestPerson")
+    await person.new(db=db, name="John", height=180)
+    await person.save(db=db)
+
+    cars = []
+    for idx in range(5):
+        car = await Node.init(db=db, schema="TestCar")
+        await car.new(db=db, name=f"car{idx}", nbr_seats=idx + 1, is_electric=bool(idx % 2), owner=person)
+        cars.append(car)
+
+    created = await NodeManager.create_many(db=db, nodes=cars)
+    assert created == cars
+    assert all(car.db_id for car in cars)
+    assert all(car.name.id and car.name.db_id for car in cars)
+
+    nodes = await NodeManager.get_many(db=db, ids=[car.id for car in cars], prefetch_relationships=True)
+    assert sorted(node.name.value for node in nodes.values()) == [f"car{idx}" for idx in range(5)]
+    for car in cars:
+        node = nodes[car.id]
+        assert node.nbr_seats.value == car.nbr_seats.value
+        assert node.is_electric.value == car.is_electric.value
+        owner = await node.owner.get_peer(db=db)
+        assert owner.id == person.id
+
+    with pytest.raises(ValueError, match="already exists"):
+        await NodeManager.create_many(db=db, nodes=cars[:1])
@@ -1,5 +1,6 @@
 from typing import Optional
 
+import pytest
 from deepdiff import DeepDiff
 
 from infrahub.core.constants import HashableModelState
@@ -326,3 +327,40 @@ def test_update_nested_objects():
 
     assert node1.value4.value2 == node2.value4.value2
     assert sorted(node1.subs) == sorted(node2.subs)
+
+
+def test_model_read_only():
+    class MySubElement(HashableModel):
+        _sort_by: list[str] = ["name"]
+        name: str
+        value1: Optional[str] = None
+
+    class MyTopElement(HashableModel):
+        _sort_by: list[str] = ["name"]
+        name: str
+        value4: MySubElement
+        subs: list[MySubElement]
+
+    node1 = MyTopElement(name="node1", value4=MySubElement(name="apple"), subs=[MySubElement(name="orange")])
+    node1.set_read_only()
+
+    assert node1.is_read_only
+    assert node1.value4.is_read_only
+    assert node1.subs[0].is_read_only
+
+    with pytest.raises(TypeError, match="read-only"):
+        node1.name = "new"
+    with pytest.raises(TypeError, match="read-only"):
+        node1.value4.value1 = "new"
+    with pytest.raises(TypeError, match="read-only"):
+        node1.subs[0].value1 = "new"
+
+    node2 = node1.duplicate()
+    assert not node2.is_read_only
+    assert not node2.subs[0].is_read_only
+    node2.name = "node2"
+    node2.subs[0].value1 = "new"
+
+    assert node1.name == "node1"
+    assert node1.subs[0].value1 is None
+    assert node1.get_hash() != node2.get_hash()
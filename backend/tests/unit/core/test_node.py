@@ -718,6 +718,63 @@ async def test_node_update_local_attrs(db: InfrahubDatabase, default_branch: Bra
     assert await count_relationships(db=db) == nbr_rels
 
 
+async def test_node_update_only_modified_attrs(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(db=db, name="low", level=4)
+    await obj1.save(db=db)
+    assert obj1.name.is_dirty is False
+
+    obj2 = await NodeManager.get_one(db=db, id=obj1.id)
+    obj3 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert not [name for name in obj2._attributes if getattr(obj2, name).is_dirty]
+
+    obj2.name.value = "high"
+    await obj2.save(db=db)
+    assert obj2.name.is_dirty is False
+
+    # The attributes that have not been modified must not overwrite the changes made by obj2
+    obj3.level.value = 2
+    obj3.json_default.value["value"] = "alice"
+    assert obj3.level.is_dirty is True
+    assert obj3.json_default.is_dirty is True
+    assert obj3.name.is_dirty is False
+    await obj3.save(db=db)
+
+    obj4 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert obj4.name.value == "high"
+    assert obj4.level.value == 2
+    assert obj4.json_default.value == {"value": "alice"}
+    assert obj4.json_default.is_default is False
+
+
+async def test_node_update_only_modified_relationships(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    p1 = await Node.init(db=db, schema="TestPerson")
+    await p1.new(db=db, name="John", height=180)
+    await p1.save(db=db)
+    p2 = await Node.init(db=db, schema="TestPerson")
+    await p2.new(db=db, name="Jane", height=170)
+    await p2.save(db=db)
+
+    c1 = await Node.init(db=db, schema="TestCar")
+    await c1.new(db=db, name="volt", nbr_seats=4, is_electric=True, owner=p1)
+    await c1.save(db=db)
+    assert c1.owner.is_dirty is False
+
+    car = await NodeManager.get_one(db=db, id=c1.id)
+    assert car.owner.is_dirty is False
+    await car.owner.get_relationships(db=db)
+    assert car.owner.is_dirty is False
+
+    await car.owner.update(db=db, data=p2)
+    assert car.owner.is_dirty is True
+    await car.save(db=db)
+    assert car.owner.is_dirty is False
+
+    car = await NodeManager.get_one(db=db, id=c1.id)
+    car_owner = await car.owner.get_peer(db=db)
+    assert car_owner.id == p2.id
+
+
 async def test_node_update_local_attrs_with_flags(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
     fields_to_query = {"name": True, "level": True}
     obj1 = await Node.init(db=db, schema=criticality_schema)
@@ -1,6 +1,7 @@
 import pendulum
 import pytest
 
+from infrahub import config
 from infrahub.core.query import (
     Query,
     QueryNode,
@@ -9,6 +10,7 @@ from infrahub.core.query import (
     QueryResult,
     QueryType,
     cleanup_return_labels,
+    get_label_index,
     sort_results_by_time,
 )
 from infrahub.database import InfrahubDatabase
@@ -140,6 +142,37 @@ async def test_query_async(db: InfrahubDatabase, simple_dataset_01):
     assert query.results[0].get("at") is not None
 
 
+async def test_query_results_larger_than_query_size_limit(db: InfrahubDatabase, simple_dataset_01):
+    original_query_size_limit = config.SETTINGS.database.query_size_limit
+    config.SETTINGS.database.query_size_limit = 1
+    try:
+        query = await Query01.init(db=db)
+        await query.execute(db=db)
+    finally:
+        config.SETTINGS.database.query_size_limit = original_query_size_limit
+
+    assert query.num_of_results == 3
+    assert {result.get("av").get("value") for result in query.results} == {"accord", "volt", 5}
+
+
+async def test_query_execute_stream(db: InfrahubDatabase, simple_dataset_01):
+    query = await Query01.init(db=db)
+
+    results = [result async for result in query.execute_stream(db=db)]
+
+    assert query.has_been_executed is True
+    assert query.results == []
+    assert {result.get("av").get("value") for result in results} == {"accord", "volt", 5}
+
+
+async def test_query_execute_stream_write_query(db: InfrahubDatabase):
+    query = await Query02.init(db=db)
+
+    with pytest.raises(TypeError):
+        async for _ in query.execute_stream(db=db):
+            pass
+
+
 async def test_query_count(db: InfrahubDatabase, simple_dataset_01):
     query = await Query01.init(db=db)
     assert await query.count(db=db) == 3
@@ -189,6 +222,31 @@ async def test_query_result_getters(neo4j_factory):
         qr.get("r3")
 
 
+def test_query_result_lazy_scores(neo4j_factory):
+    n1 = neo4j_factory.hydrate_node(333, {"Car"}, {"uuid": "n3"}, "333")
+    r1 = neo4j_factory.hydrate_relationship(
+        3334441, 333, 444, "HAS_ATTRIBUTE", {"branch": "main", "branch_level": 1, "to": None, "status": "active"}
+    )
+    r2 = neo4j_factory.hydrate_relationship(
+        3334442, 333, 444, "HAS_ATTRIBUTE", {"branch": "branch2", "branch_level": 2, "to": "x", "status": "deleted"}
+    )
+
+    labels = cleanup_return_labels(["n1", "r1 AS r1", "r2"])
+    label_index = get_label_index(labels)
+    assert label_index == {"n1": 0, "r1": 1, "r2": 2}
+
+    qr = QueryResult(data=[n1, r1, r2], labels=labels, label_index=label_index)
+    assert qr._branch_score is None
+    assert qr._time_score is None
+    assert qr._has_deleted_rels is None
+
+    assert qr.branch_score == 3
+    assert qr.time_score == 3
+    assert qr.has_deleted_rels is True
+    assert qr.get("r2") == r2
+    assert not hasattr(qr, "__dict__")
+
+
 async def test_sort_results_by_time(neo4j_factory):
     time0 = pendulum.now(tz="UTC")
 
@@ -1,4 +1,5 @@
 from typing import Dict, Literal
+from unittest.mock import patch
 
 import pytest
 from deepdiff import DeepDiff
@@ -1636,6 +1637,88 @@ async def test_query_relationship_multiple_values(
     assert result.data["TestPerson"]["edges"][1]["node"]["cars"]["edges"][0]["node"]["name"]["value"] == "nolt"
 
 
+async def test_query_relationship_peers_loaded_in_batch(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema: SchemaBranch
+):
+    car = registry.schema.get(name="TestCar")
+    person = registry.schema.get(name="TestPerson")
+
+    p1 = await Node.init(db=db, schema=person)
+    await p1.new(db=db, name="John", height=180)
+    await p1.save(db=db)
+    p2 = await Node.init(db=db, schema=person)
+    await p2.new(db=db, name="Jane", height=170)
+    await p2.save(db=db)
+
+    c1 = await Node.init(db=db, schema=car)
+    await c1.new(db=db, name="volt", nbr_seats=4, is_electric=True, owner=p1)
+    await c1.save(db=db)
+    c2 = await Node.init(db=db, schema=car)
+    await c2.new(db=db, name="bolt", nbr_seats=4, is_electric=True, owner=p1)
+    await c2.save(db=db)
+    c3 = await Node.init(db=db, schema=car)
+    await c3.new(db=db, name="nolt", nbr_seats=4, is_electric=True, owner=p2)
+    await c3.save(db=db)
+
+    query = """
+    query {
+        TestCar {
+            edges {
+                node {
+                    name { value }
+                    owner {
+                        node {
+                            name { value }
+                        }
+                    }
+                }
+            }
+        }
+        TestPerson {
+            edges {
+                node {
+                    name { value }
+                    cars {
+                        count
+                        edges {
+                            node {
+                                name { value }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(
+        db=db, include_mutation=False, include_subscription=False, branch=default_branch
+    )
+    with patch.object(NodeManager, "query_peers", wraps=NodeManager.query_peers) as query_peers:
+        result = await graphql(
+            schema=gql_params.schema,
+            source=query,
+            context_value=gql_params.context,
+            root_value=None,
+            variable_values={},
+        )
+
+    assert result.errors is None
+    assert query_peers.call_count == 2
+
+    owners = {
+        edge["node"]["name"]["value"]: edge["node"]["owner"]["node"]["name"]["value"]
+        for edge in result.data["TestCar"]["edges"]
+    }
+    assert owners == {"volt": "John", "bolt": "John", "nolt": "Jane"}
+
+    cars = {edge["node"]["name"]["value"]: edge["node"]["cars"] for edge in result.data["TestPerson"]["edges"]}
+    assert cars["John"]["count"] == 2
+    assert sorted([car["node"]["name"]["value"] for car in cars["John"]["edges"]]) == ["bolt", "volt"]
+    assert cars["Jane"]["count"] == 1
+    assert [car["node"]["name"]["value"] for car in cars["Jane"]["edges"]] == ["nolt"]
+
+
 async def test_query_oneway_relationship(db: InfrahubDatabase, default_branch: Branch, person_tag_schema: None):
     t1 = await Node.init(db=db, schema=InfrahubKind.TAG)
     await t1.new(db=db, name="Blue", description="The Blue tag")
@@ -0,0 +1,140 @@
+from graphql import graphql
+
+from infrahub.core.branch import Branch
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.database import InfrahubDatabase
+from infrahub.graphql.initialization import prepare_graphql_params
+
+
+async def test_create_many(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    query = """
+    mutation {
+        TestPersonCreateMany(data: [
+            {name: { value: "John"}, height: {value: 182}},
+            {name: { value: "Jane"}, height: {value: 165}},
+            {name: { value: "Jim"}}
+        ]) {
+            ok
+            count
+            objects {
+                id
+                name {
+                    value
+                }
+            }
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors is None
+    assert result.data["TestPersonCreateMany"]["ok"] is True
+    assert result.data["TestPersonCreateMany"]["count"] == 3
+    objects = result.data["TestPersonCreateMany"]["objects"]
+    assert [obj["name"]["value"] for obj in objects] == ["John", "Jane", "Jim"]
+
+    persons = await NodeManager.get_many(db=db, ids=[obj["id"] for obj in objects])
+    assert {person.name.value: person.height.value for person in persons.values()} == {
+        "John": 182,
+        "Jane": 165,
+        "Jim": None,
+    }
+
+
+async def test_create_many_check_unique_within_batch(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    query = """
+    mutation {
+        TestPersonCreateMany(data: [
+            {name: { value: "John"}, height: {value: 182}},
+            {name: { value: "John"}, height: {value: 165}}
+        ]) {
+            ok
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors
+    assert "An object already exist with this value: name: John" in result.errors[0].message
+    assert await NodeManager.count(db=db, schema="TestPerson") == 0
+
+
+async def test_create_many_check_unique_existing(db: InfrahubDatabase, person_john_main: Node, branch: Branch):
+    query = """
+    mutation {
+        TestPersonCreateMany(data: [
+            {name: { value: "Jane"}},
+            {name: { value: "John"}}
+        ]) {
+            ok
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors
+    assert "An object already exist" in result.errors[0].message
+    assert await NodeManager.count(db=db, schema="TestPerson", branch=branch) == 1
+
+
+async def test_upsert_many(db: InfrahubDatabase, person_john_main: Node, branch: Branch):
+    query = (
+        """
+    mutation {
+        TestPersonUpsertMany(data: [
+            {name: { value: "Jane"}, height: {value: 165}},
+            {id: "%s", height: {value: 190}}
+        ]) {
+            ok
+            count
+            objects {
+                id
+            }
+        }
+    }
+    """
+        % person_john_main.id
+    )
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors is None
+    assert result.data["TestPersonUpsertMany"]["ok"] is True
+    assert result.data["TestPersonUpsertMany"]["count"] == 2
+    objects = result.data["TestPersonUpsertMany"]["objects"]
+    assert objects[1]["id"] == person_john_main.id
+
+    jane = await NodeManager.get_one(db=db, id=objects[0]["id"], branch=branch)
+    assert jane.name.value == "Jane"
+    assert jane.height.value == 165
+    john = await NodeManager.get_one(db=db, id=person_john_main.id, branch=branch)
+    assert john.name.value == "John"
+    assert john.height.value == 190
@@ -0,0 +1,72 @@
+from graphql import build_schema
+
+from infrahub.core.branch import Branch
+from infrahub.graphql.query_cache import GraphQLQueryCache
+
+SCHEMA = build_schema("""
+type Query {
+  hello(name: String): String
+}
+""")
+
+QUERY = """
+query Hello($name: String) {
+  hello(name: $name)
+}
+"""
+
+
+def test_query_cache_reuse_analyzer():
+    cache = GraphQLQueryCache()
+    branch1 = Branch(name="branch1")
+    branch2 = Branch(name="branch2")
+
+    analyzer1 = cache.get_analyzer(
+        query=QUERY, schema=SCHEMA, schema_hash="aaaa", branch=branch1, query_variables={"name": "first"}
+    )
+    assert analyzer1.is_valid == (True, None)
+    assert [operation.name for operation in analyzer1.operations] == ["hello"]
+
+    analyzer2 = cache.get_analyzer(
+        query=QUERY, schema=SCHEMA, schema_hash="aaaa", branch=branch2, query_variables={"name": "second"}
+    )
+    assert len(cache) == 1
+    assert analyzer2.document is analyzer1.document
+    assert analyzer2.operations is analyzer1.operations
+    assert analyzer2.branch == branch2
+    assert analyzer1.branch == branch1
+    assert analyzer2.query_variables == {"name": "second"}
+
+    analyzer3 = cache.get_analyzer(query=QUERY, schema=SCHEMA, schema_hash="bbbb", branch=branch1)
+    assert len(cache) == 2
+    assert analyzer3.document is not analyzer1.document
+
+
+def test_query_cache_invalidate():
+    cache = GraphQLQueryCache()
+    branch = Branch(name="branch1")
+
+    cache.get_analyzer(query=QUERY, schema=SCHEMA, schema_hash="aaaa", branch=branch)
+    cache.get_analyzer(query="query { hello }", schema=SCHEMA, schema_hash="aaaa", branch=branch)
+    cache.get_analyzer(query=QUERY, schema=SCHEMA, schema_hash="bbbb", branch=branch)
+    assert len(cache) == 3
+
+    cache.invalidate(schema_hash="aaaa")
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_query_cache_max_size():
+    cache = GraphQLQueryCache(max_size=2)
+    branch = Branch(name="branch1")
+
+    first = cache.get_analyzer(query=QUERY, schema=SCHEMA, schema_hash="aaaa", branch=branch)
+    cache.get_analyzer(query="query { hello }", schema=SCHEMA, schema_hash="aaaa", branch=branch)
+    # Access the first query again so the second one becomes the least recently used
+    cache.get_analyzer(query=QUERY, schema=SCHEMA, schema_hash="aaaa", branch=branch)
+    cache.get_analyzer(query="query Other { hello }", schema=SCHEMA, schema_hash="aaaa", branch=branch)
+
+    assert len(cache) == 2
+    assert cache.get_analyzer(query=QUERY, schema=SCHEMA, schema_hash="aaaa", branch=branch).document is first.document
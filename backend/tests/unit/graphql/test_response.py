@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+from enum import Enum
+
+import pytest
+from starlette.responses import JSONResponse
+
+from infrahub.graphql.response import GraphQLJSONResponse, render_graphql_response
+
+
+class Color(Enum):
+    BLUE = "blue"
+
+
+def test_render_graphql_response_matches_json_response():
+    content = {
+        "data": {"BuiltinTag": {"count": 1, "edges": [{"node": {"id": "a/b", "name": {"value": "Ü tag"}}}]}},
+        "errors": [{"message": "error", "locations": [{"line": 1, "column": 2}], "path": None}],
+    }
+
+    assert render_graphql_response(content) == JSONResponse(content).body
+    assert GraphQLJSONResponse(content).body == JSONResponse(content).body
+
+
+def test_render_graphql_response_custom_types():
+    content = {"color": Color.BLUE, "time": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+
+    assert render_graphql_response(content) == b'{"color":"blue","time":"2024-01-01T00:00:00+00:00"}'
+
+
+def test_render_graphql_response_nan():
+    with pytest.raises(OverflowError):
+        render_graphql_response({"value": float("nan")})
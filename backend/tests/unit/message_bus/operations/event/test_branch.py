@@ -108,8 +108,9 @@ async def test_merged(default_branch: Branch, init_service: InfrahubServices, pr
     )
     diff_repo.get_empty_roots.assert_awaited_once_with(base_branch_names=[target_branch_name])
 
-    assert len(service.message_bus.messages) == 1
+    assert len(service.message_bus.messages) == 2
     assert service.message_bus.messages[0] == messages.RefreshRegistryBranches()
+    assert service.message_bus.messages[1] == messages.RefreshRegistryIpam(branch=target_branch_name)
 
 
 async def test_rebased(default_branch: Branch, prefect_test_fixture):
@@ -161,7 +162,9 @@ async def test_rebased(default_branch: Branch, prefect_test_fixture):
 
     mock_component_registry.get_component.assert_awaited_once_with(DiffRepository, db=database, branch=default_branch)
     diff_repo.get_empty_roots.assert_awaited_once_with(diff_branch_names=[branch_name])
-    assert len(recorder.messages) == 1
+    assert len(recorder.messages) == 2
     assert isinstance(recorder.messages[0], messages.RefreshRegistryRebasedBranch)
     refresh_message: messages.RefreshRegistryRebasedBranch = recorder.messages[0]
     assert refresh_message.branch == "cr1234"
+    assert isinstance(recorder.messages[1], messages.RefreshRegistryIpam)
+    assert recorder.messages[1].branch == "cr1234"
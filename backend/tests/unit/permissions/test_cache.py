@@ -0,0 +1,154 @@
+import random
+from itertools import product
+
+from infrahub.core.account import GlobalPermission, ObjectPermission
+from infrahub.core.constants import GlobalPermissions, PermissionDecision
+from infrahub.permissions import LocalPermissionBackend
+from infrahub.permissions.cache import CompiledPermissions, PermissionCache
+from infrahub.permissions.constants import AssignedPermissions, PermissionDecisionFlag
+
+NAMESPACES = ["Builtin", "Core", "Infra", "*"]
+NAMES = ["Tag", "Device", "Interface", "*"]
+ACTIONS = ["view", "create", "update", "delete", "any"]
+DECISIONS = [decision.value for decision in PermissionDecision]
+
+
+def test_compiled_permissions_global():
+    compiled = CompiledPermissions(
+        permissions={
+            "global_permissions": [
+                GlobalPermission(action=GlobalPermissions.EDIT_DEFAULT_BRANCH.value, decision=PermissionDecision.DENY),
+                GlobalPermission(
+                    action=GlobalPermissions.EDIT_DEFAULT_BRANCH.value, decision=PermissionDecision.ALLOW_ALL
+                ),
+                GlobalPermission(action=GlobalPermissions.MERGE_BRANCH.value, decision=PermissionDecision.ALLOW_ALL),
+            ],
+            "object_permissions": [],
+        }
+    )
+
+    assert not compiled.is_super_admin
+    assert not compiled.has_global_permission(action=GlobalPermissions.EDIT_DEFAULT_BRANCH.value)
+    assert compiled.has_global_permission(action=GlobalPermissions.MERGE_BRANCH.value)
+    assert not compiled.has_global_permission(action=GlobalPermissions.MANAGE_SCHEMA.value)
+
+
+def test_compiled_permissions_match_scan():
+    backend = LocalPermissionBackend()
+    rng = random.Random(42)
+
+    for _ in range(200):
+        object_permissions = [
+            ObjectPermission(
+                namespace=rng.choice(NAMESPACES),
+                name=rng.choice(NAMES),
+                action=rng.choice(ACTIONS),
+                decision=rng.choice(DECISIONS),
+            )
+            for _ in range(rng.randint(0, 12))
+        ]
+        compiled = CompiledPermissions(permissions={"global_permissions": [], "object_permissions": object_permissions})
+
+        for namespace, name, action in product(NAMESPACES[:-1], NAMES[:-1], ACTIONS[:-1]):
+            assert compiled.report_object_permission(
+                namespace=namespace, name=name, action=action
+            ) == backend.report_object_permission(
+                permissions=object_permissions, namespace=namespace, name=name, action=action
+            ), f"{namespace}:{name}:{action} with {[str(permission) for permission in object_permissions]}"
+
+
+def test_compiled_permissions_no_match():
+    compiled = CompiledPermissions(
+        permissions={
+            "global_permissions": [],
+            "object_permissions": [
+                ObjectPermission(namespace="Core", name="Tag", action="view", decision=PermissionDecision.ALLOW_ALL)
+            ],
+        }
+    )
+
+    assert compiled.report_object_permission(namespace="Core", name="Tag", action="view") == (
+        PermissionDecisionFlag.ALLOW_ALL
+    )
+    assert compiled.report_object_permission(namespace="Core", name="Tag", action="update") == (
+        PermissionDecisionFlag.DENY
+    )
+
+
+class PermissionsLoader:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> AssignedPermissions:
+        self.calls += 1
+        return {"global_permissions": [], "object_permissions": []}
+
+
+async def test_permission_cache_reuse_entries():
+    cache = PermissionCache(max_age=60)
+    loader = PermissionsLoader()
+
+    first = await cache.get_permissions(account_id="account1", branch_name="main", loader=loader)
+    second = await cache.get_permissions(account_id="account1", branch_name="main", loader=loader)
+    assert first is second
+    assert loader.calls == 1
+
+    await cache.get_permissions(account_id="account1", branch_name="branch2", loader=loader)
+    await cache.get_permissions(account_id="account2", branch_name="main", loader=loader)
+    assert loader.calls == 3
+
+
+async def test_permission_cache_expiry(monkeypatch):
+    cache = PermissionCache(max_age=60)
+    loader = PermissionsLoader()
+    now = 1000.0
+    monkeypatch.setattr("infrahub.permissions.cache.time.monotonic", lambda: now)
+
+    await cache.get_permissions(account_id="account1", branch_name="main", loader=loader)
+    now += 59
+    await cache.get_permissions(account_id="account1", branch_name="main", loader=loader)
+    assert loader.calls == 1
+
+    now += 2
+    await cache.get_permissions(account_id="account1", branch_name="main", loader=loader)
+    assert loader.calls == 2
+
+
+async def test_permission_cache_disabled():
+    cache = PermissionCache(max_age=0)
+    loader = PermissionsLoader()
+
+    await cache.get_permissions(account_id="account1", branch_name="main", loader=loader)
+    await cache.get_permissions(account_id="account1", branch_name="main", loader=loader)
+    assert loader.calls == 2
+
+
+async def test_permission_cache_invalidate():
+    cache = PermissionCache(max_age=60)
+    loader = PermissionsLoader()
+
+    for account_id in ("account1", "account2"):
+        await cache.get_permissions(account_id=account_id, branch_name="main", loader=loader)
+
+    cache.invalidate(account_id="account1")
+    await cache.get_permissions(account_id="account1", branch_name="main", loader=loader)
+    await cache.get_permissions(account_id="account2", branch_name="main", loader=loader)
+    assert loader.calls == 3
+
+    cache.invalidate()
+    await cache.get_permissions(account_id="account1", branch_name="main", loader=loader)
+    await cache.get_permissions(account_id="account2", branch_name="main", loader=loader)
+    assert loader.calls == 5
+
+
+async def test_permission_cache_invalidate_during_load():
+    cache = PermissionCache(max_age=60)
+    loader = PermissionsLoader()
+
+    async def invalidating_loader() -> AssignedPermissions:
+        cache.invalidate()
+        return await loader()
+
+    await cache.get_permissions(account_id="account1", branch_name="main", loader=invalidating_loader)
+    await cache.get_permissions(account_id="account1", branch_name="main", loader=loader)
+    assert loader.calls == 2
@@ -0,0 +1,194 @@
+import ipaddress
+
+from infrahub.core.ipam.constants import IPNetworkType
+from infrahub.core.timestamp import Timestamp
+from infrahub.pools.allocators import NumberAllocatorRegistry, PoolAllocatorRegistry
+from infrahub.pools.number import NumberAllocator
+from infrahub.pools.prefix import PrefixAllocator
+
+
+async def no_changes(since: str, at: Timestamp) -> list[tuple[str, IPNetworkType]]:
+    return []
+
+
+async def test_get_allocator_loaded_once():
+    registry = PoolAllocatorRegistry()
+    calls = []
+
+    async def loader(at: Timestamp) -> PrefixAllocator:
+        calls.append(1)
+        return PrefixAllocator("10.10.0.0/16")
+
+    allocator = await registry.get_allocator(
+        key=("pool1", "net1"), namespace_id="ns1", is_address=False, loader=loader, syncer=no_changes
+    )
+    assert (
+        await registry.get_allocator(
+            key=("pool1", "net1"), namespace_id="ns1", is_address=False, loader=loader, syncer=no_changes
+        )
+        is allocator
+    )
+    assert len(calls) == 1
+
+    registry.invalidate(pool_id="pool1")
+    assert (
+        await registry.get_allocator(
+            key=("pool1", "net1"), namespace_id="ns1", is_address=False, loader=loader, syncer=no_changes
+        )
+        is not allocator
+    )
+    assert len(calls) == 2
+
+
+async def test_get_allocator_synchronized():
+    registry = PoolAllocatorRegistry()
+    calls = []
+    changes = [("net2", ipaddress.ip_network("10.10.0.0/17"))]
+
+    async def loader(at: Timestamp) -> PrefixAllocator:
+        calls.append(at)
+        return PrefixAllocator("10.10.0.0/16")
+
+    async def syncer(since: str, at: Timestamp) -> list[tuple[str, IPNetworkType]]:
+        assert since < at.to_string()
+        return changes
+
+    allocator = await registry.get_allocator(
+        key=("pool1", "net1"), namespace_id="ns1", is_address=False, loader=loader, syncer=syncer
+    )
+    assert allocator.allocate(prefixlen=18) == [ipaddress.ip_network("10.10.0.0/18")]
+
+    # the prefixes created by the other workers are reserved before the next allocation
+    allocator = await registry.get_allocator(
+        key=("pool1", "net1"), namespace_id="ns1", is_address=False, loader=loader, syncer=syncer
+    )
+    assert len(calls) == 1
+    assert allocator.get_reserved(identifier="net2") == ipaddress.ip_network("10.10.0.0/17")
+    assert allocator.allocate(prefixlen=18) == [ipaddress.ip_network("10.10.128.0/18")]
+
+    # the free space is reloaded when a known prefix has moved
+    changes = [("net2", ipaddress.ip_network("10.10.128.0/17"))]
+    await registry.get_allocator(
+        key=("pool1", "net1"), namespace_id="ns1", is_address=False, loader=loader, syncer=syncer
+    )
+    assert len(calls) == 2
+
+
+async def test_update_node_prefix():
+    registry = PoolAllocatorRegistry()
+    allocator = PrefixAllocator("10.10.0.0/16")
+
+    async def loader(at: Timestamp) -> PrefixAllocator:
+        return allocator
+
+    await registry.get_allocator(
+        key=("pool1", "net1"), namespace_id="ns1", is_address=False, loader=loader, syncer=no_changes
+    )
+
+    # prefixes of other namespaces, addresses and the resource itself are ignored
+    registry.update_node(node_id="net2", namespace_id="ns2", ip_value=ipaddress.ip_network("10.10.0.0/17"))
+    registry.update_node(node_id="ip1", namespace_id="ns1", ip_value=ipaddress.ip_interface("10.10.0.1/16"))
+    registry.update_node(node_id="net1", namespace_id="ns1", ip_value=ipaddress.ip_network("10.10.0.0/16"))
+    assert allocator.num_free_addresses == 2**16
+
+    registry.update_node(node_id="net3", namespace_id="ns1", ip_value=ipaddress.ip_network("10.10.0.0/17"))
+    assert allocator.get_reserved(identifier="net3") == ipaddress.ip_network("10.10.0.0/17")
+    assert allocator.allocate(prefixlen=17) == [ipaddress.ip_network("10.10.128.0/17")]
+
+    # the free space is reloaded when a known prefix is deleted
+    registry.update_node(node_id="net3")
+    assert not registry._allocators
+
+
+async def test_update_node_address():
+    registry = PoolAllocatorRegistry()
+    allocator = PrefixAllocator("10.10.0.0/30")
+
+    async def loader(at: Timestamp) -> PrefixAllocator:
+        return allocator
+
+    await registry.get_allocator(
+        key=("pool1", "net1"), namespace_id="ns1", is_address=True, loader=loader, syncer=no_changes
+    )
+
+    registry.update_node(node_id="ip1", namespace_id="ns1", ip_value=ipaddress.ip_interface("10.10.0.1/30"))
+    assert allocator.get_reserved(identifier="ip1") == ipaddress.ip_network("10.10.0.1/32")
+    assert allocator.num_free_addresses == 3
+
+    # the free space is reloaded when a known address is moved
+    registry.update_node(node_id="ip1", namespace_id="ns1", ip_value=ipaddress.ip_interface("10.10.0.2/30"))
+    assert not registry._allocators
+
+
+async def test_update_node_address_deleted_on_branch():
+    """An address deleted on a branch must not be allocated again while it is still used on main."""
+    registry = PoolAllocatorRegistry()
+    calls = []
+
+    async def loader(at: Timestamp) -> PrefixAllocator:
+        # the free space is loaded across all the branches, the address still exists on main
+        calls.append(1)
+        allocator = PrefixAllocator("10.10.0.0/31")
+        allocator.reserve(subnet=ipaddress.ip_network("10.10.0.0/32"), identifier="ip1")
+        return allocator
+
+    allocator = await registry.get_allocator(
+        key=("pool1", "net1"), namespace_id="ns1", is_address=True, loader=loader, syncer=no_changes
+    )
+    assert allocator.get_reserved(identifier="ip1") == ipaddress.ip_network("10.10.0.0/32")
+
+    # event of the deletion of the address on a branch
+    registry.update_node(node_id="ip1")
+    assert allocator.get_reserved(identifier="ip1") == ipaddress.ip_network("10.10.0.0/32")
+
+    allocator = await registry.get_allocator(
+        key=("pool1", "net1"), namespace_id="ns1", is_address=True, loader=loader, syncer=no_changes
+    )
+    assert len(calls) == 2
+    assert allocator.allocate(prefixlen=32) == [ipaddress.ip_network("10.10.0.1/32")]
+
+
+async def test_number_allocator_synchronized():
+    registry = NumberAllocatorRegistry()
+    calls = []
+
+    async def loader(at: Timestamp) -> NumberAllocator:
+        calls.append(at)
+        return NumberAllocator.from_used(start=1, end=10, numbers=[1, 2, 3])
+
+    async def syncer(since: str, at: Timestamp) -> tuple[set[int], set[int]]:
+        assert since < at.to_string()
+        return {5}, {2}
+
+    pool_allocator = await registry.get_allocator(key=("pool1",), loader=loader, syncer=syncer)
+    assert pool_allocator.allocator.allocate(count=2) == [4, 5]
+
+    pool_allocator = await registry.get_allocator(key=("pool1",), loader=loader, syncer=syncer)
+    assert len(calls) == 1
+    assert pool_allocator.allocator.intervals == [(1, 1), (3, 5)]
+    assert pool_allocator.allocator.allocate() == [2]
+
+    registry.invalidate(pool_id="pool1")
+    await registry.get_allocator(key=("pool1",), loader=loader, syncer=syncer)
+    assert len(calls) == 2
+
+
+async def test_number_allocator_keep_local_allocations():
+    """A number allocated here but not reserved in the database yet is reported as released by the sync."""
+    registry = NumberAllocatorRegistry()
+
+    async def loader(at: Timestamp) -> NumberAllocator:
+        return NumberAllocator.from_used(start=1, end=10, numbers=[1, 2])
+
+    async def syncer(since: str, at: Timestamp) -> tuple[set[int], set[int]]:
+        return set(), {2, 3}
+
+    pool_allocator = await registry.get_allocator(key=("pool1",), loader=loader, syncer=syncer)
+    assert pool_allocator.allocate() == [3]
+
+    pool_allocator = await registry.get_allocator(key=("pool1",), loader=loader, syncer=syncer)
+    assert pool_allocator.allocator.intervals == [(1, 1), (3, 3)]
+    assert pool_allocator.allocate() == [2]
+
+    pool_allocator.release(number=3)
+    assert pool_allocator.allocator.intervals == [(1, 2)]
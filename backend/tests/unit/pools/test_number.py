@@ -0,0 +1,41 @@
+import pytest
+
+from infrahub.pools.number import NumberAllocator
+
+
+def test_from_used():
+    allocator = NumberAllocator.from_used(start=10, end=100, numbers=[14, 10, 11, 12, 5, 20, 12, 21, 200])
+    assert allocator.intervals == [(10, 12), (14, 14), (20, 21)]
+    assert allocator.num_used == 6
+    assert allocator.num_free == 85
+    assert allocator.get_next_free() == 13
+
+
+def test_reserve_and_release():
+    allocator = NumberAllocator(start=1, end=10)
+    assert allocator.reserve(number=3)
+    assert allocator.reserve(number=5)
+    assert not allocator.reserve(number=5)
+    assert allocator.reserve(number=4)
+    assert allocator.intervals == [(3, 5)]
+    assert allocator.is_used(number=4)
+    assert not allocator.is_used(number=6)
+
+    assert allocator.release(number=4)
+    assert not allocator.release(number=4)
+    assert allocator.intervals == [(3, 3), (5, 5)]
+    assert allocator.num_used == 2
+
+    with pytest.raises(ValueError):
+        allocator.reserve(number=11)
+
+
+def test_allocate():
+    allocator = NumberAllocator.from_used(start=1, end=10, numbers=[1, 2, 4, 7])
+    assert allocator.allocate() == [3]
+    assert allocator.allocate(count=3) == [5, 6, 8]
+    assert allocator.intervals == [(1, 8)]
+    assert allocator.allocate(count=5) == [9, 10]
+    assert allocator.allocate() == []
+    assert allocator.get_next_free() is None
+    assert allocator.num_free == 0
@@ -2,7 +2,7 @@ import ipaddress
 
 import pytest
 
-from infrahub.pools.prefix import PrefixPool
+from infrahub.pools.prefix import PrefixAllocator, PrefixPool
 
 
 def test_init_v4():
@@ -146,3 +146,65 @@ def test_reserve_with_owner():
     assert sub.reserve("192.192.1.0/24", identifier="second") is True
 
     assert str(sub.get(prefixlen=24)) == "192.192.2.0/24"
+
+
+def test_allocator_allocate_best_fit():
+    allocator = PrefixAllocator("10.10.0.0/16")
+    for subnet in ["10.10.1.0/24", "10.10.2.0/24", "10.10.3.0/27"]:
+        assert allocator.reserve(subnet=subnet)
+
+    assert allocator.allocate(prefixlen=24, count=2) == [
+        ipaddress.ip_network("10.10.0.0/24"),
+        ipaddress.ip_network("10.10.4.0/24"),
+    ]
+    assert allocator.allocate(prefixlen=17) == [ipaddress.ip_network("10.10.128.0/17")]
+    assert allocator.allocate(prefixlen=17) == []
+    assert allocator.allocate(prefixlen=15) == []
+
+
+def test_allocator_allocate_lowest_first():
+    allocator = PrefixAllocator("10.10.3.0/27")
+    for subnet in ["10.10.3.0/32", "10.10.3.1/32", "10.10.3.31/32"]:
+        allocator.reserve(subnet=subnet)
+
+    allocated = allocator.allocate(prefixlen=32, count=30, lowest_first=True)
+    assert [str(subnet.network_address) for subnet in allocated[:3]] == ["10.10.3.2", "10.10.3.3", "10.10.3.4"]
+    assert len(allocated) == 29
+    assert allocator.num_free_addresses == 0
+
+
+def test_allocator_reserve():
+    allocator = PrefixAllocator("192.168.0.0/24")
+
+    assert allocator.reserve(subnet="192.168.0.128/27", identifier="net1")
+    assert allocator.get_free_subnets() == [
+        ipaddress.ip_network("192.168.0.0/25"),
+        ipaddress.ip_network("192.168.0.160/27"),
+        ipaddress.ip_network("192.168.0.192/26"),
+    ]
+    assert allocator.get_reserved(identifier="net1") == ipaddress.ip_network("192.168.0.128/27")
+    # already reserved or within a reserved subnet
+    assert not allocator.reserve(subnet="192.168.0.128/27")
+    assert not allocator.reserve(subnet="192.168.0.144/28")
+
+    # a subnet containing reserved subnets replaces them
+    assert allocator.reserve(subnet="192.168.0.128/25", identifier="net2")
+    assert allocator.get_reserved(identifier="net1") is None
+    assert allocator.get_free_subnets() == [ipaddress.ip_network("192.168.0.0/25")]
+
+    with pytest.raises(ValueError):
+        allocator.reserve(subnet="10.0.0.0/24")
+
+
+def test_allocator_release():
+    allocator = PrefixAllocator("192.168.0.0/24")
+    subnets = allocator.allocate(prefixlen=26, count=4)
+    assert allocator.num_free_addresses == 0
+
+    assert allocator.release(subnet=subnets[1])
+    assert not allocator.release(subnet=subnets[1])
+    assert allocator.get_free_subnets() == [ipaddress.ip_network("192.168.0.64/26")]
+
+    assert allocator.release(subnet=subnets[0])
+    assert allocator.get_free_subnets() == [ipaddress.ip_network("192.168.0.0/25")]
+    assert allocator.allocate(prefixlen=25) == [ipaddress.ip_network("192.168.0.0/25")]
@@ -0,0 +1,47 @@
+import asyncio
+
+from infrahub.config import BrokerSettings
+from infrahub.message_bus import Meta, messages
+from infrahub.services import InfrahubServices
+from infrahub.services.adapters.message_bus.nats import NATSMessageBus
+from tests.adapters.message_bus import BusRecorder
+
+
+class FakeJetStream:
+    def __init__(self) -> None:
+        self.published: list[tuple[str, dict]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def publish(self, subject: str, payload: bytes, headers: dict) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.published.append((subject, headers))
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+
+
+async def test_nats_publish_many_pipelined():
+    bus = NATSMessageBus(settings=BrokerSettings(maximum_concurrent_publishes=3))
+    bus.jetstream = FakeJetStream()  # type: ignore[assignment]
+
+    batch = [
+        (messages.RefreshRegistryBranches(meta=Meta(correlation_id=str(idx))), "refresh.registry.branches")
+        for idx in range(7)
+    ]
+    await bus.publish_many(batch)
+
+    assert [headers["correlation_id"] for _, headers in bus.jetstream.published] == [str(idx) for idx in range(7)]
+    assert bus.jetstream.max_in_flight == 3
+    assert all(message.meta.priority for message, _ in batch)
+
+
+async def test_send_many():
+    bus = BusRecorder()
+    service = InfrahubServices(message_bus=bus)
+
+    await service.send_many(
+        messages=[messages.RefreshRegistryBranches(), messages.RefreshRegistryRebasedBranch(branch="branch1")]
+    )
+
+    assert bus.seen_routing_keys == ["refresh.registry.branches", "refresh.registry.rebased_branch"]
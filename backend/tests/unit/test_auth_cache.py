@@ -0,0 +1,189 @@
+from typing import Optional
+
+from infrahub.auth_cache import AuthCache, CachedAccount, ValidatedToken
+from infrahub.message_bus.types import KVTTL
+from tests.adapters.cache import MemoryCache
+
+
+class TokenLoader:
+    def __init__(self, account_id: Optional[str] = "account1") -> None:
+        self.account_id = account_id
+        self.calls = 0
+
+    async def __call__(self) -> Optional[ValidatedToken]:
+        self.calls += 1
+        if not self.account_id:
+            return None
+        return ValidatedToken(account_id=self.account_id, role="read-write")
+
+
+class AccountLoader:
+    def __init__(self, account_id: str = "account1") -> None:
+        self.account_id = account_id
+        self.calls = 0
+
+    async def __call__(self) -> CachedAccount:
+        self.calls += 1
+        return CachedAccount(account_id=self.account_id, role="read-write", status="active")
+
+
+async def test_get_token():
+    cache = AuthCache(max_age=10, max_size=10)
+    loader = TokenLoader()
+
+    first = await cache.get_token(token="token1", loader=loader)
+    second = await cache.get_token(token="token1", loader=loader)
+    assert first == second == ValidatedToken(account_id="account1", role="read-write")
+    assert loader.calls == 1
+
+    await cache.get_token(token="token2", loader=loader)
+    assert loader.calls == 2
+
+
+async def test_get_token_invalid_not_cached():
+    cache = AuthCache(max_age=10, max_size=10)
+    loader = TokenLoader(account_id=None)
+
+    assert await cache.get_token(token="token1", loader=loader) is None
+    assert await cache.get_token(token="token1", loader=loader) is None
+    assert loader.calls == 2
+
+
+async def test_expiry(monkeypatch):
+    cache = AuthCache(max_age=10, max_size=10)
+    loader = AccountLoader()
+    now = 1000.0
+    monkeypatch.setattr("infrahub.auth_cache.time.monotonic", lambda: now)
+
+    await cache.get_account(account_id="account1", loader=loader)
+    now += 9
+    await cache.get_account(account_id="account1", loader=loader)
+    assert loader.calls == 1
+
+    now += 1
+    await cache.get_account(account_id="account1", loader=loader)
+    assert loader.calls == 2
+
+
+async def test_disabled():
+    cache = AuthCache(max_age=0, max_size=10)
+    loader = AccountLoader()
+
+    await cache.get_account(account_id="account1", loader=loader)
+    await cache.get_account(account_id="account1", loader=loader)
+    assert loader.calls == 2
+
+
+async def test_max_size():
+    cache = AuthCache(max_age=10, max_size=2)
+    loaders = {account_id: AccountLoader(account_id=account_id) for account_id in ("account1", "account2", "account3")}
+
+    await cache.get_account(account_id="account1", loader=loaders["account1"])
+    await cache.get_account(account_id="account2", loader=loaders["account2"])
+    # account1 becomes the most recently used so account2 is evicted
+    await cache.get_account(account_id="account1", loader=loaders["account1"])
+    await cache.get_account(account_id="account3", loader=loaders["account3"])
+
+    await cache.get_account(account_id="account1", loader=loaders["account1"])
+    await cache.get_account(account_id="account2", loader=loaders["account2"])
+    assert loaders["account1"].calls == 1
+    assert loaders["account2"].calls == 2
+
+
+async def test_discard_account():
+    cache = AuthCache(max_age=10, max_size=10)
+    token_loaders = {account_id: TokenLoader(account_id=account_id) for account_id in ("account1", "account2")}
+    account_loader = AccountLoader()
+
+    await cache.get_token(token="token1", loader=token_loaders["account1"])
+    await cache.get_token(token="token2", loader=token_loaders["account2"])
+    await cache.get_account(account_id="account1", loader=account_loader)
+
+    cache.discard_account(account_id="account1")
+
+    await cache.get_token(token="token1", loader=token_loaders["account1"])
+    await cache.get_token(token="token2", loader=token_loaders["account2"])
+    await cache.get_account(account_id="account1", loader=account_loader)
+    assert token_loaders["account1"].calls == 2
+    assert token_loaders["account2"].calls == 1
+    assert account_loader.calls == 2
+
+    cache.discard_account()
+    await cache.get_token(token="token2", loader=token_loaders["account2"])
+    assert token_loaders["account2"].calls == 2
+
+
+async def test_discard_during_load():
+    cache = AuthCache(max_age=10, max_size=10)
+    loader = AccountLoader()
+
+    async def discarding_loader() -> CachedAccount:
+        cache.discard_account(account_id="account1")
+        return await loader()
+
+    await cache.get_account(account_id="account1", loader=discarding_loader)
+    await cache.get_account(account_id="account1", loader=loader)
+    assert loader.calls == 2
+
+
+async def test_shared_cache():
+    shared_cache = MemoryCache()
+    cache1 = AuthCache(max_age=10, max_size=10)
+    cache1.shared_cache = shared_cache
+    cache2 = AuthCache(max_age=10, max_size=10)
+    cache2.shared_cache = shared_cache
+    loader = TokenLoader()
+
+    await cache1.get_token(token="token1", loader=loader)
+    assert await cache2.get_token(token="token1", loader=loader) == ValidatedToken(
+        account_id="account1", role="read-write"
+    )
+    assert loader.calls == 1
+    assert not any("token1" in key for key in shared_cache.storage)
+
+    await cache1.invalidate_token(token="token1")
+    cache2.discard_account(account_id="account1")
+    await cache2.get_token(token="token1", loader=loader)
+    assert loader.calls == 2
+
+
+async def test_shared_cache_invalidate_account():
+    shared_cache = MemoryCache()
+    cache = AuthCache(max_age=10, max_size=10)
+    cache.shared_cache = shared_cache
+    loader = AccountLoader()
+
+    await cache.get_account(account_id="account1", loader=loader)
+    assert "security:account:account1" in shared_cache.storage
+
+    await cache.get_token(token="token1", loader=TokenLoader())
+    await cache.get_token(token="token2", loader=TokenLoader(account_id="account2"))
+
+    await cache.invalidate_account(account_id="account1")
+    assert not any(key.startswith("security:account") for key in shared_cache.storage if "account1" in key)
+    assert len([key for key in shared_cache.storage if key.startswith("security:api_token:")]) == 1
+
+
+async def test_shared_cache_stale_entry():
+    shared_cache = MemoryCache()
+    cache1 = AuthCache(max_age=10, max_size=10)
+    cache1.shared_cache = shared_cache
+    cache2 = AuthCache(max_age=10, max_size=10)
+    cache2.shared_cache = shared_cache
+    loader = AccountLoader()
+
+    async def invalidating_loader() -> CachedAccount:
+        # Another worker invalidates the account while this one is loading it
+        await cache2.invalidate_account(account_id="account1")
+        return await loader()
+
+    await cache1.get_account(account_id="account1", loader=invalidating_loader)
+    await cache2.get_account(account_id="account1", loader=loader)
+    assert loader.calls == 2
+
+
+def test_shared_ttl():
+    assert AuthCache(max_age=10).shared_ttl == KVTTL.TEN
+    assert AuthCache(max_age=12).shared_ttl == KVTTL.TEN
+    assert AuthCache(max_age=3600).shared_ttl == KVTTL.FIFTEEN
+    assert AuthCache(max_age=0).shared_ttl == KVTTL.ONE
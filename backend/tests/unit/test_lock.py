@@ -1,6 +1,8 @@
 import time
 from asyncio import gather, sleep
 
+from nats.js.kv import KeyValue
+
 from infrahub import lock
 
 
@@ -60,3 +62,27 @@ def test_generate_name():
     assert generate_name("simple.name", namespace="other") == "other.simple.name"
     assert generate_name("simple", namespace="other", local=True) == "local.other.simple"
     assert generate_name("simple", namespace="other", local=False) == "global.other.simple"
+
+
+def test_nats_lock_ticket_position():
+    first = KeyValue.Entry(
+        bucket="kv", key="locks.global.graph.aaa", value=b"", revision=12, delta=0, created=None, operation=None
+    )
+    renewed = KeyValue.Entry(
+        bucket="kv", key="locks.global.graph.aaa", value=b"12", revision=57, delta=0, created=None, operation=None
+    )
+
+    assert lock.get_ticket_position(entry=first) == 12
+    assert lock.get_ticket_position(entry=renewed) == 12
+
+
+def test_nats_lock_owner():
+    now = time.monotonic()
+    tickets = {"second": (20, now), "first": (10, now), "third": (30, now)}
+    assert lock.get_lock_owner(tickets=tickets, ttl=15) == "first"
+
+    tickets["first"] = (10, now - 20)
+    assert lock.get_lock_owner(tickets=tickets, ttl=15) == "second"
+    assert "first" not in tickets
+
+    assert lock.get_lock_owner(tickets={}, ttl=15) is None